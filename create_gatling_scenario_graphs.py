@@ -1,332 +1,91 @@
 # ============================================================================================================
 # Purpose:           Generates the Scenario Based Graphs using Gatling Simulation Log.
 # Author:            Navdit Sharma (Nav)
-# Notes:             Run the script from command prompt.
-# Revision:          Last change: 05/09/18 by Nav :: Created and tested the script
+# Notes:             Run the script from command prompt. The same can be done in-process with the Python API,
+#                    see gatling_run.py.
+# Revision:          Last change: 18/10/26 :: Arguments of the report validated into one ReportArguments
 # ==============================================================================================================
 
 import getopt
-import logging
+import importlib.util
+import json
+import os
 import sys
+import tempfile
 import time
+from dataclasses import dataclass, field
 from pathlib import Path
 
-import pandas as pd
-from bokeh.layouts import Column
-from bokeh.models import (ColumnDataSource, HoverTool, Legend, LinearAxis,
-                          Range1d)
-from bokeh.models.formatters import DatetimeTickFormatter
-from bokeh.models.widgets import Panel, Tabs
-from bokeh.palettes import d3
-from bokeh.plotting import figure, output_file, save
-
-
-##################################################################################################################
-# Function Name: Generate_Gatling_Log_Df
-# Description  : Consumes the Gatling Logs and Return a clean Dataframe which can be used by other functions
-# @param       : List of Simulation Logs
-# @param       : Float format of Time Difference
-# @return      : Dataframe gat_log_graph_df with columns: [Owner,Scenario,Transaction_Name,Status,ResponseTime,
-#                LocalTime]
-# Author       : Navdit Sharma
-# Comments     : Created on 05/09/2018 
-##################################################################################################################
-def generate_gatling_log_df(simulation_logs_list: list, time_diff: float) -> pd.DataFrame:
-    # Column Names
-    gat_log_col_names = ["Owner", "Scenario", "ThreadId", "JunkCol1",
-                         "Transaction_Name", "StartTime", "EndTime", "Status"]
-
-    # Reading into Dataframe
-    gat_log_df = pd.read_csv(simulation_logs_list[0], sep='\t', header=None, names=gat_log_col_names, dtype=str)
-    for index in range(len(simulation_logs_list) - 1):
-        gat_log_df_1 = pd.read_csv(simulation_logs_list[index + 1], sep='\t', header=None,
-                                   names=gat_log_col_names, dtype=str)
-        gat_log_df = gat_log_df.append(gat_log_df_1)
-
-    # Reset the index of the dataframe
-    gat_log_df = gat_log_df.reset_index(drop=True)
-
-    # Get Dataframe for Graphs
-    gat_log_graph_df = gat_log_df[gat_log_df["Owner"] != "GROUP"]
-    gat_log_graph_df = gat_log_graph_df[gat_log_graph_df["Owner"] != "RUN"]
-
-    # Set correct dtypes
-    gat_log_graph_df[['StartTime', 'EndTime']] = gat_log_graph_df[['StartTime', 'EndTime']].apply(pd.to_numeric)
-
-    # Calculate Response Time
-    gat_log_graph_df["ResponseTime"] = gat_log_graph_df.EndTime - gat_log_graph_df.StartTime
-    gat_log_graph_df[['StartTime', 'EndTime']] = gat_log_graph_df[['StartTime', 'EndTime']].apply(pd.to_numeric)
-    gat_log_graph_df['LocalTime'] = gat_log_graph_df['StartTime'] + (time_diff * 60 * 60 * 1000)
-
-    # Drop Unnecessary Columns
-    gat_log_graph_df = gat_log_graph_df.drop(["JunkCol1"], axis=1)
-    gat_log_graph_df = gat_log_graph_df.drop(["ThreadId"], axis=1)
-    gat_log_graph_df = gat_log_graph_df.drop(["StartTime"], axis=1)
-    gat_log_graph_df = gat_log_graph_df.drop(["EndTime"], axis=1)
-
-    return gat_log_graph_df
-
-
-########################################################################################################################
-
-
-########################################################################################################################
-# Function Name: compute_right_y_axis
-# Description  : Computes the  values of right y-axis in the given scenario df based on given right_y_axis_filter
-# @param       : Dataframe - which has values for that filter. Columns are:
-#                [Owner,Scenario, Transaction_Name, Status, ResponseTime, LocalTime]
-# @param       : right-y-axis filter which can be: Users, Errors, RPS and RPM
-# @param       : granularity at which the values have to be calculated.
-# @return      : Dataframe scenario_metrics_df with columns: [LocalTime, ${filter}]
-# Author       : Navdit Sharma
-# Comments     : Created on 05/09/2018
-########################################################################################################################
-def compute_right_y_axis(scenario_right_y_axis_df: pd.DataFrame, right_y_axis_filter: str, granularity: int) \
-        -> pd.DataFrame:
-    # Initialise Users
-    if right_y_axis_filter in "Users":
-        right_y_axis_value = 0
-
-    # Create temp DF for Errors
-    scenario_right_y_axis_temp_df = pd.DataFrame(columns=["LocalTime", right_y_axis_filter])
-
-    if not scenario_right_y_axis_df.empty:
-        # Start Begin and End Time
-        begin_time = scenario_right_y_axis_df["LocalTime"][scenario_right_y_axis_df.index[0]]
-        end_time = scenario_right_y_axis_df["LocalTime"][scenario_right_y_axis_df.index[-1]]
-
-        # Just get Divisor to know how many loops to go through
-        loop_count = (end_time - begin_time) // granularity
-
-        for i in range(int(loop_count)):
-            end_time = begin_time + granularity
-            tmp_df = scenario_right_y_axis_df[
-                (scenario_right_y_axis_df["LocalTime"] >= begin_time) &
-                (scenario_right_y_axis_df["LocalTime"] <= end_time)]
-            # Apply Filter - Users
-            if right_y_axis_filter in "Users":
-                right_y_axis_value = right_y_axis_value + tmp_df["Scenario"].count()
-            # Apply Filter - Errors/RPS/RPM
-            else:
-                right_y_axis_value = tmp_df["Scenario"].count()
-
-            # Add Value to the dataframe
-            scenario_right_y_axis_temp_df.loc[i + 100000] = [begin_time, right_y_axis_value]
-
-            begin_time = end_time
-
-        # To calculate for the last TimeInterval
-        end_time = scenario_right_y_axis_df["LocalTime"][scenario_right_y_axis_df.index[-1]]
-        tmp_df = scenario_right_y_axis_df[(scenario_right_y_axis_df["LocalTime"] >= begin_time) &
-                                          (scenario_right_y_axis_df["LocalTime"] <= end_time)]
-        # Apply Filter - Users
-        if right_y_axis_filter in "Users":
-            right_y_axis_value = right_y_axis_value + tmp_df["Scenario"].count()
-        # Apply Filter - Errors/RPS/RPM
-        else:
-            right_y_axis_value = tmp_df["Scenario"].count()
-
-        # Fill the last value
-        scenario_right_y_axis_temp_df.loc[-1] = [begin_time, right_y_axis_value]
-
-    # Do a Rolling Mean for RPS - to remove the zig-zag Line
-    if right_y_axis_filter in "RPS":
-        scenario_right_y_axis_temp_df["RPS"] = scenario_right_y_axis_temp_df["RPS"].rolling(window=10).mean()
-        scenario_right_y_axis_temp_df["RPS"] = scenario_right_y_axis_temp_df["RPS"].bfill()
-
-    # Refresh the index
-    scenario_right_y_axis_temp_df = scenario_right_y_axis_temp_df.reset_index(drop=True)
-    scenario_right_y_axis_temp_df = scenario_right_y_axis_temp_df.applymap(str)
-
-    return scenario_right_y_axis_temp_df
-
-########################################################################################################################
-
-
-########################################################################################################################
-# Function Name: merge_right_y_axis_values_with_scenario_df
-# Description  : Computes and merges the values of right y-axis to the given empty scenario df
-# @param       : Empty Dataframe - empty_scenario_metrics_df
-# @param       : Dataframe scenario_df, which is a filtered dataframe of gat_log_df based on given scenario.
-#                Columns are: [Owner,Scenario, Transaction_Name, Status, ResponseTime, LocalTime]
-# @param       : right_y_axis_filter_list values. As of now its limited to: Users, Errors, RPS and RPM
-# @return      : Dataframe scenario_metrics_df with columns: [LocalTime, Users, Errors, RPS, RPM]
-# Author       : Navdit Sharma
-# Comments     : Created on 05/09/2018
-########################################################################################################################
-def merge_right_y_axis_values_with_scenario_df(empty_scenario_metrics_df: pd.DataFrame, scenario_df: pd.DataFrame,
-                                               right_y_axis_filter: str) -> pd.DataFrame:
-    # Errors
-    if right_y_axis_filter in "Errors":
-        # Errors DF
-        scenario_errors_df = scenario_df.loc[scenario_df["Status"] == "KO"]
-        # Compute values of the right y-axis
-        scenario_errors_temp_df = compute_right_y_axis(scenario_errors_df, right_y_axis_filter, 1000)
-        # Merge the dataframe of Errors
-        empty_scenario_metrics_df = \
-            empty_scenario_metrics_df.merge(scenario_errors_temp_df, on='LocalTime', how='outer')
-
-    # Active Users
-    elif right_y_axis_filter in "Users":
-        # Active Users DF
-        scenario_users_df = scenario_df.loc[scenario_df["Owner"] == "USER"]
-        # Compute values of the right y-axis
-        scenario_users_temp_df = compute_right_y_axis(scenario_users_df, right_y_axis_filter, 1000)
-        # Merge the dataframe of Users
-        empty_scenario_metrics_df = \
-            empty_scenario_metrics_df.merge(scenario_users_temp_df, on='LocalTime', how='outer')
-
-    # RPS
-    elif right_y_axis_filter in ("RPS", "RPM"):
-        # RPS DF
-        scenario_rps_df = scenario_df.loc[scenario_df["Owner"] == "REQUEST"]
-        # Compute values of the right y-axis
-        if right_y_axis_filter in "RPS":
-            scenario_users_temp_df = compute_right_y_axis(scenario_rps_df, right_y_axis_filter, 1000)
-        else:
-            scenario_users_temp_df = compute_right_y_axis(scenario_rps_df, right_y_axis_filter, 60000)
-        # Merge the dataframe of Users
-        empty_scenario_metrics_df = \
-            empty_scenario_metrics_df.merge(scenario_users_temp_df, on='LocalTime', how='outer')
-
-    # Return the filled_scenario_metrics_df (Just to remove confusion this step is there)
-    filled_scenario_metrics_df = empty_scenario_metrics_df
-
-    return filled_scenario_metrics_df
-
-########################################################################################################################
-
-
-########################################################################################################################
-# Function Name: calculate_and_merge_transaction_percentiles
-# Description  : Calculates the overall and interval based percentile of the given scenario
-# @param       : Scenario Dataframe, which we got after filtering gat_log_df. Columns are : [Owner,Scenario,Transaction_
-#                Name,Status,ResponseTime, LocalTime]
-# @param       : Dataframe scenario_metrics_df, which have right-y-axis values merged. Columns are: [LocalTime,
-#                ${right-y-axis-filter}]
-# @param       : Percentile, which needs to be calculated for the scenario.
-# @return      : Dataframe scenario_metrics_df with columns: [LocalTime, ${right-y-axis-filter}, ${TransactionNames}]
-# @return      : Dataframe overall_transaction_percentile_df with columns: [Transaction, Percentile]
-# Author       : Navdit Sharma
-# Comments     : Created on 05/09/2018
-########################################################################################################################
-def calculate_and_merge_transaction_percentiles(scenario_df: pd.DataFrame,
-                                                scenario_metrics_df: pd.DataFrame,
-                                                percentile: int) -> (pd.DataFrame, pd.DataFrame):
-    # Divide the percentile to get in the format, which will be given to Dataframe
-    percentile = percentile / 100
-
-    # Transactions OK DF
-    scenario_ok_df = scenario_df.loc[scenario_df["Status"] == "OK"]
-
-    # Overall Percentile
-    overall_transaction_percentile_df = pd.DataFrame(columns=["Transaction", "Percentile"])
-
-    # Get the transaction list in the scenario
-    transactions_list = scenario_ok_df.Transaction_Name.unique().tolist()
-
-    # for i in range(len(scenario_list)):
-    for transaction_index in range(len(transactions_list)):
-        transaction_name = transactions_list[transaction_index]
-
-        # Make DF for transaction
-        temp_df = pd.DataFrame(columns=["LocalTime", "TransactionName"])
-
-        # Create new Transaction Dataframe
-        transaction_df = scenario_ok_df[scenario_ok_df['Transaction_Name'] == transaction_name]
-
-        # Calculate the overall Percentile of the Transaction
-        overall_transaction_percentile_df.loc[transaction_index] = \
-            [transaction_name, transaction_df.ResponseTime.quantile(percentile)]
-
-        # Start Begin and End Time
-        begin_time = transaction_df["LocalTime"][transaction_df.index[0]]
-        end_time = transaction_df["LocalTime"][transaction_df.index[-1]]
-
-        # Just get Divisor
-        loop_count = (end_time - begin_time) // 1000
-
-        for i in range(int(loop_count)):
-            end_time = begin_time + 1000
-            tmp_df = transaction_df[
-                (transaction_df["LocalTime"] >= begin_time) & (transaction_df["LocalTime"] <= end_time)]
-            temp_df.loc[i + 100000] = [begin_time, tmp_df.ResponseTime.quantile(percentile)]
-            begin_time = end_time
-
-        # To calculate for the last TimeInterval
-        end_time = transaction_df["LocalTime"][transaction_df.index[-1]]
-        tmp_df = transaction_df[(transaction_df["LocalTime"] >= begin_time) & (transaction_df["LocalTime"] <= end_time)]
-        temp_df.loc[-1] = [begin_time, tmp_df.ResponseTime.quantile(percentile)]
-
-        # Clean the Dataframe from NaN values
-        temp_df = temp_df.dropna(how='any')
-
-        # Round the Percentile Column
-        temp_df.TransactionName = temp_df.TransactionName.round(2)
-
-        # Refresh the index
-        temp_df = temp_df.reset_index(drop=True)
-
-        # Rename the columns and set datatype to str of all values
-        temp_df.rename(columns={'TransactionName': transaction_name}, inplace=True)
-        temp_df = temp_df.applymap(str)
-
-        # Join two Dataframes
-        scenario_metrics_df = scenario_metrics_df.merge(temp_df, on='LocalTime', how='outer')
-
-    return scenario_metrics_df, overall_transaction_percentile_df
-
-########################################################################################################################
-
-
-########################################################################################################################
-# Function Name: get_scenario_metrics
-# Description  : Calculates the Errors, Percentile of the given scenario
-# @param       : Scenario Name
-# @param       : Gatling Log Dataframe
-# @param       : right_y_axis_filter value. As of now its limited to: Users, Errors, RPS and RPM
-# @param       : percentile
-# @return      : Dataframe scenario_metrics_df with columns: [LocalTime, Errors, ${TransactionNames}]
-# @return      : Dataframe overall_transaction_percentile_df with columns: [Transaction, Percentile]
+# Only light modules here, so that the arguments are checked in milliseconds. pandas, the parser and Bokeh are
+# imported by the code paths, which need them.
+from gatling_log_compression import open_gatling_log
+from gatling_report_options import (AGGREGATE_PERCENTILES, EXPORT_FORMATS, PREVIEW_SAMPLE_RATE, SUMMARY_FORMATS,
+                                    TOP_TRANSACTIONS_RANKINGS, parse_memory_limit, parse_percentiles,
+                                    parse_sample_rate, parse_summary_threshold, parse_top_transactions)
+
+
+USAGE = """Usage:
+    create_gatling_scenario_graphs.py -i <logs separated by ,> [-o <graph html>] [-p <percentiles separated by ,>]
+        [-t <timezone hrs>]
+        [--parser fast|pandas] [-j <processes>] [--store <sqlite file>] [--export <dir> [--format parquet|csv|json]]
+        [--no-graphs] [--summary-only [--summary-format table|json] [--summary-output <file>]]
+        [--assert <[transaction:]metric<value>]... [--phases] [--steady-state] [--sample <rate> | --preview]
+        [--memory-limit <size, e.g. 2GB> [--partition-dir <dir>]] [--top <transactions> [--top-by count|percentile]]
+    create_gatling_scenario_graphs.py compare -i <baseline logs> -i <run logs>... [-o <html>] [-p <percentile>]
+        [-t <timezone hrs>] [--parser fast|pandas] [-j <processes>]
+    create_gatling_scenario_graphs.py trend --store <sqlite file> [-o <html>] [-p 50|90|95|99] [--last <runs>]
+        [-s <scenario>] [-n <transaction>]
+    create_gatling_scenario_graphs.py batch -r <root folder> [-o <html name>] [-p <percentiles separated by ,>]
+        [-t <timezone hrs>]
+        [--parser fast|pandas] [-j <processes>] [--force]
+    create_gatling_scenario_graphs.py aggregate -i <logs separated by ,> [-o <partial file>] [-t <timezone hrs>]
+        [--parser fast|pandas] [-j <processes>] [--memory-limit <size, e.g. 2GB>]
+    create_gatling_scenario_graphs.py merge -i <partial files separated by ,> [-o <graph html>]
+        [-p <percentiles separated by ,>] [--summary-only [--summary-format table|json] [--summary-output <file>]]
+        [--top <transactions> [--top-by count|percentile]]"""
+
+
+########################################################################################################################
+# Class Name   : ReportArguments
+# Description  : Arguments of the report of a run, as validated by validate_user_given_arguments. The defaults are
+#                the defaults of the command line.
 # Author       : Navdit Sharma
-# Comments     : Created on 05/09/2018
-########################################################################################################################
-def get_scenario_metrics(scenario_name: str, gatling_log_df: pd.DataFrame,
-                         right_y_axis_filter: str, percentile: int) -> (pd.DataFrame, pd.DataFrame):
-    # Create new Scenario Dataframe
-    cond_col = gatling_log_df['Scenario'] == scenario_name
-    scenario_temp_df = gatling_log_df[cond_col]
-
-    # New Dataframe
-    scenario_metrics_df = pd.DataFrame(columns=["LocalTime"])
-
-    # Calculate and Merge Right-Y-Axis Values
-    scenario_metrics_df = merge_right_y_axis_values_with_scenario_df(scenario_metrics_df,
-                                                                     scenario_temp_df, right_y_axis_filter)
-
-    # Calculate and Merge Left-Y-Axis Values and get overall Percentile values.
-    scenario_metrics_df, overall_transaction_percentile_df = calculate_and_merge_transaction_percentiles(
-        scenario_temp_df, scenario_metrics_df, percentile)
-
-    # Changing LocalTime to DateTime and sort the Time in Ascending order
-    scenario_metrics_df['LocalTime'] = pd.to_datetime(scenario_metrics_df['LocalTime'], unit='ms')
-    scenario_metrics_df = scenario_metrics_df.sort_values("LocalTime", ascending=True)
-
-    # Add the Steady State Users which are not filled -- This is for smoothing of graph.
-    if right_y_axis_filter not in "Errors":
-        scenario_metrics_df[right_y_axis_filter] = scenario_metrics_df[right_y_axis_filter].astype(float)
-        scenario_metrics_df[right_y_axis_filter] = scenario_metrics_df[right_y_axis_filter].interpolate().round(3)
-        scenario_metrics_df[right_y_axis_filter] = scenario_metrics_df[right_y_axis_filter].bfill()
-        # Fill NaN values with zero in case all the values are NaN
-        scenario_metrics_df = scenario_metrics_df.fillna(0)
-        # Convert the column to String
-        scenario_metrics_df[right_y_axis_filter] = scenario_metrics_df[right_y_axis_filter].astype(str)
-
-    # Fill NaN values with zero
-    scenario_metrics_df = scenario_metrics_df.fillna(0)
-
-    # Return Two Dataframes
-    return scenario_metrics_df, overall_transaction_percentile_df
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+@dataclass
+class ReportArguments:
+    # Simulation Log Files, separated by ",", and path of the Graph
+    simulation_logs: str = ""
+    output_graph: str = 'GatlingScenarioGraphs.html'
+    # Percentiles, Time Difference, Log Parser (fast or pandas) and Number of Parser Processes
+    percentiles: list = field(default_factory=lambda: [95])
+    time_diff: float = 0
+    parser: str = "fast"
+    jobs: int = os.cpu_count() or 1
+    # If given, path of the Trend Store to keep the run in
+    store_path: str = ""
+    # If given, directory to export the metrics to, the Export Format, and whether to skip the graphs
+    export_dir: str = ""
+    export_format: str = "parquet"
+    no_graphs: bool = False
+    # Whether to only give the transaction summary, its format and output file ("" for the console), and the
+    # thresholds to check it against
+    summary_only: bool = False
+    summary_format: str = "table"
+    summary_output: str = ""
+    thresholds: list = field(default_factory=list)
+    # Whether to print the summary of the run phases, and whether to only keep the steady state
+    phases: bool = False
+    steady_state: bool = False
+    # Sample Rate of a preview, 1 to read the whole run
+    sample_rate: float = 1
+    # Memory Limit in bytes (0 to hold the run in memory) and, if given, the folder of the scenario partitions of
+    # the out-of-core mode
+    memory_limit: int = 0
+    partition_dir: str = ""
+    # Number of Top Transactions drawn as their own lines (None for all of them) and their Ranking
+    top: int = None
+    top_by: str = "count"
 
 
 ########################################################################################################################
@@ -378,6 +137,12 @@ def check_logs_path(input_logs_list: list) -> list:
                      "please don't leave any space before or after ','."
                      "\nCurrent Input looks like - {}".format(input_logs_list))
 
+        # Check if the log can be read. Compressed logs are read as they are, but zstd needs zstandard installed.
+        try:
+            open_gatling_log(file_loc).close()
+        except ValueError as error:
+            sys.exit(str(error))
+
     return simulation_logs_list
 
 
@@ -403,36 +168,55 @@ def strip_list(list_input: list) -> list:
 # Function Name: validate_user_given_arguments
 # Description  : Validates the input given by the user to the python script
 # @param       : Arguments given by user
-# @return      : List of the Simulation Log Files
-# @return      : If given, path of the Graph, where the user wants to get generated
+# @return      : Report Arguments
 # Author       : Navdit Sharma
 # Comments     : Created on 05/09/2018
 ########################################################################################################################
-def validate_user_given_arguments(argv):
+def validate_user_given_arguments(argv) -> ReportArguments:
     # Arguments
     version = '1.0'
     verbose = False
-    output_graph_path = 'GatlingScenarioGraphs.html'
-    input_log = ""
+    arguments = ReportArguments()
     input_percentile = 95
     input_time_diff = 0
-
-    # print('ARGV      : {}'.format(sys.argv[1:]))
-
-    options, remainder = getopt.getopt(sys.argv[1:], 'i:p:o:t:v', ['input=',
-                                                                   'percentile=',
-                                                                   'output=',
-                                                                   'timezone=',
-                                                                   'verbose',
-                                                                   'version=',
-                                                                   ])
+    input_jobs = arguments.jobs
+
+    options, remainder = getopt.getopt(argv, 'i:p:o:t:j:vh', ['input=',
+                                                              'percentile=',
+                                                              'output=',
+                                                              'timezone=',
+                                                              'verbose',
+                                                              'version=',
+                                                              'parser=',
+                                                              'jobs=',
+                                                              'store=',
+                                                              'export=',
+                                                              'format=',
+                                                              'no-graphs',
+                                                              'summary-only',
+                                                              'summary-format=',
+                                                              'summary-output=',
+                                                              'assert=',
+                                                              'phases',
+                                                              'steady-state',
+                                                              'sample=',
+                                                              'preview',
+                                                              'memory-limit=',
+                                                              'partition-dir=',
+                                                              'top=',
+                                                              'top-by=',
+                                                              'help',
+                                                              ])
     # print('OPTIONS   : {}'.format(options))
 
     for opt, arg in options:
-        if opt in ('-o', '--output_graph'):
-            output_graph_path = arg
+        if opt in ('-h', '--help'):
+            print(USAGE)
+            sys.exit(0)
+        elif opt in ('-o', '--output_graph'):
+            arguments.output_graph = arg
         elif opt in ('-i', '--simulation_log'):
-            input_log = arg
+            arguments.simulation_logs = arg
         elif opt in ('-p', '--percentile'):
             input_percentile = arg
         elif opt in ('-v', '--verbose'):
@@ -441,434 +225,603 @@ def validate_user_given_arguments(argv):
             version = arg
         elif opt in ('-t', '--timezone'):
             input_time_diff = arg
+        elif opt == '--parser':
+            if arg not in ("fast", "pandas"):
+                sys.exit("Argument --parser has to be either fast or pandas. Given value is {}".format(arg))
+            arguments.parser = arg
+        elif opt in ('-j', '--jobs'):
+            input_jobs = arg
+        elif opt == '--store':
+            arguments.store_path = arg
+        elif opt == '--export':
+            arguments.export_dir = arg
+        elif opt == '--format':
+            if arg not in EXPORT_FORMATS:
+                sys.exit("Argument --format has to be one of {}. Given value is {}".format(", ".join(EXPORT_FORMATS),
+                                                                                          arg))
+            arguments.export_format = arg
+        elif opt == '--no-graphs':
+            arguments.no_graphs = True
+        elif opt == '--summary-only':
+            arguments.summary_only = True
+        elif opt == '--summary-format':
+            if arg not in SUMMARY_FORMATS:
+                sys.exit("Argument --summary-format has to be one of {}. Given value is {}".format(
+                    ", ".join(SUMMARY_FORMATS), arg))
+            arguments.summary_format = arg
+        elif opt == '--summary-output':
+            arguments.summary_output = arg
+        elif opt == '--assert':
+            try:
+                arguments.thresholds.append(parse_summary_threshold(arg))
+            except ValueError as error:
+                sys.exit(str(error))
+        elif opt == '--phases':
+            arguments.phases = True
+        elif opt == '--steady-state':
+            arguments.steady_state = True
+        elif opt == '--sample':
+            try:
+                arguments.sample_rate = parse_sample_rate(arg)
+            except ValueError as error:
+                sys.exit(str(error))
+        elif opt == '--preview':
+            arguments.sample_rate = PREVIEW_SAMPLE_RATE
+        elif opt == '--memory-limit':
+            try:
+                arguments.memory_limit = parse_memory_limit(arg)
+            except ValueError as error:
+                sys.exit(str(error))
+        elif opt == '--partition-dir':
+            arguments.partition_dir = arg
+        elif opt == '--top':
+            try:
+                arguments.top = parse_top_transactions(arg)
+            except ValueError as error:
+                sys.exit(str(error))
+        elif opt == '--top-by':
+            if arg not in TOP_TRANSACTIONS_RANKINGS:
+                sys.exit("Argument --top-by has to be one of {}. Given value is {}".format(
+                    ", ".join(TOP_TRANSACTIONS_RANKINGS), arg))
+            arguments.top_by = arg
+
+    try:
+        arguments.percentiles = parse_percentiles(input_percentile)
+    except ValueError as error:
+        sys.exit(str(error))
+
+    if arguments.export_dir and arguments.export_format == "parquet" and importlib.util.find_spec("pyarrow") is None \
+            and importlib.util.find_spec("fastparquet") is None:
+        sys.exit("Parquet export needs pyarrow or fastparquet. Please install one of them:\n    pip install pyarrow")
+
+    # A preview is not the run: it is neither kept nor exported
+    if arguments.sample_rate < 1 and (arguments.store_path or arguments.export_dir):
+        sys.exit("A sampled preview (--sample or --preview) can't be stored (--store) or exported (--export)")
+
+    # Out of core, the run is never in memory as a whole
+    if arguments.partition_dir and not arguments.memory_limit:
+        sys.exit("Argument --partition-dir needs --memory-limit")
 
     # print('VERSION   : {}'.format(version))
     # print('VERBOSE   : {}'.format(verbose))
-    # print('OUTPUT    : {}'.format(output_graph_path))
-    # print('LOG FILES : {}'.format(input_log))
+    # print('OUTPUT    : {}'.format(arguments.output_graph))
+    # print('LOG FILES : {}'.format(arguments.simulation_logs))
     # print('REMAINING : {}'.format(remainder))
 
-    return input_log, output_graph_path, int(input_percentile), float(input_time_diff)
+    arguments.time_diff = float(input_time_diff)
+    arguments.jobs = int(input_jobs)
+
+    return arguments
 
 
 ########################################################################################################################
 
 
 ########################################################################################################################
-# Function Name: get_list_of_scenarios
-# Description  : Gives the sorted list of the scenarios, which were run in the Gatling Test
-# @param       : Gatling Log Dataframe
-# @return      : Sorted List of Scenarios
+# Function Name: validate_compare_arguments
+# Description  : Validates the input given by the user to the compare command
+# @param       : Arguments given by user, after the command
+# @return      : List of Runs, each a list of Simulation Log Files. The first run is the baseline.
+# @return      : Path of the Comparison Graph, Percentile, Time Difference, Log Parser and Number of Parser Processes
 # Author       : Navdit Sharma
-# Comments     : Created on 20/09/2018
+# Comments     : Created on 18/10/2026
 ########################################################################################################################
-def get_list_of_scenarios(gatling_log_df: pd.DataFrame) -> list:
-    sorted_scenario_list = gatling_log_df.Scenario.unique().tolist()
-    sorted_scenario_list.sort()
-    return sorted_scenario_list
+def validate_compare_arguments(argv: list):
+    output_graph_path = 'GatlingRunComparison.html'
+    input_logs = []
+    input_percentile = 95
+    input_time_diff = 0
+    input_parser = "fast"
+    input_jobs = os.cpu_count() or 1
+
+    options, remainder = getopt.getopt(argv, 'i:p:o:t:j:h', ['input=',
+                                                            'percentile=',
+                                                            'output=',
+                                                            'timezone=',
+                                                            'parser=',
+                                                            'jobs=',
+                                                            'help',
+                                                            ])
 
+    for opt, arg in options:
+        if opt in ('-h', '--help'):
+            print(USAGE)
+            sys.exit(0)
+        elif opt in ('-o', '--output'):
+            output_graph_path = arg
+        elif opt in ('-i', '--input'):
+            input_logs.append(arg)
+        elif opt in ('-p', '--percentile'):
+            input_percentile = arg
+        elif opt in ('-t', '--timezone'):
+            input_time_diff = arg
+        elif opt == '--parser':
+            if arg not in ("fast", "pandas"):
+                sys.exit("Argument --parser has to be either fast or pandas. Given value is {}".format(arg))
+            input_parser = arg
+        elif opt in ('-j', '--jobs'):
+            input_jobs = arg
 
-########################################################################################################################
+    if len(input_logs) < 2:
+        sys.exit("Please provide at least two runs to compare, each with its own argument -i. "
+                 "The first one is the baseline.")
 
+    runs_list = [check_logs_path(input_log) for input_log in input_logs]
 
-########################################################################################################################
-# Function Name: remove_dollar_sign_and_get_column_names_dict
-# Description  : It removes the dollar sign from the column name and transaction names of df and returns the dictionary
-#                of the old and new column names. Reason - Having "$" in the name of the column screws the Hover
-#                Tool of Bokeh. Having dictionary will help to keep the legend names same as the ones found in Gatling
-#                Report, but Hover tool
-#                will show the name without "$" sign.
-# @param       : Scenario Metrics Dataframe and Overall Percentile Dataframe.
-# @return      : Dictionary of Column Names
-# Author       : Navdit Sharma
-# Comments     : Created on 05/09/2018
-########################################################################################################################
-def remove_dollar_sign_and_get_column_names_dict(scenario_metrics_df: pd.DataFrame,
-                                                 overall_percentile_df: pd.DataFrame) -> dict:
-    col_name_dict = {}
-    for column in scenario_metrics_df:
-        new_col_name = column.replace("$", "")
-        scenario_metrics_df.rename(columns={column: new_col_name}, inplace=True)
-        overall_percentile_df['Transaction'] = \
-            overall_percentile_df['Transaction'].replace(column, new_col_name)
-        col_name_dict[new_col_name] = column
-
-    return col_name_dict
+    return runs_list, output_graph_path, int(input_percentile), float(input_time_diff), input_parser, \
+        int(input_jobs)
 
 
 ########################################################################################################################
 
 
 ########################################################################################################################
-# Function Name: get_y_range_of_graph
-# Description  : Gives the Right and Left Y-axis range of the graph based on the max value in dataframe
-# @param       : Scenario Metrics Dataframe
-# @param       : right_y_axis_filters_list - List of rigth y-Axis filters
-# @return      : Left and Right Y-Axis Range of Bokeh Graph
+# Function Name: main_compare
+# Description  : Compares two or more runs: one overlay graph per scenario and a per-transaction delta table
+#                against the baseline. Only the cached aggregates of the runs are used, so runs parsed before are
+#                not parsed again.
+# @param       : Arguments given by user, after the command
+# @return      : Null
 # Author       : Navdit Sharma
-# Comments     : Created on 05/09/2018
+# Comments     : Created on 18/10/2026
 ########################################################################################################################
-def get_y_range_of_graph(scenario_metrics_df: pd.DataFrame, right_y_axis_filter: str) -> (int, int):
-    tmp_max_val_df = scenario_metrics_df
-    tmp_max_val_df = tmp_max_val_df.apply(pd.to_numeric)
-
-    # Right y-Axis Range
-    right_y_axis_range = tmp_max_val_df[right_y_axis_filter].max() + 1
-
-    # Left y-axis Range
-    tmp_max_val_df = tmp_max_val_df.drop(["LocalTime"], axis=1)
+def main_compare(argv: list):
+    runs_list, output_graph, percentile, time_diff, parser, jobs = validate_compare_arguments(argv)
+    print("Gatling Log Files validated successfully...")
 
-    # Drop Right-Y-Axis Columns
-    tmp_max_val_df = tmp_max_val_df.drop([right_y_axis_filter], axis=1)
+    from gatling_run_aggregates import (compare_run_transactions, get_run_label, get_unique_run_labels,
+                                        load_run_aggregates)
 
-    left_y_axis_range = (0, tmp_max_val_df.values.max() + 50)
+    # Aggregates of every run
+    runs_aggregates = []
+    for simulation_logs_list in runs_list:
+        print("Loading aggregates of {}...".format(", ".join(simulation_logs_list)))
+        try:
+            runs_aggregates.append(load_run_aggregates(simulation_logs_list, time_diff, [percentile], parser, jobs))
+        except ValueError as error:
+            sys.exit(str(error))
+    run_labels = get_unique_run_labels([get_run_label(simulation_logs_list) for simulation_logs_list in runs_list])
 
-    return left_y_axis_range, right_y_axis_range
+    # Overlay Graphs and Delta Table
+    from gatling_scenario_report import build_compare_report, save_report
+    delta_df = compare_run_transactions(runs_aggregates, run_labels, percentile)
+    save_report(build_compare_report(runs_aggregates, run_labels, delta_df, percentile), output_graph)
 
 
 ########################################################################################################################
 
 
 ########################################################################################################################
-# Function Name: get_color_palette
-# Description  : To set the color palette, which will be used in plotting Bokeh Graph
-# @param       : Scenario Metrics Dataframe
-# @param       : Scenario Name, for which the Color Palette has to be set
-# @return      : Color Palette
+# Function Name: validate_trend_arguments
+# Description  : Validates the input given by the user to the trend command
+# @param       : Arguments given by user, after the command
+# @return      : Path of the Trend Store, Path of the Trend Graph, Percentile, Number of last runs, Scenario Name and
+#                Transaction Name (both optional, "" for all)
 # Author       : Navdit Sharma
-# Comments     : Created on 05/09/2018
+# Comments     : Created on 18/10/2026
 ########################################################################################################################
-def get_color_palette(scenario_metrics_df: pd.DataFrame, scenario: str) -> list:
-    # Number of Lines to plot
-    num_lines = len(scenario_metrics_df.columns)
+def validate_trend_arguments(argv: list):
+    store_path = ""
+    output_graph_path = 'GatlingTrend.html'
+    input_percentile = 95
+    last_runs = 50
+    scenario = ""
+    transaction_name = ""
+
+    options, remainder = getopt.getopt(argv, 'p:o:s:n:h', ['store=',
+                                                          'percentile=',
+                                                          'output=',
+                                                          'last=',
+                                                          'scenario=',
+                                                          'transaction=',
+                                                          'help',
+                                                          ])
 
-    # Get the colors
-    if num_lines > 20:
-        raise Exception("At present maximum of 19 transactions/scenario is permissible. "
-                        "Please check Scenario {}, which has {} transactions".format(scenario, num_lines))
-    elif num_lines < 3:
-        color_palette = ['#1f77b4', '#2ca02c']
-    else:
-        color_palette = d3['Category20'][num_lines]
+    for opt, arg in options:
+        if opt in ('-h', '--help'):
+            print(USAGE)
+            sys.exit(0)
+        elif opt == '--store':
+            store_path = arg
+        elif opt in ('-o', '--output'):
+            output_graph_path = arg
+        elif opt in ('-p', '--percentile'):
+            input_percentile = arg
+        elif opt == '--last':
+            last_runs = arg
+        elif opt in ('-s', '--scenario'):
+            scenario = arg
+        elif opt in ('-n', '--transaction'):
+            transaction_name = arg
 
-        # Removing Red Color which is on index 5
-        if "#d62728" in color_palette:
-            color_palette.remove("#d62728")
+    if not store_path:
+        sys.exit("Please provide the trend store to read with argument --store")
+    check_path(Path(store_path))
+    if int(input_percentile) not in AGGREGATE_PERCENTILES:
+        sys.exit("The trend store keeps the percentiles {}. Given percentile is {}".format(
+            ", ".join(str(percentile) for percentile in AGGREGATE_PERCENTILES), input_percentile))
 
-    return color_palette
+    return store_path, output_graph_path, int(input_percentile), int(last_runs), scenario, transaction_name
 
 
 ########################################################################################################################
 
 
 ########################################################################################################################
-# Function Name: set_hover_tool_tips
-# Description  : Set the properties of the hover tool tips.
-# @return      : hover_tool_tips
+# Function Name: main_trend
+# Description  : Renders the trend of percentile, throughput and errors of every transaction over the last runs of
+#                the trend store. The raw logs are not needed.
+# @param       : Arguments given by user, after the command
+# @return      : Null
 # Author       : Navdit Sharma
-# Comments     : Created on 05/09/2018
+# Comments     : Created on 18/10/2026
 ########################################################################################################################
-def set_hover_tool_tips() -> object:
-    hover_tool_tips = HoverTool(
-        tooltips=[
-            ('Time', '$x{%F %T}'),
-            ("Metric", "$name"),
-            ("Value", "@$name")
-        ],
-        formatters={'$x': 'datetime', '@$name': 'printf'},
-        mode='mouse'  # display a tooltip whenever the cursor is vertically in line with a glyph
-    )
+def main_trend(argv: list):
+    store_path, output_graph, percentile, last_runs, scenario, transaction_name = validate_trend_arguments(argv)
 
-    return hover_tool_tips
+    from gatling_trend_store import load_trend
+
+    trend_df = load_trend(store_path, last_runs, scenario, transaction_name)
+    print("Loaded {} runs from the trend store...".format(trend_df["run_id"].nunique()))
+    if trend_df.empty:
+        sys.exit("Trend store {} has no matching runs".format(store_path))
+
+    # One tab per metric, one graph per scenario
+    from gatling_scenario_report import build_trend_report, save_report
+    save_report(build_trend_report(trend_df, percentile), output_graph)
 
 
 ########################################################################################################################
 
 
 ########################################################################################################################
-# Function Name: plot_new_graph
-# Description  : Set the properties of the hover tool tips.
-# @param       : x_axis_label - Label of X-Axis
-# @param       : x_axis_type
-# @param       : y_axis_label - Label of Y-Axis
-# @param       : plot_width - Width of the graph to be plotted
-# @param       : plot_height - Height of the graph to be plotted
-# @param       : left_y_range - Range of Y-Axis
-# @param       : toolbar_location - Location of Bokeh Toolbar
-# @param       : tools_to_show - Bokeh tools, which you would like to show on graph
-# @return      : figure
+# Function Name: validate_batch_arguments
+# Description  : Validates the input given by the user to the batch command
+# @param       : Arguments given by user, after the command
+# @return      : Root Folder, File Name of the reports, List of Percentiles, Time Difference, Log Parser (fast or
+#                pandas), Number of Worker Processes and whether to regenerate the reports, which are up to date
 # Author       : Navdit Sharma
-# Comments     : Created on 05/09/2018
+# Comments     : Created on 18/10/2026
 ########################################################################################################################
-def plot_new_graph(x_axis_label: str, x_axis_type: str, y_axis_label: str, plot_width: int, plot_height: int,
-                   left_y_range: int, toolbar_location: str, tools_to_show: str) -> figure():
-    plot = figure(x_axis_label=x_axis_label,
-                  x_axis_type=x_axis_type,
-                  y_axis_label=y_axis_label,
-                  plot_width=plot_width,
-                  plot_height=plot_height,
-                  y_range=left_y_range,
-                  toolbar_location=toolbar_location,
-                  tools=tools_to_show)
+def validate_batch_arguments(argv: list):
+    root = ""
+    output_name = 'GatlingScenarioGraphs.html'
+    input_percentile = 95
+    input_time_diff = 0
+    input_parser = "fast"
+    input_jobs = os.cpu_count() or 1
+    force = False
+
+    options, remainder = getopt.getopt(argv, 'r:p:o:t:j:h', ['root=',
+                                                            'percentile=',
+                                                            'output=',
+                                                            'timezone=',
+                                                            'parser=',
+                                                            'jobs=',
+                                                            'force',
+                                                            'help',
+                                                            ])
 
-    return plot
+    for opt, arg in options:
+        if opt in ('-h', '--help'):
+            print(USAGE)
+            sys.exit(0)
+        elif opt in ('-r', '--root'):
+            root = arg
+        elif opt in ('-o', '--output'):
+            if Path(arg).name != arg:
+                sys.exit("Argument -o of batch is the file name of the reports, written in every run folder. "
+                         "Given value is {}".format(arg))
+            output_name = arg
+        elif opt in ('-p', '--percentile'):
+            input_percentile = arg
+        elif opt in ('-t', '--timezone'):
+            input_time_diff = arg
+        elif opt == '--parser':
+            if arg not in ("fast", "pandas"):
+                sys.exit("Argument --parser has to be either fast or pandas. Given value is {}".format(arg))
+            input_parser = arg
+        elif opt in ('-j', '--jobs'):
+            input_jobs = arg
+        elif opt == '--force':
+            force = True
 
+    if not root:
+        sys.exit("Please provide the root folder of the Gatling results with argument -r")
+    check_path(Path(root))
+    try:
+        percentiles = parse_percentiles(input_percentile)
+    except ValueError as error:
+        sys.exit(str(error))
 
-########################################################################################################################
+    return root, output_name, percentiles, float(input_time_diff), input_parser, int(input_jobs), force
 
 
 ########################################################################################################################
-# Function Name: set_graph_and_legend_properties
-# Description  : Sets the Properties of the graph and the legend of the graph
-# @param       : Graph and the legend it will be using, Scenario Name
-# @return      : Returns the plotted graph with the properties
-# Author       : Navdit Sharma
-# Comments     : Created on 05/09/2018
+
+
 ########################################################################################################################
-def set_graph_and_legend_properties(plot_graph: figure(), legends: list, scenario: str) -> figure():
-    # Add Tool - Hovertool
-    # Hover Tool Properties
-    hover_tool_tips = set_hover_tool_tips()
-    plot_graph.add_tools(hover_tool_tips)
-
-    # Legend related formatting
-    legend = Legend(items=legends, location=(0, 0))
-    legend.click_policy = "hide"
-    legend.background_fill_color = "#2F2F2F"
-    legend.label_text_color = "white"
-    legend.border_line_color = "#2F2F2F"
-    legend.inactive_fill_color = "#2F2F2F"
-    plot_graph.add_layout(legend, 'right')
-
-    # X-Axis related formatting
-    plot_graph.xgrid.grid_line_color = "white"
-    plot_graph.xgrid.grid_line_dash = [6, 4]
-    plot_graph.xgrid.grid_line_alpha = .3
-    plot_graph.xaxis.axis_line_color = "white"
-    plot_graph.xaxis.axis_label_text_color = "white"
-    plot_graph.xaxis.major_label_text_color = "white"
-    plot_graph.xaxis.major_tick_line_color = "white"
-    plot_graph.xaxis.minor_tick_line_color = "white"
-    plot_graph.xaxis.formatter = DatetimeTickFormatter(
-        microseconds=["%H:%M:%S"],
-        milliseconds=["%H:%M:%S"],
-        seconds=["%H:%M:%S"],
-        minsec=["%H:%M:%S"],
-        minutes=["%H:%M"],
-        hourmin=["%H:%M"],
-        hours=["%H:%M"],
-        days=["%H:%M"],
-        months=["%H:%M"],
-        years=["%H:%M"], )
-
-    # Y-axis related formatting
-    plot_graph.ygrid.grid_line_color = "white"
-    plot_graph.ygrid.grid_line_dash = [6, 4]
-    plot_graph.ygrid.grid_line_alpha = .3
-    plot_graph.yaxis.axis_line_color = "white"
-    plot_graph.yaxis.axis_label_text_color = "white"
-    plot_graph.yaxis.major_label_text_color = "white"
-    plot_graph.yaxis.major_tick_line_color = "white"
-    plot_graph.yaxis.minor_tick_line_color = "white"
-
-    # Graph related Formatting
-    plot_graph.min_border_left = 80
-    plot_graph.title.text = scenario
-    plot_graph.title.text_color = "white"
-    plot_graph.title.text_font = "times"
-    plot_graph.title.text_font_style = "normal"
-    plot_graph.title.text_font_size = "14pt"
-    plot_graph.title.align = "center"
-    plot_graph.background_fill_color = '#2F2F2F'
-    plot_graph.border_fill_color = '#2F2F2F'
-    plot_graph.outline_line_color = '#444444'
-
-    return plot_graph
-
-
-########################################################################################################################
-
-
-########################################################################################################################
-# Function Name: sort_transaction_names_and_remove_localtime_col
-# Description  : Sorts the transactions names in Alphabetical order and removes Localtime Column
-# @param       : Right Y-Axis Filter
-# @param       : List of Column Names
-# @param       : Sort -- True, if you want to sort the column names. Else the Legend will have the order of
-#                transactions in which they were executed. Default value is True.
-# @return      : List of Column Names, in the order in which they will be plotted and shown on Legend
+# Function Name: main_batch
+# Description  : Generates the scenario reports of all the runs under a root folder with a pool of worker
+#                processes, skipping the runs whose reports are up to date
+# @param       : Arguments given by user, after the command
+# @return      : Null
 # Author       : Navdit Sharma
-# Comments     : Created on 05/09/2018
+# Comments     : Created on 18/10/2026
 ########################################################################################################################
-def sort_transaction_names_and_remove_localtime_col(right_y_axis_filter: str,
-                                                    col_list: list, sort: bool = True) -> list:
-    if sort:
-        # Remove the right y axis filter
-        col_list.remove(right_y_axis_filter)
-        # Remove LocalTime
-        col_list.remove("LocalTime")
-        # Sort the List
-        col_list.sort()
-        # Insert Right Y axis Filter in the beginning so that its always on top in Legend
-        col_list.insert(0, right_y_axis_filter)
-    else:
-        # Remove LocalTime
-        col_list.remove("LocalTime")
+def main_batch(argv: list):
+    root, output_name, percentiles, time_diff, parser, jobs, force = validate_batch_arguments(argv)
+
+    from gatling_batch import run_batch
+    counts = run_batch(root, output_name, percentiles, time_diff, parser, jobs, force)
+    print("Batch completed: {generated} generated, {skipped} up to date, {failed} failed".format(**counts))
 
-    return col_list
+    if counts["failed"]:
+        sys.exit("{} runs failed".format(counts["failed"]))
 
 
 ########################################################################################################################
 
 
 ########################################################################################################################
-# Function Name: plot_graph_by_transaction
-# Description  : Plots the graph of all the transactions in a given scenario
-# @param       : scenario_graph Figure
-# @param       : Right Y-Axis Filter
-# @param       : Percentile
-# @return      : Figure of Plotted graph along with Legend in Legend List
+# Function Name: validate_aggregate_arguments
+# Description  : Validates the input given by the user to the aggregate command
+# @param       : Arguments given by user, after the command
+# @return      : List of Simulation Log Files, Path of the Partial ("" for the default one, next to the first log),
+#                Time Difference, Log Parser (fast or pandas), Number of Parser Processes and Memory Limit in bytes
+#                (0 to hold the run in memory)
 # Author       : Navdit Sharma
-# Comments     : Created on 05/09/2018
+# Comments     : Created on 18/10/2026
 ########################################################################################################################
-def plot_graph_by_transaction(scenario_metrics_df: pd.DataFrame, overall_percentile_df: pd.DataFrame, scenario: str,
-                              right_y_axis_filter: str, percentile: int) -> figure():
-    # Remove $ from the names of column names of scenario_metrics_df and
-    # Rename the Transactions of overall_percentile_df
-    col_name_dict = remove_dollar_sign_and_get_column_names_dict(scenario_metrics_df, overall_percentile_df)
-
-    # Define Y-Axis Range of the Graph
-    (left_y_range, right_y_range) = get_y_range_of_graph(scenario_metrics_df, right_y_axis_filter)
-
-    # Get the colors for the Lines of the Graph
-    color_palette = get_color_palette(scenario_metrics_df, scenario)
-
-    # Tools to be available in graph
-    tools_to_show = 'box_zoom,reset,save'
-
-    # create a new plot with a title and axis labels
-    scenario_graph = plot_new_graph('Time', 'datetime', 'Response Time (ms)', 1900, 400, left_y_range, 'below',
-                                    tools_to_show)
-
-    # Disabling Hover Tool
-    scenario_graph.toolbar.active_inspect = None
-
-    # Index to go through Color Palette
-    color_index = 0
+def validate_aggregate_arguments(argv: list):
+    input_logs = ""
+    partial_path = ""
+    input_time_diff = 0
+    input_parser = "fast"
+    input_jobs = os.cpu_count() or 1
+    memory_limit = 0
+
+    options, remainder = getopt.getopt(argv, 'i:o:t:j:h', ['input=',
+                                                          'output=',
+                                                          'timezone=',
+                                                          'parser=',
+                                                          'jobs=',
+                                                          'memory-limit=',
+                                                          'help',
+                                                          ])
 
-    # get all the legends in one list
-    legend_list = []
+    for opt, arg in options:
+        if opt in ('-h', '--help'):
+            print(USAGE)
+            sys.exit(0)
+        elif opt in ('-i', '--input'):
+            input_logs = arg
+        elif opt in ('-o', '--output'):
+            partial_path = arg
+        elif opt in ('-t', '--timezone'):
+            input_time_diff = arg
+        elif opt == '--parser':
+            if arg not in ("fast", "pandas"):
+                sys.exit("Argument --parser has to be either fast or pandas. Given value is {}".format(arg))
+            input_parser = arg
+        elif opt in ('-j', '--jobs'):
+            input_jobs = arg
+        elif opt == '--memory-limit':
+            try:
+                memory_limit = parse_memory_limit(arg)
+            except ValueError as error:
+                sys.exit(str(error))
 
-    # Sort the Transactions names in Alphabetical order
-    transaction_col_list = sort_transaction_names_and_remove_localtime_col(right_y_axis_filter,
-                                                                           list(scenario_metrics_df.columns))
+    return check_logs_path(input_logs), partial_path, float(input_time_diff), input_parser, int(input_jobs), \
+        memory_limit
 
-    # Source of Graphs
-    source = ColumnDataSource(scenario_metrics_df)
 
-    # Plot graph transaction-wise
-    for col_name in transaction_col_list:
-        if col_name in right_y_axis_filter:
-            # Get the legend name
-            legend_name = col_name
+########################################################################################################################
 
-            # Setting the second y axis range name and range
-            scenario_graph.extra_y_ranges = {col_name: Range1d(0, right_y_range)}
 
-            # Adding the second axis to the plot.
-            scenario_graph.add_layout(LinearAxis(y_range_name=col_name, axis_label=col_name), 'right')
+########################################################################################################################
+# Function Name: main_aggregate
+# Description  : Turns the logs of one injector into a partial, to be merged with the partials of the other
+#                injectors by the merge command
+# @param       : Arguments given by user, after the command
+# @return      : Null
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def main_aggregate(argv: list):
+    simulation_logs_list, partial_path, time_diff, parser, jobs, memory_limit = validate_aggregate_arguments(argv)
+    print("Gatling Log Files validated successfully...")
 
-            # PlotGraph
-            if col_name in "Errors":
-                axis_color = "#d62728"
-            else:
-                axis_color = "yellow"
-            plot_graph = scenario_graph.line('LocalTime',
-                                             col_name,
-                                             source=source,
-                                             line_width=2,
-                                             color=axis_color,
-                                             y_range_name=col_name,
-                                             name=col_name)
+    from gatling_run import GatlingRun
+    from gatling_run_partials import compute_run_partial, get_partial_path, write_run_partial
 
+    print("Processing Gatling Log Files...")
+    try:
+        if memory_limit:
+            from gatling_run_partitions import PartitionedGatlingRun
+
+            with tempfile.TemporaryDirectory(prefix="gatling_partitions_") as partition_dir:
+                run = PartitionedGatlingRun.load(simulation_logs_list, partition_dir, memory_limit, time_diff,
+                                                 parser, jobs)
+                run_partial = compute_run_partial(run)
         else:
-            # Transaction Percentile
-            col_percentile = int(overall_percentile_df.loc
-                                 [overall_percentile_df['Transaction'] == col_name, 'Percentile'].item())
-
-            # Get the legend name along with Transaction's Percentile
-            legend_name = col_name_dict[col_name] + " ({}th: {} ms)".format(percentile, col_percentile)
-
-            # PlotGraph
-            plot_graph = scenario_graph.line('LocalTime',
-                                             col_name,
-                                             source=source,
-                                             line_width=2,
-                                             color=color_palette[color_index],
-                                             name=col_name)
-
-        # increment through color palette
-        color_index = color_index + 1
+            run_partial = compute_run_partial(GatlingRun.load(simulation_logs_list, time_diff, parser, jobs))
+    except ValueError as error:
+        sys.exit(str(error))
 
-        # Append the legend
-        legend_list.append((legend_name, [plot_graph]))
-
-    # Append the graph in list which will be passed to "Column"
-    scenario_graph_final = set_graph_and_legend_properties(scenario_graph, legend_list, scenario)
-
-    return scenario_graph_final
+    partial_path = write_run_partial(run_partial, partial_path or get_partial_path(simulation_logs_list))
+    print("Partial written to {} ({:.1f} kB)...".format(partial_path, partial_path.stat().st_size / 1024))
 
 
 ########################################################################################################################
 
 
 ########################################################################################################################
-# Function Name: generate_graph
-# Description  : It generates the graph based on the Dataframe made on the Simulation Log
-# @param       : Dataframe of the Gatling Logs
-# @param       : Path where the Graph needs to generated
-# @param       : right y-axis filter. Currently, they are limited to [Errors, Users, RPS, RPM]
-# @param       : Percentile, for which graph needs to be produced. Default Value is 95
-# @return      : Layout of the graph
+# Function Name: validate_merge_arguments
+# Description  : Validates the input given by the user to the merge command
+# @param       : Arguments given by user, after the command
+# @return      : List of Partial Files, Path of the Graph and List of Percentiles
+# @return      : Whether to only give the transaction summary, its format and output file ("" for the console)
+# @return      : Number of Top Transactions drawn as their own lines (None for all of them) and their Ranking
 # Author       : Navdit Sharma
-# Comments     : Created on 05/09/2018
+# Comments     : Created on 18/10/2026
 ########################################################################################################################
-def generate_graph(gat_log_df: pd.DataFrame, graph_output_path: str, right_y_axis_filter: str,
-                   percentile: int) -> object:
-    # Get the List of Scenarios in Test Run
-    scenario_list = get_list_of_scenarios(gat_log_df)
+def validate_merge_arguments(argv: list):
+    input_partials = ""
+    output_graph_path = 'GatlingScenarioGraphs.html'
+    input_percentile = 95
+    summary_only = False
+    summary_format = "table"
+    summary_output = ""
+    top = None
+    top_by = "count"
+
+    # Options read from the records of a run, which a merged run doesn't have
+    record_options = ["export", "format", "phases", "steady-state", "sample", "preview", "memory-limit",
+                      "partition-dir", "parser"]
+    try:
+        options, remainder = getopt.getopt(argv, 'i:p:o:h', ['input=',
+                                                            'percentile=',
+                                                            'output=',
+                                                            'summary-only',
+                                                            'summary-format=',
+                                                            'summary-output=',
+                                                            'top=',
+                                                            'top-by=',
+                                                            'help',
+                                                            ])
+    except getopt.GetoptError as error:
+        if error.opt in record_options:
+            sys.exit("Argument --{} is not available on merged partials: they hold the counts of the run, not its "
+                     "records".format(error.opt))
+        sys.exit("{}\n{}".format(error, USAGE))
 
-    # Set Graph Output File
-    output_file(graph_output_path)
+    for opt, arg in options:
+        if opt in ('-h', '--help'):
+            print(USAGE)
+            sys.exit(0)
+        elif opt in ('-i', '--input'):
+            input_partials = arg
+        elif opt in ('-o', '--output'):
+            output_graph_path = arg
+        elif opt in ('-p', '--percentile'):
+            input_percentile = arg
+        elif opt == '--summary-only':
+            summary_only = True
+        elif opt == '--summary-format':
+            if arg not in SUMMARY_FORMATS:
+                sys.exit("Argument --summary-format has to be one of {}. Given value is {}".format(
+                    ", ".join(SUMMARY_FORMATS), arg))
+            summary_format = arg
+        elif opt == '--summary-output':
+            summary_output = arg
+        elif opt == '--top':
+            try:
+                top = parse_top_transactions(arg)
+            except ValueError as error:
+                sys.exit(str(error))
+        elif opt == '--top-by':
+            if arg not in TOP_TRANSACTIONS_RANKINGS:
+                sys.exit("Argument --top-by has to be one of {}. Given value is {}".format(
+                    ", ".join(TOP_TRANSACTIONS_RANKINGS), arg))
+            top_by = arg
+
+    if not input_partials:
+        sys.exit("Please provide at least one partial file, as written by the aggregate command, to argument -i")
+    partial_paths = strip_list(input_partials.split(','))
+    for partial_path in partial_paths:
+        check_path(Path(partial_path))
+    try:
+        percentiles = parse_percentiles(input_percentile)
+    except ValueError as error:
+        sys.exit(str(error))
+
+    return partial_paths, output_graph_path, percentiles, summary_only, summary_format, summary_output, top, top_by
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: main_merge
+# Description  : Merges the partials of the injectors of a run into its scenario report, or its summary
+# @param       : Arguments given by user, after the command
+# @return      : Null
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def main_merge(argv: list):
+    partial_paths, output_graph, percentiles, summary_only, summary_format, summary_output, top, top_by = \
+        validate_merge_arguments(argv)
 
-    # Empty List to contain individual scenario graphs
-    scenario_plots = []
+    from gatling_run_partials import MergedGatlingRun
 
-    # Looping over Scenarios in Test
-    for scnIndex in range(len(scenario_list)):
-        # Get the scenario Name
-        scenario_name = scenario_list[scnIndex]
-        print("{} in progress...".format(scenario_name))
+    print("Merging {} partials...".format(len(partial_paths)))
+    try:
+        run = MergedGatlingRun.load(partial_paths)
+    except ValueError as error:
+        sys.exit(str(error))
+    print("Partials of {} logs merged successfully...".format(len(run.simulation_logs_list)))
 
-        # Get scenario_metrics_df and overall_percentile_df
-        (scenario_metrics_df, overall_percentile_df) = get_scenario_metrics(scenario_name,
-                                                                            gat_log_df,
-                                                                            right_y_axis_filter,
-                                                                            percentile)
-        # Plot Graphs of the Transactions in Scenario
-        complete_scenario_graph = plot_graph_by_transaction(scenario_metrics_df, overall_percentile_df,
-                                                            scenario_name, right_y_axis_filter, percentile)
+    if summary_only:
+        write_summary(run.summary(sorted(set(AGGREGATE_PERCENTILES) | set(percentiles))), run, [], summary_format,
+                      summary_output)
+        return
 
-        # Add the Scenario Graphs to the Final Combined Graph
-        scenario_plots.append(complete_scenario_graph)
+    from gatling_scenario_report import REPORT_RIGHT_Y_AXIS_FILTERS, ScenarioReportBuilder, save_report
+    save_report(ScenarioReportBuilder(percentiles, REPORT_RIGHT_Y_AXIS_FILTERS, top=top, top_by=top_by).build(run),
+                output_graph)
 
-        print("{} Completed.".format(scenario_name))
 
-    # put all the plots in a Column
-    layout = Column(children=scenario_plots)
+########################################################################################################################
 
-    # Return the layout
-    return layout
+
+########################################################################################################################
+# Function Name: write_summary
+# Description  : Writes the summary of the transactions of a run as a table or as JSON
+# @param       : Summary Dataframe, as given by compute_transaction_summary
+# @param       : Gatling Run
+# @param       : List of breached thresholds
+# @param       : Summary Format - table or json
+# @param       : Path of the output file. The summary is printed if empty.
+# @return      : Null
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def write_summary(summary_df, run, breaches: list, summary_format: str, summary_output: str):
+    if summary_format == "json":
+        summary = json.dumps({"run": run.label,
+                              "logs": run.simulation_logs_list,
+                              "transactions": json.loads(summary_df.to_json(orient="records")),
+                              "breaches": breaches}, indent=2)
+    else:
+        summary = summary_df.to_string(index=False)
+
+    if summary_output:
+        Path(summary_output).write_text(summary + "\n")
+        print("Summary written to {}...".format(summary_output))
+    else:
+        print(summary)
 
 
 ########################################################################################################################
@@ -877,50 +830,123 @@ def generate_graph(gat_log_df: pd.DataFrame, graph_output_path: str, right_y_axi
 ########################################################################################################################
 # Function Name: main
 # Description  : Calls the functions to consume Excel given by the user and update the scenarios
-# @param       : Null
+# @param       : Arguments given by user. If the first one is a command (compare, trend, batch, aggregate, merge),
+#                that command is run instead.
 # @return      : Null
 # Author       : Navdit Sharma
 # Comments     : Created on 05/09/2018
 ########################################################################################################################
 def main(argv):
+    # Commands
+    if argv and argv[0] == "compare":
+        main_compare(argv[1:])
+        return
+    elif argv and argv[0] == "trend":
+        main_trend(argv[1:])
+        return
+    elif argv and argv[0] == "batch":
+        main_batch(argv[1:])
+        return
+    elif argv and argv[0] == "aggregate":
+        main_aggregate(argv[1:])
+        return
+    elif argv and argv[0] == "merge":
+        main_merge(argv[1:])
+        return
+
     # Get the Log Files Location and Output Graph Location
-    simulation_logs, output_graph, percentile, time_diff = validate_user_given_arguments(argv)
+    arguments = validate_user_given_arguments(argv)
 
     # Check if Log Files Exist
-    simulation_logs_list = check_logs_path(simulation_logs)
+    simulation_logs_list = check_logs_path(arguments.simulation_logs)
     print("Gatling Log Files validated successfully...")
 
+    # Heavy modules, now that the arguments are fine
+    import pandas as pd
+    from gatling_run import GatlingRun
+    from gatling_run_aggregates import check_summary_thresholds
+    from gatling_trend_store import TREND_ROLLUP_MS, store_run_aggregates
+
     # Generate Combined Gatling Log Dataframe
     print("Processing Gatling Log Files...")
-    gat_log_graph_df = generate_gatling_log_df(simulation_logs_list, time_diff)
+    try:
+        if arguments.memory_limit:
+            from gatling_run_partitions import PartitionedGatlingRun
+
+            # Without --partition-dir, the partitions go to a temporary folder, deleted when the script exits
+            temporary_dir = None if arguments.partition_dir \
+                else tempfile.TemporaryDirectory(prefix="gatling_partitions_")
+            run = PartitionedGatlingRun.load(simulation_logs_list, arguments.partition_dir or temporary_dir.name,
+                                             arguments.memory_limit, arguments.time_diff, arguments.parser,
+                                             arguments.jobs, sample_rate=arguments.sample_rate)
+            print("Scenario partitions written to {}...".format(run.partition_dir))
+        else:
+            run = GatlingRun.load(simulation_logs_list, arguments.time_diff, arguments.parser, arguments.jobs,
+                                  sample_rate=arguments.sample_rate)
+    except ValueError as error:
+        # e.g. requests of a log of several scenarios, which can't be told apart
+        sys.exit(str(error))
     print("Gatling Log Files processed successfully...")
-
-    # Generate Graph
-    right_y_axis_filter_list = ["RPS", "Users", "Errors"]
-
-    # Initialise an Empty Tab List
-    tab_list = []
-
-    # Looping through the right-y-axis Filters
-    for right_y_axis_filter in right_y_axis_filter_list:
-        print("-- {}th vs {} Graph Started --".format(percentile, right_y_axis_filter))
-
-        # Get the graph
-        graph_layout = generate_graph(gat_log_graph_df, output_graph, right_y_axis_filter, percentile)
-
-        # Add the Graph to the layout
-        tab = Panel(child=graph_layout, title="{}th vs {}".format(percentile, right_y_axis_filter))
-
-        # Append the Tab to the Tab list
-        tab_list.append(tab)
-
-        print("-- {}th vs {} Graph Completed --".format(percentile, right_y_axis_filter))
-
-    # Get the Final HTML Page Ready
-    tabs = Tabs(tabs=tab_list)
+    if arguments.sample_rate < 1:
+        print("Preview of {:g}% of the requests, counts are scaled by {:g}...".format(arguments.sample_rate * 100,
+                                                                                    1 / arguments.sample_rate))
+
+    # Ramp-up, steady state and ramp-down of every scenario
+    if arguments.phases:
+        phase_summary_df = run.phase_summary(sorted(set(AGGREGATE_PERCENTILES) | set(arguments.percentiles)))
+        for time_col_name in ("Start", "End"):
+            phase_summary_df[time_col_name] = pd.to_datetime(phase_summary_df[time_col_name], unit="ms")
+        print(phase_summary_df.to_string(index=False))
+
+    # Only the steady state from here on
+    if arguments.steady_state:
+        run = run.steady_state()
+        if run.log_df is None:
+            print("Steady state of every scenario kept, read scenario by scenario...")
+        else:
+            print("Steady state of every scenario kept, {} records...".format(len(run.log_df)))
+
+    # Keep the summary of the run in the trend store
+    if arguments.store_path:
+        store_run_aggregates(arguments.store_path, run.label, simulation_logs_list,
+                             run.aggregates(AGGREGATE_PERCENTILES, TREND_ROLLUP_MS))
+        print("Run stored in trend store {}...".format(arguments.store_path))
+
+    # Export the metrics for the analytics jobs
+    if arguments.export_dir:
+        print("Exporting metrics to {}...".format(arguments.export_dir))
+        run.export(arguments.percentiles, arguments.export_dir, arguments.export_format, arguments.jobs)
+        print("Metrics exported successfully...")
+
+    # Summary of the transactions and check of the thresholds, for the CI
+    if arguments.summary_only or arguments.thresholds:
+        summary_percentiles = sorted(set(AGGREGATE_PERCENTILES) | set(arguments.percentiles) |
+                                     {threshold["percentile"] for threshold in arguments.thresholds
+                                      if threshold["percentile"]})
+        summary_df = run.summary(summary_percentiles)
+        breaches = check_summary_thresholds(summary_df, arguments.thresholds)
+        write_summary(summary_df, run, breaches, arguments.summary_format, arguments.summary_output)
+
+        if breaches:
+            sys.exit("{} threshold(s) breached:\n    {}".format(len(breaches), "\n    ".join(breaches)))
+        elif arguments.thresholds:
+            print("All {} threshold(s) met...".format(len(arguments.thresholds)))
+
+    if arguments.no_graphs or arguments.summary_only:
+        return
+
+    # Bokeh is only imported when graphs are drawn
+    from gatling_scenario_report import REPORT_RIGHT_Y_AXIS_FILTERS, ScenarioReportBuilder, save_report
+
+    # Generate Graph, one tab per right-y-axis Filter and Percentile
+    percentiles_label = "/".join(str(percentile) for percentile in arguments.percentiles)
+    print("-- {}th vs {} Graphs Started --".format(percentiles_label, ", ".join(REPORT_RIGHT_Y_AXIS_FILTERS)))
+    tabs = ScenarioReportBuilder(arguments.percentiles, REPORT_RIGHT_Y_AXIS_FILTERS, top=arguments.top,
+                                 top_by=arguments.top_by).build(run)
+    print("-- {}th vs {} Graphs Completed --".format(percentiles_label, ", ".join(REPORT_RIGHT_Y_AXIS_FILTERS)))
 
     # Save/Show HTML File
-    save(tabs)
+    save_report(tabs, arguments.output_graph)
 
 ##################################################################################################################
 
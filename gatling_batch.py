@@ -0,0 +1,214 @@
+# ============================================================================================================
+# Purpose:           Generates the scenario reports of every Gatling Run under a root folder, with a worker pool.
+# Author:            Navdit Sharma (Nav)
+# Notes:             Gatling writes every run into its own results folder, so all the simulation logs of a folder
+#                    (e.g. the logs of several injectors gathered in it) are one run. The report is written next to
+#                    them and only regenerated when it is older than one of its logs. All the reports load BokehJS
+#                    from one local copy under the root, instead of embedding or downloading it.
+# Revision:          Last change: 18/10/26 :: Simulation Logs found by their names only
+# ==============================================================================================================
+
+import os
+import re
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from bokeh.resources import Resources
+from bokeh.util.paths import bokehjsdir
+
+from gatling_run import GatlingRun
+from gatling_scenario_report import ScenarioReportBuilder, save_report
+
+
+# Folder of the shared copy of BokehJS, under the root
+BATCH_BOKEHJS_DIR = "bokehjs"
+
+# Names of the Simulation Logs: simulation*.log, plain or compressed, see gatling_log_compression.py
+SIMULATION_LOG_NAME_PATTERN = re.compile(r"^simulation.*\.log(?:\.(?:gz|bz2|xz|zst))?$")
+
+
+##################################################################################################################
+# Function Name: is_simulation_log
+# Description  : Tells if the given file is a Gatling Simulation Log, plain or compressed (e.g. simulation.log,
+#                simulation-injector2.log or simulation.log.gz), by its name. The files written next to it, e.g.
+#                the aggregates cache simulation.log.aggregates.json, are not.
+# @param       : Path of the file
+# @return      : True if it is a Simulation Log
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def is_simulation_log(file_path: Path) -> bool:
+    return SIMULATION_LOG_NAME_PATTERN.match(file_path.name) is not None
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: discover_runs
+# Description  : Finds every Gatling Run under the root: the simulation logs of a folder are grouped as one run
+# @param       : Root folder
+# @return      : Sorted list of runs, each a sorted list of the paths of its logs
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def discover_runs(root: str) -> list:
+    runs_list = []
+    for folder, _, file_names in os.walk(root):
+        simulation_logs_list = sorted(str(Path(folder) / file_name) for file_name in file_names
+                                      if is_simulation_log(Path(folder) / file_name))
+        if simulation_logs_list:
+            runs_list.append(simulation_logs_list)
+
+    return sorted(runs_list)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: is_report_up_to_date
+# Description  : Tells if the report of a run is newer than all of its logs
+# @param       : List of Simulation Logs of the run
+# @param       : Path of the report
+# @return      : True if the report exists and is up to date
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def is_report_up_to_date(simulation_logs_list: list, output_path: Path) -> bool:
+    if not output_path.exists():
+        return False
+
+    return output_path.stat().st_mtime_ns >= max(Path(simulation_log).stat().st_mtime_ns
+                                                 for simulation_log in simulation_logs_list)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: write_shared_bokehjs
+# Description  : Copies the BokehJS files of the installed Bokeh under the root once, so that all the reports can
+#                load them from there. Files already copied (same size) are kept.
+# @param       : Root folder
+# @return      : Folder of the shared copy, laid out like the static folder of a Bokeh server
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def write_shared_bokehjs(root: str) -> Path:
+    bokehjs_root = Path(root) / BATCH_BOKEHJS_DIR
+    js_dir = bokehjs_root / "static" / "js"
+    js_dir.mkdir(parents=True, exist_ok=True)
+
+    # Only the files the reports load
+    for js_url in Resources(mode="server", root_url="/").js_files:
+        js_file = Path(bokehjsdir()) / "js" / js_url.rsplit("/", 1)[-1].split("?")[0]
+        shared_js_file = js_dir / js_file.name
+        if not shared_js_file.exists() or shared_js_file.stat().st_size != js_file.stat().st_size:
+            shutil.copyfile(js_file, shared_js_file)
+
+    return bokehjs_root
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: get_shared_resources
+# Description  : Gives the Bokeh resources of a report, loading BokehJS from the shared copy by a relative URL,
+#                so that the results folders can be moved or served together
+# @param       : Path of the report
+# @param       : Folder of the shared copy of BokehJS
+# @return      : Bokeh Resources
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_shared_resources(output_path: Path, bokehjs_root: Path) -> Resources:
+    root_url = Path(os.path.relpath(bokehjs_root, output_path.parent)).as_posix() + "/"
+    return Resources(mode="server", root_url=root_url)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: generate_run_report
+# Description  : Generates the scenario report of one run. Runs in the batch worker processes, which are reused
+#                from run to run, so pandas and Bokeh are only loaded once per worker.
+# @param       : List of Simulation Logs of the run
+# @param       : Path of the report
+# @param       : List of Percentiles
+# @param       : Time Difference
+# @param       : Log Parser (fast or pandas)
+# @param       : Folder of the shared copy of BokehJS
+# @return      : Path of the report and the time taken in seconds
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def generate_run_report(simulation_logs_list: list, output_path: Path, percentiles: list, time_diff: float,
+                        parser: str, bokehjs_root: Path) -> (Path, float):
+    start_time = time.perf_counter()
+
+    run = GatlingRun.load(simulation_logs_list, time_diff, parser)
+    tabs = ScenarioReportBuilder(percentiles).build(run)
+    save_report(tabs, str(output_path), run.label, get_shared_resources(output_path, bokehjs_root))
+
+    return output_path, time.perf_counter() - start_time
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: run_batch
+# Description  : Generates the reports of all the runs under the root, which are not up to date, in parallel.
+#                A run, which fails, is reported and does not stop the others.
+# @param       : Root folder
+# @param       : File name of the reports, written in the folder of every run
+# @param       : List of Percentiles
+# @param       : Time Difference
+# @param       : Log Parser (fast or pandas)
+# @param       : Number of worker processes
+# @param       : Regenerate the reports even if they are up to date
+# @return      : Dictionary of the number of runs generated, skipped (up to date) and failed
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def run_batch(root: str, output_name: str, percentiles: list, time_diff: float, parser: str, jobs: int,
+              force: bool = False) -> dict:
+    runs_list = discover_runs(root)
+    print("Found {} runs under {}...".format(len(runs_list), root))
+
+    # Incremental: only the runs with logs newer than their report
+    pending_runs = []
+    for simulation_logs_list in runs_list:
+        output_path = Path(simulation_logs_list[0]).parent / output_name
+        if force or not is_report_up_to_date(simulation_logs_list, output_path):
+            pending_runs.append((simulation_logs_list, output_path))
+    counts = {"generated": 0, "skipped": len(runs_list) - len(pending_runs), "failed": 0}
+    print("{} runs are up to date, {} to generate...".format(counts["skipped"], len(pending_runs)))
+    if not pending_runs:
+        return counts
+
+    bokehjs_root = write_shared_bokehjs(root)
+    with ProcessPoolExecutor(max_workers=max(1, min(jobs, len(pending_runs)))) as executor:
+        futures = {executor.submit(generate_run_report, simulation_logs_list, output_path, percentiles, time_diff,
+                                   parser, bokehjs_root): output_path
+                   for simulation_logs_list, output_path in pending_runs}
+        for future in as_completed(futures):
+            try:
+                output_path, run_time = future.result()
+                counts["generated"] += 1
+                print("[{}/{}] {} generated in {:.1f} s".format(counts["generated"] + counts["failed"],
+                                                                 len(pending_runs), output_path, run_time))
+            except Exception as error:
+                counts["failed"] += 1
+                print("[{}/{}] {} failed: {}".format(counts["generated"] + counts["failed"], len(pending_runs),
+                                                     futures[future], error))
+
+    return counts
+
+
+##################################################################################################################
@@ -0,0 +1,442 @@
+# ============================================================================================================
+# Purpose:           Kernels of the hot loops: field parsing and hashing of the tokenizer, bucket assignment and
+#                    counts, and percentiles of sorted groups or of integer values without a sort.
+# Author:            Navdit Sharma (Nav)
+# Notes:             Every kernel has a vectorized NumPy version here and a compiled version in the optional
+#                    gatling_kernels_ext extension (see setup_kernels.py). The compiled version is used when the
+#                    extension is built and the kernel is in COMPILED_KERNELS_DEFAULT, i.e. it beat the NumPy
+#                    version in sandpit/benchmark/benchmark_kernels.py. GATLING_KERNELS=numpy or
+#                    GATLING_KERNELS=compiled in the environment forces one or the other for all the kernels.
+# Revision:          Last change: 18/10/26 :: Compiled histogram percentiles count dense histograms in one pass
+# ==============================================================================================================
+
+import os
+
+import numpy as np
+
+try:
+    import gatling_kernels_ext
+except ImportError:
+    gatling_kernels_ext = None
+
+
+# Compiled kernels used by default, the ones faster than their NumPy version in the benchmark
+COMPILED_KERNELS_DEFAULT = {"parse_int_fields", "hash_name_fields", "fields_equal", "count_buckets",
+                            "grouped_percentiles", "histogram_percentiles"}
+
+# Environment variable to force the NumPy or the compiled kernels
+KERNELS_ENV_VAR = "GATLING_KERNELS"
+
+# Histogram percentiles: values from 0 to HISTOGRAM_MAX_MS - 1 are counted in histograms, the others are outliers
+HISTOGRAM_MAX_MS = 60000
+
+# Histogram percentiles: bins of the histograms counted at once, and how many bins per value are worth counting
+# instead of sorting the values
+HISTOGRAM_MAX_BINS = 1 << 22
+HISTOGRAM_DENSE_FACTOR = 4
+
+
+##################################################################################################################
+# Function Name: numpy_parse_int_fields
+# Description  : Parses the given fields of the block as non-negative integers, one digit column at a time
+# @param       : uint8 Numpy array of the block
+# @param       : Start offsets and End offsets of the fields
+# @return      : int64 Numpy array of values. Empty fields are 0.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def numpy_parse_int_fields(block: np.ndarray, field_starts: np.ndarray, field_ends: np.ndarray) -> np.ndarray:
+    widths = field_ends - field_starts
+    values = np.zeros(len(widths), dtype=np.int64)
+    for digit_index in range(widths.max(initial=0)):
+        digits = np.take(block, field_starts + digit_index, mode="clip").astype(np.int64) - ord("0")
+        values = np.where(widths > digit_index, values * 10 + digits, values)
+
+    return values
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: numpy_hash_name_fields
+# Description  : Hashes the given fields of the block one character column at a time: starting from the width of
+#                the field, hash = hash * multiplier + byte, wrapping around modulo 2**64
+# @param       : uint8 Numpy array of the block
+# @param       : Start offsets and End offsets of the fields
+# @param       : Multiplier of the hash
+# @return      : uint64 Numpy array of hashes
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def numpy_hash_name_fields(block: np.ndarray, field_starts: np.ndarray, field_ends: np.ndarray,
+                           multiplier: int) -> np.ndarray:
+    widths = field_ends - field_starts
+    hashes = widths.astype(np.uint64)
+    for char_index in range(widths.max(initial=0)):
+        chars = np.take(block, field_starts + char_index, mode="clip").astype(np.uint64)
+        hashes = np.where(widths > char_index, hashes * np.uint64(multiplier) + chars, hashes)
+
+    return hashes
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: numpy_fields_equal
+# Description  : Tells if every field of the block equals its reference field of the same width, one character
+#                column at a time
+# @param       : uint8 Numpy array of the block
+# @param       : Start offsets of the fields and of the reference fields
+# @param       : Widths of the fields
+# @return      : True if all the fields equal their reference fields
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def numpy_fields_equal(block: np.ndarray, field_starts: np.ndarray, reference_starts: np.ndarray,
+                       widths: np.ndarray) -> bool:
+    for char_index in range(widths.max(initial=0)):
+        if np.any((widths > char_index) &
+                  (np.take(block, field_starts + char_index, mode="clip") !=
+                   np.take(block, reference_starts + char_index, mode="clip"))):
+            return False
+
+    return True
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: numpy_assign_buckets
+# Description  : Gives the time bucket of every record, counted from the start of the run
+# @param       : LocalTime of the records (epoch ms)
+# @param       : LocalTime of the start of the run
+# @param       : Width of a bucket in ms
+# @return      : int64 Numpy array of buckets
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def numpy_assign_buckets(local_times: np.ndarray, run_start: int, bucket_ms: int) -> np.ndarray:
+    return (local_times - run_start) // bucket_ms
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: numpy_count_buckets
+# Description  : Counts the records of every bucket with one bincount. Buckets outside [0, bucket_count) are not
+#                counted.
+# @param       : int64 Bucket of every record
+# @param       : Number of buckets
+# @return      : int64 Numpy array of the count of every bucket
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def numpy_count_buckets(buckets: np.ndarray, bucket_count: int) -> np.ndarray:
+    return np.bincount(buckets[(buckets >= 0) & (buckets < bucket_count)], minlength=bucket_count).astype(np.int64)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: numpy_grouped_percentiles
+# Description  : Reads the percentiles of every group from its sorted segment, interpolated like pandas quantile
+# @param       : float64 values, sorted within every group and stored group after group
+# @param       : Start offsets and Counts of the groups
+# @param       : Percentiles (0 to 100)
+# @return      : float64 Numpy array [groups, percentiles]. Groups without values are NaN.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def numpy_grouped_percentiles(sorted_values: np.ndarray, group_starts: np.ndarray, group_counts: np.ndarray,
+                              percentiles: np.ndarray) -> np.ndarray:
+    values = np.full((len(group_starts), len(percentiles)), np.nan)
+    has_values = group_counts > 0
+    for percentile_index, percentile in enumerate(percentiles):
+        position = (group_counts[has_values] - 1) * (percentile / 100)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        lower_values = sorted_values[group_starts[has_values] + lower]
+        upper_values = sorted_values[group_starts[has_values] + upper]
+        values[has_values, percentile_index] = lower_values + (upper_values - lower_values) * (position - lower)
+
+    return values
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: numpy_histogram_percentiles
+# Description  : Reads the exact percentiles of every group of integer values (e.g. response times in ms) from
+#                per group histograms: the values are counted with one bincount per chunk of groups, and every
+#                percentile is found by a cumulative scan of the histogram of its group. Values outside
+#                [0, HISTOGRAM_MAX_MS) are outliers, kept aside and sorted. When the histograms would be much bigger
+#                than the values (many sparse groups over a wide range), the values are sorted instead.
+# @param       : Group code of every value (0 to number of groups - 1)
+# @param       : Integer values
+# @param       : Number of groups
+# @param       : Percentiles (0 to 100)
+# @return      : float64 Numpy array [groups, percentiles], interpolated like pandas quantile. Groups without
+#                values are NaN.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def numpy_histogram_percentiles(group_codes: np.ndarray, values: np.ndarray, group_count: int,
+                                percentiles: np.ndarray) -> np.ndarray:
+    group_counts = np.bincount(group_codes, minlength=group_count)
+    is_outlier = (values < 0) | (values >= HISTOGRAM_MAX_MS)
+    width = int(values[~is_outlier].max(initial=-1)) + 1
+
+    # Sort, if the histograms do not pay off
+    if group_count * width > max(HISTOGRAM_DENSE_FACTOR * len(values), HISTOGRAM_MAX_BINS):
+        order = np.lexsort((values, group_codes))
+        return numpy_grouped_percentiles(values[order].astype(np.float64), np.cumsum(group_counts) - group_counts,
+                                         group_counts, percentiles)
+
+    # Outliers, sorted by group and value. The ones below 0 come before the histogram of their group.
+    outlier_order = np.lexsort((values[is_outlier], group_codes[is_outlier]))
+    outlier_values = values[is_outlier][outlier_order]
+    low_counts = np.bincount(group_codes[values < 0], minlength=group_count)
+    outlier_counts = np.bincount(group_codes[is_outlier], minlength=group_count)
+    outlier_starts = np.cumsum(outlier_counts) - outlier_counts
+    in_range_counts = group_counts - outlier_counts
+    in_range_starts = np.cumsum(in_range_counts) - in_range_counts
+
+    # Ranks to read: lower and upper rank of every percentile of every group
+    has_values = group_counts > 0
+    positions = (group_counts[:, None] - 1) * (np.asarray(percentiles, dtype=np.float64)[None, :] / 100)
+    lower_ranks = np.floor(positions).astype(np.int64)
+    ranks = np.concatenate((lower_ranks.ravel(), np.ceil(positions).astype(np.int64).ravel()))
+    rank_groups = np.tile(np.repeat(np.arange(group_count), len(percentiles)), 2)
+    is_wanted = has_values[rank_groups]
+    in_range_ranks = ranks - low_counts[rank_groups]
+    from_outliers = is_wanted & ((in_range_ranks < 0) | (in_range_ranks >= in_range_counts[rank_groups]))
+    from_histograms = is_wanted & ~from_outliers
+
+    rank_values = np.zeros(len(ranks), dtype=np.int64)
+    outlier_ranks = np.where(in_range_ranks < 0, ranks, ranks - in_range_counts[rank_groups])
+    rank_values[from_outliers] = outlier_values[outlier_starts[rank_groups[from_outliers]] +
+                                                outlier_ranks[from_outliers]]
+
+    # Cumulative scan of the histograms, a chunk of groups at a time
+    groups_per_chunk = max(1, HISTOGRAM_MAX_BINS // max(width, 1))
+    for chunk_start in range(0, group_count if width else 0, groups_per_chunk):
+        chunk_end = min(chunk_start + groups_per_chunk, group_count)
+        in_chunk = ~is_outlier if chunk_end - chunk_start == group_count else \
+            ~is_outlier & (group_codes >= chunk_start) & (group_codes < chunk_end)
+        histogram = np.bincount((group_codes[in_chunk] - chunk_start) * width + values[in_chunk],
+                                minlength=(chunk_end - chunk_start) * width)
+        wanted = np.flatnonzero(from_histograms & (rank_groups >= chunk_start) & (rank_groups < chunk_end))
+        bins = np.searchsorted(np.cumsum(histogram), in_range_starts[rank_groups[wanted]] -
+                               in_range_starts[chunk_start] + in_range_ranks[wanted], side="right")
+        rank_values[wanted] = bins - (rank_groups[wanted] - chunk_start) * width
+
+    lower_values = rank_values[:len(ranks) // 2].reshape(positions.shape)
+    upper_values = rank_values[len(ranks) // 2:].reshape(positions.shape)
+    percentile_values = lower_values + (upper_values - lower_values) * (positions - lower_ranks)
+    percentile_values[~has_values] = np.nan
+
+    return percentile_values
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: get_kernel_implementations
+# Description  : Chooses the implementation of every kernel: compiled or numpy
+# @return      : Dictionary of kernel name -> implementation name
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_kernel_implementations() -> dict:
+    forced = os.environ.get(KERNELS_ENV_VAR, "").lower()
+
+    implementations = {}
+    for kernel_name in ["parse_int_fields", "hash_name_fields", "fields_equal", "assign_buckets", "count_buckets",
+                        "grouped_percentiles", "histogram_percentiles"]:
+        use_compiled = gatling_kernels_ext is not None and forced != "numpy" and \
+            (forced == "compiled" or kernel_name in COMPILED_KERNELS_DEFAULT)
+        implementations[kernel_name] = "compiled" if use_compiled else "numpy"
+
+    return implementations
+
+
+##################################################################################################################
+
+
+# Implementation of every kernel, chosen once at import
+KERNEL_IMPLEMENTATIONS = get_kernel_implementations()
+
+
+##################################################################################################################
+# Function Name: parse_int_fields
+# Description  : Parses the given fields of the block as non-negative integers, with the chosen implementation
+# @param       : uint8 Numpy array of the block
+# @param       : Start offsets and End offsets of the fields
+# @return      : int64 Numpy array of values. Empty fields are 0.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def parse_int_fields(block: np.ndarray, field_starts: np.ndarray, field_ends: np.ndarray) -> np.ndarray:
+    if KERNEL_IMPLEMENTATIONS["parse_int_fields"] == "compiled":
+        return gatling_kernels_ext.parse_int_fields(block, as_int64(field_starts), as_int64(field_ends))
+    return numpy_parse_int_fields(block, field_starts, field_ends)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: hash_name_fields
+# Description  : Hashes the given fields of the block with the polynomial hash used to intern names
+#                with the chosen implementation
+# @param       : uint8 Numpy array of the block
+# @param       : Start offsets and End offsets of the fields
+# @param       : Multiplier of the hash
+# @return      : uint64 Numpy array of hashes
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def hash_name_fields(block: np.ndarray, field_starts: np.ndarray, field_ends: np.ndarray,
+                     multiplier: int) -> np.ndarray:
+    if KERNEL_IMPLEMENTATIONS["hash_name_fields"] == "compiled":
+        return gatling_kernels_ext.hash_name_fields(block, as_int64(field_starts), as_int64(field_ends),
+                                                    int(multiplier))
+    return numpy_hash_name_fields(block, field_starts, field_ends, multiplier)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: fields_equal
+# Description  : Tells if every field of the block equals its reference field of the same width
+#                with the chosen implementation
+# @param       : uint8 Numpy array of the block
+# @param       : Start offsets of the fields and of the reference fields
+# @param       : Widths of the fields
+# @return      : True if all the fields equal their reference fields
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def fields_equal(block: np.ndarray, field_starts: np.ndarray, reference_starts: np.ndarray,
+                 widths: np.ndarray) -> bool:
+    if KERNEL_IMPLEMENTATIONS["fields_equal"] == "compiled":
+        return gatling_kernels_ext.fields_equal(block, as_int64(field_starts), as_int64(reference_starts),
+                                                as_int64(widths))
+    return numpy_fields_equal(block, field_starts, reference_starts, widths)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: assign_buckets
+# Description  : Gives the time bucket of every record, counted from the start of the run
+#                with the chosen implementation
+# @param       : LocalTime of the records (epoch ms)
+# @param       : LocalTime of the start of the run
+# @param       : Width of a bucket in ms
+# @return      : int64 Numpy array of buckets
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def assign_buckets(local_times: np.ndarray, run_start: int, bucket_ms: int) -> np.ndarray:
+    if KERNEL_IMPLEMENTATIONS["assign_buckets"] == "compiled":
+        return gatling_kernels_ext.assign_buckets(as_int64(local_times), run_start, bucket_ms)
+    return numpy_assign_buckets(local_times, run_start, bucket_ms)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: count_buckets
+# Description  : Counts the records of every bucket, with the chosen implementation. Buckets outside
+#                [0, bucket_count) are not counted.
+# @param       : Bucket of every record, as given by assign_buckets
+# @param       : Number of buckets
+# @return      : int64 Numpy array of the count of every bucket
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def count_buckets(buckets: np.ndarray, bucket_count: int) -> np.ndarray:
+    if KERNEL_IMPLEMENTATIONS["count_buckets"] == "compiled":
+        return gatling_kernels_ext.count_buckets(as_int64(buckets), int(bucket_count))
+    return numpy_count_buckets(np.asarray(buckets, dtype=np.int64), int(bucket_count))
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: grouped_percentiles
+# Description  : Reads the percentiles of every group from its sorted segment, interpolated like pandas
+#                quantile, with the chosen implementation
+# @param       : Values, sorted within every group and stored group after group
+# @param       : Start offsets and Counts of the groups
+# @param       : List of Percentiles (0 to 100)
+# @return      : float64 Numpy array [groups, percentiles]. Groups without values are NaN.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def grouped_percentiles(sorted_values: np.ndarray, group_starts: np.ndarray, group_counts: np.ndarray,
+                        percentiles: list) -> np.ndarray:
+    if KERNEL_IMPLEMENTATIONS["grouped_percentiles"] == "compiled":
+        return gatling_kernels_ext.grouped_percentiles(np.ascontiguousarray(sorted_values, dtype=np.float64),
+                                                       as_int64(group_starts), as_int64(group_counts),
+                                                       np.ascontiguousarray(percentiles, dtype=np.float64))
+    return numpy_grouped_percentiles(np.asarray(sorted_values, dtype=np.float64), group_starts, group_counts,
+                                     np.asarray(percentiles, dtype=np.float64))
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: histogram_percentiles
+# Description  : Reads the exact percentiles of every group of integer values (e.g. response times in ms) without
+#                a comparison sort, with the chosen implementation: histograms with a cumulative scan (numpy), or
+#                (compiled) histograms counted in one pass when they fit in HISTOGRAM_MAX_BINS, else a counting sort
+#                by value and by group
+# @param       : Group code of every value (0 to number of groups - 1)
+# @param       : Integer values
+# @param       : Number of groups
+# @param       : List of Percentiles (0 to 100)
+# @return      : float64 Numpy array [groups, percentiles], interpolated like pandas quantile. Groups without
+#                values are NaN.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def histogram_percentiles(group_codes: np.ndarray, values: np.ndarray, group_count: int,
+                          percentiles: list) -> np.ndarray:
+    if KERNEL_IMPLEMENTATIONS["histogram_percentiles"] == "compiled":
+        return gatling_kernels_ext.histogram_percentiles(as_int64(group_codes), as_int64(values), int(group_count),
+                                                         np.ascontiguousarray(percentiles, dtype=np.float64),
+                                                         HISTOGRAM_MAX_MS, HISTOGRAM_MAX_BINS)
+    return numpy_histogram_percentiles(np.asarray(group_codes, dtype=np.int64), np.asarray(values, dtype=np.int64),
+                                       int(group_count), np.asarray(percentiles, dtype=np.float64))
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: as_int64
+# Description  : Gives the given array as a contiguous int64 array, copying it only if needed
+# @param       : Numpy array
+# @return      : Contiguous int64 Numpy array
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def as_int64(values: np.ndarray) -> np.ndarray:
+    return np.ascontiguousarray(values, dtype=np.int64)
+
+
+##################################################################################################################
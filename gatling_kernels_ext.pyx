@@ -0,0 +1,416 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False
+# ============================================================================================================
+# Purpose:           Compiled kernels of the hot loops, with typed memoryviews. Optional: gatling_kernels.py falls
+#                    back to the NumPy version of every kernel when this extension is not built.
+# Author:            Navdit Sharma (Nav)
+# Notes:             Build in place from the root of the repository (needs Cython and a C compiler):
+#                    python setup_kernels.py build_ext --inplace
+#                    Every kernel gives exactly the same result as its NumPy version in gatling_kernels.py.
+# Revision:          Last change: 18/10/26 :: Dense histograms of the histogram percentiles
+# ==============================================================================================================
+
+import numpy as np
+
+from libc.math cimport NAN, floor, ceil
+from libc.stdint cimport int64_t, uint8_t, uint64_t
+
+
+##################################################################################################################
+# Function Name: parse_int_fields
+# Description  : Parses the given fields of the block as non-negative integers
+# @param       : uint8 array of the block
+# @param       : int64 Start offsets and End offsets of the fields
+# @return      : int64 Numpy array of values. Empty fields are 0.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def parse_int_fields(const uint8_t[::1] block, const int64_t[::1] field_starts, const int64_t[::1] field_ends):
+    cdef Py_ssize_t field_count = field_starts.shape[0]
+    cdef Py_ssize_t field_index
+    cdef int64_t position, value
+
+    values = np.zeros(field_count, dtype=np.int64)
+    cdef int64_t[::1] values_view = values
+
+    with nogil:
+        for field_index in range(field_count):
+            value = 0
+            for position in range(field_starts[field_index], field_ends[field_index]):
+                value = value * 10 + (<int64_t> block[position] - 48)
+            values_view[field_index] = value
+
+    return values
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: hash_name_fields
+# Description  : Hashes the given fields of the block with the polynomial hash used to intern names: starting from
+#                the width of the field, hash = hash * multiplier + byte, wrapping around modulo 2**64
+# @param       : uint8 array of the block
+# @param       : int64 Start offsets and End offsets of the fields
+# @param       : Multiplier of the hash
+# @return      : uint64 Numpy array of hashes
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def hash_name_fields(const uint8_t[::1] block, const int64_t[::1] field_starts, const int64_t[::1] field_ends,
+                     uint64_t multiplier):
+    cdef Py_ssize_t field_count = field_starts.shape[0]
+    cdef Py_ssize_t field_index
+    cdef int64_t position
+    cdef uint64_t name_hash
+
+    hashes = np.empty(field_count, dtype=np.uint64)
+    cdef uint64_t[::1] hashes_view = hashes
+
+    with nogil:
+        for field_index in range(field_count):
+            name_hash = <uint64_t> (field_ends[field_index] - field_starts[field_index])
+            for position in range(field_starts[field_index], field_ends[field_index]):
+                name_hash = name_hash * multiplier + block[position]
+            hashes_view[field_index] = name_hash
+
+    return hashes
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: fields_equal
+# Description  : Tells if every field of the block equals its reference field of the same width
+# @param       : uint8 array of the block
+# @param       : int64 Start offsets of the fields
+# @param       : int64 Start offsets of the reference fields
+# @param       : int64 Widths of the fields
+# @return      : True if all the fields equal their reference fields
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def fields_equal(const uint8_t[::1] block, const int64_t[::1] field_starts, const int64_t[::1] reference_starts,
+                 const int64_t[::1] widths):
+    cdef Py_ssize_t field_index
+    cdef int64_t char_index
+    cdef bint equal = True
+
+    with nogil:
+        for field_index in range(field_starts.shape[0]):
+            for char_index in range(widths[field_index]):
+                if block[field_starts[field_index] + char_index] != block[reference_starts[field_index] + char_index]:
+                    equal = False
+                    break
+            if not equal:
+                break
+
+    return equal
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: assign_buckets
+# Description  : Gives the time bucket of every record, counted from the start of the run
+# @param       : int64 LocalTime of the records (epoch ms)
+# @param       : LocalTime of the start of the run
+# @param       : Width of a bucket in ms
+# @return      : int64 Numpy array of buckets
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def assign_buckets(const int64_t[::1] local_times, int64_t run_start, int64_t bucket_ms):
+    cdef Py_ssize_t record_count = local_times.shape[0]
+    cdef Py_ssize_t record_index
+    cdef int64_t offset
+
+    buckets = np.empty(record_count, dtype=np.int64)
+    cdef int64_t[::1] buckets_view = buckets
+
+    with nogil:
+        for record_index in range(record_count):
+            offset = local_times[record_index] - run_start
+            # Floor division, also for records before the start
+            if offset >= 0:
+                buckets_view[record_index] = offset // bucket_ms
+            else:
+                buckets_view[record_index] = -((-offset + bucket_ms - 1) // bucket_ms)
+
+    return buckets
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: count_buckets
+# Description  : Counts the records of every bucket. Buckets outside [0, bucket_count) are not counted.
+# @param       : int64 Bucket of every record
+# @param       : Number of buckets
+# @return      : int64 Numpy array of the count of every bucket
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def count_buckets(const int64_t[::1] buckets, Py_ssize_t bucket_count):
+    cdef Py_ssize_t record_index
+    cdef int64_t bucket
+
+    counts = np.zeros(bucket_count, dtype=np.int64)
+    cdef int64_t[::1] counts_view = counts
+
+    with nogil:
+        for record_index in range(buckets.shape[0]):
+            bucket = buckets[record_index]
+            if 0 <= bucket < bucket_count:
+                counts_view[bucket] += 1
+
+    return counts
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: grouped_percentiles
+# Description  : Reads the percentiles of every group from its sorted segment, interpolated like pandas quantile
+# @param       : float64 values, sorted within every group and stored group after group
+# @param       : int64 Start offsets and Counts of the groups
+# @param       : float64 Percentiles (0 to 100)
+# @return      : float64 Numpy array [groups, percentiles]. Groups without values are NaN.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def grouped_percentiles(const double[::1] sorted_values, const int64_t[::1] group_starts,
+                        const int64_t[::1] group_counts, const double[::1] percentiles):
+    cdef Py_ssize_t group_count = group_starts.shape[0]
+    cdef Py_ssize_t percentile_count = percentiles.shape[0]
+    cdef Py_ssize_t group_index, percentile_index
+    cdef double position, lower_value, upper_value
+    cdef int64_t lower, upper
+
+    values = np.empty((group_count, percentile_count), dtype=np.float64)
+    cdef double[:, ::1] values_view = values
+
+    with nogil:
+        for group_index in range(group_count):
+            for percentile_index in range(percentile_count):
+                if group_counts[group_index] == 0:
+                    values_view[group_index, percentile_index] = NAN
+                    continue
+                position = (group_counts[group_index] - 1) * (percentiles[percentile_index] / 100)
+                lower = <int64_t> floor(position)
+                upper = <int64_t> ceil(position)
+                lower_value = sorted_values[group_starts[group_index] + lower]
+                upper_value = sorted_values[group_starts[group_index] + upper]
+                values_view[group_index, percentile_index] = \
+                    lower_value + (upper_value - lower_value) * (position - lower)
+
+    return values
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: dense_histogram_percentiles
+# Description  : Reads the exact percentiles of every group of integer values from one histogram per group, counted
+#                in one pass over the values: the ranks of every group are found by one cumulative walk of its
+#                histogram, in increasing order. Values outside [0, max_value) are outliers, sorted apart.
+# @param       : int64 Group code of every value (0 to number of groups - 1)
+# @param       : int64 values
+# @param       : Number of groups
+# @param       : float64 Percentiles (0 to 100)
+# @param       : Values from 0 to max_value - 1 are counted, the others are outliers
+# @param       : Width of the histograms: the largest counted value + 1
+# @return      : float64 Numpy array [groups, percentiles], like histogram_percentiles
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+cdef object dense_histogram_percentiles(const int64_t[::1] group_codes, const int64_t[::1] values,
+                                        Py_ssize_t group_count, const double[::1] percentiles, int64_t max_value,
+                                        int64_t width):
+    cdef Py_ssize_t value_count = values.shape[0]
+    cdef Py_ssize_t percentile_count = percentiles.shape[0]
+    cdef Py_ssize_t value_index, group_index, rank_index, sorted_index, percentile_index
+    cdef int64_t group_code, value, group_total, low_count, in_range_count, rank, cumulative, bin_index
+    cdef double position
+
+    histograms = np.zeros(group_count * width, dtype=np.int64)
+    group_counts = np.zeros(group_count, dtype=np.int64)
+    low_counts = np.zeros(group_count, dtype=np.int64)
+    cdef int64_t[::1] histograms_view = histograms
+    cdef int64_t[::1] group_counts_view = group_counts
+    cdef int64_t[::1] low_counts_view = low_counts
+
+    with nogil:
+        for value_index in range(value_count):
+            group_code = group_codes[value_index]
+            value = values[value_index]
+            group_counts_view[group_code] += 1
+            if value < 0:
+                low_counts_view[group_code] += 1
+            elif value < max_value:
+                histograms_view[group_code * width + value] += 1
+
+    # Outliers sorted by group and value. They are few, so NumPy sorts them.
+    all_values, all_codes = np.asarray(values), np.asarray(group_codes)
+    is_outlier = (all_values < 0) | (all_values >= max_value)
+    outlier_codes = all_codes[is_outlier]
+    outlier_values = np.ascontiguousarray(all_values[is_outlier][np.lexsort((all_values[is_outlier], outlier_codes))],
+                                          dtype=np.int64)
+    outlier_counts = np.bincount(outlier_codes, minlength=group_count).astype(np.int64)
+    outlier_starts = np.cumsum(outlier_counts) - outlier_counts
+    cdef const int64_t[::1] outlier_values_view = outlier_values
+    cdef const int64_t[::1] outlier_counts_view = outlier_counts
+    cdef const int64_t[::1] outlier_starts_view = outlier_starts
+
+    # Lower and upper rank of every percentile, their order and their values
+    ranks = np.empty(2 * percentile_count, dtype=np.int64)
+    rank_order = np.empty(2 * percentile_count, dtype=np.int64)
+    rank_values = np.empty(2 * percentile_count, dtype=np.int64)
+    cdef int64_t[::1] ranks_view = ranks
+    cdef int64_t[::1] rank_order_view = rank_order
+    cdef int64_t[::1] rank_values_view = rank_values
+
+    percentile_values = np.full((group_count, percentile_count), np.nan)
+    cdef double[:, ::1] percentile_values_view = percentile_values
+
+    with nogil:
+        for group_index in range(group_count):
+            group_total = group_counts_view[group_index]
+            if group_total == 0:
+                continue
+            low_count = low_counts_view[group_index]
+            in_range_count = group_total - outlier_counts_view[group_index]
+
+            # Ranks in increasing order, by insertion: there are only two per percentile
+            for percentile_index in range(percentile_count):
+                position = (group_total - 1) * (percentiles[percentile_index] / 100)
+                ranks_view[2 * percentile_index] = <int64_t> floor(position)
+                ranks_view[2 * percentile_index + 1] = <int64_t> ceil(position)
+            for rank_index in range(2 * percentile_count):
+                sorted_index = rank_index
+                while sorted_index > 0 and ranks_view[rank_order_view[sorted_index - 1]] > ranks_view[rank_index]:
+                    rank_order_view[sorted_index] = rank_order_view[sorted_index - 1]
+                    sorted_index -= 1
+                rank_order_view[sorted_index] = rank_index
+
+            # One cumulative walk of the histogram of the group
+            cumulative = low_count
+            bin_index = 0
+            for sorted_index in range(2 * percentile_count):
+                rank_index = rank_order_view[sorted_index]
+                rank = ranks_view[rank_index]
+                if rank < low_count:
+                    rank_values_view[rank_index] = outlier_values_view[outlier_starts_view[group_index] + rank]
+                elif rank >= low_count + in_range_count:
+                    rank_values_view[rank_index] = outlier_values_view[outlier_starts_view[group_index] + rank -
+                                                                       in_range_count]
+                else:
+                    while cumulative + histograms_view[group_index * width + bin_index] <= rank:
+                        cumulative += histograms_view[group_index * width + bin_index]
+                        bin_index += 1
+                    rank_values_view[rank_index] = bin_index
+
+            for percentile_index in range(percentile_count):
+                position = (group_total - 1) * (percentiles[percentile_index] / 100)
+                percentile_values_view[group_index, percentile_index] = \
+                    rank_values_view[2 * percentile_index] + \
+                    (rank_values_view[2 * percentile_index + 1] - rank_values_view[2 * percentile_index]) * \
+                    (position - ranks_view[2 * percentile_index])
+
+    return percentile_values
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: histogram_percentiles
+# Description  : Reads the exact percentiles of every group of integer values without a comparison sort. When the
+#                histograms of all the groups fit in max_bins, from the histograms, see dense_histogram_percentiles.
+#                Otherwise the values are counting sorted by value (histogram and prefix sums), then stably by group,
+#                in linear time. Values outside [0, max_value) are outliers, sorted apart and put around the counted
+#                ones.
+# @param       : int64 Group code of every value (0 to number of groups - 1)
+# @param       : int64 values
+# @param       : Number of groups
+# @param       : float64 Percentiles (0 to 100)
+# @param       : Values from 0 to max_value - 1 are counted, the others are outliers
+# @param       : Most bins of the histograms of all the groups. Default is 0, which always sorts.
+# @return      : float64 Numpy array [groups, percentiles], interpolated like pandas quantile. Groups without
+#                values are NaN.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def histogram_percentiles(const int64_t[::1] group_codes, const int64_t[::1] values, Py_ssize_t group_count,
+                          const double[::1] percentiles, int64_t max_value, int64_t max_bins=0):
+    cdef Py_ssize_t value_count = values.shape[0]
+    cdef Py_ssize_t value_index, position
+    cdef int64_t width = 0, low_count = 0, in_range_count = 0, bin_index, total
+
+    with nogil:
+        for value_index in range(value_count):
+            if values[value_index] < 0:
+                low_count += 1
+            elif values[value_index] < max_value:
+                in_range_count += 1
+                if values[value_index] >= width:
+                    width = values[value_index] + 1
+
+    if group_count * width <= max_bins:
+        return dense_histogram_percentiles(group_codes, values, group_count, percentiles, max_value, width)
+
+    # Outliers sorted by value, the ones below 0 first and the ones above max_value last
+    outlier_indexes = np.flatnonzero((np.asarray(values) < 0) | (np.asarray(values) >= max_value))
+    outlier_indexes = outlier_indexes[np.argsort(np.asarray(values)[outlier_indexes], kind="stable")]
+    cdef const int64_t[::1] outlier_view = np.ascontiguousarray(outlier_indexes, dtype=np.int64)
+
+    # Counting sort by value
+    bin_offsets = np.zeros(width + 1, dtype=np.int64)
+    by_value = np.empty(value_count, dtype=np.int64)
+    cdef int64_t[::1] bin_offsets_view = bin_offsets
+    cdef int64_t[::1] by_value_view = by_value
+
+    with nogil:
+        for value_index in range(value_count):
+            if 0 <= values[value_index] < max_value:
+                bin_offsets_view[values[value_index]] += 1
+        total = low_count
+        for bin_index in range(width):
+            bin_offsets_view[bin_index], total = total, total + bin_offsets_view[bin_index]
+        for value_index in range(value_count):
+            if 0 <= values[value_index] < max_value:
+                by_value_view[bin_offsets_view[values[value_index]]] = value_index
+                bin_offsets_view[values[value_index]] += 1
+        for position in range(low_count):
+            by_value_view[position] = outlier_view[position]
+        for position in range(low_count, outlier_view.shape[0]):
+            by_value_view[in_range_count + position] = outlier_view[position]
+
+    # Stable counting sort by group
+    group_counts = np.zeros(group_count, dtype=np.int64)
+    group_offsets = np.empty(group_count, dtype=np.int64)
+    sorted_values = np.empty(value_count, dtype=np.float64)
+    cdef int64_t[::1] group_counts_view = group_counts
+    cdef int64_t[::1] group_offsets_view = group_offsets
+    cdef double[::1] sorted_values_view = sorted_values
+
+    with nogil:
+        for value_index in range(value_count):
+            group_counts_view[group_codes[value_index]] += 1
+        total = 0
+        for position in range(group_count):
+            group_offsets_view[position] = total
+            total += group_counts_view[position]
+        for position in range(value_count):
+            value_index = by_value_view[position]
+            sorted_values_view[group_offsets_view[group_codes[value_index]]] = values[value_index]
+            group_offsets_view[group_codes[value_index]] += 1
+
+    return grouped_percentiles(sorted_values, group_offsets - group_counts, group_counts, percentiles)
+
+
+##################################################################################################################
@@ -0,0 +1,167 @@
+# ============================================================================================================
+# Purpose:           Opens the Gatling Simulation Logs, transparently decompressing them.
+# Author:            Navdit Sharma (Nav)
+# Notes:             Logs can be plain text or compressed with gzip, bz2, xz or zstd (zstd needs the
+#                    zstandard package). Compression is detected by the magic bytes, not the file extension.
+#                    Only needs the standard library, so the logs can be checked before pandas is imported.
+# Revision:          Last change: 18/10/26 :: Moved out of gatling_log_parser.py
+# ==============================================================================================================
+
+import bz2
+import gzip
+import io
+import lzma
+import queue
+import threading
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Magic bytes at the start of the compressed files
+COMPRESSION_MAGIC_BYTES = {
+    b"\x1f\x8b": "gzip",
+    b"BZh": "bz2",
+    b"\xfd7zXZ\x00": "xz",
+    b"\x28\xb5\x2f\xfd": "zstd",
+}
+
+# Size of the blocks handed over by the decompression thread and how many of them can be queued up ahead of parsing
+DECOMPRESS_BLOCK_SIZE = 1024 * 1024
+DECOMPRESS_QUEUE_BLOCKS = 8
+
+
+##################################################################################################################
+# Function Name: detect_compression
+# Description  : Detects the compression of the given log file from its magic bytes
+# @param       : Path of the Log File
+# @return      : Name of the compression (gzip, bz2, xz, zstd) or None if the log is plain text
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def detect_compression(log_path: Path):
+    with open(log_path, "rb") as log_file:
+        file_start = log_file.read(8)
+
+    for magic_bytes, compression in COMPRESSION_MAGIC_BYTES.items():
+        if file_start.startswith(magic_bytes):
+            return compression
+
+    return None
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: open_decompressed_stream
+# Description  : Opens the given compressed log file as a stream of decompressed bytes
+# @param       : Path of the Log File
+# @param       : Name of the compression, as returned by detect_compression
+# @return      : Binary file object of the decompressed log
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def open_decompressed_stream(log_path: Path, compression: str):
+    if compression == "gzip":
+        return gzip.open(log_path, "rb")
+    elif compression == "bz2":
+        return bz2.open(log_path, "rb")
+    elif compression == "xz":
+        return lzma.open(log_path, "rb")
+    elif compression == "zstd":
+        if zstandard is None:
+            raise ValueError("Log {} is zstd compressed. Please install zstandard to read it:"
+                             "\n    pip install zstandard".format(log_path))
+        return zstandard.ZstdDecompressor().stream_reader(open(log_path, "rb"), closefd=True)
+
+    raise ValueError("Unknown compression {} of log {}".format(compression, log_path))
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Class Name   : ThreadedDecompressedReader
+# Description  : Raw reader, which decompresses the log in a background thread while the caller is parsing.
+#                gzip, bz2, lzma and zstandard release the GIL while decompressing, so both really run at once.
+#                At most DECOMPRESS_QUEUE_BLOCKS blocks are held in memory.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+class ThreadedDecompressedReader(io.RawIOBase):
+    def __init__(self, decompressed_stream):
+        self._stream = decompressed_stream
+        self._blocks = queue.Queue(maxsize=DECOMPRESS_QUEUE_BLOCKS)
+        self._stop = threading.Event()
+        self._error = None
+        self._block = memoryview(b"")
+        self._eof = False
+        self._thread = threading.Thread(target=self._decompress, daemon=True)
+        self._thread.start()
+
+    def _decompress(self):
+        try:
+            while not self._stop.is_set():
+                block = self._stream.read(DECOMPRESS_BLOCK_SIZE)
+                if not block:
+                    break
+                self._blocks.put(block)
+        except Exception as error:
+            self._error = error
+        finally:
+            self._blocks.put(None)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._block and not self._eof:
+            block = self._blocks.get()
+            if block is None:
+                self._eof = True
+                if self._error is not None:
+                    raise self._error
+            else:
+                self._block = memoryview(block)
+
+        size = min(len(buffer), len(self._block))
+        buffer[:size] = self._block[:size]
+        self._block = self._block[size:]
+        return size
+
+    def close(self):
+        if not self.closed:
+            # Let the thread finish and free the queue
+            self._stop.set()
+            while not self._eof:
+                self._eof = self._blocks.get() is None
+            self._thread.join()
+            self._stream.close()
+        super().close()
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: open_gatling_log
+# Description  : Opens the given Gatling Log for reading, transparently decompressing it if needed
+# @param       : Path of the Log File
+# @return      : Binary file object of the (decompressed) log
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def open_gatling_log(log_path: Path):
+    compression = detect_compression(log_path)
+    if compression is None:
+        return open(log_path, "rb")
+
+    return io.BufferedReader(ThreadedDecompressedReader(open_decompressed_stream(log_path, compression)),
+                             buffer_size=DECOMPRESS_BLOCK_SIZE)
+
+
+##################################################################################################################
@@ -0,0 +1,999 @@
+# ============================================================================================================
+# Purpose:           Reads the Gatling Simulation Logs into the compact Dataframe used to plot the graphs.
+# Author:            Navdit Sharma (Nav)
+# Notes:             Logs can be plain text or compressed with gzip, bz2, xz or zstd, see gatling_log_compression.py.
+# Revision:          Last change: 18/10/26 :: Requests of unknown scenario fail, binary cache index 0 referred to
+# ==============================================================================================================
+
+import io
+import mmap
+import re
+import struct
+import zlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from gatling_kernels import fields_equal, hash_name_fields, parse_int_fields
+from gatling_log_compression import detect_compression, open_gatling_log
+
+
+# Fixed dictionaries of the compact columns. Owner and Status are stored as one byte codes into these lists.
+OWNER_CATEGORIES = ["REQUEST", "USER", "GROUP", "RUN", "ERROR"]
+STATUS_CATEGORIES = ["OK", "KO"]
+
+# Number of log lines read at a time. Only one chunk is ever held as Python strings, the rest is kept compact.
+GATLING_LOG_CHUNK_SIZE = 1000000
+
+# Size in bytes of the blocks scanned at a time by the fast parser
+FAST_PARSER_BLOCK_SIZE = 32 * 1024 * 1024
+
+# Smallest byte range of a log parsed by one worker process
+PARALLEL_PARSER_MIN_RANGE_SIZE = 16 * 1024 * 1024
+
+# Formats of the Gatling Logs
+BINARY_LOG = "binary"
+GATLING_2_TEXT = "gatling2"
+GATLING_3_0_TEXT = "gatling3.0"
+GATLING_3_4_TEXT = "gatling3.4"
+
+# Field indices of the tab separated layouts, 0 being the record type. End time and Status follow the start time of
+# requests, End time, Cumulated Response Time and Status the start time of groups. GROUP records have the scenario
+# and user id fields of the REQUEST records. None means that the records of the layout don't have the field.
+TEXT_LOG_LAYOUTS = {
+    # REQUEST scenario userId groups name start end status message / USER scenario userId START|END start end /
+    # GROUP scenario userId groups start end cumulated status
+    GATLING_2_TEXT: {"request_scenario": 1, "request_user_id": None, "request_name": 4, "request_start": 5,
+                     "user_user_id": 2, "user_marker": 3, "group_name": 3, "group_start": 4},
+    # REQUEST userId groups name start end status message / USER scenario userId START|END start end /
+    # GROUP userId groups start end cumulated status
+    GATLING_3_0_TEXT: {"request_scenario": None, "request_user_id": 1, "request_name": 3, "request_start": 4,
+                       "user_user_id": 2, "user_marker": 3, "group_name": 2, "group_start": 3},
+    # REQUEST groups name start end status message / USER scenario START|END timestamp /
+    # GROUP groups start end cumulated status
+    GATLING_3_4_TEXT: {"request_scenario": None, "request_user_id": None, "request_name": 2, "request_start": 3,
+                       "user_user_id": None, "user_marker": 2, "group_name": 1, "group_start": 2},
+}
+
+# Record headers of the binary log
+BINARY_RUN_RECORD = 0
+BINARY_REQUEST_RECORD = 1
+BINARY_USER_RECORD = 2
+BINARY_GROUP_RECORD = 3
+BINARY_ERROR_RECORD = 4
+
+# Big-endian numbers of the binary log
+INT_STRUCT = struct.Struct(">i")
+LONG_STRUCT = struct.Struct(">q")
+
+# Bytes read from the binary log at a time and records decoded into one compact chunk
+BINARY_LOG_READ_SIZE = 1024 * 1024
+BINARY_LOG_CHUNK_RECORDS = 1000000
+
+# Odd multiplier of the polynomial hash used to intern names. Arithmetic wraps around modulo 2**64.
+NAME_HASH_MULTIPLIER = np.uint64(0x100000001B3)
+
+# Multiplier (2**64 / golden ratio) of the hash of the record contents, which picks the records of a sampled run
+SAMPLE_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+##################################################################################################################
+# Function Name: intern_names
+# Description  : Interns the given names into the shared name dictionary and returns their integer codes
+# @param       : Series of names (Scenario or Transaction Names)
+# @param       : Dictionary of name -> code, shared by all the chunks and columns. New names are added to it.
+# @return      : Numpy array of int32 codes. Missing names get code -1.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def intern_names(names: pd.Series, name_codes: dict) -> np.ndarray:
+    for name in pd.unique(names.dropna()):
+        if name not in name_codes:
+            name_codes[name] = len(name_codes)
+
+    return names.map(name_codes).fillna(-1).to_numpy(dtype=np.int32)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: compact_gatling_log_chunk
+# Description  : Converts a chunk of the raw string Gatling Log Dataframe into its compact columnar form
+# @param       : Raw Dataframe with columns: [Owner,Scenario,ThreadId,JunkCol1,Transaction_Name,StartTime,EndTime,
+#                Status,Message]
+# @param       : Dictionary of name -> code, shared by all the chunks
+# @param       : Time Difference in milliseconds
+# @param       : Dictionary of error message -> code, shared by all the chunks
+# @return      : Dataframe with columns: [Owner,Scenario,Transaction_Name,Status,ResponseTime,LocalTime,ErrorMessage],
+#                where Scenario, Transaction_Name and ErrorMessage are still plain int32 codes into name_codes and
+#                message_codes
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def compact_gatling_log_chunk(gat_log_df: pd.DataFrame, name_codes: dict, time_diff_ms: int,
+                              message_codes: dict) -> pd.DataFrame:
+    # Get Dataframe for Graphs. Only REQUEST, USER and GROUP rows are used, RUN and ERROR rows are dropped.
+    gat_log_df = gat_log_df[gat_log_df["Owner"].isin(["REQUEST", "USER", "GROUP"])]
+
+    # USER rows carry a timestamp in the Transaction_Name column, keep their START/END marker instead. GROUP rows
+    # have no name, so their fields are one column to the left: group hierarchy, start, end and cumulated response
+    # time.
+    is_user = (gat_log_df["Owner"] == "USER").to_numpy()
+    is_group = (gat_log_df["Owner"] == "GROUP").to_numpy()
+    transaction_names = gat_log_df["Transaction_Name"].where(~(is_user | is_group), gat_log_df["JunkCol1"])
+
+    # Set correct dtypes
+    start_time = pd.to_numeric(gat_log_df["StartTime"]).to_numpy()
+    end_time = pd.to_numeric(gat_log_df["EndTime"]).to_numpy()
+    start_time = np.where(is_group, pd.to_numeric(gat_log_df["Transaction_Name"].where(is_group)).to_numpy(),
+                          start_time)
+
+    # Calculate Response Time. Requests have one, groups their cumulated response time, rest of the rows get 0.
+    response_time = np.where(np.isnan(end_time), 0, np.where(is_group, end_time, end_time - start_time))
+    response_time = response_time.astype(np.int32)
+
+    # Error Message of the KO requests only. KO requests without message get the empty message.
+    is_ko_request = ((gat_log_df["Owner"] == "REQUEST") & (gat_log_df["Status"] == "KO")).to_numpy()
+    error_messages = gat_log_df["Message"].fillna("").where(is_ko_request)
+
+    return pd.DataFrame({
+        "Owner": pd.Categorical(gat_log_df["Owner"], categories=OWNER_CATEGORIES),
+        "Scenario": intern_names(gat_log_df["Scenario"], name_codes),
+        "Transaction_Name": intern_names(transaction_names, name_codes),
+        "Status": pd.Categorical(gat_log_df["Status"], categories=STATUS_CATEGORIES),
+        "ResponseTime": response_time,
+        "LocalTime": start_time.astype(np.int64) + time_diff_ms,
+        "ErrorMessage": intern_names(error_messages, message_codes),
+    })
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: iter_gatling_log_blocks
+# Description  : Reads the given Gatling Log in blocks of whole lines. Plain logs are memory-mapped, so the blocks
+#                are views on the page cache and nothing is copied. Compressed logs are read from the decompressed
+#                stream, carrying the partial last line of a block over to the next one.
+# @param       : Path of the Log File
+# @param       : Optional (start, end) byte range of a plain log to read, aligned to line boundaries. Default is
+#                the whole log.
+# @return      : Generator of uint8 Numpy arrays, each ending at a line boundary
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def iter_gatling_log_blocks(log_path: Path, byte_range: tuple = None):
+    if detect_compression(log_path) is None:
+        if Path(log_path).stat().st_size == 0:
+            return
+        # The map is not closed explicitly, it is unmapped once the last block looking at it is freed
+        with open(log_path, "rb") as log_file:
+            log_map = mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ)
+        log_bytes = np.frombuffer(log_map, dtype=np.uint8)
+        block_start, range_end = byte_range if byte_range else (0, len(log_bytes))
+        while block_start < range_end:
+            block_end = log_map.find(b"\n", min(block_start + FAST_PARSER_BLOCK_SIZE, range_end), range_end) + 1
+            if block_end == 0:
+                block_end = range_end
+            yield log_bytes[block_start:block_end]
+            block_start = block_end
+    else:
+        with open_gatling_log(log_path) as log_file:
+            partial_line = b""
+            while True:
+                block = log_file.read(FAST_PARSER_BLOCK_SIZE)
+                if not block:
+                    break
+                block = partial_line + block
+                block_end = block.rfind(b"\n") + 1
+                partial_line = block[block_end:]
+                if block_end:
+                    yield np.frombuffer(block, dtype=np.uint8, count=block_end)
+            if partial_line:
+                yield np.frombuffer(partial_line, dtype=np.uint8)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: get_field_bounds
+# Description  : Gives the start and end offsets of the given tab separated field of every line
+# @param       : Offsets of all the tabs in the block
+# @param       : Index (in tabs) of the first tab of every line
+# @param       : End offset of every line
+# @param       : Index of the field, 0 being the record type
+# @return      : Start offsets and End offsets of the field
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_field_bounds(tabs: np.ndarray, first_tab: np.ndarray, line_ends: np.ndarray, field: int) \
+        -> (np.ndarray, np.ndarray):
+    field_starts = np.take(tabs, first_tab + field - 1, mode="clip") + 1
+    next_tabs = np.take(tabs, first_tab + field, mode="clip")
+    field_ends = np.where((next_tabs < line_ends) & (next_tabs >= field_starts), next_tabs, line_ends)
+
+    return field_starts, field_ends
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: intern_name_fields
+# Description  : Interns the given name fields of the block without creating a string per line. Each field is
+#                hashed one character column at a time, the hashes are factorized and only one string per distinct
+#                name is decoded. Hash collisions are checked for and fall back to plain interning.
+# @param       : uint8 Numpy array of the block
+# @param       : Start offsets and End offsets of the fields
+# @param       : Dictionary of name -> code, shared by all the blocks and columns. New names are added to it.
+# @return      : int32 Numpy array of codes into name_codes
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def intern_name_fields(block: np.ndarray, field_starts: np.ndarray, field_ends: np.ndarray,
+                       name_codes: dict) -> np.ndarray:
+    widths = field_ends - field_starts
+
+    # Hash the fields
+    local_codes, _ = pd.factorize(hash_name_fields(block, field_starts, field_ends, NAME_HASH_MULTIPLIER))
+
+    # First line of every distinct hash, in the order of the codes
+    first_lines = np.flatnonzero(~pd.Series(local_codes).duplicated().to_numpy())
+
+    # Check that every field equals the first field with the same hash
+    collision = np.any(widths != widths[first_lines][local_codes]) or \
+        not fields_equal(block, field_starts, field_starts[first_lines][local_codes], widths)
+    if collision:
+        return intern_names(pd.Series([block[start:end].tobytes().decode("utf-8", "replace")
+                                       for start, end in zip(field_starts, field_ends)], dtype=object), name_codes)
+
+    # Map the local codes to the shared dictionary
+    local_to_shared = np.empty(len(first_lines), dtype=np.int32)
+    for local_code, line in enumerate(first_lines):
+        name = block[field_starts[line]:field_ends[line]].tobytes().decode("utf-8", "replace")
+        local_to_shared[local_code] = name_codes.setdefault(name, len(name_codes))
+
+    return local_to_shared[local_codes]
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: get_sample_hashes
+# Description  : Hashes the content of every record: its transaction name, owner, status, local time and response
+#                time. The hashes don't depend on the position of the records, so they are the same whatever the
+#                parser, blocks, byte ranges or number of processes.
+# @param       : Compact Dataframe, whose Transaction_Name are codes into names
+# @param       : List of names, in the order of their codes
+# @return      : uint64 Numpy array of the hash of every record
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_sample_hashes(compact_df: pd.DataFrame, names: list) -> np.ndarray:
+    # Code -1 (missing name) picks the 0 at the end of name_hashes
+    name_hashes = np.array([zlib.crc32(name.encode("utf-8")) for name in names] + [0], dtype=np.uint64)
+    hashes = name_hashes[compact_df["Transaction_Name"].to_numpy()]
+    for values in [compact_df["Owner"].cat.codes.to_numpy(), compact_df["Status"].cat.codes.to_numpy(),
+                   compact_df["LocalTime"].to_numpy(), compact_df["ResponseTime"].to_numpy()]:
+        hashes = (hashes ^ values.astype(np.int64).astype(np.uint64)) * SAMPLE_HASH_MULTIPLIER
+        hashes ^= hashes >> np.uint64(29)
+
+    return hashes
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: is_sampled
+# Description  : Tells which records are in the sample, from their hashes. Every transaction is sampled on its own,
+#                at the sample rate, as the hashes of its records are uniform whatever the others.
+# @param       : uint64 Numpy array of the hashes of the records, as given by get_sample_hashes
+# @param       : Sample Rate, from 0 to 1
+# @return      : Boolean Numpy array
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def is_sampled(hashes: np.ndarray, sample_rate: float) -> np.ndarray:
+    return (hashes >> np.uint64(11)) < np.uint64(int(sample_rate * 2 ** 53))
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: sample_compact_chunk
+# Description  : Keeps the sampled records of a compact chunk: the records picked by is_sampled, plus the first
+#                record of every transaction (and group) of the log, so that no transaction is left out of the sample.
+#                USER records are all kept, so that the active users stay exact. The chunks of a log have to be given
+#                in order, with the same set of seen transactions. Sampling a chunk again keeps the same records.
+# @param       : Compact Dataframe of the chunk, whose Transaction_Name are codes into names
+# @param       : List of names, in the order of their codes
+# @param       : Sample Rate, from 0 to 1
+# @param       : Set of the transactions of the earlier chunks, as Owner and Transaction_Name codes. The
+#                transactions of the chunk are added to it.
+# @return      : Compact Dataframe of the sampled records
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def sample_compact_chunk(compact_df: pd.DataFrame, names: list, sample_rate: float,
+                         seen_transactions: set) -> pd.DataFrame:
+    is_user = (compact_df["Owner"] == "USER").to_numpy()
+    kept_records = is_user | is_sampled(get_sample_hashes(compact_df, names), sample_rate)
+
+    # First record of every transaction not seen in the earlier chunks
+    record_rows = np.flatnonzero(~is_user)
+    transactions = compact_df["Transaction_Name"].to_numpy()[record_rows].astype(np.int64) * 3 + \
+        compact_df["Owner"].cat.codes.to_numpy()[record_rows]
+    chunk_transactions, first_indexes = np.unique(transactions, return_index=True)
+    for transaction, first_row in zip(chunk_transactions.tolist(), record_rows[first_indexes].tolist()):
+        if transaction not in seen_transactions:
+            seen_transactions.add(transaction)
+            kept_records[first_row] = True
+
+    return compact_df[kept_records].reset_index(drop=True)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: tokenize_gatling_log_block
+# Description  : Dedicated tokenizer of the tab separated Gatling Log. It scans a block of whole lines with
+#                vectorized Numpy operations and extracts only the fields the graphs need, straight into the
+#                compact columns. RUN and ERROR lines are skipped without being materialized.
+# @param       : uint8 Numpy array of the block, ending at a line boundary
+# @param       : Dictionary of name -> code, shared by all the blocks
+# @param       : Time Difference in milliseconds
+# @param       : Dictionary of error message -> code, shared by all the blocks
+# @param       : Text layout of the log, key of TEXT_LOG_LAYOUTS. Default is the Gatling 2 layout.
+# @return      : Dataframe with columns: [Owner,Scenario,Transaction_Name,Status,ResponseTime,LocalTime,
+#                ErrorMessage], same as compact_gatling_log_chunk. Layouts, whose requests only carry the user id,
+#                get an extra UserId column and Scenario -1 on the requests and groups, see resolve_request_scenarios.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def tokenize_gatling_log_block(block: np.ndarray, name_codes: dict, time_diff_ms: int, message_codes: dict,
+                               log_format: str = GATLING_2_TEXT) -> pd.DataFrame:
+    layout = TEXT_LOG_LAYOUTS[log_format]
+
+    # Line boundaries
+    line_ends = np.flatnonzero(block == ord("\n"))
+    if len(block) and block[-1] != ord("\n"):
+        line_ends = np.append(line_ends, len(block))
+    line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+
+    # Keep REQUEST, USER and GROUP lines only, by their first two bytes (REQUEST vs RUN)
+    first_chars = np.take(block, line_starts, mode="clip")
+    second_chars = np.take(block, line_starts + 1, mode="clip")
+    is_request = (first_chars == ord("R")) & (second_chars == ord("E"))
+    is_user = (first_chars == ord("U")) & (second_chars == ord("S"))
+    is_group = (first_chars == ord("G")) & (second_chars == ord("R"))
+    kept_lines = np.flatnonzero((is_request | is_user | is_group) & (line_ends > line_starts))
+    line_starts, line_ends = line_starts[kept_lines], line_ends[kept_lines]
+
+    # Owner codes into OWNER_CATEGORIES: 0 REQUEST, 1 USER and 2 GROUP
+    owner_codes = np.where(is_request[kept_lines], 0, np.where(is_group[kept_lines], 2, 1))
+
+    # Drop the carriage return of Windows line endings
+    line_ends = line_ends - (np.take(block, line_ends - 1, mode="clip") == ord("\r"))
+
+    # Tabs of every line. Lines without all the fields of their layout are dropped.
+    tabs = np.flatnonzero(block == ord("\t"))
+    first_tab = np.searchsorted(tabs, line_starts)
+    tab_count = np.searchsorted(tabs, line_ends) - first_tab
+    min_tab_count = np.array([layout["request_start"] + 2, layout["user_marker"] + 1,
+                              layout["group_start"] + 3])[owner_codes]
+    valid_lines = np.flatnonzero(tab_count >= min_tab_count)
+    line_ends, owner_codes = line_ends[valid_lines], owner_codes[valid_lines]
+    first_tab, tab_count = first_tab[valid_lines], tab_count[valid_lines]
+    is_request, is_group = owner_codes == 0, owner_codes == 2
+    if not len(tabs):
+        tabs = np.zeros(1, dtype=np.int64)
+
+    # Picks the bounds of the request field, the user field or the group field of every line
+    def pick_field_bounds(request_field, user_field, group_field):
+        fields_bounds = [get_field_bounds(tabs, first_tab, line_ends, field)
+                         for field in (request_field, user_field, group_field)]
+        return (np.choose(owner_codes, [field_bounds[0] for field_bounds in fields_bounds]),
+                np.choose(owner_codes, [field_bounds[1] for field_bounds in fields_bounds]))
+
+    # Scenario and Transaction Name (START/END marker for USER lines, group hierarchy for GROUP lines)
+    scenario_codes = intern_name_fields(block, *get_field_bounds(tabs, first_tab, line_ends, 1), name_codes)
+    if layout["request_scenario"] is None:
+        scenario_codes = np.where(owner_codes == 1, scenario_codes, -1).astype(np.int32)
+    name_codes_of_lines = intern_name_fields(block, *pick_field_bounds(layout["request_name"], layout["user_marker"],
+                                                                       layout["group_name"]), name_codes)
+
+    # Timestamps, Status and Response Time. The time of a USER line is its last field. The response time of a
+    # GROUP line is its cumulated response time, which follows its end time.
+    start_field, group_start_field = layout["request_start"], layout["group_start"]
+    start_time = parse_int_fields(block, *pick_field_bounds(start_field, tab_count, group_start_field))
+    end_time = parse_int_fields(block, *pick_field_bounds(start_field + 1, layout["user_marker"],
+                                                          group_start_field + 2))
+    status_starts, _ = pick_field_bounds(start_field + 2, layout["user_marker"], group_start_field + 3)
+    status_chars = np.take(block, status_starts, mode="clip")
+    status_codes = np.where(status_chars == ord("O"), 0, np.where(status_chars == ord("K"), 1, -1))
+    response_time = np.where(is_request, end_time - start_time, np.where(is_group, end_time, 0))
+
+    # Error Message, the field after the status, of the KO requests only. Only the distinct messages are decoded.
+    error_message_codes = np.full(len(line_ends), -1, dtype=np.int32)
+    ko_lines = np.flatnonzero(is_request & (status_codes == 1))
+    if len(ko_lines):
+        message_starts, message_ends = get_field_bounds(tabs, first_tab[ko_lines], line_ends[ko_lines],
+                                                        start_field + 3)
+        # KO requests without message get the empty message
+        has_message = tab_count[ko_lines] >= start_field + 3
+        message_starts = np.where(has_message, message_starts, line_ends[ko_lines])
+        message_ends = np.where(has_message, message_ends, line_ends[ko_lines])
+        error_message_codes[ko_lines] = intern_name_fields(block, message_starts, message_ends, message_codes)
+
+    compact_df = pd.DataFrame({
+        "Owner": pd.Categorical.from_codes(owner_codes.astype(np.int8), categories=OWNER_CATEGORIES),
+        "Scenario": scenario_codes,
+        "Transaction_Name": name_codes_of_lines,
+        "Status": pd.Categorical.from_codes(np.where(owner_codes == 1, -1, status_codes).astype(np.int8),
+                                            categories=STATUS_CATEGORIES),
+        "ResponseTime": response_time.astype(np.int32),
+        "LocalTime": start_time + time_diff_ms,
+        "ErrorMessage": error_message_codes,
+    })
+
+    # User ids, to find the scenario of the requests and groups later
+    if layout["request_user_id"] is not None:
+        compact_df["UserId"] = parse_int_fields(block, *pick_field_bounds(layout["request_user_id"],
+                                                                          layout["user_user_id"],
+                                                                          layout["request_user_id"]))
+
+    return compact_df
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: read_gatling_log_header
+# Description  : Detects the format of the given Gatling Log from its first record and reads the simulation name.
+#                Binary logs start with the RUN record header byte 0, text logs with a tab separated line. The
+#                layout of text logs follows the Gatling version at the end of their RUN line.
+# @param       : Path of the Log File
+# @return      : Format of the log (BINARY_LOG or a key of TEXT_LOG_LAYOUTS) and Simulation Name ("" if unknown)
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def read_gatling_log_header(log_path: Path) -> (str, str):
+    with open_gatling_log(log_path) as log_file:
+        log_head = log_file.read(64 * 1024)
+
+    # Binary Log
+    if log_head[:1] == bytes([BINARY_RUN_RECORD]):
+        binary_log = BinaryLogReader(io.BytesIO(log_head))
+        try:
+            return BINARY_LOG, binary_log.read_run_record()["simulation_class_name"].split(".")[-1]
+        except EOFError:
+            return BINARY_LOG, ""
+
+    # Text Log. Logs without RUN line are taken as Gatling 2 logs.
+    for line in log_head.decode("utf-8", "replace").splitlines()[:100]:
+        fields = line.rstrip("\r").split("\t")
+        if fields[0] == "RUN" and len(fields) >= 6:
+            version = [int(number) for number in re.findall(r"\d+", fields[-1])[:2]] + [0, 0]
+            if version[0] < 3:
+                log_format = GATLING_2_TEXT
+            elif version[:2] < [3, 4]:
+                log_format = GATLING_3_0_TEXT
+            else:
+                log_format = GATLING_3_4_TEXT
+            return log_format, fields[1].split(".")[-1]
+
+    return GATLING_2_TEXT, ""
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: get_user_records
+# Description  : Gives the scenario and user id of the USER records of a compact Dataframe, which is all that
+#                resolve_request_scenarios needs to know of a log, so that a log can be resolved part by part
+# @param       : Compact Dataframe, with Scenario codes and, if the layout has it, a UserId column
+# @return      : Dataframe [Scenario, UserId] of the USER records. UserId is only there if compact_df has it.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_user_records(compact_df: pd.DataFrame) -> pd.DataFrame:
+    is_user = compact_df["Owner"].cat.codes.to_numpy() == 1
+    return compact_df.loc[is_user, [col_name for col_name in ["Scenario", "UserId"] if col_name in compact_df]]
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: resolve_request_scenarios
+# Description  : Fills the scenario of the requests and groups of logs, which don't write it on their records.
+#                Gatling 3.0 to 3.3 logs carry the user id, which is looked up in the USER records. Newer text and
+#                binary logs carry neither, so their requests and groups go to the only scenario of the log, or to a
+#                scenario named after the simulation if the log has no USER record. Requests and groups left
+#                without scenario in a log of several scenarios can't be told apart, and raise a ValueError.
+# @param       : Compact Dataframe of one log, or of a part of it
+# @param       : Simulation Name of the log
+# @param       : Dictionary of name -> code, shared by all the chunks. New names are added to it.
+# @param       : Dataframe [Scenario, UserId] (UserId if the layout has it) of the USER records of the whole log, as
+#                given by get_user_records, when compact_df is only a part of the log. Default is the USER records of
+#                compact_df.
+# @return      : The same Dataframe with Scenario filled and without UserId column
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def resolve_request_scenarios(compact_df: pd.DataFrame, simulation_name: str, name_codes: dict,
+                              user_df: pd.DataFrame = None) -> pd.DataFrame:
+    scenario_codes = compact_df["Scenario"].to_numpy()
+    # Requests and groups
+    is_request = np.isin(compact_df["Owner"].cat.codes.to_numpy(), [0, 2])
+    if user_df is None:
+        user_df = get_user_records(compact_df)
+
+    # Look up the user ids
+    has_user_ids = "UserId" in compact_df
+    if has_user_ids:
+        user_scenarios = pd.Series(user_df["Scenario"].to_numpy(), index=user_df["UserId"].to_numpy())
+        user_scenarios = user_scenarios[~user_scenarios.index.duplicated()]
+        scenario_codes = np.where(is_request, user_scenarios.reindex(compact_df["UserId"].to_numpy()).fillna(-1)
+                                  .to_numpy(), scenario_codes).astype(np.int32)
+        compact_df = compact_df.drop(columns=["UserId"])
+
+    # Requests and groups still without scenario
+    unresolved = is_request & (scenario_codes < 0)
+    if np.any(unresolved):
+        log_scenarios = np.unique(user_df["Scenario"].to_numpy())
+        if len(log_scenarios) == 1:
+            scenario_codes = np.where(scenario_codes < 0, log_scenarios[0], scenario_codes)
+        elif not len(log_scenarios):
+            simulation_code = name_codes.setdefault(simulation_name or "Simulation", len(name_codes))
+            scenario_codes = np.where(scenario_codes < 0, simulation_code, scenario_codes)
+        else:
+            names = {code: name for name, code in name_codes.items()}
+            raise ValueError("{} requests and groups of simulation {} can't be told apart between its scenarios {}: "
+                             "{}".format(int(np.count_nonzero(unresolved)), simulation_name or "Simulation",
+                                         ", ".join(names[code] for code in log_scenarios),
+                                         "their users have no USER record" if has_user_ids else
+                                         "this Gatling version doesn't log the scenario or user of a request"))
+
+    compact_df["Scenario"] = scenario_codes.astype(np.int32)
+
+    return compact_df
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Class Name   : BinaryLogReader
+# Description  : Reads the records of the binary simulation.log written by newer Gatling versions, streaming the
+#                (decompressed) log in blocks. Numbers are big-endian, timestamps are int ms offsets from the run
+#                start and names are written once and then referred to by their index in a string cache.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+class BinaryLogReader:
+    def __init__(self, log_file):
+        self._file = log_file
+        self._buffer = b""
+        self._position = 0
+        self.string_cache = {}
+
+    def _read(self, size: int) -> bytes:
+        if len(self._buffer) - self._position < size:
+            self._buffer = self._buffer[self._position:] + self._file.read(max(size, BINARY_LOG_READ_SIZE))
+            self._position = 0
+            if len(self._buffer) < size:
+                raise EOFError("Binary log ends in the middle of a record")
+        data = self._buffer[self._position:self._position + size]
+        self._position += size
+        return data
+
+    def at_end(self) -> bool:
+        if self._position < len(self._buffer):
+            return False
+        self._buffer = self._file.read(BINARY_LOG_READ_SIZE)
+        self._position = 0
+        return not self._buffer
+
+    def read_byte(self) -> int:
+        return self._read(1)[0]
+
+    def read_int(self) -> int:
+        return INT_STRUCT.unpack(self._read(4))[0]
+
+    def read_long(self) -> int:
+        return LONG_STRUCT.unpack(self._read(8))[0]
+
+    def read_string(self) -> str:
+        return self._read(self.read_int()).decode("utf-8", "replace")
+
+    def read_cached_string(self) -> str:
+        # A new string comes with its index, and is then referred to by its negated index. Index 0 can't be
+        # negated: once a string is cached at 0, index 0 refers to it.
+        cache_index = self.read_int()
+        if cache_index < 0 or (cache_index == 0 and 0 in self.string_cache):
+            return self.string_cache[-cache_index]
+        self.string_cache[cache_index] = self.read_string()
+        return self.string_cache[cache_index]
+
+    def skip(self, size: int):
+        self._read(size)
+
+    def read_groups(self) -> list:
+        return [self.read_cached_string() for _ in range(self.read_int())]
+
+    def read_run_record(self) -> dict:
+        if self.read_byte() != BINARY_RUN_RECORD:
+            raise ValueError("Binary log doesn't start with a RUN record")
+        run_record = {"gatling_version": self.read_string(),
+                      "simulation_class_name": self.read_string(),
+                      "start": self.read_long(),
+                      "description": self.read_string(),
+                      "scenarios": [self.read_string() for _ in range(self.read_int())]}
+        for _ in range(self.read_int()):
+            self.skip(self.read_int())  # Assertions
+        return run_record
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: read_binary_gatling_log
+# Description  : Decodes the binary Gatling Log straight into compact chunks. Only BINARY_LOG_CHUNK_RECORDS records
+#                are held as Python objects at a time, so memory stays bounded.
+# @param       : Path of the Log File
+# @param       : Dictionary of name -> code, shared by all the chunks. New names are added to it.
+# @param       : Time Difference in milliseconds
+# @param       : Dictionary of error message -> code, shared by all the chunks. New messages are added to it.
+# @return      : Generator of compact Dataframes with columns: [Owner,Scenario,Transaction_Name,Status,
+#                ResponseTime,LocalTime,ErrorMessage]. Requests and groups have Scenario -1, see
+#                resolve_request_scenarios.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def read_binary_gatling_log(log_path: Path, name_codes: dict, time_diff_ms: int, message_codes: dict):
+    with open_gatling_log(log_path) as log_file:
+        binary_log = BinaryLogReader(log_file)
+        run_record = binary_log.read_run_record()
+        time_offset = run_record["start"] + time_diff_ms
+        scenario_codes = [name_codes.setdefault(scenario, len(name_codes)) for scenario in run_record["scenarios"]]
+        marker_codes = [name_codes.setdefault(marker, len(name_codes)) for marker in ["END", "START"]]
+
+        truncated = False
+        while True:
+            owners, scenarios, names = array("b"), array("i"), array("i")
+            statuses, response_times, local_times = array("b"), array("i"), array("q")
+            error_messages = array("i")
+            try:
+                while len(owners) < BINARY_LOG_CHUNK_RECORDS and not binary_log.at_end():
+                    record_type = binary_log.read_byte()
+                    if record_type == BINARY_REQUEST_RECORD:
+                        binary_log.read_groups()
+                        name = binary_log.read_cached_string()
+                        name_code = name_codes.setdefault(name, len(name_codes))
+                        start_time = binary_log.read_int()
+                        end_time = binary_log.read_int()
+                        is_ok = binary_log.read_byte()
+                        message = binary_log.read_cached_string()
+                        owners.append(0)
+                        scenarios.append(-1)
+                        names.append(name_code)
+                        statuses.append(0 if is_ok else 1)
+                        response_times.append(end_time - start_time)
+                        local_times.append(start_time + time_offset)
+                        error_messages.append(-1 if is_ok else message_codes.setdefault(message, len(message_codes)))
+                    elif record_type == BINARY_USER_RECORD:
+                        scenario_index = binary_log.read_int()
+                        is_start = binary_log.read_byte()
+                        timestamp = binary_log.read_int()
+                        owners.append(1)
+                        scenarios.append(scenario_codes[scenario_index])
+                        names.append(marker_codes[1 if is_start else 0])
+                        statuses.append(-1)
+                        response_times.append(0)
+                        local_times.append(timestamp + time_offset)
+                        error_messages.append(-1)
+                    elif record_type == BINARY_GROUP_RECORD:
+                        # Named by the group hierarchy, like in the text logs
+                        group_code = name_codes.setdefault(",".join(binary_log.read_groups()), len(name_codes))
+                        start_time = binary_log.read_int()
+                        binary_log.read_int()  # End
+                        cumulated_response_time = binary_log.read_int()
+                        is_ok = binary_log.read_byte()
+                        owners.append(2)
+                        scenarios.append(-1)
+                        names.append(group_code)
+                        statuses.append(0 if is_ok else 1)
+                        response_times.append(cumulated_response_time)
+                        local_times.append(start_time + time_offset)
+                        error_messages.append(-1)
+                    elif record_type == BINARY_ERROR_RECORD:
+                        binary_log.read_cached_string()
+                        binary_log.read_int()
+                    else:
+                        raise ValueError("Unknown record type {} in binary log {}".format(record_type, log_path))
+            except EOFError:
+                # Truncated log, e.g. of a crashed run. Keep what was read.
+                truncated = True
+
+            if len(owners):
+                yield pd.DataFrame({
+                    "Owner": pd.Categorical.from_codes(np.frombuffer(owners, dtype=np.int8),
+                                                       categories=OWNER_CATEGORIES),
+                    "Scenario": np.frombuffer(scenarios, dtype=np.int32),
+                    "Transaction_Name": np.frombuffer(names, dtype=np.int32),
+                    "Status": pd.Categorical.from_codes(np.frombuffer(statuses, dtype=np.int8),
+                                                        categories=STATUS_CATEGORIES),
+                    "ResponseTime": np.frombuffer(response_times, dtype=np.int32),
+                    "LocalTime": np.frombuffer(local_times, dtype=np.int64),
+                    "ErrorMessage": np.frombuffer(error_messages, dtype=np.int32),
+                })
+            if truncated or binary_log.at_end():
+                return
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: split_log_byte_ranges
+# Description  : Splits the given plain log into byte ranges aligned to line boundaries, to be parsed in parallel
+# @param       : Path of the Log File
+# @param       : Maximum number of ranges. Ranges are never smaller than PARALLEL_PARSER_MIN_RANGE_SIZE.
+# @return      : List of (start, end) byte ranges covering the whole log, in order
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def split_log_byte_ranges(log_path: Path, max_ranges: int) -> list:
+    log_size = Path(log_path).stat().st_size
+    range_count = max(1, min(max_ranges, log_size // PARALLEL_PARSER_MIN_RANGE_SIZE))
+    if range_count == 1:
+        return [(0, log_size)]
+
+    # Move every boundary to just after the next new line
+    byte_ranges = []
+    with open(log_path, "rb") as log_file, mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as log_map:
+        range_start = 0
+        for range_index in range(1, range_count + 1):
+            range_end = log_map.find(b"\n", max(range_start, log_size * range_index // range_count - 1)) + 1
+            if range_end == 0 or range_index == range_count:
+                range_end = log_size
+            if range_end > range_start:
+                byte_ranges.append((range_start, range_end))
+            range_start = range_end
+
+    return byte_ranges
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: parse_gatling_log_range
+# Description  : Parses one byte range of a plain log with the fast tokenizer. Runs in the worker processes.
+# @param       : Path of the Log File
+# @param       : (start, end) byte range, aligned to line boundaries
+# @param       : Time Difference in milliseconds
+# @param       : Text layout of the log, key of TEXT_LOG_LAYOUTS
+# @param       : Sample Rate, from 0 to 1. Default is 1, which keeps all the records.
+# @return      : List of names and List of error messages, in the order of their codes, and the compact Dataframe
+#                of the range, whose Scenario, Transaction_Name and ErrorMessage are codes into these lists
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def parse_gatling_log_range(log_path: Path, byte_range: tuple, time_diff_ms: int, log_format: str,
+                            sample_rate: float = 1) -> (list, list, pd.DataFrame):
+    name_codes, message_codes = {}, {}
+    compact_chunks = []
+    # The first record of every transaction of the range is kept, the log is sampled again once joined
+    seen_transactions = set()
+    for block in iter_gatling_log_blocks(log_path, byte_range):
+        compact_df = tokenize_gatling_log_block(block, name_codes, time_diff_ms, message_codes, log_format)
+        if sample_rate < 1:
+            compact_df = sample_compact_chunk(compact_df, list(name_codes), sample_rate, seen_transactions)
+        compact_chunks.append(compact_df)
+
+    return list(name_codes), list(message_codes), pd.concat(compact_chunks, ignore_index=True)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: remap_name_codes
+# Description  : Maps the name and error message codes of a Dataframe parsed with its own dictionaries onto the
+#                shared ones
+# @param       : Compact Dataframe, whose Scenario and Transaction_Name are codes into range_names and ErrorMessage
+#                codes into range_messages
+# @param       : List of names of the Dataframe, in the order of their codes
+# @param       : Dictionary of name -> code, shared by all the chunks. New names are added to it.
+# @param       : List of error messages of the Dataframe, in the order of their codes
+# @param       : Dictionary of error message -> code, shared by all the chunks. New messages are added to it.
+# @return      : The same Dataframe with codes into name_codes and message_codes
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def remap_name_codes(compact_df: pd.DataFrame, range_names: list, name_codes: dict, range_messages: list,
+                     message_codes: dict) -> pd.DataFrame:
+    range_to_shared = np.array([name_codes.setdefault(name, len(name_codes)) for name in range_names] + [-1],
+                               dtype=np.int32)
+    for col_name in ["Scenario", "Transaction_Name"]:
+        # Code -1 (missing name) picks the -1 at the end of range_to_shared
+        compact_df[col_name] = range_to_shared[compact_df[col_name].to_numpy()]
+
+    range_to_shared = np.array([message_codes.setdefault(message, len(message_codes))
+                                for message in range_messages] + [-1], dtype=np.int32)
+    compact_df["ErrorMessage"] = range_to_shared[compact_df["ErrorMessage"].to_numpy()]
+
+    return compact_df
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: read_gatling_log_chunks
+# Description  : Reads one log into compact chunks, in order, with the reader of its format. Large plain text logs
+#                are split into byte ranges, which are parsed in parallel by the given worker processes and given
+#                back in order.
+# @param       : Path of the Log File
+# @param       : Format of the log, as given by read_gatling_log_header
+# @param       : Dictionary of name -> code, shared by all the chunks. New names are added to it.
+# @param       : Dictionary of error message -> code, shared by all the chunks. New messages are added to it.
+# @param       : Time Difference in milliseconds
+# @param       : Parser of Gatling 2 text logs: "fast" or "pandas"
+# @param       : Process pool parsing the byte ranges. Default is None, which parses in the current process.
+# @param       : Maximum number of byte ranges of a log parsed by the process pool. Default is 1.
+# @param       : Sample Rate of the byte ranges, from 0 to 1. Default is 1, which keeps all the records.
+# @return      : Generator of compact Dataframes, see iter_gatling_log_chunks. Only the byte ranges are sampled.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def read_gatling_log_chunks(simulation_log: Path, log_format: str, name_codes: dict, message_codes: dict,
+                            time_diff_ms: int, parser: str = "fast", executor: ProcessPoolExecutor = None,
+                            max_ranges: int = 1, sample_rate: float = 1):
+    # Column Names of the pandas parser. The error message is the last field of the requests.
+    gat_log_col_names = ["Owner", "Scenario", "ThreadId", "JunkCol1",
+                         "Transaction_Name", "StartTime", "EndTime", "Status", "Message"]
+
+    # Large plain text logs are split into byte ranges, parsed in parallel and joined back in order
+    byte_ranges = []
+    if log_format != BINARY_LOG and (parser == "fast" or log_format != GATLING_2_TEXT) and executor is not None \
+            and max_ranges > 1 and detect_compression(simulation_log) is None:
+        byte_ranges = split_log_byte_ranges(simulation_log, max_ranges)
+
+    if log_format == BINARY_LOG:
+        yield from read_binary_gatling_log(simulation_log, name_codes, time_diff_ms, message_codes)
+    elif len(byte_ranges) > 1:
+        for range_names, range_messages, range_df in executor.map(
+                parse_gatling_log_range, repeat(simulation_log), byte_ranges, repeat(time_diff_ms),
+                repeat(log_format), repeat(sample_rate)):
+            yield remap_name_codes(range_df, range_names, name_codes, range_messages, message_codes)
+    elif parser == "fast" or log_format != GATLING_2_TEXT:
+        for block in iter_gatling_log_blocks(simulation_log):
+            yield tokenize_gatling_log_block(block, name_codes, time_diff_ms, message_codes, log_format)
+    else:
+        with open_gatling_log(simulation_log) as log_file:
+            for gat_log_df in pd.read_csv(log_file, sep='\t', header=None, names=gat_log_col_names,
+                                          dtype=str, chunksize=GATLING_LOG_CHUNK_SIZE):
+                yield compact_gatling_log_chunk(gat_log_df, name_codes, time_diff_ms, message_codes)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: iter_gatling_log_chunks
+# Description  : Reads one log into compact chunks, in order, see read_gatling_log_chunks, and keeps the sampled
+#                records of every chunk, see sample_compact_chunk
+# @param       : Path of the Log File
+# @param       : Format of the log, as given by read_gatling_log_header
+# @param       : Dictionary of name -> code, shared by all the chunks. New names are added to it.
+# @param       : Dictionary of error message -> code, shared by all the chunks. New messages are added to it.
+# @param       : Time Difference in milliseconds
+# @param       : Parser of Gatling 2 text logs: "fast" or "pandas"
+# @param       : Process pool parsing the byte ranges. Default is None, which parses in the current process.
+# @param       : Maximum number of byte ranges of a log parsed by the process pool. Default is 1.
+# @param       : Sample Rate, from 0 to 1. Default is 1, which keeps all the records.
+# @return      : Generator of compact Dataframes with columns: [Owner,Scenario,Transaction_Name,Status,ResponseTime,
+#                LocalTime,ErrorMessage] of codes. Logs other than Gatling 2 text logs still have to be resolved,
+#                see resolve_request_scenarios.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def iter_gatling_log_chunks(simulation_log: Path, log_format: str, name_codes: dict, message_codes: dict,
+                            time_diff_ms: int, parser: str = "fast", executor: ProcessPoolExecutor = None,
+                            max_ranges: int = 1, sample_rate: float = 1):
+    log_chunks = read_gatling_log_chunks(simulation_log, log_format, name_codes, message_codes, time_diff_ms,
+                                         parser, executor, max_ranges, sample_rate)
+    if sample_rate >= 1:
+        yield from log_chunks
+        return
+
+    # Transactions of the log already seen, in the order of the chunks
+    seen_transactions = set()
+    for compact_df in log_chunks:
+        yield sample_compact_chunk(compact_df, list(name_codes), sample_rate, seen_transactions)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: Generate_Gatling_Log_Df
+# Description  : Consumes the Gatling Logs and Return a clean Dataframe which can be used by other functions.
+#                This is the one entry point for all the log formats: Gatling 2 and 3 text logs and binary logs,
+#                plain or compressed, detected per log.
+#                The Dataframe is compact: Owner and Status are one byte categoricals, Scenario and Transaction_Name
+#                are categoricals sharing one dictionary, ResponseTime is int32 and LocalTime is int64 epoch ms.
+#                ErrorMessage is a categorical of the interned error messages, set on the KO requests only, so a run
+#                with millions of identical errors keeps one string and one code per row.
+#                GROUP rows are kept next to the requests: Transaction_Name is their group hierarchy (comma separated,
+#                as in the log), ResponseTime their cumulated response time and LocalTime their start.
+# @param       : List of Simulation Logs
+# @param       : Float format of Time Difference
+# @param       : Parser of Gatling 2 text logs: "fast" (dedicated tokenizer, default) or "pandas" (pd.read_csv).
+#                Other formats are always read by their dedicated reader.
+# @param       : Number of worker processes used by the fast parser to parse each plain log by byte ranges.
+#                Default is 1, which parses in the current process.
+# @param       : Sample Rate, from 0 to 1, for a quick preview of a large run: only this fraction of the requests
+#                and groups is kept, picked by a hash of their content within every transaction, plus the first
+#                record of every transaction, see sample_compact_chunk. Every parser keeps the same records. USER
+#                records are all kept. Default is 1, all records.
+# @return      : Dataframe gat_log_graph_df with columns: [Owner,Scenario,Transaction_Name,Status,ResponseTime,
+#                LocalTime,ErrorMessage]
+# Author       : Navdit Sharma
+# Comments     : Created on 05/09/2018 
+##################################################################################################################
+def generate_gatling_log_df(simulation_logs_list: list, time_diff: float, parser: str = "fast",
+                            jobs: int = 1, sample_rate: float = 1) -> pd.DataFrame:
+    # Time Difference in ms
+    time_diff_ms = int(round(time_diff * 60 * 60 * 1000))
+
+    # Reading into compact chunks, interning the names and the error messages across all the log files
+    name_codes, message_codes = {}, {}
+    compact_chunks = []
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        for simulation_log in simulation_logs_list:
+            log_format, simulation_name = read_gatling_log_header(simulation_log)
+            log_chunks = list(iter_gatling_log_chunks(simulation_log, log_format, name_codes, message_codes,
+                                                      time_diff_ms, parser, executor, jobs, sample_rate))
+
+            # Only Gatling 2 logs write the scenario of every request
+            if log_format == GATLING_2_TEXT:
+                compact_chunks.extend(log_chunks)
+            elif log_chunks:
+                compact_chunks.append(resolve_request_scenarios(pd.concat(log_chunks, ignore_index=True),
+                                                                simulation_name, name_codes))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    # Join the chunks and reset the index of the dataframe
+    gat_log_graph_df = pd.concat(compact_chunks, ignore_index=True)
+
+    # Scenario and Transaction_Name share one dictionary of names
+    name_dtype = pd.CategoricalDtype(categories=list(name_codes))
+    for col_name in ["Scenario", "Transaction_Name"]:
+        gat_log_graph_df[col_name] = pd.Categorical.from_codes(gat_log_graph_df[col_name], dtype=name_dtype)
+    gat_log_graph_df["ErrorMessage"] = pd.Categorical.from_codes(gat_log_graph_df["ErrorMessage"],
+                                                                 categories=list(message_codes))
+
+    return gat_log_graph_df
+
+
+##################################################################################################################
@@ -0,0 +1,176 @@
+# ============================================================================================================
+# Purpose:           Options of the reports, which are validated before any heavy module is imported.
+# Author:            Navdit Sharma (Nav)
+# Notes:             Only needs the standard library: the command line checks its arguments with these before
+#                    pandas and Bokeh are imported, so that mistakes fail fast.
+# Revision:          Last change: 18/10/26 :: Top transactions capped at the colours of the graphs
+# ==============================================================================================================
+
+import operator
+import re
+
+
+# Percentiles always kept in the aggregates. Other requested percentiles are added to them.
+AGGREGATE_PERCENTILES = [50, 90, 95, 99]
+
+# Formats of the metrics export
+EXPORT_FORMATS = ["parquet", "csv", "json"]
+
+# Formats of the transaction summary
+SUMMARY_FORMATS = ["table", "json"]
+
+# Summary thresholds, e.g. p95<800 or GET_Account:error_rate<=1
+SUMMARY_THRESHOLD_PATTERN = re.compile(r"^(?:(?P<transaction>.+):)?(?P<metric>[A-Za-z_]+|[pP][0-9.]+)\s*"
+                                       r"(?P<operator><=|>=|<|>)\s*(?P<value>[0-9.]+)$")
+SUMMARY_THRESHOLD_OPERATORS = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge}
+SUMMARY_THRESHOLD_METRICS = {"count": "Count", "errors": "Errors", "error_rate": "ErrorRate",
+                             "throughput": "Throughput"}
+
+# Sample rate of the preview of a run
+PREVIEW_SAMPLE_RATE = 0.01
+
+# Units of the memory limit, e.g. 512MB or 2G
+MEMORY_LIMIT_PATTERN = re.compile(r"^(?P<value>[0-9.]+)\s*(?P<unit>[KMGT]?)B?$", re.IGNORECASE)
+MEMORY_LIMIT_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+# Rankings of the top transactions of the graphs: by number of requests, or by percentile (the slowest first)
+TOP_TRANSACTIONS_RANKINGS = ["count", "percentile"]
+
+# Most transactions drawn as their own lines in a graph, one per colour of the palette. Wider scenarios are drawn as
+# their top GRAPH_MAX_TRANSACTIONS - 1 transactions and one line of all the others.
+GRAPH_MAX_TRANSACTIONS = 19
+
+
+##################################################################################################################
+# Function Name: get_percentile_col_name
+# Description  : Gives the name of the column of the given percentile in the aggregates, e.g. P95
+# @param       : Percentile
+# @return      : Column Name
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_percentile_col_name(percentile: float) -> str:
+    return "P{:g}".format(percentile)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: parse_percentiles
+# Description  : Parses the percentiles of the graphs, given as one percentile or a list separated by "," (e.g.
+#                50,90,95,99). Repeated percentiles are only kept once, in the given order.
+# @param       : Percentiles
+# @return      : List of Percentiles
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def parse_percentiles(percentiles: str) -> list:
+    percentiles_list = []
+    for percentile in str(percentiles).split(","):
+        if not percentile.strip().isdigit() or not 0 < int(percentile) <= 100:
+            raise ValueError("Percentiles have to be whole numbers between 1 and 100, separated by \",\" "
+                             "(e.g. 50,90,95,99). Given value is {}".format(percentiles))
+        if int(percentile) not in percentiles_list:
+            percentiles_list.append(int(percentile))
+
+    return percentiles_list
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: parse_summary_threshold
+# Description  : Parses a threshold on the summary of the transactions, e.g. p95<800, error_rate<=1 or
+#                GET_Account:p99<1500. Without a transaction name, the threshold applies to every transaction.
+# @param       : Threshold
+# @return      : Dictionary with transaction (None for all), metric (column of the summary), percentile (None if
+#                the metric is not a percentile), operator and value
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def parse_summary_threshold(threshold: str) -> dict:
+    match = SUMMARY_THRESHOLD_PATTERN.match(threshold.strip())
+    if match is None:
+        raise ValueError("Threshold {} is not like [transaction:]metric<value, e.g. p95<800".format(threshold))
+
+    metric = match.group("metric").lower()
+    percentile = None
+    if metric.startswith("p") and metric not in SUMMARY_THRESHOLD_METRICS:
+        percentile = float(metric[1:])
+        if not 0 < percentile <= 100:
+            raise ValueError("Percentile of threshold {} has to be between 0 and 100".format(threshold))
+        metric = get_percentile_col_name(percentile)
+    elif metric in SUMMARY_THRESHOLD_METRICS:
+        metric = SUMMARY_THRESHOLD_METRICS[metric]
+    else:
+        raise ValueError("Metric of threshold {} has to be one of {} or a percentile like p95".format(
+            threshold, ", ".join(SUMMARY_THRESHOLD_METRICS)))
+
+    return {"threshold": threshold.strip(), "transaction": match.group("transaction"), "metric": metric,
+            "percentile": percentile, "operator": match.group("operator"), "value": float(match.group("value"))}
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: parse_sample_rate
+# Description  : Parses the sample rate of a preview, given as a fraction (e.g. 0.05) or a percentage (e.g. 5%)
+# @param       : Sample Rate
+# @return      : Sample Rate, above 0 and up to 1
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def parse_sample_rate(sample_rate: str) -> float:
+    try:
+        rate = float(sample_rate[:-1]) / 100 if sample_rate.endswith("%") else float(sample_rate)
+    except ValueError:
+        rate = 0
+    if not 0 < rate <= 1:
+        raise ValueError("Sample rate has to be above 0 and up to 1 (e.g. 0.05) or a percentage (e.g. 5%). "
+                         "Given value is {}".format(sample_rate))
+
+    return rate
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: parse_top_transactions
+# Description  : Parses the number of top transactions drawn as their own lines in the graphs of a scenario
+# @param       : Number of Top Transactions
+# @return      : Number of Top Transactions, from 1 to GRAPH_MAX_TRANSACTIONS
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def parse_top_transactions(top: str) -> int:
+    if not top.strip().isdigit() or not 1 <= int(top) <= GRAPH_MAX_TRANSACTIONS:
+        raise ValueError("Number of top transactions has to be a whole number from 1 to {}. Given value is {}"
+                         .format(GRAPH_MAX_TRANSACTIONS, top))
+
+    return int(top)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: parse_memory_limit
+# Description  : Parses a memory limit given in bytes or with a unit, e.g. 512MB, 2G or 1.5GB (units of 1024)
+# @param       : Memory Limit
+# @return      : Memory Limit in bytes
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def parse_memory_limit(memory_limit: str) -> int:
+    match = MEMORY_LIMIT_PATTERN.match(memory_limit.strip())
+    if match is None or match.group("value").count(".") > 1 or float(match.group("value")) <= 0:
+        raise ValueError("Memory limit has to be a size like 512MB or 2GB. Given value is {}".format(memory_limit))
+
+    return int(float(match.group("value")) * MEMORY_LIMIT_UNITS[match.group("unit").upper()])
+
+
+##################################################################################################################
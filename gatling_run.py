@@ -0,0 +1,208 @@
+# ============================================================================================================
+# Purpose:           Compact in-memory Gatling Run, the entry point of the Python API.
+# Author:            Navdit Sharma (Nav)
+# Notes:             A run is loaded once and can then be given to the metrics engine and the report builders
+#                    any number of times, in the same process:
+#                        run = GatlingRun.load(["simulation.log"])
+#                        metrics_df, overall_df = run.scenario_metrics("MyScenario", "RPS", 95)
+#                        percentiles_metrics = run.scenario_percentiles_metrics("MyScenario", "RPS", [50, 95])
+#                        top_metrics = run.scenario_percentiles_metrics("MyScenario", "RPS", [95], top=10)
+#                        tabs = ScenarioReportBuilder(95).build(run)
+#                        summary_df = run.summary([50, 95, 99])
+#                        phase_summary_df = run.phase_summary([50, 95, 99])
+#                        steady_run = run.steady_state()
+#                        steady_run.export([50, 95], "export", "csv")
+#                    A run loaded with a sample rate below 1 is a preview: its counts are scaled back up to the
+#                    whole run by every method. Runs too large for memory are read from on-disk scenario
+#                    partitions, see PartitionedGatlingRun in gatling_run_partitions.py. The report builders and the
+#                    summary read any GatlingReportSource, such as MergedGatlingRun of the partials of a run, which
+#                    has no records.
+# Revision:          Last change: 18/10/26 :: Export of a run, overridden by the partitioned runs
+# ==============================================================================================================
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+
+from gatling_log_parser import generate_gatling_log_df
+from gatling_report_options import AGGREGATE_PERCENTILES
+from gatling_run_aggregates import (AGGREGATE_BUCKET_MS, compute_run_aggregates, compute_transaction_summary,
+                                    get_run_label)
+from gatling_run_phases import compute_scenario_phase_summary, detect_scenario_phases, get_steady_state_df
+from gatling_scenario_metrics import (export_metrics, get_list_of_scenarios, get_scenario_error_breakdown,
+                                      get_scenario_export_metrics, get_scenario_heatmap, get_scenario_metrics,
+                                      get_scenario_percentiles_metrics, scale_sampled_counts)
+
+
+##################################################################################################################
+# Class Name   : GatlingReportSource
+# Description  : What the scenario report builders and the summary read from a run: its scenarios, their metrics,
+#                heatmaps and error breakdowns, and the aggregates and summary of the whole run. The aggregates are
+#                cached and the summary and aggregates of a sampled run are scaled back up to the whole run.
+#                GatlingRun adds the records of the run (scenario_df, export, phases and steady state) to it.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+class GatlingReportSource(ABC):
+    def __init__(self, simulation_logs_list: list = None, label: str = None, sample_rate: float = 1):
+        self.sample_rate = sample_rate
+        self.simulation_logs_list = list(simulation_logs_list or [])
+        if label is None:
+            label = get_run_label(self.simulation_logs_list) if self.simulation_logs_list else "Run"
+        self.label = label
+        self._aggregates = {}
+
+    @property
+    @abstractmethod
+    def scenarios(self) -> list:
+        pass
+
+    @abstractmethod
+    def scenario_metrics(self, scenario_name: str, right_y_axis_filter: str, percentile: int) \
+            -> (pd.DataFrame, pd.DataFrame):
+        pass
+
+    @abstractmethod
+    def scenario_percentiles_metrics(self, scenario_name: str, right_y_axis_filter: str, percentiles: list,
+                                     top: int = None, top_by: str = "count", max_transactions: int = None) -> dict:
+        pass
+
+    @abstractmethod
+    def scenario_heatmap(self, scenario_name: str) -> dict:
+        pass
+
+    @abstractmethod
+    def scenario_error_breakdown(self, scenario_name: str) -> dict:
+        pass
+
+    def aggregates(self, percentiles: list = None, bucket_ms: int = AGGREGATE_BUCKET_MS) -> dict:
+        percentiles = tuple(sorted(percentiles or AGGREGATE_PERCENTILES))
+        if (percentiles, bucket_ms) not in self._aggregates:
+            aggregates = self.compute_aggregates(list(percentiles), bucket_ms)
+            self._aggregates[(percentiles, bucket_ms)] = {
+                key: scale_sampled_counts(value, self.sample_rate) if isinstance(value, pd.DataFrame) else value
+                for key, value in aggregates.items()}
+        return self._aggregates[(percentiles, bucket_ms)]
+
+    def summary(self, percentiles: list = None) -> pd.DataFrame:
+        summary_df = self.compute_summary(sorted(percentiles or AGGREGATE_PERCENTILES))
+        return scale_sampled_counts(summary_df, self.sample_rate)
+
+    # Computed over the whole run, whatever its sample rate
+    @abstractmethod
+    def compute_aggregates(self, percentiles: list, bucket_ms: int) -> dict:
+        pass
+
+    @abstractmethod
+    def compute_summary(self, percentiles: list) -> pd.DataFrame:
+        pass
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Class Name   : GatlingRun
+# Description  : Holds the compact Gatling Log Dataframe of a run, as given by generate_gatling_log_df, and caches
+#                what is derived from it: the list of scenarios, the per scenario Dataframes, their phases and the
+#                aggregates.
+#                The Dataframe must not be changed after the run is created. The sample rate is the fraction of the
+#                requests and groups kept in it (see generate_gatling_log_df).
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+class GatlingRun(GatlingReportSource):
+    def __init__(self, log_df: pd.DataFrame, simulation_logs_list: list = None, label: str = None,
+                 sample_rate: float = 1):
+        super().__init__(simulation_logs_list, label, sample_rate)
+        self.log_df = log_df
+        self._scenarios = None
+        self._scenario_dfs = None
+        self._phases = {}
+
+    @classmethod
+    def load(cls, simulation_logs_list: list, time_diff: float = 0, parser: str = "fast", jobs: int = 1,
+             label: str = None, sample_rate: float = 1) -> "GatlingRun":
+        log_df = generate_gatling_log_df(list(simulation_logs_list), time_diff, parser, jobs, sample_rate)
+        return cls(log_df, simulation_logs_list, label, sample_rate)
+
+    @property
+    def scenarios(self) -> list:
+        if self._scenarios is None:
+            self._scenarios = get_list_of_scenarios(self.log_df)
+        return self._scenarios
+
+    def scenario_df(self, scenario_name: str) -> pd.DataFrame:
+        # Split by scenario in one pass, the first time a scenario is asked for
+        if self._scenario_dfs is None:
+            self._scenario_dfs = {name: scenario_df for name, scenario_df
+                                  in self.log_df.groupby("Scenario", sort=False, observed=True)}
+        if scenario_name not in self._scenario_dfs:
+            raise KeyError("Scenario {} is not in run {}".format(scenario_name, self.label))
+        return self._scenario_dfs[scenario_name]
+
+    def scenario_metrics(self, scenario_name: str, right_y_axis_filter: str, percentile: int) \
+            -> (pd.DataFrame, pd.DataFrame):
+        scenario_metrics_df, overall_df = get_scenario_metrics(scenario_name, self.scenario_df(scenario_name),
+                                                               right_y_axis_filter, percentile)
+        return scale_sampled_counts(scenario_metrics_df, self.sample_rate), overall_df
+
+    def scenario_percentiles_metrics(self, scenario_name: str, right_y_axis_filter: str, percentiles: list,
+                                     top: int = None, top_by: str = "count", max_transactions: int = None) -> dict:
+        percentiles_metrics = get_scenario_percentiles_metrics(scenario_name, self.scenario_df(scenario_name),
+                                                               right_y_axis_filter, percentiles, top, top_by,
+                                                               max_transactions)
+        return {percentile: (scale_sampled_counts(scenario_metrics_df, self.sample_rate), overall_df)
+                for percentile, (scenario_metrics_df, overall_df) in percentiles_metrics.items()}
+
+    def scenario_heatmap(self, scenario_name: str) -> dict:
+        scenario_heatmap = get_scenario_heatmap(self.scenario_df(scenario_name))
+        if scenario_heatmap is not None and self.sample_rate < 1:
+            scenario_heatmap["counts"] = (scenario_heatmap["counts"] / self.sample_rate).round().astype(np.int64)
+        return scenario_heatmap
+
+    def scenario_error_breakdown(self, scenario_name: str) -> dict:
+        error_breakdown = get_scenario_error_breakdown(self.scenario_df(scenario_name))
+        if error_breakdown is not None and self.sample_rate < 1:
+            error_breakdown["counts"] = (error_breakdown["counts"] / self.sample_rate).round().astype(np.int64)
+            error_breakdown["errors_df"] = scale_sampled_counts(error_breakdown["errors_df"], self.sample_rate)
+        return error_breakdown
+
+    def scenario_export_metrics(self, scenario_name: str, percentile) -> (pd.DataFrame, pd.DataFrame):
+        scenario_metrics_df, overall_df = get_scenario_export_metrics(self.scenario_df(scenario_name), percentile)
+        return scale_sampled_counts(scenario_metrics_df, self.sample_rate), overall_df
+
+    def phases(self, scenario_name: str) -> pd.DataFrame:
+        if scenario_name not in self._phases:
+            self._phases[scenario_name] = detect_scenario_phases(self.scenario_df(scenario_name))
+        return self._phases[scenario_name]
+
+    def phase_summary(self, percentiles: list = None) -> pd.DataFrame:
+        percentiles = sorted(percentiles or AGGREGATE_PERCENTILES)
+        scenario_summaries = []
+        for scenario_name in self.scenarios:
+            scenario_summary_df = compute_scenario_phase_summary(self.scenario_df(scenario_name),
+                                                                 self.phases(scenario_name), percentiles)
+            scenario_summary_df.insert(0, "Scenario", scenario_name)
+            scenario_summaries.append(scenario_summary_df)
+        return scale_sampled_counts(pd.concat(scenario_summaries, ignore_index=True), self.sample_rate)
+
+    def steady_state(self) -> "GatlingRun":
+        # The per bucket metrics of the returned run are only computed over the steady states
+        steady_df = get_steady_state_df(self.log_df, {scenario_name: self.phases(scenario_name)
+                                                      for scenario_name in self.scenarios})
+        return GatlingRun(steady_df, self.simulation_logs_list, self.label, self.sample_rate)
+
+    # Runs not held in one Dataframe override them
+    def export(self, percentiles: list, export_dir: str, export_format: str, jobs: int = 1):
+        export_metrics(self.log_df, percentiles, export_dir, export_format, jobs)
+
+    def compute_aggregates(self, percentiles: list, bucket_ms: int) -> dict:
+        return compute_run_aggregates(self.log_df, percentiles, bucket_ms)
+
+    def compute_summary(self, percentiles: list) -> pd.DataFrame:
+        return compute_transaction_summary(self.log_df, percentiles)
+
+
+##################################################################################################################
@@ -0,0 +1,449 @@
+# ============================================================================================================
+# Purpose:           Computes the per-bucket and overall aggregates of a Gatling Run and caches them next to its logs.
+# Author:            Navdit Sharma (Nav)
+# Notes:             The aggregates are all a run comparison needs, so a run is parsed only once. The cache is
+#                    invalidated when the logs, the time difference or the requested percentiles change. It is
+#                    plain JSON, as results folders are shared: reading it never runs code.
+# Revision:          Last change: 18/10/26 :: Change of the error rate of the compared runs
+# ==============================================================================================================
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from gatling_kernels import assign_buckets, histogram_percentiles
+from gatling_log_parser import OWNER_CATEGORIES, generate_gatling_log_df
+from gatling_report_options import AGGREGATE_PERCENTILES, SUMMARY_THRESHOLD_OPERATORS, get_percentile_col_name
+
+
+# Width of a time bucket in ms
+AGGREGATE_BUCKET_MS = 1000
+
+# Version of the cached aggregates. A cache of another version is recomputed.
+AGGREGATES_CACHE_VERSION = 3
+
+##################################################################################################################
+# Function Name: compute_run_aggregates
+# Description  : Computes the aggregates of a run from its compact Gatling Log Dataframe in grouped passes.
+#                Buckets are counted from the start of the run, so that runs can be aligned on them.
+# @param       : Gatling Log Dataframe, as given by generate_gatling_log_df
+# @param       : List of Percentiles to compute
+# @param       : Width of a time bucket in ms. Default is AGGREGATE_BUCKET_MS.
+# @param       : LocalTime (epoch ms) of the start and Duration in seconds of the run, when gat_log_df is only a
+#                part of it (e.g. one scenario). Default is the ones of gat_log_df.
+# @return      : Dictionary with:
+#                run_start - LocalTime (epoch ms) of the first record
+#                buckets - Dataframe [Scenario, Transaction, Bucket, Count, Errors, P..] of the requests per bucket.
+#                          Percentiles are of the OK requests, like in the graphs.
+#                users - Dataframe [Scenario, Bucket, Users] of the USER records per bucket
+#                transactions - Dataframe [Scenario, Transaction, Count, Errors, Throughput, P..] of the whole run.
+#                               Throughput is in requests per second over the duration of the run.
+#                group_buckets - Dataframe [Scenario, Group, Bucket, Count, Errors, P..] of the groups per bucket.
+#                                Percentiles are of the cumulated response time of the OK groups.
+#                groups - Dataframe [Scenario, Group, Count, Errors, Throughput, P..] of the whole run
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def compute_run_aggregates(gat_log_df: pd.DataFrame, percentiles: list,
+                           bucket_ms: int = AGGREGATE_BUCKET_MS, run_start: int = None,
+                           run_duration: float = None) -> dict:
+    percentile_col_names = [get_percentile_col_name(percentile) for percentile in percentiles]
+
+    if run_start is None:
+        run_start = int(gat_log_df["LocalTime"].min()) if len(gat_log_df) else 0
+    if run_duration is None:
+        run_duration = max((int(gat_log_df["LocalTime"].max()) - run_start) / 1000, 1) if len(gat_log_df) else 1
+
+    # Plain string names and buckets since the start of the run
+    requests_df = pd.DataFrame({
+        "Scenario": gat_log_df["Scenario"].astype(str),
+        "Transaction": gat_log_df["Transaction_Name"].astype(str),
+        "Bucket": assign_buckets(gat_log_df["LocalTime"].to_numpy(), run_start, bucket_ms),
+        "IsError": (gat_log_df["Status"] == "KO").to_numpy(),
+        "IsOK": (gat_log_df["Status"] == "OK").to_numpy(),
+        "ResponseTime": gat_log_df["ResponseTime"].to_numpy(),
+    })
+    users_df = requests_df[(gat_log_df["Owner"] == "USER").to_numpy()]
+    groups_df = requests_df[(gat_log_df["Owner"] == "GROUP").to_numpy()].rename(columns={"Transaction": "Group"})
+    requests_df = requests_df[(gat_log_df["Owner"] == "REQUEST").to_numpy()]
+
+    # Requests and groups, per bucket and for the whole run
+    buckets_df, transactions_df = aggregate_timings(requests_df, "Transaction", run_duration, percentiles,
+                                                    percentile_col_names)
+    group_buckets_df, groups_df = aggregate_timings(groups_df, "Group", run_duration, percentiles,
+                                                    percentile_col_names)
+
+    return {
+        "run_start": run_start,
+        "buckets": buckets_df,
+        "users": users_df.groupby(["Scenario", "Bucket"], sort=True).size().rename("Users").reset_index(),
+        "transactions": transactions_df,
+        "group_buckets": group_buckets_df,
+        "groups": groups_df,
+    }
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: aggregate_timings
+# Description  : Aggregates the timed records (requests or groups) of a run per bucket and for the whole run
+# @param       : Dataframe of the records with the columns Scenario, the name column, Bucket, IsError, IsOK and
+#                ResponseTime
+# @param       : Name Column (Transaction or Group)
+# @param       : Duration of the run in seconds
+# @param       : List of Percentiles
+# @param       : List of Column Names of the Percentiles
+# @return      : Dataframe [Scenario, ${name column}, Bucket, Count, Errors, P..] per bucket and Dataframe [Scenario,
+#                ${name column}, Count, Errors, Throughput, P..] of the whole run
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def aggregate_timings(timings_df: pd.DataFrame, name_col_name: str, run_duration: float, percentiles: list,
+                      percentile_col_names: list) -> (pd.DataFrame, pd.DataFrame):
+    # Per bucket
+    bucket_keys = ["Scenario", name_col_name, "Bucket"]
+    buckets_df = timings_df.groupby(bucket_keys, sort=True).agg(Count=("IsError", "size"),
+                                                                Errors=("IsError", "sum"))
+    buckets_df = buckets_df.join(get_percentiles_df(timings_df, bucket_keys, percentiles, percentile_col_names))
+
+    # Whole run
+    name_keys = ["Scenario", name_col_name]
+    names_df = timings_df.groupby(name_keys, sort=True).agg(Count=("IsError", "size"), Errors=("IsError", "sum"))
+    names_df["Throughput"] = (names_df["Count"] / run_duration).round(3)
+    names_df = names_df.join(get_percentiles_df(timings_df, name_keys, percentiles, percentile_col_names))
+
+    return buckets_df.reset_index(), names_df.reset_index()
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: compute_transaction_summary
+# Description  : Computes the whole run summary of every transaction and group straight from the compact Gatling Log
+#                Dataframe: the histograms of the OK response times of every transaction give all the percentiles,
+#                and the counts are bincounts of the name codes. Percentiles are interpolated like pandas quantile.
+#                Groups are summarised the same way, from their cumulated response time.
+# @param       : Gatling Log Dataframe, as given by generate_gatling_log_df
+# @param       : List of Percentiles to compute
+# @param       : Duration of the run in seconds, when gat_log_df is only a part of it (e.g. one scenario). Default
+#                is the one of gat_log_df.
+# @return      : Dataframe [Scenario, Transaction, Type, Count, Errors, ErrorRate, Throughput, P..]. Type is REQUEST
+#                or GROUP, the Transaction of a group is its group hierarchy. ErrorRate is in %, Throughput in
+#                requests (or groups) per second over the duration of the run.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def compute_transaction_summary(gat_log_df: pd.DataFrame, percentiles: list,
+                                run_duration: float = None) -> pd.DataFrame:
+    percentile_col_names = [get_percentile_col_name(percentile) for percentile in percentiles]
+    summary_col_names = ["Scenario", "Transaction", "Type", "Count", "Errors", "ErrorRate", "Throughput"]
+    if not len(gat_log_df):
+        return pd.DataFrame(columns=summary_col_names + percentile_col_names)
+
+    if run_duration is None:
+        local_time = gat_log_df["LocalTime"].to_numpy()
+        run_duration = max((int(local_time.max()) - int(local_time.min())) / 1000, 1)
+
+    # Scenario and Transaction share their categories, so a pair of codes and the owner (0 REQUEST, 2 GROUP) is one
+    # key
+    owner_codes = gat_log_df["Owner"].cat.codes.to_numpy()
+    is_timed = (owner_codes == 0) | (owner_codes == 2)
+    name_count = len(gat_log_df["Transaction_Name"].cat.categories)
+    keys = (owner_codes[is_timed].astype(np.int64) * name_count +
+            gat_log_df["Scenario"].cat.codes.to_numpy()[is_timed]) * name_count + \
+        gat_log_df["Transaction_Name"].cat.codes.to_numpy()[is_timed]
+    is_ok = (gat_log_df["Status"] == "OK").to_numpy()[is_timed]
+    response_times = gat_log_df["ResponseTime"].to_numpy()[is_timed]
+
+    # Counts
+    summary_keys, key_index = np.unique(keys, return_inverse=True)
+    counts = np.bincount(key_index, minlength=len(summary_keys))
+    errors = np.bincount(key_index, weights=~is_ok, minlength=len(summary_keys)).astype(np.int64)
+
+    # Percentiles of the OK requests, from their histograms
+    percentile_values = histogram_percentiles(key_index[is_ok], response_times[is_ok], len(summary_keys),
+                                              percentiles).round(2)
+
+    summary_df = pd.DataFrame({
+        "Scenario": gat_log_df["Scenario"].cat.categories[summary_keys // name_count % name_count],
+        "Transaction": gat_log_df["Transaction_Name"].cat.categories[summary_keys % name_count],
+        "Type": np.array(OWNER_CATEGORIES, dtype=object)[summary_keys // (name_count * name_count)],
+        "Count": counts,
+        "Errors": errors,
+        "ErrorRate": (errors / counts * 100).round(2),
+        "Throughput": (counts / run_duration).round(3),
+    })
+    for percentile_index, col_name in enumerate(percentile_col_names):
+        summary_df[col_name] = percentile_values[:, percentile_index]
+
+    return summary_df.sort_values(["Scenario", "Type", "Transaction"], ascending=[True, False, True],
+                                  ignore_index=True)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: check_summary_thresholds
+# Description  : Checks the summary of the transactions against the thresholds. Transactions without OK requests
+#                have no percentiles and are not checked against percentile thresholds. A threshold without
+#                transaction applies to every request transaction, groups are only checked when named.
+# @param       : Summary Dataframe, as given by compute_transaction_summary
+# @param       : List of thresholds, as given by parse_summary_threshold
+# @return      : List of breach messages, empty if all the thresholds are met
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def check_summary_thresholds(summary_df: pd.DataFrame, thresholds: list) -> list:
+    breaches = []
+    for threshold in thresholds:
+        threshold_df = summary_df[summary_df["Type"] == "REQUEST"]
+        if threshold["transaction"] is not None:
+            threshold_df = summary_df[summary_df["Transaction"] == threshold["transaction"]]
+            if threshold_df.empty:
+                breaches.append("{}: transaction {} not found".format(threshold["threshold"],
+                                                                      threshold["transaction"]))
+                continue
+
+        met = SUMMARY_THRESHOLD_OPERATORS[threshold["operator"]](threshold_df[threshold["metric"]], threshold["value"])
+        for row in threshold_df[~met & threshold_df[threshold["metric"]].notna()].itertuples(index=False):
+            breaches.append("{}: {} / {} is {:g}".format(threshold["threshold"], row.Scenario, row.Transaction,
+                                                         getattr(row, threshold["metric"])))
+
+    return breaches
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: get_percentiles_df
+# Description  : Computes the percentiles of the response time of the OK requests per group, all in one pass over
+#                the histograms of the groups
+# @param       : Dataframe of requests with the key columns, IsOK and ResponseTime
+# @param       : Key Columns to group by
+# @param       : List of Percentiles
+# @param       : List of Column Names of the Percentiles
+# @return      : Dataframe indexed by the keys, with one column per percentile
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_percentiles_df(requests_df: pd.DataFrame, key_col_names: list, percentiles: list,
+                       percentile_col_names: list) -> pd.DataFrame:
+    ok_groups = requests_df[requests_df["IsOK"]].groupby(key_col_names, sort=True)
+    percentile_values = histogram_percentiles(ok_groups.ngroup().to_numpy(), ok_groups.obj["ResponseTime"].to_numpy(),
+                                              ok_groups.ngroups, percentiles)
+    percentiles_df = pd.DataFrame(percentile_values, index=ok_groups.size().index, columns=percentile_col_names)
+
+    return percentiles_df.round(2)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: get_aggregates_cache_path
+# Description  : Gives the path of the JSON cache file of the aggregates of a run, next to its first log
+# @param       : List of Simulation Logs of the run
+# @return      : Path of the cache file
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_aggregates_cache_path(simulation_logs_list: list) -> Path:
+    first_log = Path(simulation_logs_list[0])
+    return first_log.with_name(first_log.name + ".aggregates.json")
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: get_aggregates_cache_key
+# Description  : Gives what the cached aggregates of a run depend on
+# @param       : List of Simulation Logs of the run
+# @param       : Time Difference
+# @return      : Dictionary of the resolved log paths with their sizes and modification times, and the time difference
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_aggregates_cache_key(simulation_logs_list: list, time_diff: float) -> dict:
+    logs = []
+    for simulation_log in simulation_logs_list:
+        log_stat = Path(simulation_log).stat()
+        logs.append([str(Path(simulation_log).resolve()), log_stat.st_size, log_stat.st_mtime_ns])
+
+    return {"version": AGGREGATES_CACHE_VERSION, "logs": logs, "time_diff": time_diff}
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: aggregates_to_json
+# Description  : Gives the aggregates of a run as plain JSON data: every Dataframe as its columns, their dtypes and
+#                their values
+# @param       : Dictionary of aggregates, see compute_run_aggregates
+# @return      : Dictionary of JSON data
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def aggregates_to_json(aggregates: dict) -> dict:
+    return {name: {"columns": list(value.columns), "dtypes": [value[col_name].dtype.str for col_name in value],
+                   "values": [value[col_name].tolist() for col_name in value]}
+            if isinstance(value, pd.DataFrame) else value
+            for name, value in aggregates.items()}
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: aggregates_from_json
+# Description  : Gives back the aggregates of a run from the JSON data of aggregates_to_json
+# @param       : Dictionary of JSON data
+# @return      : Dictionary of aggregates, see compute_run_aggregates
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def aggregates_from_json(aggregates_json: dict) -> dict:
+    return {name: pd.DataFrame({col_name: np.array(col_values, dtype=col_dtype) for col_name, col_dtype, col_values
+                                in zip(value["columns"], value["dtypes"], value["values"])}, columns=value["columns"])
+            if isinstance(value, dict) else value
+            for name, value in aggregates_json.items()}
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: load_run_aggregates
+# Description  : Gives the aggregates of a run from its cache, computing and caching them if the cache is missing,
+#                out of date or lacks one of the requested percentiles
+# @param       : List of Simulation Logs of the run
+# @param       : Time Difference
+# @param       : List of Percentiles needed
+# @param       : Log Parser (fast or pandas) and Number of Parser Processes, used if the logs have to be parsed
+# @return      : Dictionary of aggregates, see compute_run_aggregates
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def load_run_aggregates(simulation_logs_list: list, time_diff: float, percentiles: list,
+                        parser: str = "fast", jobs: int = 1) -> dict:
+    cache_path = get_aggregates_cache_path(simulation_logs_list)
+    cache_key = get_aggregates_cache_key(simulation_logs_list, time_diff)
+    needed_col_names = [get_percentile_col_name(percentile) for percentile in percentiles]
+
+    # Cached aggregates
+    if cache_path.exists():
+        try:
+            with open(cache_path, "r", encoding="utf-8") as cache_file:
+                cached = json.load(cache_file)
+            if cached["key"] == cache_key and \
+                    all(col_name in cached["aggregates"]["transactions"]["columns"] for col_name in needed_col_names):
+                return aggregates_from_json(cached["aggregates"])
+        except (OSError, ValueError, TypeError, KeyError):
+            pass
+
+    # Compute them once
+    all_percentiles = sorted(set(AGGREGATE_PERCENTILES) | set(percentiles))
+    gat_log_df = generate_gatling_log_df(simulation_logs_list, time_diff, parser, jobs)
+    aggregates = compute_run_aggregates(gat_log_df, all_percentiles)
+
+    try:
+        with open(cache_path, "w", encoding="utf-8") as cache_file:
+            json.dump({"key": cache_key, "aggregates": aggregates_to_json(aggregates)}, cache_file)
+    except OSError as error:
+        print("Aggregates could not be cached at {}: {}".format(cache_path, error))
+
+    return aggregates
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: get_run_label
+# Description  : Gives a short label of a run. Gatling writes every run into its own results folder, so logs named
+#                simulation.log are labelled by their folder, other logs by their file name.
+# @param       : List of Simulation Logs of the run
+# @return      : Label
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_run_label(simulation_logs_list: list) -> str:
+    first_log = Path(simulation_logs_list[0])
+    if first_log.name.startswith("simulation.log") and first_log.parent.name:
+        return first_log.parent.name
+    return first_log.name.split(".")[0]
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: get_unique_run_labels
+# Description  : Makes the labels of the compared runs unique, e.g. two results folders of the same name: a repeated
+#                label gets the number of its repeat, "run1", "run1 #2", "run1 #3"
+# @param       : List of the labels of the runs
+# @return      : List of unique labels, in the same order
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_unique_run_labels(run_labels: list) -> list:
+    unique_labels = []
+    for run_label in run_labels:
+        unique_label, repeat_count = run_label, 1
+        while unique_label in unique_labels:
+            repeat_count += 1
+            unique_label = "{} #{}".format(run_label, repeat_count)
+        unique_labels.append(unique_label)
+
+    return unique_labels
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: compare_run_transactions
+# Description  : Builds the per-transaction delta table of runs against the first (baseline) run
+# @param       : List of the aggregates of the runs, baseline first
+# @param       : List of the labels of the runs, made unique by get_unique_run_labels
+# @param       : Percentile to compare
+# @return      : Dataframe with Scenario, Transaction and for every run its Count, Throughput, Errors and
+#                Percentile, plus for every run after the baseline the change of Percentile and Throughput in % and
+#                the change of its error rate (errors per 100 requests) in points
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def compare_run_transactions(runs_aggregates: list, run_labels: list, percentile: float) -> pd.DataFrame:
+    percentile_col_name = get_percentile_col_name(percentile)
+    compared_col_names = ["Count", "Throughput", "Errors", percentile_col_name]
+    run_labels = get_unique_run_labels(run_labels)
+
+    delta_df = None
+    for run_index, (aggregates, run_label) in enumerate(zip(runs_aggregates, run_labels)):
+        run_df = aggregates["transactions"].set_index(["Scenario", "Transaction"])[compared_col_names]
+        run_df.columns = ["{} {}".format(run_label, col_name) for col_name in compared_col_names]
+        delta_df = run_df if delta_df is None else delta_df.join(run_df, how="outer")
+
+        if run_index > 0:
+            for col_name in [percentile_col_name, "Throughput"]:
+                baseline = delta_df["{} {}".format(run_labels[0], col_name)]
+                change = (delta_df["{} {}".format(run_label, col_name)] - baseline) / baseline.replace(0, np.nan)
+                delta_df["{} Δ{} %".format(run_label, col_name)] = (change * 100).round(1)
+
+            # Errors in points of the error rate: runs of different counts, and baselines without errors
+            error_rates = [delta_df["{} Errors".format(label)] / delta_df["{} Count".format(label)].replace(0, np.nan)
+                           for label in [run_labels[0], run_label]]
+            delta_df["{} ΔError Rate pts".format(run_label)] = ((error_rates[1] - error_rates[0]) * 100).round(2)
+
+    return delta_df.reset_index()
+
+
+##################################################################################################################
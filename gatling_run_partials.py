@@ -0,0 +1,598 @@
+# ============================================================================================================
+# Purpose:           Mergeable partial aggregates of a Gatling Run: every injector turns its own simulation.log into
+#                    a small partial, and any number of partials are merged into the run report on one machine.
+# Author:            Navdit Sharma (Nav)
+# Notes:             A partial holds, per scenario and per second of the run:
+#                        histograms - the response times of the requests and groups of every transaction and status,
+#                                     in log-linear bins (see get_sketch_bins), so percentiles stay mergeable
+#                        users      - the USER records started and ended
+#                        errors     - the KO requests of every transaction and error message
+#                    Merging is a sum of the counts over the same keys, so the partials of the injectors can be
+#                    merged in any order and in any number of steps:
+#                        run_partial = compute_run_partial(GatlingRun.load(["simulation.log"]))
+#                        write_run_partial(run_partial, "a.partial.json.gz")
+#                        run = MergedGatlingRun.load(["a.partial.json.gz", "b.partial.json.gz"])
+#                        tabs = ScenarioReportBuilder(95).build(run)
+#                    Partials are gzip compressed JSON of plain data: the columns, dtypes and values of every table.
+# Revision:          Last change: 18/10/26 :: Merged run is a report source, not a Gatling Run without records
+# ==============================================================================================================
+
+import gzip
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from gatling_report_options import get_percentile_col_name
+from gatling_run import GatlingReportSource, GatlingRun
+from gatling_run_aggregates import aggregates_from_json, aggregates_to_json
+from gatling_scenario_metrics import (ERROR_BREAKDOWN_MAX_BUCKETS, NO_ERROR_MESSAGE, OTHER_TRANSACTIONS_NAME,
+                                      get_folded_top, get_heatmap, get_top_transaction_indexes,
+                                      merge_scenario_percentiles_metrics)
+
+
+# Version of the partials. Partials of another version can't be read.
+PARTIAL_VERSION = 2
+
+# Response times below 2 * SKETCH_SUB_BINS ms are kept exact, larger ones in bins of less than 1 / SKETCH_SUB_BINS of
+# their value. Must be a power of 2.
+SKETCH_SUB_BINS = 128
+
+# Compression level of the partial files: level 3 is about as small as the slow levels, and 5 times faster
+PARTIAL_COMPRESS_LEVEL = 3
+
+# Key columns of every table of a partial. The other columns are counts, summed when partials are merged.
+PARTIAL_TABLE_KEYS = {
+    "histograms": ["Scenario", "Type", "Transaction", "Status", "Second", "Bin"],
+    "users": ["Scenario", "Second"],
+    "errors": ["Scenario", "Transaction", "ErrorMessage", "Second"],
+}
+
+# Columns of names, kept as categoricals
+PARTIAL_NAME_COL_NAMES = ["Scenario", "Type", "Transaction", "Status", "ErrorMessage"]
+
+
+##################################################################################################################
+# Function Name: get_partial_path
+# Description  : Gives the default path of the partial of a run, next to its first log
+# @param       : List of Simulation Logs of the run
+# @return      : Path of the partial
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_partial_path(simulation_logs_list: list) -> Path:
+    first_log = Path(simulation_logs_list[0])
+    return first_log.with_name(first_log.name + ".partial.json.gz")
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: get_sketch_bins
+# Description  : Gives the log-linear bin of every response time: response times below 2 * SKETCH_SUB_BINS are
+#                their own bin, larger ones are shifted right until they are below 2 * SKETCH_SUB_BINS, and the bins
+#                of every shift follow each other. Negative response times are in bin 0.
+# @param       : Numpy array of Response Times (ms)
+# @return      : int64 Numpy array of bins, in the order of the response times
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_sketch_bins(response_times: np.ndarray) -> np.ndarray:
+    values = np.maximum(np.asarray(response_times, dtype=np.int64), 0)
+    shifts = np.maximum(np.frexp(values.astype(np.float64))[1] - SKETCH_SUB_BINS.bit_length(), 0)
+    return shifts * SKETCH_SUB_BINS + (values >> shifts)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: get_sketch_values
+# Description  : Gives the response time of every bin: the value of the exact bins and the middle of the others
+# @param       : Numpy array of bins, as given by get_sketch_bins
+# @return      : float64 Numpy array of Response Times (ms)
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_sketch_values(bins: np.ndarray) -> np.ndarray:
+    bins = np.asarray(bins, dtype=np.int64)
+    shifts = np.maximum(bins // SKETCH_SUB_BINS - 1, 0)
+    return ((bins - shifts * SKETCH_SUB_BINS) << shifts) + ((1 << shifts) - 1) / 2
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: get_histogram_percentiles
+# Description  : Reads the percentiles of every group from its histogram, interpolated like pandas quantile over the
+#                values repeated as many times as they are counted
+# @param       : Group code of every bin (0 to number of groups - 1)
+# @param       : Value of every bin
+# @param       : Count of every bin
+# @param       : Number of groups
+# @param       : List of Percentiles (0 to 100)
+# @return      : float64 Numpy array [groups, percentiles]. Groups without counts are NaN.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_histogram_percentiles(group_codes: np.ndarray, values: np.ndarray, counts: np.ndarray, group_count: int,
+                              percentiles: list) -> np.ndarray:
+    order = np.lexsort((values, group_codes))
+    sorted_values = np.asarray(values, dtype=np.float64)[order]
+    cumulative_counts = np.cumsum(np.asarray(counts, dtype=np.int64)[order])
+    group_totals = np.bincount(group_codes, weights=counts, minlength=group_count).astype(np.int64)
+    group_offsets = np.cumsum(group_totals) - group_totals
+
+    # Rank of every percentile in its group, and the value at the ranks around it
+    positions = np.maximum(group_totals[:, None] - 1, 0) * (np.asarray(percentiles, dtype=np.float64) / 100)
+    lower_ranks, upper_ranks = np.floor(positions), np.ceil(positions)
+    last_bin = max(len(sorted_values) - 1, 0)
+    lower_values = sorted_values[np.minimum(np.searchsorted(
+        cumulative_counts, group_offsets[:, None] + lower_ranks.astype(np.int64), side="right"), last_bin)] \
+        if len(sorted_values) else np.zeros(positions.shape)
+    upper_values = sorted_values[np.minimum(np.searchsorted(
+        cumulative_counts, group_offsets[:, None] + upper_ranks.astype(np.int64), side="right"), last_bin)] \
+        if len(sorted_values) else np.zeros(positions.shape)
+
+    percentile_values = lower_values + (upper_values - lower_values) * (positions - lower_ranks)
+    percentile_values[group_totals == 0] = np.nan
+    return percentile_values
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: as_name_categories
+# Description  : Turns the name columns of a table of a partial into categoricals of the names they use
+# @param       : Table of a partial
+# @return      : The same Dataframe
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def as_name_categories(table_df: pd.DataFrame) -> pd.DataFrame:
+    for col_name in PARTIAL_NAME_COL_NAMES:
+        if col_name in table_df:
+            table_df[col_name] = table_df[col_name].astype(str).astype("category")
+    return table_df
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: compute_scenario_partial
+# Description  : Computes the tables of the partial of one scenario, in grouped passes over its records
+# @param       : Scenario Name
+# @param       : Dataframe scenario_df, which is a filtered dataframe of gat_log_df based on given scenario.
+# @return      : Dictionary of table name -> Dataframe, see PARTIAL_TABLE_KEYS
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def compute_scenario_partial(scenario_name: str, scenario_df: pd.DataFrame) -> dict:
+    owner_codes = scenario_df["Owner"].cat.codes.to_numpy()
+    transaction_codes = scenario_df["Transaction_Name"].cat.codes.to_numpy()
+    transaction_names = scenario_df["Transaction_Name"].cat.categories.to_numpy()
+    seconds = scenario_df["LocalTime"].to_numpy().astype(np.int64) // 1000
+
+    # Requests and groups, grouped by codes and then named
+    is_timed = (owner_codes == 0) | (owner_codes == 2)
+    histograms_df = pd.DataFrame({
+        "Type": owner_codes[is_timed],
+        "Transaction": transaction_codes[is_timed],
+        "Status": scenario_df["Status"].cat.codes.to_numpy()[is_timed],
+        "Second": seconds[is_timed],
+        "Bin": get_sketch_bins(scenario_df["ResponseTime"].to_numpy()[is_timed]),
+    }).groupby(PARTIAL_TABLE_KEYS["histograms"][1:], sort=True).size().rename("Count").reset_index() \
+        .astype({"Bin": np.int16, "Count": np.int32})
+    histograms_df["Type"] = scenario_df["Owner"].cat.categories.to_numpy()[histograms_df["Type"]]
+    histograms_df["Transaction"] = transaction_names[histograms_df["Transaction"]]
+    histograms_df["Status"] = scenario_df["Status"].cat.categories.to_numpy()[histograms_df["Status"]]
+
+    # Users started and ended
+    is_user = owner_codes == 1
+    is_start = (scenario_df["Transaction_Name"] == "START").to_numpy()[is_user]
+    users_df = pd.DataFrame({"Second": seconds[is_user], "Starts": is_start, "Ends": ~is_start}) \
+        .groupby("Second", sort=True).sum().astype(np.int32).reset_index()
+
+    # KO requests, by error message. Code 0 of the messages is no message.
+    is_error = (owner_codes == 0) & (scenario_df["Status"] == "KO").to_numpy()
+    errors_df = pd.DataFrame({
+        "Transaction": transaction_codes[is_error],
+        "ErrorMessage": scenario_df["ErrorMessage"].cat.codes.to_numpy()[is_error].astype(np.int64) + 1,
+        "Second": seconds[is_error],
+    }).groupby(PARTIAL_TABLE_KEYS["errors"][1:], sort=True).size().rename("Count").reset_index() \
+        .astype({"Count": np.int32})
+    message_names = np.array([NO_ERROR_MESSAGE] + [message if message.strip() else NO_ERROR_MESSAGE
+                                                   for message in scenario_df["ErrorMessage"].cat.categories],
+                             dtype=object)
+    errors_df["Transaction"] = transaction_names[errors_df["Transaction"]]
+    errors_df["ErrorMessage"] = message_names[errors_df["ErrorMessage"]]
+
+    scenario_partial = {}
+    for table_name, table_df in [("histograms", histograms_df), ("users", users_df), ("errors", errors_df)]:
+        table_df.insert(0, "Scenario", scenario_name)
+        scenario_partial[table_name] = table_df
+    return scenario_partial
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: compute_run_partial
+# Description  : Computes the partial of a run, scenario by scenario, so that a partitioned run is never in memory as
+#                a whole
+# @param       : Gatling Run, in memory or partitioned. Sampled runs are not partials of the whole run.
+# @return      : Dictionary of the partial: version, label, logs, run_start and run_end (first and last LocalTime,
+#                epoch ms) and the tables, see PARTIAL_TABLE_KEYS
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def compute_run_partial(run: GatlingRun) -> dict:
+    if run.sample_rate < 1:
+        raise ValueError("The partial of a sampled run would not add up with the others, load the whole run")
+
+    scenario_partials, run_times = [], []
+    for scenario_name in run.scenarios:
+        scenario_df = run.scenario_df(scenario_name)
+        scenario_partials.append(compute_scenario_partial(scenario_name, scenario_df))
+        run_times.extend([int(scenario_df["LocalTime"].min()), int(scenario_df["LocalTime"].max())])
+
+    run_partial = {
+        "version": PARTIAL_VERSION,
+        "label": run.label,
+        "logs": list(run.simulation_logs_list),
+        "run_start": min(run_times) if run_times else None,
+        "run_end": max(run_times) if run_times else None,
+    }
+    for table_name in PARTIAL_TABLE_KEYS:
+        run_partial[table_name] = as_name_categories(pd.concat(
+            [scenario_partial[table_name] for scenario_partial in scenario_partials], ignore_index=True)) \
+            if scenario_partials else pd.DataFrame(columns=PARTIAL_TABLE_KEYS[table_name])
+    return run_partial
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: merge_run_partials
+# Description  : Merges partials into one: the counts of the same keys are summed, the run spans all the partials
+# @param       : List of partials, as given by compute_run_partial or read_run_partial
+# @return      : Merged partial, labelled like the first one
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def merge_run_partials(run_partials: list) -> dict:
+    for run_partial in run_partials:
+        if run_partial.get("version") != PARTIAL_VERSION:
+            raise ValueError("Partial of {} is of version {}, only version {} can be merged".format(
+                run_partial.get("label"), run_partial.get("version"), PARTIAL_VERSION))
+
+    run_starts = [run_partial["run_start"] for run_partial in run_partials if run_partial["run_start"] is not None]
+    run_ends = [run_partial["run_end"] for run_partial in run_partials if run_partial["run_end"] is not None]
+    merged_partial = {
+        "version": PARTIAL_VERSION,
+        "label": run_partials[0]["label"],
+        "logs": [simulation_log for run_partial in run_partials for simulation_log in run_partial["logs"]],
+        "run_start": min(run_starts) if run_starts else None,
+        "run_end": max(run_ends) if run_ends else None,
+    }
+    for table_name, key_col_names in PARTIAL_TABLE_KEYS.items():
+        table_df = pd.concat([as_name_categories(run_partial[table_name].copy()) for run_partial in run_partials],
+                             ignore_index=True)
+        merged_partial[table_name] = as_name_categories(
+            table_df.groupby(key_col_names, sort=True, observed=True).sum().reset_index())
+    return merged_partial
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: write_run_partial
+# Description  : Writes a partial as gzip compressed JSON, its tables as their columns, dtypes and values (see
+#                aggregates_to_json) and PARTIAL_COMPRESS_LEVEL
+# @param       : Partial
+# @param       : Path of the partial file
+# @return      : Path of the partial file
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def write_run_partial(run_partial: dict, partial_path: str) -> Path:
+    with gzip.open(partial_path, "wt", encoding="utf-8", compresslevel=PARTIAL_COMPRESS_LEVEL) as partial_file:
+        json.dump(aggregates_to_json(run_partial), partial_file)
+    return Path(partial_path)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: read_run_partial
+# Description  : Reads a partial written by write_run_partial
+# @param       : Path of the partial file
+# @return      : Partial. Raises ValueError if the file is not a partial, or a partial of another version.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def read_run_partial(partial_path: str) -> dict:
+    try:
+        with gzip.open(partial_path, "rt", encoding="utf-8") as partial_file:
+            partial_json = json.load(partial_file)
+    except (OSError, EOFError, ValueError) as error:
+        raise ValueError("{} is not a partial, as written by the aggregate command: {}".format(partial_path, error))
+    if not isinstance(partial_json, dict) or "version" not in partial_json:
+        raise ValueError("{} is not a partial, as written by the aggregate command".format(partial_path))
+    if partial_json["version"] != PARTIAL_VERSION:
+        raise ValueError("{} is a partial of version {}, only version {} can be read. Aggregate its logs again."
+                         .format(partial_path, partial_json["version"], PARTIAL_VERSION))
+    if not all(isinstance(partial_json.get(table_name), dict) for table_name in PARTIAL_TABLE_KEYS):
+        raise ValueError("{} is not a partial, as written by the aggregate command".format(partial_path))
+
+    run_partial = aggregates_from_json(partial_json)
+    for table_name in PARTIAL_TABLE_KEYS:
+        as_name_categories(run_partial[table_name])
+    return run_partial
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: aggregate_histograms
+# Description  : Counts the records and errors and reads the percentiles of the OK records of every group of the
+#                given histogram rows
+# @param       : Rows of the histograms table of a partial
+# @param       : List of Key Columns of the groups
+# @param       : List of Percentiles
+# @return      : Dataframe [${key columns}, Count, Errors, P..] of the groups, sorted by their keys. Percentiles are
+#                rounded to 2 decimals and NaN for the groups without OK records.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def aggregate_histograms(histograms_df: pd.DataFrame, key_col_names: list, percentiles: list) -> pd.DataFrame:
+    grouped_histograms = histograms_df.groupby(key_col_names, sort=True, observed=True)
+    group_codes = grouped_histograms.ngroup().to_numpy()
+    groups_df = grouped_histograms.size().index.to_frame(index=False)
+    counts = histograms_df["Count"].to_numpy()
+    is_ok = (histograms_df["Status"] == "OK").to_numpy()
+
+    groups_df["Count"] = np.bincount(group_codes, weights=counts, minlength=len(groups_df)).astype(np.int64)
+    groups_df["Errors"] = np.bincount(group_codes, weights=np.where(is_ok, 0, counts),
+                                      minlength=len(groups_df)).astype(np.int64)
+    percentile_values = get_histogram_percentiles(group_codes[is_ok], get_sketch_values(histograms_df["Bin"])[is_ok],
+                                                  counts[is_ok], len(groups_df), percentiles).round(2)
+    for percentile_index, percentile in enumerate(percentiles):
+        groups_df[get_percentile_col_name(percentile)] = percentile_values[:, percentile_index]
+
+    for col_name in key_col_names:
+        if col_name in PARTIAL_NAME_COL_NAMES:
+            groups_df[col_name] = groups_df[col_name].astype(str)
+    return groups_df
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: fold_other_histograms
+# Description  : Keeps the top transactions of a scenario and folds the histograms of all the others into
+#                OTHER_TRANSACTIONS_NAME, like fold_other_transactions does with the records
+# @param       : REQUEST rows of the histograms table of the scenario
+# @param       : OK rows of the same
+# @param       : Number of Top Transactions, or None
+# @param       : Ranking of the transactions: "count" or "percentile"
+# @param       : Percentile of the ranking by percentile
+# @param       : Most transactions without top, see get_folded_top. Default is None, for no limit.
+# @return      : OK rows, with the transactions outside of the top ones renamed
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def fold_other_histograms(requests_df: pd.DataFrame, ok_df: pd.DataFrame, top: int, top_by: str,
+                          percentile: float, max_transactions: int = None) -> pd.DataFrame:
+    transactions = pd.unique(ok_df.sort_values("Second", kind="stable")["Transaction"].astype(str))
+    top = get_folded_top(len(transactions), top, max_transactions)
+    if not top:
+        return ok_df
+
+    if top_by == "percentile":
+        ranking_values = aggregate_histograms(ok_df, ["Transaction"], [percentile]).set_index("Transaction")[
+            get_percentile_col_name(percentile)]
+    else:
+        ranking_values = requests_df.groupby(requests_df["Transaction"].astype(str))["Count"].sum()
+    top_transactions = transactions[get_top_transaction_indexes(ranking_values.reindex(transactions).to_numpy(), top)]
+
+    transaction_names = ok_df["Transaction"].astype(str)
+    return ok_df.assign(Transaction=transaction_names.where(transaction_names.isin(top_transactions),
+                                                            OTHER_TRANSACTIONS_NAME))
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: get_partial_right_y_axis
+# Description  : Computes the values of the right y-axis from the counts of every second, like compute_right_y_axis
+#                does from the records: per second (per minute for RPM) from the first counted second, cumulated for
+#                Users and as a rolling mean of 10 seconds for RPS
+# @param       : Numpy array of the seconds (epoch s)
+# @param       : Numpy array of the counts of the seconds
+# @param       : right-y-axis filter which can be: Users, Errors, RPS and RPM
+# @return      : Dataframe with columns: [LocalTime, ${filter}] as strings
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_partial_right_y_axis(seconds: np.ndarray, counts: np.ndarray, right_y_axis_filter: str) -> pd.DataFrame:
+    if not len(seconds):
+        return pd.DataFrame(columns=["LocalTime", right_y_axis_filter])
+
+    granularity = 60 if right_y_axis_filter == "RPM" else 1
+    first_second = int(seconds.min())
+    values = np.bincount((seconds - first_second) // granularity, weights=counts).astype(np.int64)
+    if right_y_axis_filter == "Users":
+        values = np.cumsum(values)
+    right_y_axis_df = pd.DataFrame({"LocalTime": (first_second + np.arange(len(values)) * granularity) * 1000,
+                                    right_y_axis_filter: values})
+
+    # Rolling Mean for RPS - to remove the zig-zag Line
+    if right_y_axis_filter == "RPS":
+        right_y_axis_df["RPS"] = right_y_axis_df["RPS"].rolling(window=10).mean().bfill()
+
+    return right_y_axis_df.applymap(str)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Class Name   : MergedGatlingRun
+# Description  : Gatling Run read from merged partials instead of its records. It builds the same scenario report
+#                and summary as a run in memory, from the histograms: percentiles are within the precision of the
+#                bins and the per second values are on whole seconds. It is a report source and not a GatlingRun:
+#                it has no records, so no phases, steady state or export.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+class MergedGatlingRun(GatlingReportSource):
+    def __init__(self, run_partial: dict, label: str = None):
+        super().__init__(run_partial["logs"], label or run_partial["label"])
+        self.partial = run_partial
+
+    @classmethod
+    def load(cls, partial_paths: list, label: str = None) -> "MergedGatlingRun":
+        return cls(merge_run_partials([read_run_partial(partial_path) for partial_path in partial_paths]), label)
+
+    @property
+    def scenarios(self) -> list:
+        return sorted(set(self.partial["histograms"]["Scenario"].astype(str)) |
+                      set(self.partial["users"]["Scenario"].astype(str)))
+
+    @property
+    def run_duration(self) -> float:
+        if self.partial["run_start"] is None:
+            return 1
+        return max((self.partial["run_end"] - self.partial["run_start"]) / 1000, 1)
+
+    def scenario_table(self, table_name: str, scenario_name: str) -> pd.DataFrame:
+        table_df = self.partial[table_name]
+        return table_df[(table_df["Scenario"] == scenario_name).to_numpy()]
+
+    def scenario_metrics(self, scenario_name: str, right_y_axis_filter: str, percentile: int) \
+            -> (pd.DataFrame, pd.DataFrame):
+        scenario_metrics_df, overall_df = self.scenario_percentiles_metrics(scenario_name, right_y_axis_filter,
+                                                                            [percentile])[percentile]
+        return scenario_metrics_df, overall_df[["Transaction", "Percentile"]]
+
+    def scenario_percentiles_metrics(self, scenario_name: str, right_y_axis_filter: str, percentiles: list,
+                                     top: int = None, top_by: str = "count", max_transactions: int = None) -> dict:
+        histograms_df = self.scenario_table("histograms", scenario_name)
+        requests_df = histograms_df[(histograms_df["Type"] == "REQUEST").to_numpy()]
+
+        # Right y-axis values
+        if right_y_axis_filter == "Users":
+            users_df = self.scenario_table("users", scenario_name)
+            seconds, counts = users_df["Second"].to_numpy(), (users_df["Starts"] + users_df["Ends"]).to_numpy()
+        else:
+            counted_df = requests_df[(requests_df["Status"] == "KO").to_numpy()] if right_y_axis_filter == "Errors" \
+                else requests_df
+            seconds, counts = counted_df["Second"].to_numpy(), counted_df["Count"].to_numpy()
+        right_y_axis_metrics_df = get_partial_right_y_axis(seconds, counts, right_y_axis_filter)
+
+        # Percentiles of every second of every transaction, transactions in the order of their first OK second
+        ok_df = requests_df[(requests_df["Status"] == "OK").to_numpy()]
+        percentile_col_names = [get_percentile_col_name(percentile) for percentile in percentiles]
+        if top or max_transactions:
+            ok_df = fold_other_histograms(requests_df, ok_df, top, top_by, percentiles[0], max_transactions)
+        bucket_percentiles_df = aggregate_histograms(ok_df, ["Transaction", "Second"], percentiles)
+        transactions_list = list(pd.unique(bucket_percentiles_df.sort_values("Second", kind="stable")["Transaction"]))
+        if OTHER_TRANSACTIONS_NAME in transactions_list:
+            transactions_list.remove(OTHER_TRANSACTIONS_NAME)
+            transactions_list.append(OTHER_TRANSACTIONS_NAME)
+        bucket_percentiles_df.insert(1, "LocalTime", bucket_percentiles_df.pop("Second") * 1000)
+        bucket_percentiles_df = bucket_percentiles_df[["Transaction", "LocalTime"] + percentile_col_names]
+        overall_percentiles_df = aggregate_histograms(ok_df, ["Transaction"], percentiles).set_index("Transaction") \
+            .reindex(transactions_list).reset_index()[["Transaction"] + percentile_col_names]
+
+        return merge_scenario_percentiles_metrics(right_y_axis_metrics_df, bucket_percentiles_df,
+                                                  overall_percentiles_df, transactions_list, right_y_axis_filter,
+                                                  percentiles)
+
+    def scenario_heatmap(self, scenario_name: str) -> dict:
+        histograms_df = self.scenario_table("histograms", scenario_name)
+        requests_df = histograms_df[(histograms_df["Type"] == "REQUEST").to_numpy()]
+        if requests_df.empty:
+            return None
+        return get_heatmap(requests_df["Second"].to_numpy().astype(np.int64) * 1000,
+                           get_sketch_values(requests_df["Bin"]), requests_df["Count"].to_numpy())
+
+    def scenario_error_breakdown(self, scenario_name: str, max_buckets: int = ERROR_BREAKDOWN_MAX_BUCKETS) -> dict:
+        errors_df = self.scenario_table("errors", scenario_name)
+        if errors_df.empty:
+            return None
+        histograms_df = self.scenario_table("histograms", scenario_name)
+        request_seconds = histograms_df.loc[(histograms_df["Type"] == "REQUEST").to_numpy(), "Second"].to_numpy()
+
+        # Time buckets of whole seconds, over all the requests of the scenario
+        begin_time = int(request_seconds.min()) * 1000
+        bucket_ms = 1000 * max(1, -(-(int(request_seconds.max()) * 1000 - begin_time + 1) // (1000 * max_buckets)))
+        buckets = (errors_df["Second"].to_numpy().astype(np.int64) * 1000 - begin_time) // bucket_ms
+        bucket_count = int(buckets.max()) + 1
+
+        # (Transaction, Error Message) pairs, most frequent first
+        pair_codes, pairs = pd.MultiIndex.from_arrays([errors_df["Transaction"].astype(str),
+                                                       errors_df["ErrorMessage"].astype(str)]).factorize()
+        counts = np.bincount(buckets * len(pairs) + pair_codes, weights=errors_df["Count"].to_numpy(),
+                             minlength=bucket_count * len(pairs)).astype(np.int64).reshape(bucket_count, len(pairs))
+        pair_totals = counts.sum(axis=0)
+        order = np.argsort(-pair_totals, kind="stable")
+
+        return {
+            "counts": counts[:, order],
+            "begin_time": begin_time,
+            "bucket_ms": bucket_ms,
+            "errors_df": pd.DataFrame({
+                "Transaction": pairs.get_level_values(0).to_numpy()[order],
+                "Error Message": pairs.get_level_values(1).to_numpy()[order],
+                "Count": pair_totals[order],
+                "% of Errors": np.round(pair_totals[order] * 100 / pair_totals.sum(), 2),
+            }),
+        }
+
+    def compute_aggregates(self, percentiles: list, bucket_ms: int) -> dict:
+        run_start = self.partial["run_start"] or 0
+        histograms_df = self.partial["histograms"].copy()
+        histograms_df["Bucket"] = np.maximum((histograms_df["Second"].to_numpy() * 1000 - run_start) // bucket_ms, 0)
+        users_df = self.partial["users"].copy()
+        users_df["Bucket"] = np.maximum((users_df["Second"].to_numpy() * 1000 - run_start) // bucket_ms, 0)
+        users_df["Users"] = users_df["Starts"] + users_df["Ends"]
+
+        aggregates = {"run_start": run_start}
+        for owner, name_col_name, buckets_key, names_key in [("REQUEST", "Transaction", "buckets", "transactions"),
+                                                             ("GROUP", "Group", "group_buckets", "groups")]:
+            timings_df = histograms_df[(histograms_df["Type"] == owner).to_numpy()] \
+                .rename(columns={"Transaction": name_col_name})
+            aggregates[buckets_key] = aggregate_histograms(timings_df, ["Scenario", name_col_name, "Bucket"],
+                                                           percentiles)
+            names_df = aggregate_histograms(timings_df, ["Scenario", name_col_name], percentiles)
+            names_df.insert(4, "Throughput", (names_df["Count"] / self.run_duration).round(3))
+            aggregates[names_key] = names_df
+        aggregates["users"] = users_df.groupby(["Scenario", "Bucket"], sort=True, observed=True)["Users"].sum() \
+            .reset_index().astype({"Scenario": str})
+        return aggregates
+
+    def compute_summary(self, percentiles: list) -> pd.DataFrame:
+        summary_df = aggregate_histograms(self.partial["histograms"], ["Scenario", "Type", "Transaction"],
+                                          percentiles)
+        summary_df.insert(5, "ErrorRate", (summary_df["Errors"] / summary_df["Count"] * 100).round(2))
+        summary_df.insert(6, "Throughput", (summary_df["Count"] / self.run_duration).round(3))
+        summary_df = summary_df[["Scenario", "Transaction", "Type"] + list(summary_df.columns[3:])]
+        return summary_df.sort_values(["Scenario", "Type", "Transaction"], ascending=[True, False, True],
+                                      ignore_index=True)
+
+
+##################################################################################################################
@@ -0,0 +1,386 @@
+# ============================================================================================================
+# Purpose:           Out-of-core Gatling Run: the logs are streamed once into one on-disk partition per scenario,
+#                    and every scenario is then computed from its own partition, under a memory budget.
+# Author:            Navdit Sharma (Nav)
+# Notes:             A partition is a folder of raw little-endian column files (one code or number per record, see
+#                    PARTITION_COLUMNS), appended chunk after chunk, and read back with np.fromfile. The names, the
+#                    error messages and the scenarios are in the manifest.json of the partition folder:
+#                        run = PartitionedGatlingRun.load(["simulation.log"], "partitions", memory_limit=2 ** 30)
+#                        tabs = ScenarioReportBuilder(95).build(run)
+#                    Logs, which don't write the scenario of their requests (Gatling 3), are spilled to disk
+#                    unresolved and resolved piece by piece, once their USER records are all read.
+# Revision:          Last change: 18/10/26 :: Steady state and export of a partitioned run, scenario by scenario
+# ==============================================================================================================
+
+import json
+import math
+import shutil
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from gatling_log_parser import (GATLING_2_TEXT, GATLING_LOG_CHUNK_SIZE, OWNER_CATEGORIES,
+                                PARALLEL_PARSER_MIN_RANGE_SIZE, STATUS_CATEGORIES, get_user_records,
+                                iter_gatling_log_chunks, read_gatling_log_header, resolve_request_scenarios)
+from gatling_run import GatlingRun
+from gatling_run_aggregates import compute_run_aggregates, compute_transaction_summary
+from gatling_run_phases import get_steady_state_df
+from gatling_scenario_metrics import export_scenario_metrics, write_export_df
+
+
+# Columns of the partition files and their dtypes. Owner, Status, Transaction_Name and ErrorMessage are codes.
+PARTITION_COLUMNS = {
+    "Owner": np.int8,
+    "Transaction_Name": np.int32,
+    "Status": np.int8,
+    "ResponseTime": np.int32,
+    "LocalTime": np.int64,
+    "ErrorMessage": np.int32,
+}
+
+# Extra columns of the records spilled before their scenario is resolved
+UNRESOLVED_COLUMNS = {"Scenario": np.int32, "UserId": np.int64}
+
+# Files and folders of a partition folder
+PARTITION_MANIFEST_NAME = "manifest.json"
+UNRESOLVED_DIR_NAME = "unresolved"
+
+# Peak memory of the fast parser per byte of log parsed at once, used to size the byte ranges under the budget
+PARSER_MEMORY_FACTOR = 4
+
+
+##################################################################################################################
+# Function Name: get_column_codes
+# Description  : Gives the codes of a categorical column of a compact chunk, or the values of a numeric column
+# @param       : Column of a compact Dataframe
+# @return      : Numpy array
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_column_codes(column: pd.Series) -> np.ndarray:
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.cat.codes.to_numpy()
+    return column.to_numpy()
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: append_partition_columns
+# Description  : Appends the given rows of a compact chunk to the column files of a folder
+# @param       : Folder of the column files, created if needed
+# @param       : Compact Dataframe
+# @param       : Numpy array of the positions of the rows to append
+# @param       : Dictionary of column name -> dtype of the column files
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def append_partition_columns(columns_dir: Path, compact_df: pd.DataFrame, rows: np.ndarray, columns: dict):
+    columns_dir.mkdir(parents=True, exist_ok=True)
+    for col_name, col_dtype in columns.items():
+        if col_name in compact_df:
+            with open(columns_dir / "{}.bin".format(col_name), "ab") as column_file:
+                get_column_codes(compact_df[col_name])[rows].astype(col_dtype).tofile(column_file)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: read_partition_columns
+# Description  : Reads the column files of a folder, whole or a slice of their rows
+# @param       : Folder of the column files
+# @param       : Dictionary of column name -> dtype of the column files. Columns without file are left out.
+# @param       : First row to read. Default is 0.
+# @param       : Number of rows to read. Default is -1, all the rows from the first one.
+# @return      : Dictionary of column name -> Numpy array
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def read_partition_columns(columns_dir: Path, columns: dict, first_row: int = 0, row_count: int = -1) -> dict:
+    column_arrays = {}
+    for col_name, col_dtype in columns.items():
+        column_path = columns_dir / "{}.bin".format(col_name)
+        if column_path.exists():
+            column_arrays[col_name] = np.fromfile(column_path, dtype=col_dtype, count=row_count,
+                                                  offset=first_row * np.dtype(col_dtype).itemsize)
+    return column_arrays
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Class Name   : ScenarioPartitionWriter
+# Description  : Appends the compact chunks of the logs to the partitions of their scenarios and keeps what the
+#                manifest needs: the rows of every scenario and the first and last LocalTime of the run
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+class ScenarioPartitionWriter:
+    def __init__(self, partition_dir: Path):
+        self.partition_dir = partition_dir
+        self.scenario_rows = {}
+        self.run_start = None
+        self.run_end = None
+
+    def write(self, compact_df: pd.DataFrame):
+        if compact_df.empty:
+            return
+
+        # Rows grouped by scenario, in their order
+        scenario_codes = compact_df["Scenario"].to_numpy()
+        order = np.argsort(scenario_codes, kind="stable")
+        codes, code_starts = np.unique(scenario_codes[order], return_index=True)
+        for code, rows in zip(codes, np.split(order, code_starts[1:])):
+            append_partition_columns(self.partition_dir / "scenario_{}".format(code), compact_df, rows,
+                                     PARTITION_COLUMNS)
+            self.scenario_rows[int(code)] = self.scenario_rows.get(int(code), 0) + len(rows)
+
+        local_times = compact_df["LocalTime"].to_numpy()
+        self.run_start = int(local_times.min()) if self.run_start is None else min(self.run_start,
+                                                                                  int(local_times.min()))
+        self.run_end = int(local_times.max()) if self.run_end is None else max(self.run_end, int(local_times.max()))
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: write_resolved_partitions
+# Description  : Resolves the scenario of the records of one log spilled unresolved, piece by piece, and writes
+#                them to their partitions. The spill is deleted.
+# @param       : Folder of the spilled records
+# @param       : Dataframe [Scenario, UserId] of the USER records of the log, as given by get_user_records
+# @param       : Simulation Name of the log
+# @param       : Dictionary of name -> code, shared by all the logs
+# @param       : ScenarioPartitionWriter
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def write_resolved_partitions(unresolved_dir: Path, user_df: pd.DataFrame, simulation_name: str, name_codes: dict,
+                              partition_writer: ScenarioPartitionWriter):
+    spill_columns = dict(PARTITION_COLUMNS, **UNRESOLVED_COLUMNS)
+    row_count = (unresolved_dir / "Owner.bin").stat().st_size if (unresolved_dir / "Owner.bin").exists() else 0
+
+    for first_row in range(0, row_count, GATLING_LOG_CHUNK_SIZE):
+        compact_df = pd.DataFrame(read_partition_columns(unresolved_dir, spill_columns, first_row,
+                                                         GATLING_LOG_CHUNK_SIZE))
+        compact_df["Owner"] = pd.Categorical.from_codes(compact_df["Owner"], categories=OWNER_CATEGORIES)
+        partition_writer.write(resolve_request_scenarios(compact_df, simulation_name, name_codes, user_df))
+
+    shutil.rmtree(unresolved_dir)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: write_scenario_partitions
+# Description  : Streams the logs once into one partition per scenario, see the notes of this module. Partitions
+#                already in the folder are replaced. With several jobs, the plain logs are parsed by byte ranges
+#                sized so that the ranges parsed at once stay within the memory limit.
+# @param       : List of Simulation Logs
+# @param       : Partition folder, created if needed
+# @param       : Float format of Time Difference
+# @param       : Log Parser (fast or pandas)
+# @param       : Number of worker processes
+# @param       : Memory Limit in bytes. Default is None, no limit on the size of the byte ranges.
+# @param       : Sample Rate, from 0 to 1. Default is 1, which keeps all the records.
+# @return      : Manifest of the partitions, as written in the partition folder
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def write_scenario_partitions(simulation_logs_list: list, partition_dir: str, time_diff: float,
+                              parser: str = "fast", jobs: int = 1, memory_limit: int = None,
+                              sample_rate: float = 1) -> dict:
+    partition_dir = Path(partition_dir)
+    partition_dir.mkdir(parents=True, exist_ok=True)
+    for old_path in list(partition_dir.glob("scenario_*")) + [partition_dir / UNRESOLVED_DIR_NAME]:
+        if old_path.is_dir():
+            shutil.rmtree(old_path)
+
+    time_diff_ms = int(round(time_diff * 60 * 60 * 1000))
+    name_codes, message_codes = {}, {}
+    partition_writer = ScenarioPartitionWriter(partition_dir)
+    unresolved_dir = partition_dir / UNRESOLVED_DIR_NAME
+
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        for simulation_log in simulation_logs_list:
+            log_format, simulation_name = read_gatling_log_header(simulation_log)
+            max_ranges = jobs
+            if memory_limit is not None:
+                range_size = max(PARALLEL_PARSER_MIN_RANGE_SIZE, memory_limit // (PARSER_MEMORY_FACTOR * jobs))
+                max_ranges = max(jobs, math.ceil(Path(simulation_log).stat().st_size / range_size))
+
+            # Only Gatling 2 logs write the scenario of every request, the others are spilled until resolved
+            user_dfs = []
+            for compact_df in iter_gatling_log_chunks(Path(simulation_log), log_format, name_codes, message_codes,
+                                                      time_diff_ms, parser, executor, max_ranges, sample_rate):
+                if log_format == GATLING_2_TEXT:
+                    partition_writer.write(compact_df)
+                else:
+                    user_dfs.append(get_user_records(compact_df))
+                    append_partition_columns(unresolved_dir, compact_df, np.arange(len(compact_df)),
+                                             dict(PARTITION_COLUMNS, **UNRESOLVED_COLUMNS))
+            if user_dfs:
+                write_resolved_partitions(unresolved_dir, pd.concat(user_dfs, ignore_index=True), simulation_name,
+                                          name_codes, partition_writer)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    names = list(name_codes)
+    manifest = {
+        "logs": [str(simulation_log) for simulation_log in simulation_logs_list],
+        "sample_rate": sample_rate,
+        "names": names,
+        "messages": list(message_codes),
+        "scenarios": {names[code]: {"dir": "scenario_{}".format(code), "code": code, "rows": rows}
+                      for code, rows in partition_writer.scenario_rows.items()},
+        "run_start": partition_writer.run_start,
+        "run_end": partition_writer.run_end,
+    }
+    with open(partition_dir / PARTITION_MANIFEST_NAME, "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file)
+
+    return manifest
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: read_scenario_partition
+# Description  : Reads the partition of one scenario back into a compact Dataframe, with the same columns and
+#                dtypes as generate_gatling_log_df
+# @param       : Partition folder
+# @param       : Manifest of the partitions
+# @param       : Scenario Name
+# @return      : Dataframe with columns: [Owner,Scenario,Transaction_Name,Status,ResponseTime,LocalTime,ErrorMessage]
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def read_scenario_partition(partition_dir: Path, manifest: dict, scenario_name: str) -> pd.DataFrame:
+    scenario_partition = manifest["scenarios"][scenario_name]
+    columns = read_partition_columns(Path(partition_dir) / scenario_partition["dir"], PARTITION_COLUMNS)
+    name_dtype = pd.CategoricalDtype(categories=manifest["names"])
+
+    return pd.DataFrame({
+        "Owner": pd.Categorical.from_codes(columns["Owner"], categories=OWNER_CATEGORIES),
+        "Scenario": pd.Categorical.from_codes(np.full(len(columns["Owner"]), scenario_partition["code"]),
+                                              dtype=name_dtype),
+        "Transaction_Name": pd.Categorical.from_codes(columns["Transaction_Name"], dtype=name_dtype),
+        "Status": pd.Categorical.from_codes(columns["Status"], categories=STATUS_CATEGORIES),
+        "ResponseTime": columns["ResponseTime"],
+        "LocalTime": columns["LocalTime"],
+        "ErrorMessage": pd.Categorical.from_codes(columns["ErrorMessage"], categories=manifest["messages"]),
+    })
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Class Name   : PartitionedGatlingRun
+# Description  : Gatling Run read from its scenario partitions instead of one in-memory Dataframe. Scenarios are
+#                read when asked for and the least recently used ones are dropped to stay within the memory limit,
+#                the last one read is always kept. The summary, the aggregates and the export are computed scenario
+#                by scenario. The steady state run reads the same partitions and drops the records outside of the
+#                steady state of their scenario when the scenario is read. log_df is None.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+class PartitionedGatlingRun(GatlingRun):
+    def __init__(self, partition_dir: str, memory_limit: int = None, label: str = None, steady_phases: dict = None):
+        self.partition_dir = Path(partition_dir)
+        with open(self.partition_dir / PARTITION_MANIFEST_NAME, encoding="utf-8") as manifest_file:
+            self.manifest = json.load(manifest_file)
+        super().__init__(None, self.manifest["logs"], label, self.manifest["sample_rate"])
+        self.memory_limit = memory_limit
+        self.steady_phases = steady_phases
+        self._loaded_dfs = OrderedDict()
+        self._run_bounds = (self.manifest["run_start"], self.manifest["run_end"]) if steady_phases is None else None
+
+    @classmethod
+    def load(cls, simulation_logs_list: list, partition_dir: str = None, memory_limit: int = None,
+             time_diff: float = 0, parser: str = "fast", jobs: int = 1, label: str = None,
+             sample_rate: float = 1) -> "PartitionedGatlingRun":
+        write_scenario_partitions(list(simulation_logs_list), partition_dir, time_diff, parser, jobs, memory_limit,
+                                  sample_rate)
+        return cls(partition_dir, memory_limit, label)
+
+    @property
+    def scenarios(self) -> list:
+        return sorted(self.manifest["scenarios"])
+
+    @property
+    def run_bounds(self) -> (int, int):
+        # First and last LocalTime of the run. Those of the steady states are only known once their scenarios are read.
+        if self._run_bounds is None:
+            scenario_bounds = [(int(scenario_df["LocalTime"].min()), int(scenario_df["LocalTime"].max()))
+                               for scenario_df in map(self.scenario_df, self.scenarios) if len(scenario_df)]
+            self._run_bounds = (min(bounds[0] for bounds in scenario_bounds),
+                                max(bounds[1] for bounds in scenario_bounds)) if scenario_bounds else (None, None)
+        return self._run_bounds
+
+    @property
+    def run_duration(self) -> float:
+        run_start, run_end = self.run_bounds
+        if run_start is None:
+            return 1
+        return max((run_end - run_start) / 1000, 1)
+
+    def scenario_df(self, scenario_name: str) -> pd.DataFrame:
+        if scenario_name not in self.manifest["scenarios"]:
+            raise KeyError("Scenario {} is not in run {}".format(scenario_name, self.label))
+        if scenario_name in self._loaded_dfs:
+            self._loaded_dfs.move_to_end(scenario_name)
+            return self._loaded_dfs[scenario_name]
+
+        scenario_df = read_scenario_partition(self.partition_dir, self.manifest, scenario_name)
+        if self.steady_phases is not None:
+            scenario_df = get_steady_state_df(scenario_df, {scenario_name: self.steady_phases[scenario_name]})
+        self._loaded_dfs[scenario_name] = scenario_df
+        if self.memory_limit is not None:
+            while len(self._loaded_dfs) > 1 and sum(loaded_df.memory_usage().sum() for loaded_df
+                                                    in self._loaded_dfs.values()) > self.memory_limit:
+                self._loaded_dfs.popitem(last=False)
+        return self._loaded_dfs[scenario_name]
+
+    def steady_state(self) -> "PartitionedGatlingRun":
+        # Phases detected scenario by scenario, like those of a run in memory
+        return PartitionedGatlingRun(self.partition_dir, self.memory_limit, self.label,
+                                     {scenario_name: self.phases(scenario_name) for scenario_name in self.scenarios})
+
+    def export(self, percentiles: list, export_dir: str, export_format: str, jobs: int = 1):
+        # One scenario at a time, whatever the number of processes, to stay within the memory limit
+        Path(export_dir).mkdir(parents=True, exist_ok=True)
+        overall_percentile_df = pd.concat([export_scenario_metrics(scenario_name, self.scenario_df(scenario_name),
+                                                                   percentiles, export_dir, export_format)
+                                           for scenario_name in self.scenarios], ignore_index=True)
+        write_export_df(overall_percentile_df, Path(export_dir) / "overall_percentiles", export_format)
+
+    def compute_aggregates(self, percentiles: list, bucket_ms: int) -> dict:
+        run_start = self.run_bounds[0]
+        scenarios_aggregates = [compute_run_aggregates(self.scenario_df(scenario_name), percentiles, bucket_ms,
+                                                       run_start, self.run_duration)
+                                for scenario_name in self.scenarios]
+        aggregates = {"run_start": run_start or 0}
+        for key in ["buckets", "users", "transactions", "group_buckets", "groups"]:
+            aggregates[key] = pd.concat([scenario_aggregates[key] for scenario_aggregates in scenarios_aggregates],
+                                        ignore_index=True)
+        return aggregates
+
+    def compute_summary(self, percentiles: list) -> pd.DataFrame:
+        return pd.concat([compute_transaction_summary(self.scenario_df(scenario_name), percentiles,
+                                                      self.run_duration) for scenario_name in self.scenarios],
+                         ignore_index=True)
+
+
+##################################################################################################################
@@ -0,0 +1,208 @@
+# ============================================================================================================
+# Purpose:           Detects the ramp-up, steady state and ramp-down phases of every scenario of a Gatling Run and
+#                    summarises every phase.
+# Author:            Navdit Sharma (Nav)
+# Notes:             Only needs pandas. Phases are found from the active users and the requests per second of
+#                    the scenario, bucketed per second, in linear time: no sort and no search over the buckets.
+# Revision:          Last change: 18/10/26 :: Created the phase detection
+# ==============================================================================================================
+
+import numpy as np
+import pandas as pd
+
+from gatling_kernels import histogram_percentiles
+from gatling_report_options import get_percentile_col_name
+
+
+# Phases of a scenario, in their order
+RUN_PHASES = ["Ramp-Up", "Steady", "Ramp-Down"]
+
+# Width of a bucket in ms and window of the moving average of the bucketed series, in buckets
+PHASE_BUCKET_MS = 1000
+PHASE_SMOOTHING_BUCKETS = 10
+
+# A bucket is at load when its active users are within this fraction of their peak and its requests per second
+# within this fraction of their level at load
+PHASE_TOLERANCE = 0.1
+
+
+##################################################################################################################
+# Function Name: get_moving_average
+# Description  : Gives the centred moving average of the given series, from its prefix sums. The window is
+#                narrowed at both ends of the series.
+# @param       : Numpy array of the series
+# @param       : Width of the window
+# @return      : float64 Numpy array of the moving average
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_moving_average(series: np.ndarray, window: int) -> np.ndarray:
+    prefix_sums = np.concatenate(([0], np.cumsum(series, dtype=np.float64)))
+    window_starts = np.maximum(np.arange(len(series)) - window // 2, 0)
+    window_ends = np.minimum(window_starts + window, len(series))
+
+    return (prefix_sums[window_ends] - prefix_sums[window_starts]) / (window_ends - window_starts)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: detect_scenario_phases
+# Description  : Segments a scenario into ramp-up, steady state and ramp-down. Active users (users started minus
+#                users ended) and requests per second are counted per bucket and smoothed. The steady state runs
+#                from the first to the last bucket at load: active users within PHASE_TOLERANCE of their peak and
+#                requests per second within PHASE_TOLERANCE of their median at that user level. Scenarios without
+#                USER records are segmented on their requests per second only.
+# @param       : Dataframe scenario_df, which is a filtered dataframe of gat_log_df based on given scenario.
+# @param       : Tolerance. Default is PHASE_TOLERANCE.
+# @param       : Width of a bucket in ms. Default is PHASE_BUCKET_MS.
+# @return      : Dataframe [Phase, Start, End] of the phases in their order, Start and End being LocalTime (epoch
+#                ms, End excluded). Phases without any bucket are left out. Empty if the scenario has no record.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def detect_scenario_phases(scenario_df: pd.DataFrame, tolerance: float = PHASE_TOLERANCE,
+                           bucket_ms: int = PHASE_BUCKET_MS) -> pd.DataFrame:
+    if scenario_df.empty:
+        return pd.DataFrame(columns=["Phase", "Start", "End"])
+
+    # Active users and requests per bucket
+    local_times = scenario_df["LocalTime"].to_numpy().astype(np.int64)
+    begin_time = int(local_times.min())
+    buckets = (local_times - begin_time) // bucket_ms
+    bucket_count = int(buckets.max()) + 1
+    is_user = (scenario_df["Owner"] == "USER").to_numpy()
+    user_steps = np.where(is_user, np.where((scenario_df["Transaction_Name"] == "START").to_numpy(), 1, -1), 0)
+    active_users = np.cumsum(np.bincount(buckets, weights=user_steps, minlength=bucket_count))
+    requests = np.bincount(buckets, weights=(scenario_df["Owner"] == "REQUEST").to_numpy(), minlength=bucket_count)
+
+    # Buckets at load
+    smooth_users = get_moving_average(active_users, PHASE_SMOOTHING_BUCKETS)
+    smooth_requests = get_moving_average(requests, PHASE_SMOOTHING_BUCKETS)
+    at_load = smooth_users >= (1 - tolerance) * smooth_users.max() if smooth_users.max() > 0 \
+        else np.ones(bucket_count, dtype=bool)
+    if smooth_requests[at_load].max() > 0:
+        at_load &= smooth_requests >= (1 - tolerance) * np.median(smooth_requests[at_load])
+
+    # Steady state from the first to the last bucket at load
+    load_buckets = np.flatnonzero(at_load)
+    if len(load_buckets):
+        steady_start, steady_end = int(load_buckets[0]), int(load_buckets[-1]) + 1
+    else:
+        steady_start, steady_end = 0, bucket_count
+    phase_bounds = [(0, steady_start), (steady_start, steady_end), (steady_end, bucket_count)]
+
+    return pd.DataFrame([(phase, begin_time + start * bucket_ms, begin_time + end * bucket_ms)
+                         for phase, (start, end) in zip(RUN_PHASES, phase_bounds) if end > start],
+                        columns=["Phase", "Start", "End"])
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: assign_phases
+# Description  : Gives the phase of every record of a scenario
+# @param       : Dataframe scenario_df, which is a filtered dataframe of gat_log_df based on given scenario.
+# @param       : Dataframe of the phases of the scenario, as given by detect_scenario_phases
+# @return      : int64 Numpy array of the index of the phase (in the phases Dataframe) of every record
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def assign_phases(scenario_df: pd.DataFrame, phases_df: pd.DataFrame) -> np.ndarray:
+    phase_starts = phases_df["Start"].to_numpy()[1:]
+    return np.searchsorted(phase_starts, scenario_df["LocalTime"].to_numpy(), side="right")
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: compute_scenario_phase_summary
+# Description  : Summarises every phase of a scenario and every transaction in it, in one grouped pass: counts are
+#                bincounts of the phase and transaction codes and the percentiles of the OK response times are
+#                read from their histograms.
+# @param       : Dataframe scenario_df, which is a filtered dataframe of gat_log_df based on given scenario.
+# @param       : Dataframe of the phases of the scenario, as given by detect_scenario_phases
+# @param       : List of Percentiles
+# @return      : Dataframe [Phase, Transaction, Start, End, Duration, Count, Errors, ErrorRate, Throughput, P..].
+#                Every phase has one row per transaction and a first row of all its requests (Transaction "All").
+#                Duration is in seconds, ErrorRate in % and Throughput in requests per second of the phase.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def compute_scenario_phase_summary(scenario_df: pd.DataFrame, phases_df: pd.DataFrame,
+                                   percentiles: list) -> pd.DataFrame:
+    requests_df = scenario_df.loc[scenario_df["Owner"] == "REQUEST"]
+    phase_codes = assign_phases(requests_df, phases_df)
+    transaction_codes, transactions = pd.factorize(requests_df["Transaction_Name"], sort=True)
+    is_ok = (requests_df["Status"] == "OK").to_numpy()
+    response_times = requests_df["ResponseTime"].to_numpy()
+
+    # Code 0 of every phase is all its requests, the transactions follow
+    phase_count, key_count = len(phases_df), len(transactions) + 1
+    summary_names = np.array(["All"] + [str(transaction) for transaction in transactions], dtype=object)
+    keys = np.concatenate((phase_codes * key_count, phase_codes * key_count + transaction_codes + 1))
+    is_ok = np.concatenate((is_ok, is_ok))
+    response_times = np.concatenate((response_times, response_times))
+
+    counts = np.bincount(keys, minlength=phase_count * key_count)
+    errors = np.bincount(keys, weights=~is_ok, minlength=phase_count * key_count).astype(np.int64)
+    percentile_values = histogram_percentiles(keys[is_ok], response_times[is_ok], phase_count * key_count,
+                                              percentiles).round(2)
+
+    # Rows of the phases and transactions with requests, and the "All" row of every phase
+    summary_keys = np.flatnonzero((counts > 0) | (np.arange(phase_count * key_count) % key_count == 0))
+    summary_phases = summary_keys // key_count
+    durations = (phases_df["End"].to_numpy() - phases_df["Start"].to_numpy()) / 1000
+    summary_df = pd.DataFrame({
+        "Phase": phases_df["Phase"].to_numpy()[summary_phases],
+        "Transaction": summary_names[summary_keys % key_count],
+        "Start": phases_df["Start"].to_numpy()[summary_phases],
+        "End": phases_df["End"].to_numpy()[summary_phases],
+        "Duration": durations[summary_phases],
+        "Count": counts[summary_keys],
+        "Errors": errors[summary_keys],
+        "ErrorRate": (errors[summary_keys] / np.maximum(counts[summary_keys], 1) * 100).round(2),
+        "Throughput": (counts[summary_keys] / durations[summary_phases]).round(3),
+    })
+    for percentile_index, percentile in enumerate(percentiles):
+        summary_df[get_percentile_col_name(percentile)] = percentile_values[summary_keys, percentile_index]
+
+    return summary_df
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: get_steady_state_df
+# Description  : Keeps the records of every scenario, which are in its steady state, so that the per bucket
+#                metrics are only computed over the steady state
+# @param       : Gatling Log Dataframe, as given by generate_gatling_log_df
+# @param       : Dictionary of scenario name -> Dataframe of its phases, as given by detect_scenario_phases
+# @return      : Gatling Log Dataframe of the steady states. Scenarios without steady state are kept whole.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_steady_state_df(gat_log_df: pd.DataFrame, scenarios_phases: dict) -> pd.DataFrame:
+    # Window of every scenario, by its code
+    scenario_categories = gat_log_df["Scenario"].cat.categories
+    window_starts = np.full(len(scenario_categories), np.iinfo(np.int64).min)
+    window_ends = np.full(len(scenario_categories), np.iinfo(np.int64).max)
+    for scenario_name, phases_df in scenarios_phases.items():
+        steady_df = phases_df[phases_df["Phase"] == "Steady"]
+        if not steady_df.empty:
+            scenario_code = scenario_categories.get_loc(scenario_name)
+            window_starts[scenario_code] = steady_df["Start"].iloc[0]
+            window_ends[scenario_code] = steady_df["End"].iloc[0]
+
+    scenario_codes = gat_log_df["Scenario"].cat.codes.to_numpy()
+    local_times = gat_log_df["LocalTime"].to_numpy()
+    in_window = (local_times >= window_starts[scenario_codes]) & (local_times < window_ends[scenario_codes])
+
+    return gat_log_df[in_window].reset_index(drop=True)
+
+
+##################################################################################################################
@@ -0,0 +1,856 @@
+# ============================================================================================================
+# Purpose:           Computes the per scenario metrics behind the graphs from the Gatling Log Dataframe.
+# Author:            Navdit Sharma (Nav)
+# Notes:             Only needs pandas, so it can be used without Bokeh. Metrics of a scenario are Dataframes
+#                    indexed by LocalTime, with the right y-axis values and the percentile of every transaction.
+# Revision:          Last change: 18/10/26 :: Right y-axis values counted per bucket by the kernels
+# ==============================================================================================================
+
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from gatling_kernels import assign_buckets, count_buckets, histogram_percentiles
+from gatling_report_options import get_percentile_col_name
+from gatling_shared_log import SharedGatlingLog, read_shared_scenario_df
+
+
+# Right y-axis values in the exported metrics
+EXPORT_RIGHT_Y_AXIS_FILTERS = ["RPS", "Users", "Errors"]
+
+# Response time heatmap: maximum number of time buckets, and response time bins per power of 10
+HEATMAP_MAX_BUCKETS = 1800
+HEATMAP_BINS_PER_DECADE = 16
+
+# Error breakdown: maximum number of time buckets, and label of the KO requests without error message
+ERROR_BREAKDOWN_MAX_BUCKETS = 300
+NO_ERROR_MESSAGE = "(no message)"
+
+# Columns of counts, which are scaled back up in a sampled run. Error rates and percentiles are not scaled.
+SAMPLED_COUNT_COL_NAMES = ["Count", "Errors", "Throughput", "RPS", "RPM"]
+
+# Line of the requests of all the transactions, which are not in the top transactions of a scenario
+OTHER_TRANSACTIONS_NAME = "Other transactions"
+
+
+########################################################################################################################
+# Function Name: compute_right_y_axis
+# Description  : Computes the  values of right y-axis in the given scenario df based on given right_y_axis_filter.
+#                Buckets of granularity ms start at the first record and include both their ends, so a record on the
+#                boundary of two buckets counts in both. The last bucket ends at the last record. The records are
+#                counted per bucket with the assign_buckets and count_buckets kernels.
+# @param       : Dataframe - which has values for that filter. Columns are:
+#                [Owner,Scenario, Transaction_Name, Status, ResponseTime, LocalTime]
+# @param       : right-y-axis filter which can be: Users, Errors, RPS and RPM
+# @param       : granularity at which the values have to be calculated.
+# @return      : Dataframe scenario_metrics_df with columns: [LocalTime, ${filter}]
+# Author       : Navdit Sharma
+# Comments     : Created on 05/09/2018
+########################################################################################################################
+def compute_right_y_axis(scenario_right_y_axis_df: pd.DataFrame, right_y_axis_filter: str, granularity: int) \
+        -> pd.DataFrame:
+    # Create temp DF for Errors
+    scenario_right_y_axis_temp_df = pd.DataFrame(columns=["LocalTime", right_y_axis_filter])
+
+    # Records counted by the filter: all but the ones without scenario
+    local_times = scenario_right_y_axis_df["LocalTime"].to_numpy()[scenario_right_y_axis_df["Scenario"].notna()
+                                                                   .to_numpy()]
+    if not scenario_right_y_axis_df.empty:
+        # Start Begin and End Time
+        begin_time = int(scenario_right_y_axis_df["LocalTime"].iloc[0])
+        end_time = int(scenario_right_y_axis_df["LocalTime"].iloc[-1])
+        bucket_count = max((end_time - begin_time) // granularity, 0) + 1
+
+        # Records of every bucket, plus the ones on its end, which start the next bucket
+        local_times = local_times[(local_times >= begin_time) & (local_times <= end_time)]
+        buckets = assign_buckets(local_times, begin_time, granularity)
+        on_bucket_end = (local_times - begin_time) % granularity == 0
+        values = count_buckets(buckets, bucket_count) + count_buckets(buckets[on_bucket_end] - 1, bucket_count)
+
+        # Apply Filter - Users are cumulated, Errors/RPS/RPM are per bucket
+        if right_y_axis_filter in "Users":
+            values = np.cumsum(values)
+        scenario_right_y_axis_temp_df = pd.DataFrame({
+            "LocalTime": begin_time + np.arange(bucket_count, dtype=np.int64) * granularity,
+            right_y_axis_filter: values})
+
+    # Do a Rolling Mean for RPS - to remove the zig-zag Line
+    if right_y_axis_filter in "RPS":
+        scenario_right_y_axis_temp_df["RPS"] = scenario_right_y_axis_temp_df["RPS"].rolling(window=10).mean()
+        scenario_right_y_axis_temp_df["RPS"] = scenario_right_y_axis_temp_df["RPS"].bfill()
+
+    # Keep LocalTime as integer ms, so that the string merge keys match the ones of transactions
+    scenario_right_y_axis_temp_df["LocalTime"] = scenario_right_y_axis_temp_df["LocalTime"].astype(np.int64)
+    scenario_right_y_axis_temp_df = scenario_right_y_axis_temp_df.applymap(str)
+
+    return scenario_right_y_axis_temp_df
+
+########################################################################################################################
+# Function Name: merge_right_y_axis_values_with_scenario_df
+# Description  : Computes and merges the values of right y-axis to the given empty scenario df
+# @param       : Empty Dataframe - empty_scenario_metrics_df
+# @param       : Dataframe scenario_df, which is a filtered dataframe of gat_log_df based on given scenario.
+#                Columns are: [Owner,Scenario, Transaction_Name, Status, ResponseTime, LocalTime]
+# @param       : right_y_axis_filter_list values. As of now its limited to: Users, Errors, RPS and RPM
+# @return      : Dataframe scenario_metrics_df with columns: [LocalTime, Users, Errors, RPS, RPM]
+# Author       : Navdit Sharma
+# Comments     : Created on 05/09/2018
+########################################################################################################################
+def merge_right_y_axis_values_with_scenario_df(empty_scenario_metrics_df: pd.DataFrame, scenario_df: pd.DataFrame,
+                                               right_y_axis_filter: str) -> pd.DataFrame:
+    # Errors
+    if right_y_axis_filter in "Errors":
+        # Errors DF, of the requests. KO groups are counted through their requests.
+        scenario_errors_df = scenario_df.loc[(scenario_df["Owner"] == "REQUEST") & (scenario_df["Status"] == "KO")]
+        # Compute values of the right y-axis
+        scenario_errors_temp_df = compute_right_y_axis(scenario_errors_df, right_y_axis_filter, 1000)
+        # Merge the dataframe of Errors
+        empty_scenario_metrics_df = \
+            empty_scenario_metrics_df.merge(scenario_errors_temp_df, on='LocalTime', how='outer')
+
+    # Active Users
+    elif right_y_axis_filter in "Users":
+        # Active Users DF
+        scenario_users_df = scenario_df.loc[scenario_df["Owner"] == "USER"]
+        # Compute values of the right y-axis
+        scenario_users_temp_df = compute_right_y_axis(scenario_users_df, right_y_axis_filter, 1000)
+        # Merge the dataframe of Users
+        empty_scenario_metrics_df = \
+            empty_scenario_metrics_df.merge(scenario_users_temp_df, on='LocalTime', how='outer')
+
+    # RPS
+    elif right_y_axis_filter in ("RPS", "RPM"):
+        # RPS DF
+        scenario_rps_df = scenario_df.loc[scenario_df["Owner"] == "REQUEST"]
+        # Compute values of the right y-axis
+        if right_y_axis_filter in "RPS":
+            scenario_users_temp_df = compute_right_y_axis(scenario_rps_df, right_y_axis_filter, 1000)
+        else:
+            scenario_users_temp_df = compute_right_y_axis(scenario_rps_df, right_y_axis_filter, 60000)
+        # Merge the dataframe of Users
+        empty_scenario_metrics_df = \
+            empty_scenario_metrics_df.merge(scenario_users_temp_df, on='LocalTime', how='outer')
+
+    # Return the filled_scenario_metrics_df (Just to remove confusion this step is there)
+    filled_scenario_metrics_df = empty_scenario_metrics_df
+
+    return filled_scenario_metrics_df
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: get_top_transaction_indexes
+# Description  : Ranks the transactions by the given values, the highest first, and keeps the top ones
+# @param       : Numpy array of the ranking value of every transaction: its number of requests or its percentile.
+#                NaN ranks last.
+# @param       : Number of Top Transactions
+# @return      : int64 Numpy array of the indexes of the top transactions, in their order in the ranking values
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def get_top_transaction_indexes(ranking_values: np.ndarray, top: int) -> np.ndarray:
+    ranking_values = np.nan_to_num(np.asarray(ranking_values, dtype=np.float64), nan=-np.inf)
+    return np.sort(np.argsort(-ranking_values, kind="stable")[:top])
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: get_folded_top
+# Description  : Gives the number of top transactions of a scenario to keep, the others being folded into one
+# @param       : Number of transactions of the scenario
+# @param       : Number of Top Transactions asked for, or None
+# @param       : Most transactions drawn as their own lines when no top is asked for, or None for no limit. Above
+#                it, the top max_transactions - 1 are kept, so that the folded one is the last line.
+# @return      : Number of Top Transactions to keep, or None to keep them all
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def get_folded_top(transaction_count: int, top: int = None, max_transactions: int = None) -> int:
+    if not top and max_transactions and transaction_count > max_transactions:
+        top = max_transactions - 1
+
+    return top if top and transaction_count > top else None
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: fold_other_transactions
+# Description  : Keeps the top transactions of a scenario and folds all the others into OTHER_TRANSACTIONS_NAME, so
+#                that its percentiles are computed from the requests of all of them together
+# @param       : Scenario Dataframe, which we got after filtering gat_log_df
+# @param       : Transaction code of every OK request, as factorized from the transactions list
+# @param       : List of the transactions
+# @param       : Response Times of the OK requests
+# @param       : Number of Top Transactions, or None
+# @param       : Ranking of the transactions: "count" (number of requests, OK and KO) or "percentile" (the given
+#                percentile of the OK requests, the slowest first)
+# @param       : Percentile of the ranking by percentile
+# @param       : Most transactions without top, see get_folded_top. Default is None, for no limit.
+# @return      : Transaction code of every OK request, in the new list of the transactions
+# @return      : List of the top transactions, in their order in the given list, then OTHER_TRANSACTIONS_NAME.
+#                Unchanged if get_folded_top keeps all the transactions.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def fold_other_transactions(scenario_df: pd.DataFrame, transaction_codes: np.ndarray, transactions_list: list,
+                            response_times: np.ndarray, top: int, top_by: str, percentile: float,
+                            max_transactions: int = None) -> (np.ndarray, list):
+    top = get_folded_top(len(transactions_list), top, max_transactions)
+    if not top:
+        return transaction_codes, transactions_list
+
+    if top_by == "percentile":
+        ranking_values = histogram_percentiles(transaction_codes, response_times, len(transactions_list),
+                                               [percentile])[:, 0]
+    else:
+        request_counts = scenario_df.loc[scenario_df["Owner"] == "REQUEST", "Transaction_Name"].value_counts()
+        ranking_values = request_counts.rename(index=str).reindex(transactions_list).fillna(0).to_numpy()
+    top_indexes = get_top_transaction_indexes(ranking_values, top)
+
+    # Codes of the top transactions are 0 to top - 1, the others are all top
+    folded_codes = np.full(len(transactions_list), top)
+    folded_codes[top_indexes] = np.arange(top)
+
+    return folded_codes[transaction_codes], [transactions_list[index] for index in top_indexes] + \
+        [OTHER_TRANSACTIONS_NAME]
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: get_transaction_bucket_percentiles
+# Description  : Calculates the overall and the per second percentiles of every transaction of the given scenario, for
+#                all the given percentiles at once: the response times of the OK requests are counted per second, and
+#                every percentile is read from the counts of its second (histogram_percentiles), without a sort. The
+#                seconds of a transaction start at its first request and include both their ends, like the graphs
+#                always had them.
+# @param       : Scenario Dataframe, which we got after filtering gat_log_df. Columns are : [Owner,Scenario,Transaction_
+#                Name,Status,ResponseTime, LocalTime]
+# @param       : List of Percentiles
+# @param       : Number of Top Transactions, the others being folded into one, see fold_other_transactions. Default
+#                is None, for all the transactions.
+# @param       : Ranking of the top transactions: "count" or "percentile" (the first of the percentiles)
+# @param       : Most transactions without top, see get_folded_top. Default is None, for no limit.
+# @return      : Dataframe bucket_percentiles_df with columns: [Transaction, LocalTime, P..]
+# @return      : Dataframe overall_transaction_percentile_df with columns: [Transaction, P..]
+# @return      : List of the transactions, in the order of their first OK request
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def get_transaction_bucket_percentiles(scenario_df: pd.DataFrame, percentiles: list, top: int = None,
+                                       top_by: str = "count", max_transactions: int = None) \
+        -> (pd.DataFrame, pd.DataFrame, list):
+    percentile_col_names = [get_percentile_col_name(percentile) for percentile in percentiles]
+
+    # Transactions OK, coded in the order of their first request. Groups are not transactions.
+    scenario_ok_df = scenario_df.loc[(scenario_df["Owner"] == "REQUEST") & (scenario_df["Status"] == "OK")]
+    transaction_codes, transactions = pd.factorize(scenario_ok_df["Transaction_Name"])
+    transactions_list = [str(transaction_name) for transaction_name in transactions]
+    local_times = scenario_ok_df["LocalTime"].to_numpy().astype(np.int64)
+    response_times = scenario_ok_df["ResponseTime"].to_numpy()
+    if top or max_transactions:
+        transaction_codes, transactions_list = fold_other_transactions(scenario_df, transaction_codes,
+                                                                       transactions_list, response_times, top,
+                                                                       top_by, percentiles[0], max_transactions)
+
+    # Seconds of every transaction, from its first to its last request (in the order of the log)
+    first_rows = np.unique(transaction_codes, return_index=True)[1]
+    last_rows = len(transaction_codes) - 1 - np.unique(transaction_codes[::-1], return_index=True)[1]
+    begin_times = local_times[first_rows]
+    last_offsets = local_times[last_rows] - begin_times
+    last_buckets = last_offsets // 1000
+
+    # Bucket of every request. A request on the boundary of two seconds is in both of them.
+    offsets = local_times - begin_times[transaction_codes]
+    in_range = (offsets >= 0) & (offsets <= last_offsets[transaction_codes])
+    buckets = np.minimum(offsets // 1000, last_buckets[transaction_codes])
+    on_boundary = in_range & (offsets >= 1000) & (offsets % 1000 == 0) & \
+        (offsets // 1000 <= last_buckets[transaction_codes])
+    bucket_codes = np.concatenate((transaction_codes[in_range], transaction_codes[on_boundary]))
+    buckets = np.concatenate((buckets[in_range], offsets[on_boundary] // 1000 - 1))
+    bucket_times = np.concatenate((response_times[in_range], response_times[on_boundary]))
+
+    # Dense code of every second of every transaction, in the order of the transactions and seconds
+    bucket_count = int(buckets.max(initial=-1)) + 1
+    bucket_keys = bucket_codes * bucket_count + buckets
+    has_key = np.bincount(bucket_keys, minlength=len(transactions_list) * bucket_count) > 0
+    group_keys = np.flatnonzero(has_key)
+    group_codes = (np.cumsum(has_key) - 1)[bucket_keys]
+
+    # All the percentiles of all the seconds from their histograms
+    bucket_percentiles = histogram_percentiles(group_codes, bucket_times, len(group_keys), percentiles).round(2)
+
+    bucket_percentiles_df = pd.DataFrame({
+        "Transaction": np.array(transactions_list, dtype=object)[group_keys // max(bucket_count, 1)],
+        "LocalTime": begin_times[group_keys // max(bucket_count, 1)] + group_keys % max(bucket_count, 1) * 1000,
+    })
+    for percentile_index, col_name in enumerate(percentile_col_names):
+        bucket_percentiles_df[col_name] = bucket_percentiles[:, percentile_index]
+
+    # Overall Percentiles
+    overall_percentiles = histogram_percentiles(transaction_codes, response_times, len(transactions_list),
+                                                percentiles)
+    overall_transaction_percentile_df = pd.DataFrame({"Transaction": transactions_list})
+    for percentile_index, col_name in enumerate(percentile_col_names):
+        overall_transaction_percentile_df[col_name] = overall_percentiles[:, percentile_index]
+
+    return bucket_percentiles_df, overall_transaction_percentile_df, transactions_list
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: merge_transaction_percentiles
+# Description  : Merges the per second values of one percentile of every transaction to the scenario metrics
+# @param       : Dataframe scenario_metrics_df, which have right-y-axis values merged. Columns are: [LocalTime,
+#                ${right-y-axis-filter}]
+# @param       : Dataframe bucket_percentiles_df, as given by get_transaction_bucket_percentiles
+# @param       : Dataframe overall_transaction_percentile_df, as given by get_transaction_bucket_percentiles
+# @param       : List of the transactions, in the order in which their columns are added
+# @param       : Percentile
+# @return      : Dataframe scenario_metrics_df with columns: [LocalTime, ${right-y-axis-filter}, ${TransactionNames}]
+# @return      : Dataframe overall_transaction_percentile_df with columns: [Transaction, Percentile, P..]
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def merge_transaction_percentiles(scenario_metrics_df: pd.DataFrame, bucket_percentiles_df: pd.DataFrame,
+                                  overall_transaction_percentile_df: pd.DataFrame, transactions_list: list,
+                                  percentile: int) -> (pd.DataFrame, pd.DataFrame):
+    percentile_col_name = get_percentile_col_name(percentile)
+
+    # One column per transaction, values as strings like the right y-axis values
+    transactions_df = bucket_percentiles_df.pivot(index="LocalTime", columns="Transaction",
+                                                  values=percentile_col_name)
+    transactions_df = transactions_df.reindex(columns=transactions_list).reset_index()
+    transactions_df.columns.name = None
+    transactions_df = transactions_df.astype(object).where(transactions_df.notna())
+    for col_name in transactions_df.columns:
+        transactions_df[col_name] = transactions_df[col_name].map(str, na_action="ignore")
+
+    # Join two Dataframes
+    scenario_metrics_df = scenario_metrics_df.merge(transactions_df, on='LocalTime', how='outer')
+
+    overall_transaction_percentile_df = overall_transaction_percentile_df.copy()
+    overall_transaction_percentile_df.insert(1, "Percentile", overall_transaction_percentile_df[percentile_col_name])
+
+    return scenario_metrics_df, overall_transaction_percentile_df
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: calculate_and_merge_transaction_percentiles
+# Description  : Calculates the overall and interval based percentile of the given scenario
+# @param       : Scenario Dataframe, which we got after filtering gat_log_df. Columns are : [Owner,Scenario,Transaction_
+#                Name,Status,ResponseTime, LocalTime]
+# @param       : Dataframe scenario_metrics_df, which have right-y-axis values merged. Columns are: [LocalTime,
+#                ${right-y-axis-filter}]
+# @param       : Percentile, which needs to be calculated for the scenario.
+# @return      : Dataframe scenario_metrics_df with columns: [LocalTime, ${right-y-axis-filter}, ${TransactionNames}]
+# @return      : Dataframe overall_transaction_percentile_df with columns: [Transaction, Percentile]
+# Author       : Navdit Sharma
+# Comments     : Created on 05/09/2018
+########################################################################################################################
+def calculate_and_merge_transaction_percentiles(scenario_df: pd.DataFrame,
+                                                scenario_metrics_df: pd.DataFrame,
+                                                percentile: int) -> (pd.DataFrame, pd.DataFrame):
+    bucket_percentiles_df, overall_transaction_percentile_df, transactions_list = \
+        get_transaction_bucket_percentiles(scenario_df, [percentile])
+    scenario_metrics_df, overall_transaction_percentile_df = merge_transaction_percentiles(
+        scenario_metrics_df, bucket_percentiles_df, overall_transaction_percentile_df, transactions_list, percentile)
+
+    return scenario_metrics_df, overall_transaction_percentile_df[["Transaction", "Percentile"]]
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: get_scenario_metrics
+# Description  : Calculates the Errors, Percentile of the given scenario
+# @param       : Scenario Name
+# @param       : Gatling Log Dataframe
+# @param       : right_y_axis_filter value. As of now its limited to: Users, Errors, RPS and RPM
+# @param       : percentile
+# @return      : Dataframe scenario_metrics_df with columns: [LocalTime, Errors, ${TransactionNames}]
+# @return      : Dataframe overall_transaction_percentile_df with columns: [Transaction, Percentile]
+# Author       : Navdit Sharma
+# Comments     : Created on 05/09/2018
+########################################################################################################################
+def get_scenario_metrics(scenario_name: str, gatling_log_df: pd.DataFrame,
+                         right_y_axis_filter: str, percentile: int) -> (pd.DataFrame, pd.DataFrame):
+    scenario_metrics_df, overall_transaction_percentile_df = get_scenario_percentiles_metrics(
+        scenario_name, gatling_log_df, right_y_axis_filter, [percentile])[percentile]
+
+    # Return Two Dataframes
+    return scenario_metrics_df, overall_transaction_percentile_df[["Transaction", "Percentile"]]
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: get_scenario_percentiles_metrics
+# Description  : Calculates the Errors and several Percentiles of the given scenario. The right y-axis values and the
+#                sort of the response times are shared by all the percentiles.
+# @param       : Scenario Name
+# @param       : Gatling Log Dataframe
+# @param       : right_y_axis_filter value. As of now its limited to: Users, Errors, RPS and RPM
+# @param       : List of Percentiles
+# @param       : Number of Top Transactions, their Ranking and the most transactions without top, see
+#                get_transaction_bucket_percentiles. Default is all the transactions.
+# @return      : Dictionary of percentile -> (scenario_metrics_df, overall_transaction_percentile_df), like
+#                get_scenario_metrics. The overall Dataframes also have the columns P.. of all the percentiles.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def get_scenario_percentiles_metrics(scenario_name: str, gatling_log_df: pd.DataFrame,
+                                     right_y_axis_filter: str, percentiles: list, top: int = None,
+                                     top_by: str = "count", max_transactions: int = None) -> dict:
+    # Create new Scenario Dataframe
+    cond_col = gatling_log_df['Scenario'] == scenario_name
+    scenario_temp_df = gatling_log_df[cond_col]
+
+    # New Dataframe
+    empty_scenario_metrics_df = pd.DataFrame(columns=["LocalTime"])
+
+    # Calculate and Merge Right-Y-Axis Values
+    right_y_axis_metrics_df = merge_right_y_axis_values_with_scenario_df(empty_scenario_metrics_df,
+                                                                         scenario_temp_df, right_y_axis_filter)
+
+    # Left-Y-Axis Values and overall Percentile values of all the percentiles
+    bucket_percentiles_df, overall_percentiles_df, transactions_list = \
+        get_transaction_bucket_percentiles(scenario_temp_df, percentiles, top, top_by, max_transactions)
+
+    return merge_scenario_percentiles_metrics(right_y_axis_metrics_df, bucket_percentiles_df, overall_percentiles_df,
+                                              transactions_list, right_y_axis_filter, percentiles)
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: merge_scenario_percentiles_metrics
+# Description  : Merges the per second values of every percentile of every transaction to the right y-axis values of
+#                a scenario, and smooths the right y-axis values for the graphs
+# @param       : Dataframe of the right y-axis values, with columns: [LocalTime, ${right-y-axis-filter}] as strings
+# @param       : Dataframe bucket_percentiles_df, as given by get_transaction_bucket_percentiles
+# @param       : Dataframe overall_transaction_percentile_df, as given by get_transaction_bucket_percentiles
+# @param       : List of the transactions, in the order in which their columns are added
+# @param       : right_y_axis_filter value. As of now its limited to: Users, Errors, RPS and RPM
+# @param       : List of Percentiles
+# @return      : Dictionary of percentile -> (scenario_metrics_df, overall_transaction_percentile_df), like
+#                get_scenario_percentiles_metrics
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def merge_scenario_percentiles_metrics(right_y_axis_metrics_df: pd.DataFrame, bucket_percentiles_df: pd.DataFrame,
+                                       overall_percentiles_df: pd.DataFrame, transactions_list: list,
+                                       right_y_axis_filter: str, percentiles: list) -> dict:
+    percentiles_metrics = {}
+    for percentile in percentiles:
+        # Merge Left-Y-Axis Values of the percentile
+        scenario_metrics_df, overall_transaction_percentile_df = merge_transaction_percentiles(
+            right_y_axis_metrics_df, bucket_percentiles_df, overall_percentiles_df, transactions_list, percentile)
+
+        # Changing LocalTime to DateTime and sort the Time in Ascending order
+        scenario_metrics_df['LocalTime'] = pd.to_datetime(scenario_metrics_df['LocalTime'], unit='ms')
+        scenario_metrics_df = scenario_metrics_df.sort_values("LocalTime", ascending=True)
+
+        # Add the Steady State Users which are not filled -- This is for smoothing of graph.
+        if right_y_axis_filter not in "Errors":
+            scenario_metrics_df[right_y_axis_filter] = scenario_metrics_df[right_y_axis_filter].astype(float)
+            scenario_metrics_df[right_y_axis_filter] = \
+                scenario_metrics_df[right_y_axis_filter].interpolate().round(3)
+            scenario_metrics_df[right_y_axis_filter] = scenario_metrics_df[right_y_axis_filter].bfill()
+            # Fill NaN values with zero in case all the values are NaN
+            scenario_metrics_df = scenario_metrics_df.fillna(0)
+            # Convert the column to String
+            scenario_metrics_df[right_y_axis_filter] = scenario_metrics_df[right_y_axis_filter].astype(str)
+
+        # Fill NaN values with zero
+        percentiles_metrics[percentile] = (scenario_metrics_df.fillna(0), overall_transaction_percentile_df)
+
+    return percentiles_metrics
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: get_scenario_heatmap
+# Description  : Counts the requests of the given scenario over time buckets and log-scaled response time bins, with
+#                one 2-D histogram (a bincount of the combined bucket and bin of every request). Buckets are whole
+#                seconds, widened so that a long run has at most max_buckets of them. Bin i holds the response times
+#                from 10^(i/bins_per_decade) ms to the next bin, response times under 1 ms are in bin 0.
+# @param       : Dataframe scenario_df, which is a filtered dataframe of gat_log_df based on given scenario.
+# @param       : Maximum number of time buckets. Default is HEATMAP_MAX_BUCKETS.
+# @param       : Number of response time bins per power of 10. Default is HEATMAP_BINS_PER_DECADE.
+# @return      : Dictionary with counts (int64 Numpy array [bins, buckets]), begin_time (LocalTime of the first bucket,
+#                epoch ms), bucket_ms (width of a bucket) and bin_edges (response times of the edges of the bins, ms).
+#                None if the scenario has no requests.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def get_scenario_heatmap(scenario_df: pd.DataFrame, max_buckets: int = HEATMAP_MAX_BUCKETS,
+                         bins_per_decade: int = HEATMAP_BINS_PER_DECADE) -> dict:
+    requests_df = scenario_df.loc[scenario_df["Owner"] == "REQUEST"]
+    if requests_df.empty:
+        return None
+
+    return get_heatmap(requests_df["LocalTime"].to_numpy().astype(np.int64), requests_df["ResponseTime"].to_numpy(),
+                       None, max_buckets, bins_per_decade)
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: get_heatmap
+# Description  : Counts requests over time buckets and log-scaled response time bins, see get_scenario_heatmap
+# @param       : int64 Numpy array of the LocalTime of the requests (epoch ms), not empty
+# @param       : Numpy array of the Response Times of the requests
+# @param       : Numpy array of the number of requests of every LocalTime and Response Time, e.g. of a histogram.
+#                None if every request is given on its own.
+# @param       : Maximum number of time buckets. Default is HEATMAP_MAX_BUCKETS.
+# @param       : Number of response time bins per power of 10. Default is HEATMAP_BINS_PER_DECADE.
+# @return      : Dictionary of the heatmap, like get_scenario_heatmap
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def get_heatmap(local_times: np.ndarray, response_times: np.ndarray, request_counts: np.ndarray = None,
+                max_buckets: int = HEATMAP_MAX_BUCKETS, bins_per_decade: int = HEATMAP_BINS_PER_DECADE) -> dict:
+    # Time buckets of whole seconds
+    begin_time = int(local_times.min())
+    bucket_ms = 1000 * max(1, -(-(int(local_times.max()) - begin_time + 1) // (1000 * max_buckets)))
+    buckets = (local_times - begin_time) // bucket_ms
+    bucket_count = int(buckets.max()) + 1
+
+    # Log-scaled response time bins
+    bins = np.floor(np.log10(np.maximum(response_times, 1)) * bins_per_decade).astype(np.int64)
+    bin_count = int(bins.max()) + 1
+
+    counts = np.bincount(bins * bucket_count + buckets, weights=request_counts, minlength=bin_count * bucket_count)
+
+    return {
+        "counts": counts.astype(np.int64).reshape(bin_count, bucket_count),
+        "begin_time": begin_time,
+        "bucket_ms": bucket_ms,
+        "bin_edges": 10 ** (np.arange(bin_count + 1) / bins_per_decade),
+    }
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: get_scenario_error_breakdown
+# Description  : Counts the KO requests of the given scenario per time bucket and per (transaction, error message), in
+#                one grouped pass: every KO request gets the code of its (transaction, error message) pair and one
+#                bincount of the combined bucket and pair counts them all. Buckets are whole seconds from the first
+#                request of the scenario, widened so that a long run has at most max_buckets of them.
+# @param       : Dataframe scenario_df, which is a filtered dataframe of gat_log_df based on given scenario.
+# @param       : Maximum number of time buckets. Default is ERROR_BREAKDOWN_MAX_BUCKETS.
+# @return      : Dictionary with counts (int64 Numpy array [buckets, pairs]), begin_time (LocalTime of the first
+#                bucket, epoch ms), bucket_ms (width of a bucket) and errors_df (Dataframe with columns: [Transaction,
+#                Error Message, Count, % of Errors], one row per pair in the order of the columns of counts, most
+#                frequent first). None if the scenario has no KO requests.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def get_scenario_error_breakdown(scenario_df: pd.DataFrame,
+                                 max_buckets: int = ERROR_BREAKDOWN_MAX_BUCKETS) -> dict:
+    requests_df = scenario_df.loc[scenario_df["Owner"] == "REQUEST"]
+    ko_df = requests_df.loc[requests_df["Status"] == "KO"]
+    if ko_df.empty:
+        return None
+    local_times = requests_df["LocalTime"].to_numpy().astype(np.int64)
+
+    # Time buckets of whole seconds, over all the requests of the scenario
+    begin_time = int(local_times.min())
+    bucket_ms = 1000 * max(1, -(-(int(local_times.max()) - begin_time + 1) // (1000 * max_buckets)))
+    buckets = (ko_df["LocalTime"].to_numpy().astype(np.int64) - begin_time) // bucket_ms
+    bucket_count = int(buckets.max()) + 1
+
+    # (Transaction, Error Message) pair of every KO request. Code -1 of the messages is no message.
+    transaction_codes = ko_df["Transaction_Name"].cat.codes.to_numpy().astype(np.int64)
+    message_codes = ko_df["ErrorMessage"].cat.codes.to_numpy().astype(np.int64)
+    message_count = len(ko_df["ErrorMessage"].cat.categories) + 1
+    pair_codes, pairs = pd.factorize(transaction_codes * message_count + message_codes + 1)
+
+    counts = np.bincount(buckets * len(pairs) + pair_codes, minlength=bucket_count * len(pairs))
+    counts = counts.reshape(bucket_count, len(pairs))
+
+    # Pairs, most frequent first
+    pair_totals = counts.sum(axis=0)
+    order = np.argsort(-pair_totals, kind="stable")
+    message_names = np.array([NO_ERROR_MESSAGE] + [message if message.strip() else NO_ERROR_MESSAGE
+                                                   for message in ko_df["ErrorMessage"].cat.categories], dtype=object)
+    errors_df = pd.DataFrame({
+        "Transaction": ko_df["Transaction_Name"].cat.categories.to_numpy()[pairs[order] // message_count],
+        "Error Message": message_names[pairs[order] % message_count],
+        "Count": pair_totals[order],
+        "% of Errors": np.round(pair_totals[order] * 100 / len(ko_df), 2),
+    })
+
+    return {
+        "counts": counts[:, order],
+        "begin_time": begin_time,
+        "bucket_ms": bucket_ms,
+        "errors_df": errors_df,
+    }
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: get_list_of_scenarios
+# Description  : Gives the sorted list of the scenarios, which were run in the Gatling Test
+# @param       : Gatling Log Dataframe
+# @return      : Sorted List of Scenarios
+# Author       : Navdit Sharma
+# Comments     : Created on 20/09/2018
+########################################################################################################################
+def get_list_of_scenarios(gatling_log_df: pd.DataFrame) -> list:
+    sorted_scenario_list = gatling_log_df.Scenario.unique().tolist()
+    sorted_scenario_list.sort()
+    return sorted_scenario_list
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: get_scenario_export_metrics
+# Description  : Calculates the metrics of all the right y-axis filters and the percentiles of the transactions of the
+#                given scenario in one wide Dataframe with numeric columns, for the export
+# @param       : Dataframe scenario_df, which is a filtered dataframe of gat_log_df based on given scenario.
+# @param       : Percentile, or List of Percentiles
+# @return      : Dataframe with columns: [LocalTime, RPS, Users, Errors, ${TransactionNames}]. One row per LocalTime,
+#                transactions without OK requests in a second are NaN. For a list of percentiles, the columns of the
+#                transactions are named "${TransactionName} P.." (e.g. "GET_Account P95").
+# @return      : Dataframe overall_transaction_percentile_df with columns: [Transaction, Percentile], or [Transaction,
+#                P..] for a list of percentiles
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def get_scenario_export_metrics(scenario_df: pd.DataFrame, percentile) -> (pd.DataFrame, pd.DataFrame):
+    percentiles = percentile if isinstance(percentile, list) else [percentile]
+
+    # Calculate and Merge the values of all the Right-Y-Axis Filters
+    scenario_metrics_df = pd.DataFrame(columns=["LocalTime"])
+    for right_y_axis_filter in EXPORT_RIGHT_Y_AXIS_FILTERS:
+        scenario_metrics_df = merge_right_y_axis_values_with_scenario_df(scenario_metrics_df, scenario_df,
+                                                                         right_y_axis_filter)
+
+    # Calculate and Merge Left-Y-Axis Values of every percentile and get overall Percentile values.
+    bucket_percentiles_df, overall_transaction_percentile_df, transactions_list = \
+        get_transaction_bucket_percentiles(scenario_df, percentiles)
+    for percentile_value in percentiles:
+        percentile_metrics_df, _ = merge_transaction_percentiles(pd.DataFrame(columns=["LocalTime"]),
+                                                                 bucket_percentiles_df,
+                                                                 overall_transaction_percentile_df,
+                                                                 transactions_list, percentile_value)
+        if isinstance(percentile, list):
+            percentile_metrics_df = percentile_metrics_df.rename(columns={
+                transaction_name: "{} {}".format(transaction_name, get_percentile_col_name(percentile_value))
+                for transaction_name in transactions_list})
+        scenario_metrics_df = scenario_metrics_df.merge(percentile_metrics_df, on='LocalTime', how='outer')
+    if not isinstance(percentile, list):
+        overall_transaction_percentile_df = overall_transaction_percentile_df.rename(
+            columns={get_percentile_col_name(percentile): "Percentile"})
+
+    # Numeric values and one row per LocalTime, sorted
+    scenario_metrics_df = scenario_metrics_df.apply(pd.to_numeric)
+    scenario_metrics_df = scenario_metrics_df.groupby("LocalTime", sort=True).first().reset_index()
+
+    # Same smoothing of the steady state as in the graphs
+    for right_y_axis_filter in ("RPS", "Users"):
+        scenario_metrics_df[right_y_axis_filter] = \
+            scenario_metrics_df[right_y_axis_filter].interpolate().round(3).bfill().fillna(0)
+    scenario_metrics_df["Errors"] = scenario_metrics_df["Errors"].fillna(0).astype(np.int64)
+    scenario_metrics_df["LocalTime"] = pd.to_datetime(scenario_metrics_df["LocalTime"], unit='ms')
+
+    overall_transaction_percentile_df = overall_transaction_percentile_df.round(2)
+
+    return scenario_metrics_df, overall_transaction_percentile_df
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: write_export_df
+# Description  : Writes the given Dataframe in the given export format
+# @param       : Dataframe to write
+# @param       : Path of the file, without its extension
+# @param       : Export Format - parquet, csv or json
+# @return      : Path of the written file
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def write_export_df(export_df: pd.DataFrame, export_path: Path, export_format: str) -> Path:
+    export_path = export_path.with_name(export_path.name + "." + export_format)
+
+    if export_format == "parquet":
+        export_df.to_parquet(export_path, index=False)
+    elif export_format == "csv":
+        export_df.to_csv(export_path, index=False)
+    else:
+        export_df.to_json(export_path, orient="records", date_format="iso")
+
+    return export_path
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: export_scenario_metrics
+# Description  : Calculates and writes the metrics of a scenario. Runs in the export worker processes.
+# @param       : Scenario Name
+# @param       : Dataframe scenario_df, which is a filtered dataframe of gat_log_df based on given scenario.
+# @param       : List of Percentiles
+# @param       : Export Directory
+# @param       : Export Format - parquet, csv or json
+# @return      : Dataframe of the overall percentiles of the scenario with columns: [Scenario, Transaction, P..]
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def export_scenario_metrics(scenario_name: str, scenario_df: pd.DataFrame, percentiles: list, export_dir: str,
+                            export_format: str) -> pd.DataFrame:
+    # Same columns as before for a single percentile
+    scenario_metrics_df, overall_percentile_df = get_scenario_export_metrics(
+        scenario_df, percentiles if len(percentiles) > 1 else percentiles[0])
+
+    # File names without special characters
+    write_export_df(scenario_metrics_df, Path(export_dir) / "scenario_{}".format(re.sub(r"\W", "_", scenario_name)),
+                    export_format)
+
+    overall_percentile_df.insert(0, "Scenario", scenario_name)
+    return overall_percentile_df.rename(columns={"Percentile": get_percentile_col_name(percentiles[0])})
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: export_shared_scenario_metrics
+# Description  : Reads the records of a scenario from the shared Gatling Log, then calculates and writes its metrics
+#                like export_scenario_metrics. Runs in the export worker processes.
+# @param       : Handle of the SharedGatlingLog
+# @param       : Scenario Name
+# @param       : List of Percentiles
+# @param       : Export Directory
+# @param       : Export Format - parquet, csv or json
+# @return      : Dataframe of the overall percentiles of the scenario, as given by export_scenario_metrics
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def export_shared_scenario_metrics(shared_log_handle: dict, scenario_name: str, percentiles: list, export_dir: str,
+                                   export_format: str) -> pd.DataFrame:
+    return export_scenario_metrics(scenario_name, read_shared_scenario_df(shared_log_handle, scenario_name),
+                                   percentiles, export_dir, export_format)
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: export_metrics
+# Description  : Exports the per-scenario metrics and the overall percentile table of the run, the scenarios in
+#                parallel. The workers read their scenario from a SharedGatlingLog, so that what is sent to them doesn't
+#                grow with the log and the records are held once, whatever the number of workers.
+# @param       : Gatling Log Dataframe
+# @param       : List of Percentiles
+# @param       : Export Directory, created if needed
+# @param       : Export Format - parquet, csv or json
+# @param       : Number of worker processes
+# @return      : Null
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def export_metrics(gat_log_df: pd.DataFrame, percentiles: list, export_dir: str, export_format: str, jobs: int):
+    Path(export_dir).mkdir(parents=True, exist_ok=True)
+
+    scenario_list = get_list_of_scenarios(gat_log_df)
+
+    if jobs > 1 and len(scenario_list) > 1:
+        # The executor is shut down, i.e. the workers are done, before the shared log is freed
+        with SharedGatlingLog(gat_log_df) as shared_log, \
+                ProcessPoolExecutor(max_workers=min(jobs, len(scenario_list))) as executor:
+            overall_percentile_df_list = list(executor.map(export_shared_scenario_metrics, repeat(shared_log.handle),
+                                                           scenario_list, repeat(percentiles), repeat(export_dir),
+                                                           repeat(export_format)))
+    else:
+        scenario_df_list = [gat_log_df[gat_log_df["Scenario"] == scenario_name] for scenario_name in scenario_list]
+        overall_percentile_df_list = list(map(export_scenario_metrics, scenario_list, scenario_df_list,
+                                              repeat(percentiles), repeat(export_dir), repeat(export_format)))
+
+    overall_percentile_df = pd.concat(overall_percentile_df_list, ignore_index=True)
+    write_export_df(overall_percentile_df, Path(export_dir) / "overall_percentiles", export_format)
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: scale_sampled_counts
+# Description  : Scales the counts of a sampled run back up to the whole run: Count and Errors are rounded to whole
+#                numbers, Throughput, RPS and RPM to 3 decimals. Columns of strings (as in the graph metrics) stay
+#                strings.
+# @param       : Dataframe of metrics, with some of the columns SAMPLED_COUNT_COL_NAMES
+# @param       : Sample Rate, from 0 to 1
+# @return      : Scaled copy of the Dataframe, or the Dataframe itself if the run is not sampled
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def scale_sampled_counts(metrics_df: pd.DataFrame, sample_rate: float) -> pd.DataFrame:
+    if sample_rate >= 1:
+        return metrics_df
+
+    metrics_df = metrics_df.copy()
+    for col_name in SAMPLED_COUNT_COL_NAMES:
+        if col_name in metrics_df.columns:
+            scaled_counts = pd.to_numeric(metrics_df[col_name]) / sample_rate
+            if col_name in ("Count", "Errors"):
+                scaled_counts = scaled_counts.round().astype(np.int64)
+            else:
+                scaled_counts = scaled_counts.round(3)
+            metrics_df[col_name] = scaled_counts.astype(str) if metrics_df[col_name].dtype == object else scaled_counts
+
+    return metrics_df
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: get_sample_percentile_error
+# Description  : Gives the expected error of a percentile read from a sample: the half width, in percentile points,
+#                of the 95% confidence interval of its rank, 1.96 * sqrt(p * (1 - p) / n). E.g. a 95th percentile
+#                read from 1000 sampled response times is the true 93.6th to 96.4th percentile.
+# @param       : Percentile
+# @param       : Number of sampled response times
+# @return      : Expected error in percentile points. NaN without sampled response times.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def get_sample_percentile_error(percentile: float, sample_count: int) -> float:
+    if sample_count <= 0:
+        return np.nan
+
+    return 1.96 * np.sqrt(percentile / 100 * (1 - percentile / 100) / sample_count) * 100
+
+
+########################################################################################################################
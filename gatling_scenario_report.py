@@ -0,0 +1,933 @@
+# ============================================================================================================
+# Purpose:           Builds the Bokeh graphs of the scenario, comparison and trend reports.
+# Author:            Navdit Sharma (Nav)
+# Notes:             Nothing here writes files: the builders return Bokeh layouts, which can be saved with
+#                    save_report or embedded in another page.
+# Revision:          Last change: 18/10/26 :: Every graph inspected by its crosshair, at the nearest point of every line
+# ==============================================================================================================
+
+import re
+
+import numpy as np
+import pandas as pd
+from bokeh.layouts import Column
+from bokeh.models import (ColorBar, ColumnDataSource, CrosshairTool, Div, HoverTool, Legend, LinearAxis,
+                          LogColorMapper, Range1d)
+from bokeh.models.formatters import DatetimeTickFormatter
+from bokeh.models.widgets import DataTable, Panel, TableColumn, Tabs
+from bokeh.palettes import Viridis256, d3
+from bokeh.plotting import figure, save
+from bokeh.resources import CDN, Resources
+
+from gatling_run import GatlingReportSource, GatlingRun
+from gatling_report_options import GRAPH_MAX_TRANSACTIONS, get_percentile_col_name
+from gatling_run_aggregates import AGGREGATE_BUCKET_MS
+from gatling_scenario_metrics import OTHER_TRANSACTIONS_NAME, get_sample_percentile_error
+
+
+# Right y-axis values of the tabs of the scenario report
+REPORT_RIGHT_Y_AXIS_FILTERS = ["RPS", "Users", "Errors"]
+
+# Errors breakdown: (transaction, error message) pairs plotted on their own, the rest are stacked as "Other", rows of
+# the table of the most frequent errors, and longest error message shown in the legend
+ERROR_BREAKDOWN_TOP = 10
+ERROR_TABLE_TOP = 20
+ERROR_LEGEND_MAX_CHARS = 60
+
+# Farthest point of a line of a scenario graph shown by the crosshair inspector, in ms: half of the 1 s buckets of the
+# transactions, which start at the first request of their transaction
+INSPECTOR_MAX_DISTANCE_MS = 500
+
+# Colour of the line of the transactions folded out of the top transactions
+OTHER_TRANSACTIONS_COLOR = "#999999"
+
+
+########################################################################################################################
+# Function Name: remove_dollar_sign_and_get_column_names_dict
+# Description  : It removes the dollar sign from the column name and transaction names of df and returns the dictionary
+#                of the old and new column names. Reason - Having "$" in the name of the column screws the Hover
+#                Tool of Bokeh. Having dictionary will help to keep the legend names same as the ones found in Gatling
+#                Report, but Hover tool
+#                will show the name without "$" sign.
+# @param       : Scenario Metrics Dataframe and Overall Percentile Dataframe.
+# @return      : Dictionary of Column Names
+# Author       : Navdit Sharma
+# Comments     : Created on 05/09/2018
+########################################################################################################################
+def remove_dollar_sign_and_get_column_names_dict(scenario_metrics_df: pd.DataFrame,
+                                                 overall_percentile_df: pd.DataFrame) -> dict:
+    col_name_dict = {}
+    for column in scenario_metrics_df:
+        new_col_name = column.replace("$", "")
+        scenario_metrics_df.rename(columns={column: new_col_name}, inplace=True)
+        overall_percentile_df['Transaction'] = \
+            overall_percentile_df['Transaction'].replace(column, new_col_name)
+        col_name_dict[new_col_name] = column
+
+    return col_name_dict
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: get_y_range_of_graph
+# Description  : Gives the Right and Left Y-axis range of the graph based on the max value in dataframe
+# @param       : Scenario Metrics Dataframe
+# @param       : right_y_axis_filters_list - List of rigth y-Axis filters
+# @return      : Left and Right Y-Axis Range of Bokeh Graph
+# Author       : Navdit Sharma
+# Comments     : Created on 05/09/2018
+########################################################################################################################
+def get_y_range_of_graph(scenario_metrics_df: pd.DataFrame, right_y_axis_filter: str) -> (int, int):
+    tmp_max_val_df = scenario_metrics_df
+    tmp_max_val_df = tmp_max_val_df.apply(pd.to_numeric)
+
+    # Right y-Axis Range
+    right_y_axis_range = tmp_max_val_df[right_y_axis_filter].max() + 1
+
+    # Left y-axis Range
+    tmp_max_val_df = tmp_max_val_df.drop(["LocalTime"], axis=1)
+
+    # Drop Right-Y-Axis Columns
+    tmp_max_val_df = tmp_max_val_df.drop([right_y_axis_filter], axis=1)
+
+    left_y_axis_range = (0, tmp_max_val_df.values.max() + 50)
+
+    return left_y_axis_range, right_y_axis_range
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: get_color_palette
+# Description  : To set the color palette, which will be used in plotting Bokeh Graph. Red is kept for the errors, so
+#                the 19 other colours of Category20 are used in turn. ScenarioReportBuilder draws no more than
+#                GRAPH_MAX_TRANSACTIONS transactions, so that their colours are all different.
+# @param       : Scenario Metrics Dataframe
+# @param       : Scenario Name, for which the Color Palette has to be set
+# @return      : Color Palette, with one colour per column of the Scenario Metrics Dataframe
+# Author       : Navdit Sharma
+# Comments     : Created on 05/09/2018
+########################################################################################################################
+def get_color_palette(scenario_metrics_df: pd.DataFrame, scenario: str) -> list:
+    # Number of Lines to plot
+    num_lines = len(scenario_metrics_df.columns)
+
+    # Get the colors
+    if num_lines < 3:
+        color_palette = ['#1f77b4', '#2ca02c']
+    else:
+        # Removing Red Color which is on index 5
+        colors = [color for color in d3['Category20'][20] if color != "#d62728"]
+        color_palette = [colors[color_index % len(colors)] for color_index in range(num_lines)]
+
+    return color_palette
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: set_crosshair_inspector
+# Description  : Adds one inspector to a graph: a vertical crosshair and one tooltip of the values of every line at the
+#                cursor. The x-axis is cut in one invisible cell per time of the lines, from midpoint to midpoint, so
+#                the cell under the cursor is the time nearest to it. BokehJS finds that cell from its spatial index (a
+#                search of the sorted time axis), instead of hit testing every point of every line on each mouse move.
+#                Every line shows its own point nearest to the time of the cell, not a value binned again.
+# @param       : Graph
+# @param       : List of (Label, Times in epoch ms, Values) of the lines, in the order of the tooltip
+# @param       : Top of the cells, i.e. the top of the left y-axis range
+# @param       : Farthest point of a line from the time of a cell, in ms, shown in the cell. Lines without a point
+#                that close have no value in the cell. Default is 0, only the points at that time.
+# @return      : Hover Tool of the inspector
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def set_crosshair_inspector(plot_graph: figure(), labelled_lines: list, cell_top: float,
+                            max_distance_ms: int = 0) -> HoverTool:
+    lines = []
+    for label, times, values in labelled_lines:
+        times = np.asarray(times, dtype=np.int64)
+        values = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype=np.float64)
+        order = np.argsort(times, kind="stable")
+        has_value = ~np.isnan(values[order])
+        lines.append((label, times[order][has_value], values[order][has_value]))
+
+    # Cells of the times of the lines, from midpoint to midpoint
+    cell_times = np.unique(np.concatenate([times for _, times, _ in lines] + [np.empty(0, dtype=np.int64)]))
+    cell_edges = (cell_times[1:] + cell_times[:-1]) / 2
+    end_width = (np.diff(cell_times).min() if len(cell_times) > 1 else max(max_distance_ms, 1000)) / 2
+    inspector_data = {"LocalTime": pd.to_datetime(cell_times, unit='ms'),
+                      "left": np.concatenate((cell_times[:1] - end_width, cell_edges)),
+                      "right": np.concatenate((cell_edges, cell_times[-1:] + end_width))}
+
+    # Point of every line nearest to every cell
+    for line_index, (_, times, values) in enumerate(lines):
+        cell_values = np.full(len(cell_times), np.nan)
+        if len(times):
+            after = np.minimum(np.searchsorted(times, cell_times), len(times) - 1)
+            before = np.maximum(after - 1, 0)
+            nearest = np.where(np.abs(times[before] - cell_times) <= np.abs(times[after] - cell_times), before, after)
+            is_near = np.abs(times[nearest] - cell_times) <= max_distance_ms
+            cell_values[is_near] = values[nearest[is_near]].round(2)
+        inspector_data["line{}".format(line_index)] = cell_values
+
+    inspector_cells = plot_graph.quad(left='left', right='right', bottom=0, top=cell_top,
+                                      source=ColumnDataSource(inspector_data), fill_alpha=0, line_alpha=0,
+                                      hover_fill_alpha=0, hover_line_alpha=0)
+    inspector = HoverTool(
+        renderers=[inspector_cells],
+        tooltips=[('Time', '@LocalTime{%F %T}')] + [(label, "@line{}".format(line_index))
+                                                      for line_index, (label, _, _) in enumerate(lines)],
+        formatters={'@LocalTime': 'datetime'},
+        mode='mouse'
+    )
+    plot_graph.add_tools(CrosshairTool(dimensions='height', line_color='white', line_alpha=.5), inspector)
+
+    return inspector
+
+
+########################################################################################################################
+# Function Name: plot_new_graph
+# Description  : Set the properties of the hover tool tips.
+# @param       : x_axis_label - Label of X-Axis
+# @param       : x_axis_type
+# @param       : y_axis_label - Label of Y-Axis
+# @param       : plot_width - Width of the graph to be plotted
+# @param       : plot_height - Height of the graph to be plotted
+# @param       : left_y_range - Range of Y-Axis
+# @param       : toolbar_location - Location of Bokeh Toolbar
+# @param       : tools_to_show - Bokeh tools, which you would like to show on graph
+# @return      : figure
+# Author       : Navdit Sharma
+# Comments     : Created on 05/09/2018
+########################################################################################################################
+def plot_new_graph(x_axis_label: str, x_axis_type: str, y_axis_label: str, plot_width: int, plot_height: int,
+                   left_y_range: int, toolbar_location: str, tools_to_show: str) -> figure():
+    plot = figure(x_axis_label=x_axis_label,
+                  x_axis_type=x_axis_type,
+                  y_axis_label=y_axis_label,
+                  plot_width=plot_width,
+                  plot_height=plot_height,
+                  y_range=left_y_range,
+                  toolbar_location=toolbar_location,
+                  tools=tools_to_show)
+
+    return plot
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: set_graph_and_legend_properties
+# Description  : Sets the Properties of the graph and the legend of the graph
+# @param       : Graph and the legend it will be using, Scenario Name
+# @return      : Returns the plotted graph with the properties
+# Author       : Navdit Sharma
+# Comments     : Created on 05/09/2018
+########################################################################################################################
+def set_graph_and_legend_properties(plot_graph: figure(), legends: list, scenario: str) -> figure():
+    # Legend related formatting
+    legend = Legend(items=legends, location=(0, 0))
+    legend.click_policy = "hide"
+    legend.background_fill_color = "#2F2F2F"
+    legend.label_text_color = "white"
+    legend.border_line_color = "#2F2F2F"
+    legend.inactive_fill_color = "#2F2F2F"
+    plot_graph.add_layout(legend, 'right')
+
+    return set_graph_properties(plot_graph, scenario)
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: set_graph_properties
+# Description  : Sets the Properties of the axes, title and background of the graph
+# @param       : Graph, Scenario Name
+# @return      : Returns the graph with the properties
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def set_graph_properties(plot_graph: figure(), scenario: str) -> figure():
+    # X-Axis related formatting
+    plot_graph.xgrid.grid_line_color = "white"
+    plot_graph.xgrid.grid_line_dash = [6, 4]
+    plot_graph.xgrid.grid_line_alpha = .3
+    plot_graph.xaxis.axis_line_color = "white"
+    plot_graph.xaxis.axis_label_text_color = "white"
+    plot_graph.xaxis.major_label_text_color = "white"
+    plot_graph.xaxis.major_tick_line_color = "white"
+    plot_graph.xaxis.minor_tick_line_color = "white"
+    plot_graph.xaxis.formatter = DatetimeTickFormatter(
+        microseconds=["%H:%M:%S"],
+        milliseconds=["%H:%M:%S"],
+        seconds=["%H:%M:%S"],
+        minsec=["%H:%M:%S"],
+        minutes=["%H:%M"],
+        hourmin=["%H:%M"],
+        hours=["%H:%M"],
+        days=["%H:%M"],
+        months=["%H:%M"],
+        years=["%H:%M"], )
+
+    # Y-axis related formatting
+    plot_graph.ygrid.grid_line_color = "white"
+    plot_graph.ygrid.grid_line_dash = [6, 4]
+    plot_graph.ygrid.grid_line_alpha = .3
+    plot_graph.yaxis.axis_line_color = "white"
+    plot_graph.yaxis.axis_label_text_color = "white"
+    plot_graph.yaxis.major_label_text_color = "white"
+    plot_graph.yaxis.major_tick_line_color = "white"
+    plot_graph.yaxis.minor_tick_line_color = "white"
+
+    # Graph related Formatting
+    plot_graph.min_border_left = 80
+    plot_graph.title.text = scenario
+    plot_graph.title.text_color = "white"
+    plot_graph.title.text_font = "times"
+    plot_graph.title.text_font_style = "normal"
+    plot_graph.title.text_font_size = "14pt"
+    plot_graph.title.align = "center"
+    plot_graph.background_fill_color = '#2F2F2F'
+    plot_graph.border_fill_color = '#2F2F2F'
+    plot_graph.outline_line_color = '#444444'
+
+    return plot_graph
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: sort_transaction_names_and_remove_localtime_col
+# Description  : Sorts the transactions names in Alphabetical order and removes Localtime Column
+# @param       : Right Y-Axis Filter
+# @param       : List of Column Names
+# @param       : Sort -- True, if you want to sort the column names. Else the Legend will have the order of
+#                transactions in which they were executed. Default value is True.
+# @return      : List of Column Names, in the order in which they will be plotted and shown on Legend
+# Author       : Navdit Sharma
+# Comments     : Created on 05/09/2018
+########################################################################################################################
+def sort_transaction_names_and_remove_localtime_col(right_y_axis_filter: str,
+                                                    col_list: list, sort: bool = True) -> list:
+    if sort:
+        # Remove the right y axis filter
+        col_list.remove(right_y_axis_filter)
+        # Remove LocalTime
+        col_list.remove("LocalTime")
+        # Sort the List
+        col_list.sort()
+        # Insert Right Y axis Filter in the beginning so that its always on top in Legend
+        col_list.insert(0, right_y_axis_filter)
+    else:
+        # Remove LocalTime
+        col_list.remove("LocalTime")
+
+    return col_list
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: plot_graph_by_transaction
+# Description  : Plots the graph of all the transactions in a given scenario
+# @param       : scenario_graph Figure
+# @param       : Right Y-Axis Filter
+# @param       : Percentile
+# @param       : Percentiles to show in the legend, from the columns P.. of overall_percentile_df. Default is only
+#                the percentile of the graph.
+# @return      : Figure of Plotted graph along with Legend in Legend List
+# Author       : Navdit Sharma
+# Comments     : Created on 05/09/2018
+########################################################################################################################
+def plot_graph_by_transaction(scenario_metrics_df: pd.DataFrame, overall_percentile_df: pd.DataFrame, scenario: str,
+                              right_y_axis_filter: str, percentile: int, legend_percentiles: list = None) -> figure():
+    # Remove $ from the names of column names of scenario_metrics_df and
+    # Rename the Transactions of overall_percentile_df
+    col_name_dict = remove_dollar_sign_and_get_column_names_dict(scenario_metrics_df, overall_percentile_df)
+
+    # Define Y-Axis Range of the Graph
+    (left_y_range, right_y_range) = get_y_range_of_graph(scenario_metrics_df, right_y_axis_filter)
+
+    # Get the colors for the Lines of the Graph
+    color_palette = get_color_palette(scenario_metrics_df, scenario)
+
+    # Tools to be available in graph
+    tools_to_show = 'box_zoom,reset,save'
+
+    # create a new plot with a title and axis labels
+    scenario_graph = plot_new_graph('Time', 'datetime', 'Response Time (ms)', 1900, 400, left_y_range, 'below',
+                                    tools_to_show)
+
+    # Disabling Hover Tool
+    scenario_graph.toolbar.active_inspect = None
+
+    # Index to go through Color Palette
+    color_index = 0
+
+    # get all the legends in one list, and the lines of the inspector
+    legend_list = []
+    inspector_line_list = []
+    local_times = scenario_metrics_df["LocalTime"].to_numpy().astype("datetime64[ms]").astype(np.int64)
+
+    # Sort the Transactions names in Alphabetical order, the folded transactions last
+    transaction_col_list = sort_transaction_names_and_remove_localtime_col(right_y_axis_filter,
+                                                                           list(scenario_metrics_df.columns))
+    if OTHER_TRANSACTIONS_NAME in transaction_col_list:
+        transaction_col_list.remove(OTHER_TRANSACTIONS_NAME)
+        transaction_col_list.append(OTHER_TRANSACTIONS_NAME)
+
+    # Source of Graphs
+    source = ColumnDataSource(scenario_metrics_df)
+
+    # Plot graph transaction-wise
+    for col_name in transaction_col_list:
+        if col_name in right_y_axis_filter:
+            # Get the legend name
+            legend_name = col_name
+
+            # Setting the second y axis range name and range
+            scenario_graph.extra_y_ranges = {col_name: Range1d(0, right_y_range)}
+
+            # Adding the second axis to the plot.
+            scenario_graph.add_layout(LinearAxis(y_range_name=col_name, axis_label=col_name), 'right')
+
+            # PlotGraph
+            if col_name in "Errors":
+                axis_color = "#d62728"
+            else:
+                axis_color = "yellow"
+            plot_graph = scenario_graph.line('LocalTime',
+                                             col_name,
+                                             source=source,
+                                             line_width=2,
+                                             color=axis_color,
+                                             y_range_name=col_name,
+                                             name=col_name)
+
+        else:
+            # Transaction Percentile
+            col_percentile = int(overall_percentile_df.loc
+                                 [overall_percentile_df['Transaction'] == col_name, 'Percentile'].item())
+
+            # Get the legend name along with Transaction's Percentile, or all its Percentiles
+            if legend_percentiles and len(legend_percentiles) > 1:
+                legend_name = col_name_dict[col_name] + " ({})".format(", ".join(
+                    "{}th: {} ms".format(legend_percentile, int(overall_percentile_df.loc[
+                        overall_percentile_df['Transaction'] == col_name,
+                        get_percentile_col_name(legend_percentile)].item()))
+                    for legend_percentile in legend_percentiles))
+            else:
+                legend_name = col_name_dict[col_name] + " ({}th: {} ms)".format(percentile, col_percentile)
+
+            # PlotGraph
+            plot_graph = scenario_graph.line('LocalTime',
+                                             col_name,
+                                             source=source,
+                                             line_width=2,
+                                             color=OTHER_TRANSACTIONS_COLOR if col_name == OTHER_TRANSACTIONS_NAME
+                                             else color_palette[color_index],
+                                             name=col_name)
+
+        # increment through color palette
+        color_index = color_index + 1
+
+        # Append the legend
+        legend_list.append((legend_name, [plot_graph]))
+        inspector_line_list.append((col_name_dict[col_name], local_times, scenario_metrics_df[col_name]))
+
+    # One inspector for all the lines
+    set_crosshair_inspector(scenario_graph, inspector_line_list, left_y_range[1], INSPECTOR_MAX_DISTANCE_MS)
+
+    # Append the graph in list which will be passed to "Column"
+    scenario_graph_final = set_graph_and_legend_properties(scenario_graph, legend_list, scenario)
+
+    return scenario_graph_final
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: plot_scenario_heatmap
+# Description  : Plots the heatmap of the requests of a scenario over time and log-scaled response time as one image,
+#                so that it costs the same to draw whatever the number of requests. Empty cells are transparent.
+# @param       : Heatmap of the scenario, as given by get_scenario_heatmap
+# @param       : Scenario Name
+# @return      : Figure of the heatmap with its colour bar
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def plot_scenario_heatmap(scenario_heatmap: dict, scenario: str) -> figure():
+    counts = scenario_heatmap["counts"].astype(float)
+    counts[counts == 0] = np.nan
+    bin_edges = scenario_heatmap["bin_edges"]
+    heatmap_ms = counts.shape[1] * scenario_heatmap["bucket_ms"]
+
+    heatmap_graph = figure(x_axis_label='Time', x_axis_type='datetime', y_axis_label='Response Time (ms)',
+                           y_axis_type='log', plot_width=1900, plot_height=400,
+                           x_range=(scenario_heatmap["begin_time"], scenario_heatmap["begin_time"] + heatmap_ms),
+                           y_range=(bin_edges[0], bin_edges[-1]), toolbar_location='below',
+                           tools='box_zoom,reset,save')
+
+    # Cells, from the first bin up and the first bucket right
+    color_mapper = LogColorMapper(palette=Viridis256, low=1, high=max(np.nanmax(counts), 2), nan_color=(0, 0, 0, 0))
+    heatmap_graph.image(image=[counts], x=scenario_heatmap["begin_time"], y=bin_edges[0], dw=heatmap_ms,
+                        dh=bin_edges[-1] - bin_edges[0], color_mapper=color_mapper)
+
+    heatmap_graph.add_tools(HoverTool(tooltips=[('Time', '$x{%F %T}'), ('Response Time', '$y{0} ms'),
+                                                ('Requests', '@image')],
+                                      formatters={'$x': 'datetime'}))
+    heatmap_graph.toolbar.active_inspect = None
+
+    color_bar = ColorBar(color_mapper=color_mapper, title="Requests", background_fill_color="#2F2F2F",
+                         major_label_text_color="white", title_text_color="white")
+    heatmap_graph.add_layout(color_bar, 'right')
+
+    return set_graph_properties(heatmap_graph, scenario)
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: plot_scenario_error_breakdown
+# Description  : Plots the KO requests of a scenario over time as stacked bars, one stack per (transaction, error
+#                message) pair of the top pairs and one for all the other pairs
+# @param       : Error breakdown of the scenario, as given by get_scenario_error_breakdown
+# @param       : Scenario Name
+# @param       : Number of pairs plotted on their own. Default is ERROR_BREAKDOWN_TOP.
+# @return      : Figure of Plotted graph along with its Legend
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def plot_scenario_error_breakdown(error_breakdown: dict, scenario: str, top: int = ERROR_BREAKDOWN_TOP) -> figure():
+    counts = error_breakdown["counts"]
+    errors_df = error_breakdown["errors_df"]
+    bucket_ms = error_breakdown["bucket_ms"]
+
+    # Names of the stacks, without "$" which screws the Hover Tool
+    legend_names = ["{}: {}".format(transaction, message if len(message) <= ERROR_LEGEND_MAX_CHARS
+                                    else message[:ERROR_LEGEND_MAX_CHARS - 3] + "...")
+                    for transaction, message in zip(errors_df["Transaction"][:top], errors_df["Error Message"][:top])]
+    stack_counts = [counts[:, pair_index] for pair_index in range(len(legend_names))]
+    if counts.shape[1] > top:
+        legend_names.append("Other")
+        stack_counts.append(counts[:, top:].sum(axis=1))
+    stack_names = ["{} {}".format(stack_index + 1, legend_name.replace("$", ""))
+                   for stack_index, legend_name in enumerate(legend_names)]
+
+    bucket_times = error_breakdown["begin_time"] + bucket_ms * (np.arange(len(counts)) + 0.5)
+    source = ColumnDataSource(dict(zip(stack_names, stack_counts), LocalTime=bucket_times))
+
+    breakdown_graph = plot_new_graph('Time', 'datetime', 'Errors per {} s'.format(bucket_ms // 1000), 1900, 400,
+                                     (0, max(int(counts.sum(axis=1).max()), 1) * 1.1), 'below',
+                                     'box_zoom,reset,save')
+    breakdown_graph.toolbar.active_inspect = None
+
+    # Red first, it is the colour of the errors in the other graphs, and grey for the other pairs
+    color_palette = ["#d62728"] + [color for color in d3['Category20'][20] if color != "#d62728"]
+    colors = color_palette[:len(stack_names)]
+    if counts.shape[1] > top:
+        colors[-1] = "#7f7f7f"
+    stack_bars = breakdown_graph.vbar_stack(stack_names, x='LocalTime', width=bucket_ms * 0.9, color=colors,
+                                            line_color=None, source=source)
+
+    legend_list = [(legend_name, [stack_bar]) for legend_name, stack_bar in zip(legend_names, stack_bars)]
+    set_crosshair_inspector(breakdown_graph, [(legend_name, bucket_times, stack_count) for legend_name, stack_count
+                                              in zip(legend_names, stack_counts)], breakdown_graph.y_range.end)
+
+    return set_graph_and_legend_properties(breakdown_graph, legend_list, scenario)
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: generate_error_table
+# Description  : Gives the most frequent errors of a scenario as a Bokeh Data Table
+# @param       : Error breakdown of the scenario, as given by get_scenario_error_breakdown
+# @param       : Number of rows. Default is ERROR_TABLE_TOP.
+# @return      : Data Table
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def generate_error_table(error_breakdown: dict, top: int = ERROR_TABLE_TOP) -> DataTable:
+    errors_df = error_breakdown["errors_df"].head(top)
+    table_columns = [TableColumn(field=col_name, title=col_name, width=1200 if col_name == "Error Message" else 200)
+                     for col_name in errors_df.columns]
+
+    return DataTable(source=ColumnDataSource(errors_df), columns=table_columns, width=1900,
+                     height=40 + 25 * len(errors_df), index_position=None)
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: generate_graph
+# Description  : It generates the graph based on the Dataframe made on the Simulation Log
+# @param       : Gatling Run, or the Dataframe of the Gatling Logs
+# @param       : right y-axis filter. Currently, they are limited to [Errors, Users, RPS, RPM]
+# @param       : Percentile, for which graph needs to be produced. Default Value is 95
+# @return      : Layout of the graph
+# Author       : Navdit Sharma
+# Comments     : Created on 05/09/2018
+########################################################################################################################
+def generate_graph(run, right_y_axis_filter: str, percentile: int = 95) -> Column:
+    return ScenarioReportBuilder(percentile, [right_y_axis_filter]).build_layout(run, right_y_axis_filter)
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Class Name   : ScenarioReportBuilder
+# Description  : Builds the scenario report of a run: one tab per right y-axis filter and percentile, with one graph per
+#                scenario of the percentile of every transaction, a tab of the response time heatmap of every
+#                scenario and a tab of the breakdown of the errors by transaction and error message, with the table of
+#                the most frequent errors. With several percentiles, they are all computed from
+#                one sort of the response times and the legends show all the overall percentiles. Every tab of a
+#                sampled run starts with a header of its sample rate and expected percentile error. With top, only the
+#                top transactions of every scenario are drawn as their own lines, ranked by top_by ("count" or
+#                "percentile"), and the others as one line of their requests together. Without top, scenarios of more
+#                than GRAPH_MAX_TRANSACTIONS transactions are drawn the same way, with the top GRAPH_MAX_TRANSACTIONS
+#                - 1 by count, so that no two lines share a colour. The builder keeps no state of a run, so one
+#                builder can build the reports of any number of runs.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+class ScenarioReportBuilder:
+    def __init__(self, percentile=95, right_y_axis_filters: list = None, heatmap: bool = True,
+                 errors: bool = True, top: int = None, top_by: str = "count"):
+        # One percentile, or a list of percentiles
+        self.percentiles = list(percentile) if isinstance(percentile, (list, tuple)) else [percentile]
+        self.percentile = self.percentiles[0]
+        self.right_y_axis_filters = list(right_y_axis_filters or REPORT_RIGHT_Y_AXIS_FILTERS)
+        self.heatmap = heatmap
+        self.errors = errors
+        self.top = top
+        self.top_by = top_by
+
+    def build_scenario_graphs(self, run, scenario_name: str, right_y_axis_filter: str) -> dict:
+        run = as_gatling_run(run)
+        percentiles_metrics = run.scenario_percentiles_metrics(scenario_name, right_y_axis_filter, self.percentiles,
+                                                               self.top, self.top_by, GRAPH_MAX_TRANSACTIONS)
+        return {percentile: plot_graph_by_transaction(*percentiles_metrics[percentile], scenario_name,
+                                                      right_y_axis_filter, percentile, self.percentiles)
+                for percentile in self.percentiles}
+
+    def build_scenario_graph(self, run, scenario_name: str, right_y_axis_filter: str) -> figure():
+        return self.build_scenario_graphs(run, scenario_name, right_y_axis_filter)[self.percentile]
+
+    def build_layouts(self, run, right_y_axis_filter: str) -> dict:
+        run = as_gatling_run(run)
+        scenarios_graphs = [self.build_scenario_graphs(run, scenario_name, right_y_axis_filter)
+                            for scenario_name in run.scenarios]
+        return {percentile: Column(children=[scenario_graphs[percentile] for scenario_graphs in scenarios_graphs])
+                for percentile in self.percentiles}
+
+    def build_layout(self, run, right_y_axis_filter: str) -> Column:
+        return self.build_layouts(run, right_y_axis_filter)[self.percentile]
+
+    def build_tabs(self, run, right_y_axis_filter: str) -> list:
+        return [Panel(child=layout, title="{}th vs {}".format(percentile, right_y_axis_filter))
+                for percentile, layout in self.build_layouts(run, right_y_axis_filter).items()]
+
+    def build_tab(self, run, right_y_axis_filter: str) -> Panel:
+        return self.build_tabs(run, right_y_axis_filter)[0]
+
+    def build_heatmap_tab(self, run) -> Panel:
+        run = as_gatling_run(run)
+        heatmap_graphs = []
+        for scenario_name in run.scenarios:
+            scenario_heatmap = run.scenario_heatmap(scenario_name)
+            if scenario_heatmap is not None:
+                heatmap_graphs.append(plot_scenario_heatmap(scenario_heatmap, scenario_name))
+        return Panel(child=Column(children=heatmap_graphs), title="Response Time Heatmap")
+
+    def build_errors_tab(self, run) -> Panel:
+        run = as_gatling_run(run)
+        error_layouts = []
+        for scenario_name in run.scenarios:
+            error_breakdown = run.scenario_error_breakdown(scenario_name)
+            if error_breakdown is not None:
+                error_layouts.append(plot_scenario_error_breakdown(error_breakdown, scenario_name))
+                error_layouts.append(generate_error_table(error_breakdown))
+        if not error_layouts:
+            error_layouts.append(Div(text="No KO requests in this run."))
+        return Panel(child=Column(children=error_layouts), title="Errors Breakdown")
+
+    def build(self, run) -> Tabs:
+        run = as_gatling_run(run)
+        tabs = [tab for right_y_axis_filter in self.right_y_axis_filters
+                for tab in self.build_tabs(run, right_y_axis_filter)]
+        if self.heatmap:
+            tabs.append(self.build_heatmap_tab(run))
+        if self.errors:
+            tabs.append(self.build_errors_tab(run))
+        if run.sample_rate < 1:
+            tabs = [Panel(child=Column(children=[generate_sample_header(run, self.percentiles), tab.child]),
+                          title=tab.title) for tab in tabs]
+        return Tabs(tabs=tabs)
+
+
+########################################################################################################################
+# Function Name: as_gatling_run
+# Description  : Gives the given run as a report source, wrapping a Gatling Log Dataframe in a Gatling Run if needed
+# @param       : Report source such as a Gatling Run or a merged run, or the Dataframe of the Gatling Logs
+# @return      : Report source
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def as_gatling_run(run) -> GatlingReportSource:
+    return run if isinstance(run, GatlingReportSource) else GatlingRun(run)
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: generate_sample_header
+# Description  : Generates the header of a sampled run: its sample rate, the scaling of its counts, and the expected
+#                error of every percentile for a transaction with the median number of sampled OK requests
+# @param       : Gatling Run, loaded with a sample rate
+# @param       : List of Percentiles
+# @return      : Div of the header
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def generate_sample_header(run: GatlingRun, percentiles: list) -> Div:
+    # Sampled OK requests of every transaction of every scenario, one scenario at a time
+    scenario_counts = []
+    for scenario_name in run.scenarios:
+        scenario_df = run.scenario_df(scenario_name)
+        scenario_counts.append(scenario_df.loc[(scenario_df["Owner"] == "REQUEST") & (scenario_df["Status"] == "OK"),
+                                               "Transaction_Name"].value_counts())
+    sample_counts = pd.concat(scenario_counts) if scenario_counts else pd.Series(dtype=np.int64)
+    sample_count = int(sample_counts[sample_counts > 0].median()) if (sample_counts > 0).any() else 0
+    percentile_errors = ", ".join("{}th &plusmn;{:.1f}".format(percentile,
+                                                               get_sample_percentile_error(percentile, sample_count))
+                                  for percentile in percentiles)
+
+    return Div(text="<b>Sampled preview</b>: {:g}% of the requests were read and the counts (RPS, errors, heatmap) are "
+                    "scaled by {:g}. Expected percentile error (95% confidence) for a transaction with {} sampled "
+                    "requests, the median: {} percentile points.".format(run.sample_rate * 100, 1 / run.sample_rate,
+                                                                        sample_count, percentile_errors),
+               width=1900)
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: save_report
+# Description  : Saves a report layout as a standalone HTML page
+# @param       : Layout of the report, e.g. as given by ScenarioReportBuilder.build
+# @param       : Path of the HTML page
+# @param       : Title of the page
+# @param       : Bokeh Resources to load BokehJS from. Default is the Bokeh CDN.
+# @return      : Path of the HTML page
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def save_report(layout, output_path: str, title: str = "Bokeh Plot", resources: Resources = None) -> str:
+    return save(layout, filename=output_path, resources=resources or CDN, title=title)
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: plot_compare_graph_by_transaction
+# Description  : Plots the percentile of every transaction of a scenario for all the runs, aligned on the time
+#                since the start of each run. A transaction keeps its colour across the runs, the baseline is drawn
+#                solid and the other runs dashed.
+# @param       : Scenario Name
+# @param       : List of the aggregates of the runs, baseline first
+# @param       : List of the labels of the runs
+# @param       : Percentile
+# @return      : Figure of Plotted graph along with its Legend
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def plot_compare_graph_by_transaction(scenario: str, runs_aggregates: list, run_labels: list,
+                                      percentile: int) -> figure():
+    percentile_col_name = get_percentile_col_name(percentile)
+    line_dashes = ["solid", "dashed", "dotted", "dotdash", "dashdot"]
+    color_palette = [color for color in d3['Category20'][20] if color != "#d62728"]
+
+    # Per bucket percentiles of the scenario in every run
+    runs_buckets = [aggregates["buckets"][aggregates["buckets"]["Scenario"] == scenario]
+                    for aggregates in runs_aggregates]
+    transactions_list = sorted(set().union(*[run_buckets["Transaction"].unique() for run_buckets in runs_buckets]))
+    max_value = max([run_buckets[percentile_col_name].max() for run_buckets in runs_buckets if len(run_buckets)])
+
+    scenario_graph = plot_new_graph('Time since start', 'datetime', 'Response Time (ms)', 1900, 400,
+                                    (0, max_value + 50), 'below', 'box_zoom,reset,save')
+    scenario_graph.toolbar.active_inspect = None
+
+    legend_list = []
+    inspector_line_list = []
+    for transaction_index, transaction_name in enumerate(transactions_list):
+        for run_index, run_buckets in enumerate(runs_buckets):
+            transaction_buckets = run_buckets[run_buckets["Transaction"] == transaction_name].dropna()
+            if transaction_buckets.empty:
+                continue
+
+            # Names without special characters, as the hover tool refers to the column by the name of the line
+            col_name = "run{}_{}".format(run_index, re.sub(r"\W", "_", transaction_name))
+            bucket_times = transaction_buckets["Bucket"].to_numpy() * AGGREGATE_BUCKET_MS
+            source = ColumnDataSource({
+                "LocalTime": pd.to_datetime(bucket_times, unit='ms'),
+                col_name: transaction_buckets[percentile_col_name].to_numpy(),
+            })
+            plot_graph = scenario_graph.line('LocalTime', col_name, source=source, line_width=2,
+                                             color=color_palette[transaction_index % len(color_palette)],
+                                             line_dash=line_dashes[run_index % len(line_dashes)],
+                                             name=col_name)
+
+            # Overall Percentile of the Transaction in the run
+            transactions_df = runs_aggregates[run_index]["transactions"]
+            overall_percentile = transactions_df.loc[(transactions_df["Scenario"] == scenario) &
+                                                     (transactions_df["Transaction"] == transaction_name),
+                                                     percentile_col_name].iloc[0]
+            legend_name = "{}: {} ({}th: {:.0f} ms)".format(run_labels[run_index], transaction_name, percentile,
+                                                           overall_percentile)
+            legend_list.append((legend_name, [plot_graph]))
+            inspector_line_list.append(("{}: {}".format(run_labels[run_index], transaction_name), bucket_times,
+                                        transaction_buckets[percentile_col_name]))
+
+    # Runs share the buckets of their time since start
+    set_crosshair_inspector(scenario_graph, inspector_line_list, max_value + 50)
+
+    return set_graph_and_legend_properties(scenario_graph, legend_list, scenario)
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: generate_compare_table
+# Description  : Gives the per-transaction delta table of the runs as a Bokeh Data Table
+# @param       : Delta Dataframe, as given by compare_run_transactions
+# @return      : Data Table
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def generate_compare_table(delta_df: pd.DataFrame) -> DataTable:
+    table_columns = [TableColumn(field=col_name, title=col_name) for col_name in delta_df.columns]
+
+    return DataTable(source=ColumnDataSource(delta_df.fillna("")), columns=table_columns, width=1900,
+                     height=min(40 + 25 * len(delta_df), 900), index_position=None)
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: plot_trend_graph_by_transaction
+# Description  : Plots the trend of a metric of every transaction of a scenario over the stored runs
+# @param       : Trend Dataframe of the scenario, as given by load_trend
+# @param       : Scenario Name
+# @param       : Metric Column of the trend Dataframe (e.g. p95, throughput or errors)
+# @param       : Label of the Y-Axis
+# @return      : Figure of Plotted graph along with its Legend
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def plot_trend_graph_by_transaction(scenario_trend_df: pd.DataFrame, scenario: str, metric_col: str,
+                                    y_axis_label: str) -> figure():
+    color_palette = [color for color in d3['Category20'][20] if color != "#d62728"]
+    max_value = scenario_trend_df[metric_col].max()
+
+    trend_graph = plot_new_graph('Run Start', 'datetime', y_axis_label, 1900, 400,
+                                 (0, (0 if pd.isna(max_value) else max_value) * 1.1 + 1), 'below',
+                                 'box_zoom,reset,save')
+    trend_graph.toolbar.active_inspect = None
+
+    legend_list = []
+    inspector_line_list = []
+    for transaction_index, (transaction_name, transaction_df) in \
+            enumerate(scenario_trend_df.groupby("transaction_name", sort=True)):
+        # Names without special characters, as the hover tool refers to the column by the name of the line
+        col_name = re.sub(r"\W", "_", transaction_name)
+        source = ColumnDataSource({"LocalTime": pd.to_datetime(transaction_df["run_start"], unit='ms'),
+                                   col_name: transaction_df[metric_col].to_numpy(),
+                                   "Run": transaction_df["label"].to_numpy()})
+        color = color_palette[transaction_index % len(color_palette)]
+        plot_graph = trend_graph.line('LocalTime', col_name, source=source, line_width=2, color=color, name=col_name)
+        trend_graph.circle('LocalTime', col_name, source=source, size=6, color=color)
+        legend_list.append((transaction_name, [plot_graph]))
+        inspector_line_list.append((transaction_name, transaction_df["run_start"], transaction_df[metric_col]))
+
+    # Transactions share the start of their run
+    set_crosshair_inspector(trend_graph, inspector_line_list, trend_graph.y_range.end)
+    trend_graph = set_graph_and_legend_properties(trend_graph, legend_list, scenario)
+
+    # Runs are days apart, so show the dates
+    trend_graph.xaxis.formatter = DatetimeTickFormatter(hours=["%d/%m %H:%M"], days=["%d/%m/%y"],
+                                                        months=["%d/%m/%y"], years=["%d/%m/%y"])
+
+    return trend_graph
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: build_compare_report
+# Description  : Builds the comparison report of runs: one overlay graph per scenario and the per-transaction delta
+#                table against the baseline
+# @param       : List of the aggregates of the runs, baseline first
+# @param       : List of the labels of the runs
+# @param       : Delta Dataframe, as given by compare_run_transactions
+# @param       : Percentile
+# @return      : Tabs of the report
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def build_compare_report(runs_aggregates: list, run_labels: list, delta_df: pd.DataFrame, percentile: int) -> Tabs:
+    scenario_list = sorted(set().union(*[aggregates["buckets"]["Scenario"].unique()
+                                         for aggregates in runs_aggregates]))
+    scenario_plots = [plot_compare_graph_by_transaction(scenario, runs_aggregates, run_labels, percentile)
+                      for scenario in scenario_list]
+
+    return Tabs(tabs=[Panel(child=Column(children=scenario_plots), title="{}th Overlay".format(percentile)),
+                      Panel(child=generate_compare_table(delta_df), title="Delta vs {}".format(run_labels[0]))])
+
+
+########################################################################################################################
+
+
+########################################################################################################################
+# Function Name: build_trend_report
+# Description  : Builds the trend report: one tab per metric (percentile, throughput and errors), with one graph per
+#                scenario
+# @param       : Trend Dataframe, as given by load_trend
+# @param       : Percentile
+# @return      : Tabs of the report
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+########################################################################################################################
+def build_trend_report(trend_df: pd.DataFrame, percentile: int) -> Tabs:
+    tab_list = []
+    for metric_col, tab_title, y_axis_label in [("p{}".format(percentile), "{}th Trend".format(percentile),
+                                                 "Response Time (ms)"),
+                                                ("throughput", "Throughput Trend", "Requests per second"),
+                                                ("errors", "Errors Trend", "Errors")]:
+        scenario_plots = [plot_trend_graph_by_transaction(scenario_trend_df, scenario_name, metric_col, y_axis_label)
+                          for scenario_name, scenario_trend_df in trend_df.groupby("scenario", sort=True)]
+        tab_list.append(Panel(child=Column(children=scenario_plots), title=tab_title))
+
+    return Tabs(tabs=tab_list)
+
+
+########################################################################################################################
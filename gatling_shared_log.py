@@ -0,0 +1,148 @@
+# ============================================================================================================
+# Purpose:           Shares the columns of a Gatling Log Dataframe with worker processes through one block of shared
+#                    memory, so that the workers attach it instead of receiving their records pickled.
+# Author:            Navdit Sharma (Nav)
+# Notes:             Only needs NumPy, pandas and multiprocessing.shared_memory. The records are written once, sorted
+#                    by scenario, so that every scenario is one slice of every column. Categorical columns are kept
+#                    as their codes and their categories go with the handle, whose size doesn't depend on the
+#                    number of records:
+#                        with SharedGatlingLog(gat_log_df) as shared_log:
+#                            executor.map(worker, repeat(shared_log.handle), scenario_list)
+#                    and in the worker: scenario_df = read_shared_scenario_df(handle, scenario_name)
+#                    The worker keeps the block attached and its scenario Dataframes are views of it, not copies.
+# Revision:          Last change: 18/10/26 :: Scenarios read as views of the block, attached once per worker
+# ==============================================================================================================
+
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pandas as pd
+
+
+# Alignment of the columns in the shared memory block, in bytes
+SHARED_COLUMN_ALIGNMENT = 64
+
+# Shared memory block attached by this process, the worker, see attach_shared_log
+attached_shared_memory = None
+
+
+##################################################################################################################
+# Class Name   : SharedGatlingLog
+# Description  : Writes the columns of a Gatling Log Dataframe, sorted by scenario, to a new block of shared memory.
+#                The handle is what the workers need to read a scenario back: the name of the block, the dtype,
+#                offset and categories of every column and the first row and number of rows of every scenario.
+#                The block is freed by close, or at the end of the with statement, once the workers are done.
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+class SharedGatlingLog:
+    def __init__(self, log_df: pd.DataFrame):
+        # Rows of every scenario, in the order of the log. Records without scenario are left out.
+        scenario_codes = log_df["Scenario"].cat.codes.to_numpy()
+        order = np.argsort(scenario_codes, kind="stable")
+        scenario_counts = np.bincount(scenario_codes + 1, minlength=len(log_df["Scenario"].cat.categories) + 1)
+        scenario_starts = np.cumsum(scenario_counts) - scenario_counts
+        scenarios = {str(scenario_name): (int(scenario_starts[code + 1]), int(scenario_counts[code + 1]))
+                     for code, scenario_name in enumerate(log_df["Scenario"].cat.categories)
+                     if scenario_counts[code + 1]}
+
+        # Layout of the columns: codes of the categorical ones, values of the others
+        columns, column_arrays, block_size = [], [], 0
+        for col_name in log_df.columns:
+            col_series = log_df[col_name]
+            if isinstance(col_series.dtype, pd.CategoricalDtype):
+                column_array = col_series.cat.codes.to_numpy()
+                categories, ordered = col_series.cat.categories, col_series.cat.ordered
+            else:
+                column_array = col_series.to_numpy()
+                categories, ordered = None, False
+            if column_array.dtype == object:
+                raise TypeError("Column {} of dtype object can't be shared".format(col_name))
+
+            block_size = -(-block_size // SHARED_COLUMN_ALIGNMENT) * SHARED_COLUMN_ALIGNMENT
+            columns.append({"name": col_name, "dtype": column_array.dtype.str, "offset": block_size,
+                            "categories": categories, "ordered": ordered})
+            column_arrays.append(column_array)
+            block_size += column_array.nbytes
+
+        self.shared_memory = SharedMemory(create=True, size=max(block_size, 1))
+        try:
+            for column, column_array in zip(columns, column_arrays):
+                np.take(column_array, order, out=np.ndarray(len(log_df), dtype=column_array.dtype,
+                                                            buffer=self.shared_memory.buf, offset=column["offset"]))
+        except Exception:
+            self.close()
+            raise
+
+        self.handle = {"name": self.shared_memory.name, "columns": columns, "scenarios": scenarios}
+
+    def close(self):
+        self.shared_memory.close()
+        self.shared_memory.unlink()
+
+    def __enter__(self) -> "SharedGatlingLog":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: attach_shared_log
+# Description  : Attaches the shared memory block of a SharedGatlingLog once per process and keeps it attached, so
+#                that the Dataframes read from it can stay views of the block. The block attached before is detached
+#                when a new one is attached, unless Dataframes still use it: it is then dropped with the last of them.
+# @param       : Handle of the SharedGatlingLog
+# @return      : SharedMemory of the block
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def attach_shared_log(handle: dict) -> SharedMemory:
+    global attached_shared_memory
+    if attached_shared_memory is None or attached_shared_memory.name != handle["name"]:
+        if attached_shared_memory is not None:
+            try:
+                attached_shared_memory.close()
+            except BufferError:
+                pass
+        attached_shared_memory = SharedMemory(name=handle["name"])
+    return attached_shared_memory
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: read_shared_scenario_df
+# Description  : Reads the records of one scenario from its slice of every column of the shared memory block of a
+#                SharedGatlingLog, without copying them: the columns of the Dataframe are read-only views of the
+#                block, which stays attached for the life of the process (see attach_shared_log).
+# @param       : Handle of the SharedGatlingLog
+# @param       : Scenario Name
+# @return      : Dataframe of the records of the scenario, with the columns and dtypes of the shared Dataframe
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def read_shared_scenario_df(handle: dict, scenario_name: str) -> pd.DataFrame:
+    first_row, row_count = handle["scenarios"][scenario_name]
+    shared_memory = attach_shared_log(handle)
+
+    scenario_columns = {}
+    for column in handle["columns"]:
+        column_dtype = np.dtype(column["dtype"])
+        column_array = np.ndarray(row_count, dtype=column_dtype, buffer=shared_memory.buf,
+                                  offset=column["offset"] + first_row * column_dtype.itemsize)
+        column_array.flags.writeable = False
+        if column["categories"] is not None:
+            column_array = pd.Categorical.from_codes(column_array, dtype=pd.CategoricalDtype(
+                column["categories"], column["ordered"]))
+        scenario_columns[column["name"]] = column_array
+
+    # Not consolidated, so every column stays its own view
+    return pd.DataFrame(scenario_columns, copy=False)
+
+
+##################################################################################################################
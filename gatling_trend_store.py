@@ -0,0 +1,203 @@
+# ============================================================================================================
+# Purpose:           Keeps the per-transaction summaries of Gatling Runs in a local SQLite file, to follow their
+#                    trend over many runs without going back to the raw logs.
+# Author:            Navdit Sharma (Nav)
+# Notes:             Every run stores its whole-run summary per scenario and transaction and per minute rollups.
+#                    Storing the same run again (same label and start) replaces it.
+# Revision:          Last change: 18/10/26 :: Runs stored from their aggregates, so partitioned runs too
+# ==============================================================================================================
+
+import sqlite3
+import time
+
+import pandas as pd
+
+from gatling_report_options import AGGREGATE_PERCENTILES, get_percentile_col_name
+from gatling_run_aggregates import compute_run_aggregates
+
+
+# Width of the rollups in ms
+TREND_ROLLUP_MS = 60 * 1000
+
+# Percentile columns of the store, e.g. p95
+TREND_PERCENTILE_COLS = ["p{:g}".format(percentile) for percentile in AGGREGATE_PERCENTILES]
+
+TREND_STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    label TEXT NOT NULL,
+    run_start INTEGER NOT NULL,
+    logs TEXT NOT NULL,
+    stored_at INTEGER NOT NULL,
+    UNIQUE (label, run_start)
+);
+CREATE INDEX IF NOT EXISTS runs_by_start ON runs (run_start);
+
+CREATE TABLE IF NOT EXISTS transaction_summaries (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    scenario TEXT NOT NULL,
+    transaction_name TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    throughput REAL NOT NULL,
+    {percentile_cols},
+    PRIMARY KEY (run_id, scenario, transaction_name)
+);
+CREATE INDEX IF NOT EXISTS summaries_by_transaction ON transaction_summaries (scenario, transaction_name, run_id);
+
+CREATE TABLE IF NOT EXISTS minute_rollups (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    scenario TEXT NOT NULL,
+    transaction_name TEXT NOT NULL,
+    minute INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    {percentile_cols},
+    PRIMARY KEY (run_id, scenario, transaction_name, minute)
+);
+""".format(percentile_cols=",\n    ".join("{} REAL".format(col_name) for col_name in TREND_PERCENTILE_COLS))
+
+
+##################################################################################################################
+# Function Name: open_trend_store
+# Description  : Opens the trend store, creating its tables and indexes if needed
+# @param       : Path of the SQLite file
+# @return      : SQLite Connection
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def open_trend_store(store_path: str) -> sqlite3.Connection:
+    connection = sqlite3.connect(str(store_path))
+    connection.execute("PRAGMA foreign_keys = ON")
+    connection.executescript(TREND_STORE_SCHEMA)
+    return connection
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: get_trend_rows
+# Description  : Turns the given aggregates Dataframe into rows of a trend store table, followed by the percentiles
+# @param       : Aggregates Dataframe
+# @param       : Run Id
+# @param       : Columns of the Dataframe to store, before the percentiles
+# @return      : List of row tuples, starting with the Run Id. Missing values are None (NULL).
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_trend_rows(aggregates_df: pd.DataFrame, run_id: int, col_names: list) -> list:
+    col_names = col_names + [get_percentile_col_name(percentile) for percentile in AGGREGATE_PERCENTILES]
+    rows_df = aggregates_df[col_names].astype(object).where(aggregates_df[col_names].notna(), None)
+
+    return [(run_id,) + tuple(row) for row in rows_df.itertuples(index=False)]
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: store_run
+# Description  : Stores the summary and the per minute rollups of a run in the trend store
+# @param       : Path of the SQLite file
+# @param       : Label of the run
+# @param       : List of Simulation Logs of the run
+# @param       : Gatling Log Dataframe of the run
+# @return      : Run Id in the store
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def store_run(store_path: str, run_label: str, simulation_logs_list: list, gat_log_df: pd.DataFrame) -> int:
+    return store_run_aggregates(store_path, run_label, simulation_logs_list,
+                                compute_run_aggregates(gat_log_df, AGGREGATE_PERCENTILES, TREND_ROLLUP_MS))
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: store_run_aggregates
+# Description  : Stores the summary and the per minute rollups of a run in the trend store, from its aggregates, e.g.
+#                run.aggregates(AGGREGATE_PERCENTILES, TREND_ROLLUP_MS) of a partitioned run
+# @param       : Path of the SQLite file
+# @param       : Label of the run
+# @param       : List of Simulation Logs of the run
+# @param       : Aggregates of the run with the AGGREGATE_PERCENTILES and buckets of TREND_ROLLUP_MS, see
+#                compute_run_aggregates
+# @return      : Run Id in the store
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def store_run_aggregates(store_path: str, run_label: str, simulation_logs_list: list, aggregates: dict) -> int:
+    percentile_placeholders = ", ?" * len(TREND_PERCENTILE_COLS)
+
+    connection = open_trend_store(store_path)
+    try:
+        with connection:
+            # Replace the run if it was stored before
+            connection.execute("DELETE FROM runs WHERE label = ? AND run_start = ?",
+                               (run_label, aggregates["run_start"]))
+            run_id = connection.execute("INSERT INTO runs (label, run_start, logs, stored_at) VALUES (?, ?, ?, ?)",
+                                        (run_label, aggregates["run_start"], ",".join(simulation_logs_list),
+                                         int(time.time()))).lastrowid
+
+            # Summaries
+            connection.executemany("INSERT INTO transaction_summaries (run_id, scenario, transaction_name, count, "
+                                   "errors, throughput, {}) VALUES (?, ?, ?, ?, ?, ?{})"
+                                   .format(", ".join(TREND_PERCENTILE_COLS), percentile_placeholders),
+                                   get_trend_rows(aggregates["transactions"], run_id,
+                                                  ["Scenario", "Transaction", "Count", "Errors", "Throughput"]))
+
+            # Rollups
+            connection.executemany("INSERT INTO minute_rollups (run_id, scenario, transaction_name, minute, count, "
+                                   "errors, {}) VALUES (?, ?, ?, ?, ?, ?{})"
+                                   .format(", ".join(TREND_PERCENTILE_COLS), percentile_placeholders),
+                                   get_trend_rows(aggregates["buckets"], run_id,
+                                                  ["Scenario", "Transaction", "Bucket", "Count", "Errors"]))
+    finally:
+        connection.close()
+
+    return run_id
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: load_trend
+# Description  : Loads the summaries of the last runs of the trend store, oldest run first
+# @param       : Path of the SQLite file
+# @param       : Number of last runs to load
+# @param       : Optional Scenario Name to filter on
+# @param       : Optional Transaction Name to filter on
+# @return      : Dataframe with columns: [run_id, label, run_start, scenario, transaction_name, count, errors,
+#                throughput, p50, p90, p95, p99]
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def load_trend(store_path: str, last_runs: int = 50, scenario: str = None, transaction_name: str = None) \
+        -> pd.DataFrame:
+    filters, params = [], [last_runs]
+    if scenario:
+        filters.append("AND s.scenario = ?")
+        params.append(scenario)
+    if transaction_name:
+        filters.append("AND s.transaction_name = ?")
+        params.append(transaction_name)
+
+    query = """
+        SELECT r.run_id, r.label, r.run_start, s.scenario, s.transaction_name, s.count, s.errors, s.throughput, {}
+        FROM (SELECT * FROM runs ORDER BY run_start DESC LIMIT ?) AS r
+        JOIN transaction_summaries AS s ON s.run_id = r.run_id
+        WHERE 1 = 1 {}
+        ORDER BY r.run_start, s.scenario, s.transaction_name
+    """.format(", ".join("s." + col_name for col_name in TREND_PERCENTILE_COLS), " ".join(filters))
+
+    connection = open_trend_store(store_path)
+    try:
+        return pd.read_sql_query(query, connection, params=params)
+    finally:
+        connection.close()
+
+
+##################################################################################################################
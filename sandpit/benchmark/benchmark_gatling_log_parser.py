@@ -0,0 +1,68 @@
+# ============================================================================================================
+# Purpose:           Benchmarks the fast tokenizer against the pandas read_csv parser of the Gatling Logs.
+# Author:            Navdit Sharma (Nav)
+# Notes:             Run from the root of the repository:
+#                    python sandpit/benchmark/benchmark_gatling_log_parser.py <simulation.log> [repeats]
+# Revision:          Last change: 18/10/26 :: Created the benchmark
+# ==============================================================================================================
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from gatling_log_parser import generate_gatling_log_df  # noqa: E402
+
+
+##################################################################################################################
+# Function Name: time_parser
+# Description  : Times the given parser on the given log and returns the best time out of the repeats
+# @param       : Path of the Log File
+# @param       : Parser - fast or pandas
+# @param       : Number of repeats
+# @return      : Best time in seconds and the parsed Dataframe
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def time_parser(log_path: str, parser: str, repeats: int):
+    best_time = None
+    gat_log_df = None
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        gat_log_df = generate_gatling_log_df([log_path], 0, parser)
+        run_time = time.perf_counter() - start_time
+        best_time = run_time if best_time is None else min(best_time, run_time)
+
+    return best_time, gat_log_df
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: main
+# Description  : Runs both the parsers and prints their times and whether their results are the same
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def main(argv):
+    log_path = argv[0]
+    repeats = int(argv[1]) if len(argv) > 1 else 3
+
+    pandas_time, pandas_df = time_parser(log_path, "pandas", repeats)
+    fast_time, fast_df = time_parser(log_path, "fast", repeats)
+
+    print("Rows           : {}".format(len(fast_df)))
+    print("pandas parser  : {:.3f} s".format(pandas_time))
+    print("fast parser    : {:.3f} s ({:.1f}x)".format(fast_time, pandas_time / fast_time))
+    print("Same result    : {}".format(pandas_df.equals(fast_df)))
+
+
+##################################################################################################################
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
+
+##################################################################################################################
@@ -0,0 +1,168 @@
+# ============================================================================================================
+# Purpose:           Benchmarks the NumPy and the compiled version of every kernel of gatling_kernels.py, on the
+#                    fields of a real Simulation Log, and checks that they give the same result.
+# Author:            Navdit Sharma (Nav)
+# Notes:             Build the kernels, then run from the root of the repository:
+#                    python setup_kernels.py build_ext --inplace
+#                    python sandpit/benchmark/benchmark_kernels.py simulation.log [repeats]
+#                    COMPILED_KERNELS_DEFAULT should list the kernels, for which the compiled version wins.
+# Revision:          Last change: 18/10/26 :: Histogram percentiles by transaction
+# ==============================================================================================================
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import gatling_kernels  # noqa: E402
+from gatling_log_parser import NAME_HASH_MULTIPLIER, get_field_bounds  # noqa: E402
+from gatling_report_options import AGGREGATE_PERCENTILES  # noqa: E402
+
+
+##################################################################################################################
+# Function Name: get_kernel_inputs
+# Description  : Tokenizes the REQUEST lines of the log into the inputs of every kernel
+# @param       : Path of the Simulation Log
+# @return      : Dictionary of kernel name, followed by the case if a kernel has several -> tuple of arguments
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_kernel_inputs(simulation_log: str) -> dict:
+    block = np.fromfile(simulation_log, dtype=np.uint8)
+    line_ends = np.flatnonzero(block == ord("\n"))
+    line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+    is_request = (np.take(block, line_starts, mode="clip") == ord("R")) & \
+        (np.take(block, line_starts + 1, mode="clip") == ord("E"))
+    line_starts, line_ends = line_starts[is_request], line_ends[is_request]
+    tabs = np.flatnonzero(block == ord("\t"))
+    first_tab = np.searchsorted(tabs, line_starts)
+
+    # Name fields (transaction names) and integer fields (request start and end times)
+    name_starts, name_ends = get_field_bounds(tabs, first_tab, line_ends, 4)
+    int_starts, int_ends = get_field_bounds(tabs, first_tab, line_ends, 5)
+    end_starts, end_ends = get_field_bounds(tabs, first_tab, line_ends, 6)
+    widths = name_ends - name_starts
+
+    local_times = gatling_kernels.numpy_parse_int_fields(block, int_starts, int_ends)
+    response_times = gatling_kernels.numpy_parse_int_fields(block, end_starts, end_ends) - local_times
+    sorted_response_times = np.sort(response_times).astype(np.float64)
+    group_counts = np.full(1000, len(response_times) // 1000)
+    group_counts[-1] += len(response_times) % 1000
+    group_starts = np.concatenate(([0], np.cumsum(group_counts)[:-1]))
+
+    # Seconds of the run, and transactions, as groups of the histogram percentiles
+    seconds = (local_times - local_times.min()) // 1000
+    transaction_codes = np.unique(gatling_kernels.numpy_hash_name_fields(block, name_starts, name_ends,
+                                                                         NAME_HASH_MULTIPLIER), return_inverse=True)[1]
+
+    return {
+        "parse_int_fields": (block, int_starts, int_ends),
+        "hash_name_fields": (block, name_starts, name_ends, NAME_HASH_MULTIPLIER),
+        "fields_equal": (block, name_starts, name_starts.copy(), widths),
+        "assign_buckets": (local_times, int(local_times.min()), 1000),
+        "count_buckets": (seconds, int(seconds.max()) + 1),
+        "grouped_percentiles": (sorted_response_times, group_starts, group_counts,
+                                np.asarray(AGGREGATE_PERCENTILES, dtype=np.float64)),
+        "histogram_percentiles": (seconds, response_times, int(seconds.max()) + 1,
+                                  np.asarray(AGGREGATE_PERCENTILES, dtype=np.float64)),
+        "histogram_percentiles by transaction": (transaction_codes, response_times, int(transaction_codes.max()) + 1,
+                                                 np.asarray(AGGREGATE_PERCENTILES, dtype=np.float64)),
+    }
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: time_kernel
+# Description  : Runs the given kernel with the given arguments and returns the best time out of the repeats
+# @param       : Kernel function
+# @param       : Tuple of arguments
+# @param       : Number of repeats
+# @return      : Best time in seconds and the result of the kernel
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def time_kernel(kernel, kernel_args: tuple, repeats: int) -> (float, object):
+    best_time = None
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        result = kernel(*kernel_args)
+        run_time = time.perf_counter() - start_time
+        best_time = run_time if best_time is None else min(best_time, run_time)
+
+    return best_time, result
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: sort_percentiles
+# Description  : Reads the percentiles of every group with a sort of the values by group, as a reference for the
+#                histogram percentiles
+# @param       : Group code of every value
+# @param       : Integer values
+# @param       : Number of groups
+# @param       : Percentiles (0 to 100)
+# @return      : float64 Numpy array [groups, percentiles]
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def sort_percentiles(group_codes: np.ndarray, values: np.ndarray, group_count: int,
+                     percentiles: np.ndarray) -> np.ndarray:
+    order = np.lexsort((values, group_codes))
+    group_counts = np.bincount(group_codes, minlength=group_count)
+    return gatling_kernels.numpy_grouped_percentiles(values[order].astype(np.float64),
+                                                     np.cumsum(group_counts) - group_counts, group_counts, percentiles)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: main
+# Description  : Times the NumPy and the compiled version of every kernel and prints the speedup
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def main(argv):
+    if not argv:
+        sys.exit("Usage: python sandpit/benchmark/benchmark_kernels.py simulation.log [repeats]")
+    if gatling_kernels.gatling_kernels_ext is None:
+        sys.exit("The compiled kernels are not built: python setup_kernels.py build_ext --inplace")
+    repeats = int(argv[1]) if len(argv) > 1 else 5
+
+    for case_name, kernel_args in get_kernel_inputs(argv[0]).items():
+        kernel_name = case_name.split(" ")[0]
+        numpy_time, numpy_result = time_kernel(getattr(gatling_kernels, "numpy_" + kernel_name), kernel_args,
+                                               repeats)
+        compiled_args = tuple(gatling_kernels.as_int64(arg) if isinstance(arg, np.ndarray) and arg.dtype != np.uint8
+                              and arg.dtype != np.float64 else arg for arg in kernel_args)
+        if kernel_name == "histogram_percentiles":
+            compiled_args += (gatling_kernels.HISTOGRAM_MAX_MS, gatling_kernels.HISTOGRAM_MAX_BINS)
+        compiled_time, compiled_result = time_kernel(getattr(gatling_kernels.gatling_kernels_ext, kernel_name),
+                                                     compiled_args, repeats)
+        same = np.array_equal(numpy_result, compiled_result, equal_nan=isinstance(numpy_result, np.ndarray)
+                              and numpy_result.dtype == np.float64)
+        print("{:36} : numpy {:8.2f} ms, compiled {:8.2f} ms, x{:5.1f}, same result: {}, default: {}".format(
+            case_name, numpy_time * 1000, compiled_time * 1000, numpy_time / compiled_time, same,
+            "compiled" if kernel_name in gatling_kernels.COMPILED_KERNELS_DEFAULT else "numpy"))
+
+        # Reference for the histogram percentiles: a sort of the values by group
+        if kernel_name == "histogram_percentiles":
+            sort_time, sort_result = time_kernel(sort_percentiles, kernel_args, repeats)
+            print("{:36} : sort  {:8.2f} ms, same result: {}".format("", sort_time * 1000, np.array_equal(
+                numpy_result, sort_result, equal_nan=True)))
+
+
+##################################################################################################################
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
+
+##################################################################################################################
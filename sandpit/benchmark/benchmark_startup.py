@@ -0,0 +1,74 @@
+# ============================================================================================================
+# Purpose:           Benchmarks the startup of the command line: time to the usage and to the first argument error.
+# Author:            Navdit Sharma (Nav)
+# Notes:             Run from the root of the repository:
+#                    python sandpit/benchmark/benchmark_startup.py [repeats]
+#                    The bare interpreter start is shown for reference, the script should add tens of ms to it.
+# Revision:          Last change: 18/10/26 :: Created the benchmark
+# ==============================================================================================================
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_PATH = Path(__file__).resolve().parents[2] / "create_gatling_scenario_graphs.py"
+
+# Command lines to time, by name
+STARTUP_COMMANDS = {
+    "interpreter   ": [sys.executable, "-c", "pass"],
+    "--help        ": [sys.executable, str(SCRIPT_PATH), "--help"],
+    "missing -i log": [sys.executable, str(SCRIPT_PATH), "-i", "missing_simulation.log"],
+    "compare --help": [sys.executable, str(SCRIPT_PATH), "compare", "--help"],
+    "pandas import ": [sys.executable, "-c", "import pandas"],
+}
+
+
+##################################################################################################################
+# Function Name: time_command
+# Description  : Runs the given command line and returns the best time out of the repeats
+# @param       : Command line
+# @param       : Number of repeats
+# @return      : Best time in seconds
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def time_command(command: list, repeats: int) -> float:
+    best_time = None
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        run_time = time.perf_counter() - start_time
+        best_time = run_time if best_time is None else min(best_time, run_time)
+
+    return best_time
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: main
+# Description  : Times every startup command line and prints its time and its overhead on the bare interpreter
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def main(argv):
+    repeats = int(argv[0]) if argv else 10
+
+    interpreter_time = None
+    for name, command in STARTUP_COMMANDS.items():
+        command_time = time_command(command, repeats)
+        if interpreter_time is None:
+            interpreter_time = command_time
+        print("{} : {:7.1f} ms (+{:.1f} ms)".format(name, command_time * 1000,
+                                                    (command_time - interpreter_time) * 1000))
+
+
+##################################################################################################################
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
+
+##################################################################################################################
@@ -0,0 +1,26 @@
+# ============================================================================================================
+# Purpose:           Builds the optional compiled kernels (gatling_kernels_ext) in place.
+# Author:            Navdit Sharma (Nav)
+# Notes:             Run from the root of the repository (needs Cython and a C compiler):
+#                    python setup_kernels.py build_ext --inplace
+#                    Without the extension, the scripts use the NumPy version of the kernels.
+# Revision:          Last change: 18/10/26 :: Created the build of the kernels
+# ==============================================================================================================
+
+import sys
+
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    sys.exit("Cython is needed to build the compiled kernels:\n    pip install cython\n"
+             "The scripts work without them, with the NumPy version of the kernels.")
+
+
+setup(
+    name="gatling_kernels_ext",
+    ext_modules=cythonize([Extension("gatling_kernels_ext", ["gatling_kernels_ext.pyx"],
+                                     extra_compile_args=["-O3"] if sys.platform != "win32" else [],
+                                     optional=True)]),
+)
@@ -0,0 +1,32 @@
+# ============================================================================================================
+# Purpose:           Tests of the validation of the arguments of create_gatling_scenario_graphs.py
+# Author:            Navdit Sharma (Nav)
+# Notes:             Run from the root of the repository: python -m pytest -q tests
+# Revision:          Last change: 18/10/26 :: Created the tests
+# ==============================================================================================================
+
+import pytest
+
+from create_gatling_scenario_graphs import ReportArguments, validate_user_given_arguments
+
+
+def test_arguments_default_to_the_report_arguments():
+    assert validate_user_given_arguments(["-i", "simulation.log"]) == ReportArguments(simulation_logs="simulation.log")
+
+
+def test_arguments_are_validated_into_report_arguments():
+    arguments = validate_user_given_arguments(["-i", "a.log,b.log", "-p", "50,95", "-t", "10.5", "-j", "3",
+                                               "--assert", "p95<800", "--memory-limit", "2GB", "--top", "5",
+                                               "--top-by", "percentile"])
+
+    assert (arguments.simulation_logs, arguments.percentiles, arguments.time_diff, arguments.jobs) == \
+        ("a.log,b.log", [50, 95], 10.5, 3)
+    assert len(arguments.thresholds) == 1 and arguments.memory_limit == 2 * 1024 ** 3
+    assert (arguments.top, arguments.top_by) == (5, "percentile")
+    # Defaults are not shared between runs
+    assert ReportArguments().thresholds == []
+
+
+def test_partition_dir_needs_a_memory_limit():
+    with pytest.raises(SystemExit, match="--partition-dir needs --memory-limit"):
+        validate_user_given_arguments(["-i", "simulation.log", "--partition-dir", "partitions"])
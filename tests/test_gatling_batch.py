@@ -0,0 +1,55 @@
+# ============================================================================================================
+# Purpose:           Tests of the discovery of the runs and of the incremental skip of gatling_batch.py
+# Author:            Navdit Sharma (Nav)
+# Notes:             Run from the root of the repository: python -m pytest -q tests
+# Revision:          Last change: 18/10/26 :: Created the tests
+# ==============================================================================================================
+
+import os
+
+from gatling_batch import discover_runs, is_report_up_to_date, run_batch
+
+
+##################################################################################################################
+# Function Name: write_test_file
+# Description  : Writes an empty file, with the given modification time
+# @param       : Path of the file
+# @param       : Modification time (epoch s)
+# @return      : Path of the file
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def write_test_file(file_path, mtime: int):
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(b"")
+    os.utime(file_path, (mtime, mtime))
+
+    return file_path
+
+
+##################################################################################################################
+
+
+def test_only_simulation_logs_are_discovered(tmp_path):
+    for file_name in ["simulation.log", "simulation.log.aggregates.json", "simulation.log.partial", "report.html"]:
+        write_test_file(tmp_path / "run1" / file_name, 1000)
+    for file_name in ["simulation-injector1.log.gz", "simulation-injector2.log.zst", "simulation.logs.txt"]:
+        write_test_file(tmp_path / "run2" / file_name, 1000)
+    write_test_file(tmp_path / "run3" / "notes.log", 1000)
+
+    assert discover_runs(str(tmp_path)) == [[str(tmp_path / "run1" / "simulation.log")],
+                                            [str(tmp_path / "run2" / "simulation-injector1.log.gz"),
+                                             str(tmp_path / "run2" / "simulation-injector2.log.zst")]]
+
+
+def test_up_to_date_runs_are_skipped(tmp_path):
+    simulation_log = write_test_file(tmp_path / "run1" / "simulation.log", 1000)
+    write_test_file(tmp_path / "run1" / "report.html", 2000)
+    # Written by compare after the report, the cache doesn't make the report out of date
+    write_test_file(tmp_path / "run1" / "simulation.log.aggregates.json", 3000)
+
+    assert is_report_up_to_date([str(simulation_log)], tmp_path / "run1" / "report.html")
+    assert run_batch(str(tmp_path), "report.html", [95], 0, "fast", 1) == {"generated": 0, "skipped": 1, "failed": 0}
+
+    os.utime(simulation_log, (4000, 4000))
+    assert not is_report_up_to_date([str(simulation_log)], tmp_path / "run1" / "report.html")
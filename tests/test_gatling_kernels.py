@@ -0,0 +1,125 @@
+# ============================================================================================================
+# Purpose:           Tests of the kernels of gatling_kernels.py: the NumPy and the compiled version of every kernel
+#                    give the same result, the histogram percentiles are the quantiles of pandas, and the right
+#                    y-axis values counted by the kernels
+# Author:            Navdit Sharma (Nav)
+# Notes:             Run from the root of the repository: python -m pytest -q tests
+#                    The parity tests are skipped when the compiled kernels are not built.
+# Revision:          Last change: 18/10/26 :: Histogram percentiles against the quantiles of pandas
+# ==============================================================================================================
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import gatling_kernels
+from gatling_log_parser import NAME_HASH_MULTIPLIER
+from gatling_scenario_metrics import compute_right_y_axis
+
+compiled_kernels = pytest.mark.skipif(gatling_kernels.gatling_kernels_ext is None,
+                                      reason="The compiled kernels are not built")
+
+
+##################################################################################################################
+# Function Name: get_test_fields
+# Description  : Gives a block of tab separated numbers and names, and the bounds of its fields
+# @return      : uint8 Numpy array of the block, and the start and end offsets of its fields
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_test_fields() -> (np.ndarray, np.ndarray, np.ndarray):
+    fields = ["1534344682000", "GET_Account", "", "7", "POST_Bet", "1534344682376", "GET_Account"]
+    block = np.frombuffer("\t".join(fields).encode(), dtype=np.uint8)
+    field_ends = np.cumsum([len(field) + 1 for field in fields]) - 1
+    field_starts = field_ends - [len(field) for field in fields]
+
+    return block, field_starts.astype(np.int64), field_ends.astype(np.int64)
+
+
+##################################################################################################################
+
+
+@compiled_kernels
+def test_field_kernels_parity():
+    block, field_starts, field_ends = get_test_fields()
+    number_fields = np.array([0, 2, 3, 5])
+    ext = gatling_kernels.gatling_kernels_ext
+
+    assert np.array_equal(ext.parse_int_fields(block, field_starts[number_fields], field_ends[number_fields]),
+                          gatling_kernels.numpy_parse_int_fields(block, field_starts[number_fields],
+                                                                 field_ends[number_fields]))
+    assert np.array_equal(ext.hash_name_fields(block, field_starts, field_ends, int(NAME_HASH_MULTIPLIER)),
+                          gatling_kernels.numpy_hash_name_fields(block, field_starts, field_ends,
+                                                                 NAME_HASH_MULTIPLIER))
+    widths = field_ends - field_starts
+    assert ext.fields_equal(block, field_starts[[1]], field_starts[[6]], widths[[1]]) is True
+    assert gatling_kernels.numpy_fields_equal(block, field_starts[[1]], field_starts[[6]], widths[[1]])
+    assert not ext.fields_equal(block, field_starts[[1]], field_starts[[4]], widths[[4]])
+    assert not gatling_kernels.numpy_fields_equal(block, field_starts[[1]], field_starts[[4]], widths[[4]])
+
+
+@compiled_kernels
+def test_bucket_kernels_parity():
+    local_times = np.array([999, 1000, 1500, 2999, 3000, 7000, 12000], dtype=np.int64)
+    ext = gatling_kernels.gatling_kernels_ext
+    buckets = gatling_kernels.numpy_assign_buckets(local_times, 1000, 1000)
+
+    assert np.array_equal(ext.assign_buckets(local_times, 1000, 1000), buckets)
+    assert np.array_equal(ext.count_buckets(buckets, 5), gatling_kernels.numpy_count_buckets(buckets, 5))
+    assert gatling_kernels.numpy_count_buckets(buckets, 5).tolist() == [2, 1, 1, 0, 0]
+
+
+@compiled_kernels
+def test_percentile_kernels_parity():
+    rng = np.random.default_rng(7)
+    group_codes = rng.integers(0, 20, 5000)
+    values = np.concatenate((rng.integers(0, 3000, 4990), [-5, 70000, 90000, -1, 0, 59999, 60000, 1, 2, 3]))
+    percentiles = np.array([0, 50, 90, 95, 99, 100], dtype=np.float64)
+    ext = gatling_kernels.gatling_kernels_ext
+
+    numpy_values = gatling_kernels.numpy_histogram_percentiles(group_codes, values, 21, percentiles)
+    # Counting sort, and dense histograms
+    for max_bins in [0, gatling_kernels.HISTOGRAM_MAX_BINS]:
+        assert np.array_equal(ext.histogram_percentiles(group_codes, values, 21, percentiles,
+                                                        gatling_kernels.HISTOGRAM_MAX_MS, max_bins), numpy_values,
+                              equal_nan=True)
+
+    order = np.lexsort((values, group_codes))
+    group_counts = np.bincount(group_codes, minlength=21)
+    group_starts = np.cumsum(group_counts) - group_counts
+    sorted_values = values[order].astype(np.float64)
+    assert np.array_equal(ext.grouped_percentiles(sorted_values, group_starts, group_counts, percentiles),
+                          gatling_kernels.numpy_grouped_percentiles(sorted_values, group_starts, group_counts,
+                                                                    percentiles), equal_nan=True)
+
+
+def test_histogram_percentiles_are_the_quantiles_of_pandas():
+    rng = np.random.default_rng(11)
+    percentiles = [0, 50, 90, 95, 99, 99.9, 100]
+    # Dense groups, with outliers on both sides of the histograms and a group without values, and sparse groups
+    # whose histograms (400 of HISTOGRAM_MAX_MS bins) would be much bigger than their values, read by a sort
+    for group_count, value_count in [(21, 20000), (400, 1000)]:
+        group_codes = rng.integers(0, group_count, value_count)
+        values = np.concatenate((rng.gamma(2, 300, value_count - 6).astype(np.int64),
+                                 [-3, gatling_kernels.HISTOGRAM_MAX_MS - 1, gatling_kernels.HISTOGRAM_MAX_MS,
+                                  90000, 250000, 0]))
+        group_codes[group_codes == 7] = 8
+
+        quantiles_df = pd.Series(values).groupby(group_codes).quantile(np.array(percentiles) / 100).unstack() \
+            .reindex(range(group_count))
+        for implementation in [gatling_kernels.numpy_histogram_percentiles, gatling_kernels.histogram_percentiles]:
+            assert np.allclose(implementation(group_codes, values, group_count, np.array(percentiles, dtype=float)),
+                               quantiles_df.to_numpy(), equal_nan=True, rtol=0, atol=1e-9)
+
+
+def test_right_y_axis_buckets_include_both_ends():
+    scenario_df = pd.DataFrame({"Scenario": "MyScenario",
+                                "LocalTime": np.array([1000, 1400, 2000, 2500, 4100], dtype=np.int64)})
+
+    errors_df = compute_right_y_axis(scenario_df, "Errors", 1000)
+    users_df = compute_right_y_axis(scenario_df, "Users", 1000)
+
+    # [1000, 2000], [2000, 3000], [3000, 4000], [4000, 4100]: 2000 is the end of one bucket and the start of the next
+    assert errors_df["LocalTime"].tolist() == ["1000", "2000", "3000", "4000"]
+    assert errors_df["Errors"].tolist() == ["3", "2", "0", "1"]
+    assert users_df["Users"].tolist() == ["3", "5", "5", "6"]
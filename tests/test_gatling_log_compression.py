@@ -0,0 +1,95 @@
+# ============================================================================================================
+# Purpose:           Tests of gatling_log_compression.py: compressed logs are detected by their magic bytes and read
+#                    as a stream into the records of the plain log
+# Author:            Navdit Sharma (Nav)
+# Notes:             Run from the root of the repository: python -m pytest -q tests
+# Revision:          Last change: 18/10/26 :: Created the tests
+# ==============================================================================================================
+
+import bz2
+import gzip
+import lzma
+
+import pytest
+
+import gatling_log_compression
+from gatling_log_compression import DECOMPRESS_BLOCK_SIZE, detect_compression, open_gatling_log
+from gatling_log_parser import generate_gatling_log_df
+
+# Compressors of the compressions read without any extra package
+COMPRESSORS = {"gzip": gzip.compress, "bz2": bz2.compress, "xz": lzma.compress}
+
+
+##################################################################################################################
+# Function Name: get_test_log_bytes
+# Description  : Gives a Gatling 2 log of one scenario, of the given number of users of 10 requests each
+# @param       : Number of Users
+# @return      : Bytes of the Log
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_test_log_bytes(user_count: int) -> bytes:
+    run_start = 1534344682000
+    lines = ["RUN\tcom.Sim\tsim\t{}\t \t2.0".format(run_start)]
+    for user_id in range(user_count):
+        user_start = run_start + user_id * 100
+        lines.append("USER\tMyScenario\t{0}\tSTART\t{1}\t{1}".format(user_id, user_start))
+        for index in range(10):
+            start = user_start + index * 1000
+            lines.append("REQUEST\tMyScenario\t{}\t\tGET_Account\t{}\t{}\t{}".format(
+                user_id, start, start + 50 + (user_id * 7 + index * 13) % 400, "KO\tTimeout" if index == 9 else "OK"))
+        lines.append("USER\tMyScenario\t{}\tEND\t{}\t{}".format(user_id, user_start, user_start + 10000))
+
+    return ("\n".join(lines) + "\n").encode()
+
+
+##################################################################################################################
+
+
+def test_compression_is_detected_by_the_magic_bytes(tmp_path):
+    log_bytes = get_test_log_bytes(2)
+    (tmp_path / "simulation.log").write_bytes(log_bytes)
+    assert detect_compression(tmp_path / "simulation.log") is None
+
+    for compression, compress in COMPRESSORS.items():
+        # Not by the extension
+        log_path = tmp_path / "simulation-{}.log".format(compression)
+        log_path.write_bytes(compress(log_bytes))
+        assert detect_compression(log_path) == compression
+        with open_gatling_log(log_path) as log_file:
+            assert log_file.read() == log_bytes
+
+
+def test_compressed_logs_are_parsed_as_the_plain_log(tmp_path):
+    # Logs of several decompressed blocks
+    log_bytes = get_test_log_bytes(4000)
+    assert len(log_bytes) > 2 * DECOMPRESS_BLOCK_SIZE
+    (tmp_path / "simulation.log").write_bytes(log_bytes)
+    log_df = generate_gatling_log_df([str(tmp_path / "simulation.log")], 0)
+
+    for compression, compress in COMPRESSORS.items():
+        log_path = tmp_path / "simulation.log.{}".format(compression)
+        log_path.write_bytes(compress(log_bytes))
+        # Same values, and categories of the same names
+        assert generate_gatling_log_df([str(log_path)], 0).equals(log_df)
+
+
+def test_log_closed_before_its_end_stops_the_decompression(tmp_path):
+    log_path = tmp_path / "simulation.log.gz"
+    log_path.write_bytes(gzip.compress(get_test_log_bytes(4000)))
+
+    log_file = open_gatling_log(log_path)
+    log_file.read(100)
+    log_file.close()
+
+    assert log_file.closed
+
+
+def test_zstd_log_without_zstandard_asks_to_install_it(tmp_path, monkeypatch):
+    log_path = tmp_path / "simulation.log"
+    log_path.write_bytes(b"\x28\xb5\x2f\xfd" + bytes(16))
+    monkeypatch.setattr(gatling_log_compression, "zstandard", None)
+
+    assert detect_compression(log_path) == "zstd"
+    with pytest.raises(ValueError, match="pip install zstandard"):
+        open_gatling_log(log_path)
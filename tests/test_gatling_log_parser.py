@@ -0,0 +1,222 @@
+# ============================================================================================================
+# Purpose:           Tests of gatling_log_parser.py: the sampled preview, and the scenarios of the requests of the
+#                    Gatling 3 and binary layouts
+# Author:            Navdit Sharma (Nav)
+# Notes:             Run from the root of the repository: python -m pytest -q tests
+# Revision:          Last change: 18/10/26 :: Scenarios of the requests of the Gatling 3 and binary layouts
+# ==============================================================================================================
+
+import struct
+
+import pandas as pd
+import pytest
+
+from gatling_log_parser import generate_gatling_log_df
+
+
+# Start of the runs of the test logs (epoch ms)
+TEST_RUN_START = 1534344682000
+
+
+##################################################################################################################
+# Function Name: write_test_log
+# Description  : Writes a Gatling 2 log of one user, one frequent transaction, one rare transaction and one group
+# @param       : Path of the Log File
+# @return      : Path of the Log File
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def write_test_log(log_path) -> str:
+    run_start = 1534344682000
+    lines = ["RUN\tcom.Sim\tsim\t{}\t \t2.0".format(run_start),
+             "USER\tMyScenario\t1\tSTART\t{0}\t{0}".format(run_start)]
+    for index in range(5000):
+        start = run_start + index * 10
+        lines.append("REQUEST\tMyScenario\t1\t\tGET_Account\t{}\t{}\t{}".format(start, start + index % 97,
+                                                                           "KO\tTimeout" if index % 50 else "OK"))
+        if index % 1000 == 999:
+            lines.append("REQUEST\tMyScenario\t1\t\tPOST_Rare\t{}\t{}\tOK".format(start, start + 200))
+    lines.append("GROUP\tMyScenario\t1\tLoginFlow\t{}\t{}\t300\tOK".format(run_start, run_start + 400))
+    lines.append("USER\tMyScenario\t1\tEND\t{}\t{}".format(run_start, run_start + 50000))
+    log_path.write_text("\n".join(lines) + "\n")
+
+    return str(log_path)
+
+
+##################################################################################################################
+
+
+def test_parsers_keep_the_same_sample(tmp_path):
+    log_path = write_test_log(tmp_path / "simulation.log")
+    fast_df = generate_gatling_log_df([log_path], 0, "fast", 1, 0.05)
+    pandas_df = generate_gatling_log_df([log_path], 0, "pandas", 1, 0.05)
+
+    pd.testing.assert_frame_equal(fast_df.astype(str), pandas_df.astype(str))
+
+
+def test_sample_keeps_every_transaction(tmp_path):
+    log_path = write_test_log(tmp_path / "simulation.log")
+    sampled_df = generate_gatling_log_df([log_path], 0, "fast", 1, 0.05)
+    counts = sampled_df.groupby(["Owner", "Transaction_Name"], observed=True).size()
+
+    assert counts[("REQUEST", "POST_Rare")] >= 1
+    assert counts[("GROUP", "LoginFlow")] == 1
+    assert 150 <= counts[("REQUEST", "GET_Account")] <= 350
+    assert counts[("USER", "START")] == 1 and counts[("USER", "END")] == 1
+
+
+##################################################################################################################
+# Function Name: get_test_records
+# Description  : Gives the records of 4 users, spread over the given scenarios, of 3 requests each: GET_Account twice,
+#                the second one KO, and POST_Bet
+# @param       : List of Scenario Names
+# @return      : List of (Owner, Scenario, User Id, Name, Start, End, Status) tuples, times in ms since the run start
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_test_records(scenarios: list) -> list:
+    records = []
+    for user_id in range(1, 5):
+        scenario_name, user_start = scenarios[user_id % len(scenarios)], user_id * 1000
+        records.append(("USER", scenario_name, user_id, "START", user_start, user_start, ""))
+        for index, (name, status) in enumerate([("GET_Account", "OK"), ("GET_Account", "KO"), ("POST_Bet", "OK")]):
+            start = user_start + 100 * (index + 1)
+            records.append(("REQUEST", scenario_name, user_id, name, start, start + 20 * user_id, status))
+        records.append(("USER", scenario_name, user_id, "END", user_start, user_start + 500, ""))
+    return records
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: write_text_layout_log
+# Description  : Writes the test records in the text layout of a Gatling version
+# @param       : Path of the Log File
+# @param       : List of records, as given by get_test_records
+# @param       : Gatling Version of the RUN line: 3.0 to 3.3 logs have user ids, 3.4 and later neither user ids
+#                nor scenarios on their requests
+# @return      : Path of the Log File
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def write_text_layout_log(log_path, records: list, gatling_version: str) -> str:
+    has_user_ids = gatling_version < "3.4"
+    lines = ["RUN\tcom.Sim\tsim\t{}\t \t{}".format(TEST_RUN_START, gatling_version)]
+    for owner, scenario_name, user_id, name, start, end, status in records:
+        start, end = start + TEST_RUN_START, end + TEST_RUN_START
+        if owner == "USER" and has_user_ids:
+            lines.append("USER\t{}\t{}\t{}\t{}\t{}".format(scenario_name, user_id, name, start, end))
+        elif owner == "USER":
+            lines.append("USER\t{}\t{}\t{}".format(scenario_name, name, end))
+        else:
+            lines.append("REQUEST\t{}\t{}\t{}\t{}\t{}{}".format(
+                "{}\t".format(user_id) if has_user_ids else "", name, start, end, status,
+                "\tTimeout" if status == "KO" else ""))
+    log_path.write_text("\n".join(lines) + "\n")
+
+    return str(log_path)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: write_binary_log
+# Description  : Writes the test records as a binary log. A name is written with its index in the string cache the
+#                first time, and as its negated index afterwards.
+# @param       : Path of the Log File
+# @param       : List of records, as given by get_test_records
+# @param       : List of Scenario Names, in the order of the RUN record
+# @param       : Index of the first string of the cache
+# @return      : Path of the Log File
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def write_binary_log(log_path, records: list, scenarios: list, first_cache_index: int) -> str:
+    string_cache = {}
+
+    def pack_string(string: str) -> bytes:
+        return struct.pack(">i", len(string.encode())) + string.encode()
+
+    def pack_cached_string(string: str) -> bytes:
+        if string in string_cache:
+            return struct.pack(">i", -string_cache[string])
+        string_cache[string] = len(string_cache) + first_cache_index
+        return struct.pack(">i", string_cache[string]) + pack_string(string)
+
+    log_bytes = bytes([0]) + pack_string("3.10.0") + pack_string("com.Sim") + struct.pack(">q", TEST_RUN_START) + \
+        pack_string("") + struct.pack(">i", len(scenarios)) + b"".join(map(pack_string, scenarios)) + \
+        struct.pack(">i", 0)
+    for owner, scenario_name, user_id, name, start, end, status in records:
+        if owner == "USER":
+            log_bytes += bytes([2]) + struct.pack(">i", scenarios.index(scenario_name)) + \
+                bytes([name == "START"]) + struct.pack(">i", end)
+        else:
+            log_bytes += bytes([1]) + struct.pack(">i", 0) + pack_cached_string(name) + \
+                struct.pack(">ii", start, end) + bytes([status == "OK"]) + \
+                pack_cached_string("Timeout" if status == "KO" else "")
+    log_path.write_bytes(log_bytes)
+
+    return str(log_path)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: get_request_counts
+# Description  : Counts the requests of every scenario, transaction and status of a log
+# @param       : Path of the Log File
+# @return      : Dictionary of (Scenario, Transaction, Status) -> Count
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_request_counts(log_path: str) -> dict:
+    log_df = generate_gatling_log_df([log_path], 0)
+    requests_df = log_df[log_df["Owner"] == "REQUEST"].astype({"Scenario": str, "Transaction_Name": str,
+                                                               "Status": str})
+    return requests_df.groupby(["Scenario", "Transaction_Name", "Status"]).size().to_dict()
+
+
+##################################################################################################################
+
+
+def test_binary_log_refers_to_cache_index_0(tmp_path):
+    records = get_test_records(["MyScenario"])
+    expected_counts = {("MyScenario", "GET_Account", "OK"): 4, ("MyScenario", "GET_Account", "KO"): 4,
+                       ("MyScenario", "POST_Bet", "OK"): 4}
+
+    # GET_Account is the first string of the cache, repeated 7 times
+    for first_cache_index in [0, 1]:
+        log_path = write_binary_log(tmp_path / "simulation-{}.log".format(first_cache_index), records,
+                                    ["MyScenario"], first_cache_index)
+        assert get_request_counts(log_path) == expected_counts
+
+
+def test_gatling_3_0_requests_are_resolved_by_user_id(tmp_path):
+    log_path = write_text_layout_log(tmp_path / "simulation.log", get_test_records(["Accounts", "Bets"]), "3.2.1")
+
+    assert get_request_counts(log_path) == {("Accounts", "GET_Account", "KO"): 2, ("Accounts", "GET_Account", "OK"): 2,
+                                            ("Accounts", "POST_Bet", "OK"): 2, ("Bets", "GET_Account", "KO"): 2,
+                                            ("Bets", "GET_Account", "OK"): 2, ("Bets", "POST_Bet", "OK"): 2}
+
+
+def test_requests_of_one_scenario_need_no_user_id(tmp_path):
+    records = get_test_records(["MyScenario"])
+    text_log_path = write_text_layout_log(tmp_path / "simulation.log", records, "3.9.5")
+    binary_log_path = write_binary_log(tmp_path / "simulation-binary.log", records, ["MyScenario"], 1)
+
+    assert get_request_counts(text_log_path) == get_request_counts(binary_log_path) == \
+        {("MyScenario", "GET_Account", "KO"): 4, ("MyScenario", "GET_Account", "OK"): 4,
+         ("MyScenario", "POST_Bet", "OK"): 4}
+
+
+def test_requests_of_several_scenarios_without_user_id_fail(tmp_path):
+    records = get_test_records(["Accounts", "Bets"])
+    text_log_path = write_text_layout_log(tmp_path / "simulation.log", records, "3.9.5")
+    binary_log_path = write_binary_log(tmp_path / "simulation-binary.log", records, ["Accounts", "Bets"], 1)
+
+    for log_path in [text_log_path, binary_log_path]:
+        with pytest.raises(ValueError, match="can't be told apart between its scenarios"):
+            generate_gatling_log_df([log_path], 0)
@@ -0,0 +1,108 @@
+# ============================================================================================================
+# Purpose:           Tests of the run comparison and of the cache of the aggregates of gatling_run_aggregates.py
+# Author:            Navdit Sharma (Nav)
+# Notes:             Run from the root of the repository: python -m pytest -q tests
+# Revision:          Last change: 18/10/26 :: Change of the error rate, comparison of cached aggregates
+# ==============================================================================================================
+
+import numpy as np
+import pandas as pd
+
+from gatling_run_aggregates import (aggregates_from_json, aggregates_to_json, compare_run_transactions,
+                                    get_aggregates_cache_path, get_run_label, get_unique_run_labels,
+                                    load_run_aggregates)
+
+
+##################################################################################################################
+# Function Name: get_test_aggregates
+# Description  : Gives the aggregates of a run of one transaction
+# @param       : Number of requests and 95th percentile of the transaction
+# @return      : Dictionary of aggregates, like compute_run_aggregates
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_test_aggregates(count: int, p95: float) -> dict:
+    transactions_df = pd.DataFrame({"Scenario": ["MyScenario"], "Transaction": ["GET_Account"], "Count": [count],
+                                    "Errors": [1], "Throughput": [count / 60], "P95": [p95]})
+    return {"run_start": 1534344682000, "transactions": transactions_df}
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: write_run_log
+# Description  : Writes the Gatling 2 log of a run of one scenario: 10 users of 30 requests each, GET_Account and
+#                POST_Bet in turn, of which the given share is KO
+# @param       : Path of the Log File
+# @param       : Share of KO requests
+# @param       : Seed of the response times
+# @return      : Path of the Log File
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def write_run_log(log_path, ko_share: float, seed: int) -> str:
+    rng = np.random.default_rng(seed)
+    run_start = 1534344682000
+    lines = ["RUN\tcom.Sim\tsim\t{}\t \t2.0".format(run_start)]
+    for user_id in range(10):
+        user_start = run_start + user_id * 1000
+        lines.append("USER\tMyScenario\t{0}\tSTART\t{1}\t{1}".format(user_id, user_start))
+        for index in range(30):
+            start = user_start + index * 500
+            status = "KO\tTimeout" if rng.random() < ko_share else "OK"
+            lines.append("REQUEST\tMyScenario\t{}\t\t{}\t{}\t{}\t{}".format(
+                user_id, ["GET_Account", "POST_Bet"][index % 2], start, start + int(rng.gamma(2, 100)), status))
+        lines.append("USER\tMyScenario\t{}\tEND\t{}\t{}".format(user_id, user_start, user_start + 15000))
+    log_path.write_text("\n".join(lines) + "\n")
+
+    return str(log_path)
+
+
+##################################################################################################################
+
+
+def test_same_run_labels_are_made_unique():
+    runs_list = [["baseline/run1/simulation.log"], ["candidate/run1/simulation.log"], ["other/run1/simulation.log"]]
+    run_labels = [get_run_label(simulation_logs_list) for simulation_logs_list in runs_list]
+
+    assert run_labels == ["run1", "run1", "run1"]
+    assert get_unique_run_labels(run_labels) == ["run1", "run1 #2", "run1 #3"]
+
+
+def test_compare_runs_of_the_same_label():
+    delta_df = compare_run_transactions([get_test_aggregates(100, 200), get_test_aggregates(120, 300)],
+                                        ["sim", "sim"], 95)
+
+    assert delta_df["sim Count"].tolist() == [100]
+    assert delta_df["sim #2 Count"].tolist() == [120]
+    assert delta_df["sim #2 ΔP95 %"].tolist() == [50.0]
+    # 1 error in 100 requests, then 1 in 120
+    assert delta_df["sim #2 ΔError Rate pts"].tolist() == [-0.17]
+
+
+def test_compare_cached_aggregates(tmp_path):
+    runs_list = [[write_run_log(tmp_path / "baseline.log", 0.02, 1)],
+                 [write_run_log(tmp_path / "candidate.log", 0.1, 2)]]
+    delta_df = compare_run_transactions([load_run_aggregates(logs, 0, [95]) for logs in runs_list],
+                                        ["baseline", "candidate"], 95)
+
+    # The second comparison reads the aggregates back from their cache
+    assert all(get_aggregates_cache_path(logs).exists() for logs in runs_list)
+    pd.testing.assert_frame_equal(compare_run_transactions([load_run_aggregates(logs, 0, [95]) for logs in runs_list],
+                                                           ["baseline", "candidate"], 95), delta_df)
+
+    error_rates = delta_df["candidate Errors"] / delta_df["candidate Count"] - \
+        delta_df["baseline Errors"] / delta_df["baseline Count"]
+    assert delta_df["Transaction"].tolist() == ["GET_Account", "POST_Bet"]
+    assert delta_df["baseline Count"].tolist() == delta_df["candidate Count"].tolist() == [150, 150]
+    assert delta_df["candidate ΔError Rate pts"].tolist() == (error_rates * 100).round(2).tolist()
+    assert (delta_df["candidate ΔError Rate pts"] > 0).all()
+
+
+def test_aggregates_json_round_trip():
+    aggregates = get_test_aggregates(100, np.nan)
+    restored = aggregates_from_json(aggregates_to_json(aggregates))
+
+    assert restored["run_start"] == aggregates["run_start"]
+    pd.testing.assert_frame_equal(restored["transactions"], aggregates["transactions"])
@@ -0,0 +1,104 @@
+# ============================================================================================================
+# Purpose:           Tests of the partials of gatling_run_partials.py: written as plain data and read back as they
+#                    were, merged in any order into the counts and percentiles of the run read in memory
+# Author:            Navdit Sharma (Nav)
+# Notes:             Run from the root of the repository: python -m pytest -q tests
+# Revision:          Last change: 18/10/26 :: Created the tests
+# ==============================================================================================================
+
+import gzip
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gatling_run import GatlingReportSource, GatlingRun
+from gatling_run_partials import (PARTIAL_TABLE_KEYS, PARTIAL_VERSION, MergedGatlingRun, compute_run_partial,
+                                  merge_run_partials, read_run_partial, write_run_partial)
+from gatling_scenario_report import ScenarioReportBuilder
+
+
+##################################################################################################################
+# Function Name: write_injector_log
+# Description  : Writes the Gatling 2 log of one injector: users of one scenario with two transactions, some of
+#                their requests KO, and one group
+# @param       : Path of the Log File
+# @param       : Id of the injector, which offsets its users and seeds its response times
+# @return      : Path of the Log File
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def write_injector_log(log_path, injector: int) -> str:
+    rng = np.random.default_rng(injector)
+    run_start = 1534344682000 + injector * 700
+    lines = ["RUN\tcom.Sim\tsim\t{}\t \t2.0".format(run_start)]
+    for user in range(20):
+        user_id, user_start = injector * 100 + user, run_start + user * 500
+        lines.append("USER\tMyScenario\t{0}\tSTART\t{1}\t{1}".format(user_id, user_start))
+        for index in range(50):
+            start = user_start + index * 200
+            for transaction_name in ["GET_Account", "POST_Bet"]:
+                status = "KO\tTimeout" if rng.random() < 0.05 else "OK"
+                lines.append("REQUEST\tMyScenario\t{}\t\t{}\t{}\t{}\t{}".format(
+                    user_id, transaction_name, start, start + int(rng.gamma(2, 150)), status))
+        lines.append("GROUP\tMyScenario\t{}\tLoginFlow\t{}\t{}\t300\tOK".format(user_id, user_start,
+                                                                            user_start + 400))
+        lines.append("USER\tMyScenario\t{}\tEND\t{}\t{}".format(user_id, user_start, user_start + 10500))
+    log_path.write_text("\n".join(lines) + "\n")
+
+    return str(log_path)
+
+
+##################################################################################################################
+
+
+def test_partial_round_trip(tmp_path):
+    run_partial = compute_run_partial(GatlingRun.load([write_injector_log(tmp_path / "simulation.log", 1)]))
+    read_partial = read_run_partial(write_run_partial(run_partial, str(tmp_path / "a.partial.json.gz")))
+
+    assert {key: value for key, value in read_partial.items() if key not in PARTIAL_TABLE_KEYS} == \
+        {key: value for key, value in run_partial.items() if key not in PARTIAL_TABLE_KEYS}
+    for table_name in PARTIAL_TABLE_KEYS:
+        pd.testing.assert_frame_equal(read_partial[table_name], run_partial[table_name])
+
+
+def test_partials_of_other_versions_are_rejected(tmp_path):
+    partial_path = tmp_path / "old.partial.json.gz"
+    with gzip.open(partial_path, "wt", encoding="utf-8") as partial_file:
+        json.dump({"version": PARTIAL_VERSION - 1}, partial_file)
+    (tmp_path / "not.partial.json.gz").write_bytes(b"not a partial")
+
+    with pytest.raises(ValueError, match="version"):
+        read_run_partial(str(partial_path))
+    with pytest.raises(ValueError, match="not a partial"):
+        read_run_partial(str(tmp_path / "not.partial.json.gz"))
+
+
+def test_merge_is_order_independent_and_matches_the_run_in_memory(tmp_path):
+    log_paths = [write_injector_log(tmp_path / "simulation-{}.log".format(injector), injector)
+                 for injector in range(3)]
+    run_partials = [compute_run_partial(GatlingRun.load([log_path])) for log_path in log_paths]
+
+    merged_partial = merge_run_partials(run_partials)
+    reversed_partial = merge_run_partials([merge_run_partials(run_partials[1:][::-1]), run_partials[0]])
+    for table_name in PARTIAL_TABLE_KEYS:
+        pd.testing.assert_frame_equal(merged_partial[table_name], reversed_partial[table_name])
+
+    merged_summary_df = MergedGatlingRun(merged_partial).summary([50, 95])
+    summary_df = GatlingRun.load(log_paths).summary([50, 95])
+    pd.testing.assert_frame_equal(merged_summary_df[["Scenario", "Transaction", "Type", "Count", "Errors"]],
+                                  summary_df[["Scenario", "Transaction", "Type", "Count", "Errors"]],
+                                  check_dtype=False)
+    # Response times above 255 ms are in bins of 0.4% at most
+    for col_name in ["P50", "P95"]:
+        assert np.allclose(merged_summary_df[col_name], summary_df[col_name], rtol=0.004, atol=1)
+
+
+def test_merged_run_is_a_report_source_without_records(tmp_path):
+    run_partial = compute_run_partial(GatlingRun.load([write_injector_log(tmp_path / "simulation.log", 1)]))
+    merged_run = MergedGatlingRun(merge_run_partials([run_partial]))
+
+    assert isinstance(merged_run, GatlingReportSource) and not isinstance(merged_run, GatlingRun)
+    assert not hasattr(merged_run, "scenario_df")
+    assert len(ScenarioReportBuilder(95, ["RPS"]).build(merged_run).tabs) == 3
@@ -0,0 +1,82 @@
+# ============================================================================================================
+# Purpose:           Tests of the out-of-core runs of gatling_run_partitions.py: a run read from its scenario
+#                    partitions gives the summary, aggregates, steady state and export of the run read in memory
+# Author:            Navdit Sharma (Nav)
+# Notes:             Run from the root of the repository: python -m pytest -q tests
+# Revision:          Last change: 18/10/26 :: Created the tests
+# ==============================================================================================================
+
+import numpy as np
+import pandas as pd
+
+from gatling_run import GatlingRun
+from gatling_run_partitions import PartitionedGatlingRun
+
+
+##################################################################################################################
+# Function Name: write_ramp_log
+# Description  : Writes a Gatling 2 log of two scenarios, whose users are started over 20 s, send one request a
+#                second and are ended over 20 s after a minute at load
+# @param       : Path of the Log File
+# @return      : Path of the Log File
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def write_ramp_log(log_path) -> str:
+    rng = np.random.default_rng(3)
+    run_start = 1534344682000
+    lines = ["RUN\tcom.Sim\tsim\t{}\t \t2.0".format(run_start)]
+    for scenario_index, scenario_name in enumerate(["AccountsScenario", "BetsScenario"]):
+        for user in range(20):
+            user_id = scenario_index * 100 + user
+            user_start, user_end = run_start + user * 1000, run_start + (80 + user) * 1000
+            lines.append("USER\t{0}\t{1}\tSTART\t{2}\t{2}".format(scenario_name, user_id, user_start))
+            for start in range(user_start + 100, user_end, 1000):
+                status = "KO\tTimeout" if rng.random() < 0.03 else "OK"
+                lines.append("REQUEST\t{}\t{}\t\tGET_{}\t{}\t{}\t{}".format(
+                    scenario_name, user_id, user % 3, start, start + int(rng.gamma(2, 100)), status))
+            lines.append("USER\t{}\t{}\tEND\t{}\t{}".format(scenario_name, user_id, user_start, user_end))
+    log_path.write_text("\n".join(lines) + "\n")
+
+    return str(log_path)
+
+
+##################################################################################################################
+
+
+def test_partitioned_run_gives_the_summaries_of_the_run_in_memory(tmp_path):
+    log_path = write_ramp_log(tmp_path / "simulation.log")
+    run = GatlingRun.load([log_path])
+    partitioned_run = PartitionedGatlingRun.load([log_path], str(tmp_path / "partitions"), memory_limit=2 ** 16)
+
+    pd.testing.assert_frame_equal(partitioned_run.summary([50, 95]), run.summary([50, 95]))
+    for key, value in run.aggregates([50, 95], 10000).items():
+        if isinstance(value, pd.DataFrame):
+            pd.testing.assert_frame_equal(partitioned_run.aggregates([50, 95], 10000)[key], value, check_dtype=False)
+
+
+def test_partitioned_steady_state_is_the_steady_state_in_memory(tmp_path):
+    log_path = write_ramp_log(tmp_path / "simulation.log")
+    steady_run = GatlingRun.load([log_path]).steady_state()
+    partitioned_steady_run = PartitionedGatlingRun.load([log_path], str(tmp_path / "partitions"),
+                                                        memory_limit=2 ** 16).steady_state()
+
+    # The ramps are cut off
+    assert len(steady_run.log_df) < len(GatlingRun.load([log_path]).log_df)
+    pd.testing.assert_frame_equal(partitioned_steady_run.summary([50, 95]), steady_run.summary([50, 95]))
+    for scenario_name in steady_run.scenarios:
+        pd.testing.assert_frame_equal(partitioned_steady_run.scenario_df(scenario_name).reset_index(drop=True),
+                                      steady_run.scenario_df(scenario_name).reset_index(drop=True))
+
+
+def test_partitioned_export_is_the_export_in_memory(tmp_path):
+    log_path = write_ramp_log(tmp_path / "simulation.log")
+    GatlingRun.load([log_path]).export([50, 95], str(tmp_path / "export"), "csv")
+    PartitionedGatlingRun.load([log_path], str(tmp_path / "partitions"), memory_limit=2 ** 16) \
+        .export([50, 95], str(tmp_path / "partitioned_export"), "csv", 2)
+
+    export_names = sorted(export_path.name for export_path in (tmp_path / "export").iterdir())
+    assert export_names == ["overall_percentiles.csv", "scenario_AccountsScenario.csv", "scenario_BetsScenario.csv"]
+    for export_name in export_names:
+        assert (tmp_path / "partitioned_export" / export_name).read_text() == \
+            (tmp_path / "export" / export_name).read_text()
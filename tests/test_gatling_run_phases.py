@@ -0,0 +1,78 @@
+# ============================================================================================================
+# Purpose:           Tests of gatling_run_phases.py: the phases of a synthetic ramp are found where its users ramp,
+#                    and summarised without losing any request
+# Author:            Navdit Sharma (Nav)
+# Notes:             Run from the root of the repository: python -m pytest -q tests
+# Revision:          Last change: 18/10/26 :: Created the tests
+# ==============================================================================================================
+
+import numpy as np
+import pandas as pd
+
+from gatling_run_phases import RUN_PHASES, compute_scenario_phase_summary, detect_scenario_phases
+
+
+##################################################################################################################
+# Function Name: get_ramp_scenario_df
+# Description  : Gives the records of a scenario, whose 20 users are started one a second, send a request a second
+#                (GET_Account and POST_Bet in turn, 1 in 20 of them KO) and are ended one a second after 60 s at
+#                full load
+# @param       : Whether to keep the USER records
+# @return      : Dataframe with columns: [Owner, Transaction_Name, Status, ResponseTime, LocalTime], LocalTime in ms
+#                since the start of the run
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_ramp_scenario_df(with_users: bool = True) -> pd.DataFrame:
+    records = []
+    for user in range(20):
+        user_start, user_end = user * 1000, (80 + user) * 1000
+        if with_users:
+            records += [("USER", "START", "OK", 0, user_start), ("USER", "END", "OK", 0, user_end)]
+        for index, start in enumerate(range(user_start + 100, user_end, 1000)):
+            records.append(("REQUEST", ["GET_Account", "POST_Bet"][index % 2], "KO" if index % 20 == 19 else "OK",
+                            100 + 10 * user + index % 7, start))
+
+    return pd.DataFrame(records, columns=["Owner", "Transaction_Name", "Status", "ResponseTime", "LocalTime"]) \
+        .sort_values("LocalTime", kind="stable", ignore_index=True)
+
+
+##################################################################################################################
+
+
+def test_phases_of_a_ramp_are_found_where_its_users_ramp():
+    phases_df = detect_scenario_phases(get_ramp_scenario_df())
+
+    assert phases_df["Phase"].tolist() == RUN_PHASES
+    # Phases follow each other, from the first to the last record
+    assert phases_df["Start"].iloc[0] == 0 and phases_df["End"].iloc[-1] == 100000
+    assert (phases_df["Start"].to_numpy()[1:] == phases_df["End"].to_numpy()[:-1]).all()
+    # At load from 18 of the 20 users, up to the end of the 18th last user, give or take the smoothing
+    steady_start, steady_end = phases_df.loc[1, ["Start", "End"]]
+    assert 15000 <= steady_start <= 20000 and 80000 <= steady_end <= 85000
+
+
+def test_phases_of_a_ramp_without_users_are_found_from_its_requests():
+    phases_df = detect_scenario_phases(get_ramp_scenario_df(with_users=False))
+
+    steady_start, steady_end = phases_df.loc[phases_df["Phase"] == "Steady", ["Start", "End"]].iloc[0]
+    assert 15000 <= steady_start <= 20000 and 80000 <= steady_end <= 85000
+
+
+def test_phase_summary_counts_every_request_once():
+    scenario_df = get_ramp_scenario_df()
+    phases_df = detect_scenario_phases(scenario_df)
+    summary_df = compute_scenario_phase_summary(scenario_df, phases_df, [50, 95])
+
+    requests_df = scenario_df[scenario_df["Owner"] == "REQUEST"]
+    transactions_df = summary_df[summary_df["Transaction"] != "All"]
+    assert transactions_df.groupby("Transaction")["Count"].sum().to_dict() == \
+        requests_df["Transaction_Name"].value_counts().to_dict()
+    assert transactions_df["Errors"].sum() == (requests_df["Status"] == "KO").sum()
+
+    # 20 requests a second at load, and the percentiles of its OK requests
+    steady = summary_df[(summary_df["Phase"] == "Steady") & (summary_df["Transaction"] == "All")].iloc[0]
+    assert 19 <= steady["Throughput"] <= 20.5
+    in_steady_state = (requests_df["LocalTime"] >= steady["Start"]) & (requests_df["LocalTime"] < steady["End"])
+    steady_ok_df = requests_df[in_steady_state & (requests_df["Status"] == "OK")]
+    assert np.allclose(steady[["P50", "P95"]].astype(float), steady_ok_df["ResponseTime"].quantile([0.5, 0.95]))
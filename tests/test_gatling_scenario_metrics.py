@@ -0,0 +1,141 @@
+# ============================================================================================================
+# Purpose:           Tests of the metrics of gatling_scenario_metrics.py: the export of the scenario metrics, and
+#                    the top transactions with the others folded into one
+# Author:            Navdit Sharma (Nav)
+# Notes:             Run from the root of the repository: python -m pytest -q tests
+# Revision:          Last change: 18/10/26 :: Top transactions and the fold of the others
+# ==============================================================================================================
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from gatling_run import GatlingRun
+from gatling_scenario_metrics import OTHER_TRANSACTIONS_NAME, get_folded_top, get_transaction_bucket_percentiles
+
+
+##################################################################################################################
+# Function Name: write_scenarios_log
+# Description  : Writes the Gatling 2 log of two scenarios, the second one of a name with special characters, whose
+#                users send GET_Account and POST_Bet twice a second for 20 s, some of them KO. Records are written in
+#                the order of their time, as Gatling does.
+# @param       : Path of the Log File
+# @return      : Path of the Log File
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def write_scenarios_log(log_path) -> str:
+    rng = np.random.default_rng(5)
+    run_start = 1534344682000
+    records = []
+    for scenario_index, scenario_name in enumerate(["AccountsScenario", "Bets Scenario-1"]):
+        for user in range(5):
+            user_id, user_start = scenario_index * 100 + user, run_start + user * 1000
+            records.append((user_start, "USER\t{0}\t{1}\tSTART\t{2}\t{2}".format(scenario_name, user_id, user_start)))
+            for start in range(user_start, user_start + 20000, 500):
+                for transaction_name in ["GET_Account", "POST_Bet"]:
+                    status = "KO\tTimeout" if rng.random() < 0.05 else "OK"
+                    end = start + int(rng.gamma(2, 80))
+                    records.append((end, "REQUEST\t{}\t{}\t\t{}\t{}\t{}\t{}".format(
+                        scenario_name, user_id, transaction_name, start, end, status)))
+            records.append((user_start + 20000, "USER\t{}\t{}\tEND\t{}\t{}".format(scenario_name, user_id,
+                                                                                  user_start, user_start + 20000)))
+    lines = ["RUN\tcom.Sim\tsim\t{}\t \t2.0".format(run_start)] + [line for _, line in sorted(records)]
+    log_path.write_text("\n".join(lines) + "\n")
+
+    return str(log_path)
+
+
+##################################################################################################################
+
+
+##################################################################################################################
+# Function Name: get_wide_scenario_df
+# Description  : Gives the requests of a scenario of 6 transactions over 10 s: TX_0 has the most requests and
+#                the fastest ones, TX_5 the fewest and the slowest ones
+# @return      : Dataframe with columns: [Owner, Scenario, Transaction_Name, Status, ResponseTime, LocalTime]
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_wide_scenario_df() -> pd.DataFrame:
+    rng = np.random.default_rng(9)
+    records = []
+    for transaction_index in range(6):
+        request_count = 60 - 8 * transaction_index
+        for start in np.sort(rng.integers(0, 10000, request_count)):
+            records.append(("REQUEST", "MyScenario", "TX_{}".format(transaction_index), "OK",
+                            int(rng.gamma(2, 50)) + 100 * transaction_index, 1534344682000 + int(start)))
+
+    return pd.DataFrame(records, columns=["Owner", "Scenario", "Transaction_Name", "Status", "ResponseTime",
+                                          "LocalTime"]).sort_values("LocalTime", kind="stable", ignore_index=True)
+
+
+##################################################################################################################
+
+
+def test_export_writes_numeric_metrics_of_one_row_per_time(tmp_path):
+    run = GatlingRun.load([write_scenarios_log(tmp_path / "simulation.log")])
+    run.export([50, 95], str(tmp_path / "export"), "csv")
+
+    # File names without special characters
+    assert sorted(export_path.name for export_path in (tmp_path / "export").iterdir()) == \
+        ["overall_percentiles.csv", "scenario_AccountsScenario.csv", "scenario_Bets_Scenario_1.csv"]
+
+    scenario_metrics_df = pd.read_csv(tmp_path / "export" / "scenario_Bets_Scenario_1.csv", parse_dates=["LocalTime"])
+    assert scenario_metrics_df.columns[:4].tolist() == ["LocalTime", "RPS", "Users", "Errors"]
+    assert sorted(scenario_metrics_df.columns[4:]) == ["GET_Account P50", "GET_Account P95", "POST_Bet P50",
+                                                       "POST_Bet P95"]
+    assert scenario_metrics_df["LocalTime"].is_unique and scenario_metrics_df["LocalTime"].is_monotonic_increasing
+    assert all(pd.api.types.is_numeric_dtype(scenario_metrics_df[col_name])
+               for col_name in scenario_metrics_df.columns[1:])
+    # Every KO request in its bucket, and also in the next one when on the end of its bucket
+    ko_times = run.log_df.loc[(run.log_df["Scenario"] == "Bets Scenario-1") & (run.log_df["Status"] == "KO"),
+                              "LocalTime"].to_numpy()
+    on_bucket_end = (ko_times > ko_times[0]) & ((ko_times - ko_times[0]) % 1000 == 0)
+    assert scenario_metrics_df["Errors"].sum() == len(ko_times) + on_bucket_end.sum()
+
+    # Overall percentiles of the summary
+    overall_percentile_df = pd.read_csv(tmp_path / "export" / "overall_percentiles.csv") \
+        .sort_values(["Scenario", "Transaction"], ignore_index=True)
+    summary_df = run.summary([50, 95])
+    summary_df = summary_df.loc[summary_df["Type"] == "REQUEST", ["Scenario", "Transaction", "P50", "P95"]] \
+        .sort_values(["Scenario", "Transaction"], ignore_index=True)
+    pd.testing.assert_frame_equal(overall_percentile_df, summary_df, check_dtype=False, atol=0.01)
+
+
+def test_parallel_export_is_the_export(tmp_path):
+    run = GatlingRun.load([write_scenarios_log(tmp_path / "simulation.log")])
+    run.export([95], str(tmp_path / "export"), "json")
+    run.export([95], str(tmp_path / "parallel_export"), "json", 2)
+
+    for export_path in (tmp_path / "export").iterdir():
+        assert (tmp_path / "parallel_export" / export_path.name).read_text() == export_path.read_text()
+
+    # A single percentile keeps the names of the transactions
+    with open(tmp_path / "export" / "scenario_AccountsScenario.json", encoding="utf-8") as export_file:
+        assert sorted(json.load(export_file)[0]) == ["Errors", "GET_Account", "LocalTime", "POST_Bet", "RPS", "Users"]
+
+
+def test_top_transactions_are_kept_and_the_others_folded_into_one():
+    scenario_df = get_wide_scenario_df()
+
+    for top_by, top_transactions in [("count", ["TX_0", "TX_1"]), ("percentile", ["TX_4", "TX_5"])]:
+        _, overall_percentile_df, transactions_list = get_transaction_bucket_percentiles(scenario_df, [50, 95],
+                                                                                         top=2, top_by=top_by)
+        assert sorted(transactions_list[:-1]) == top_transactions
+        assert transactions_list[-1] == OTHER_TRANSACTIONS_NAME
+
+        # Percentiles of the others from all their requests together, not from their own percentiles
+        other_times = scenario_df.loc[~scenario_df["Transaction_Name"].isin(top_transactions), "ResponseTime"]
+        other = overall_percentile_df.set_index("Transaction").loc[OTHER_TRANSACTIONS_NAME]
+        assert np.allclose(other[["P50", "P95"]].astype(float), other_times.quantile([0.5, 0.95]))
+
+
+def test_folded_top_caps_the_lines_of_wide_scenarios():
+    # No top asked for: the widest scenarios keep max_transactions lines, the folded one last
+    assert get_folded_top(25, None, 19) == 18
+    assert get_folded_top(19, None, 19) is None
+    # A top of at least every transaction folds nothing
+    assert get_folded_top(6, 2) == 2
+    assert get_folded_top(6, 6) is None
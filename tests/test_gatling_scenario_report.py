@@ -0,0 +1,29 @@
+# ============================================================================================================
+# Purpose:           Tests of the crosshair inspector of gatling_scenario_report.py: every line shows its own point
+#                    nearest to the cursor, not a value binned again
+# Author:            Navdit Sharma (Nav)
+# Notes:             Run from the root of the repository: python -m pytest -q tests
+# Revision:          Last change: 18/10/26 :: Created the tests
+# ==============================================================================================================
+
+import numpy as np
+from bokeh.plotting import figure
+
+from gatling_scenario_report import set_crosshair_inspector
+
+
+def test_inspector_shows_the_nearest_point_of_every_line():
+    plot_graph = figure(x_axis_type='datetime', y_range=(0, 100))
+    inspector = set_crosshair_inspector(plot_graph, [("GET_Account", [1000, 2000, 3000], [10, 50, 20]),
+                                                     ("POST_Bet", [1400, 2400, 3400], ["7", "", "9"])], 100, 500)
+
+    inspector_data = inspector.renderers[0].data_source.data
+    # One cell per time of the lines with a value, from midpoint to midpoint
+    assert inspector_data["LocalTime"].astype("datetime64[ms]").astype(np.int64).tolist() == \
+        [1000, 1400, 2000, 3000, 3400]
+    assert inspector_data["left"].tolist() == [800, 1200, 1700, 2500, 3200]
+    assert inspector_data["right"].tolist() == [1200, 1700, 2500, 3200, 3600]
+    # POST_Bet has no value at 2400, and its points at 1400 and 3400 are too far from 2000
+    assert inspector_data["line0"].tolist() == [10, 10, 50, 20, 20]
+    assert np.array_equal(inspector_data["line1"], [7, 7, np.nan, 9, 9], equal_nan=True)
+    assert [label for label, _ in inspector.tooltips] == ["Time", "GET_Account", "POST_Bet"]
@@ -0,0 +1,65 @@
+# ============================================================================================================
+# Purpose:           Tests of gatling_shared_log.py: the scenarios read back from the shared memory block are the
+#                    scenarios of the shared Dataframe, as read-only views of the block
+# Author:            Navdit Sharma (Nav)
+# Notes:             Run from the root of the repository: python -m pytest -q tests
+# Revision:          Last change: 18/10/26 :: Created the tests
+# ==============================================================================================================
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import gatling_shared_log
+from gatling_shared_log import SharedGatlingLog, read_shared_scenario_df
+
+
+##################################################################################################################
+# Function Name: get_test_log_df
+# Description  : Gives a compact Gatling Log Dataframe of two interleaved scenarios and records without scenario
+# @return      : Dataframe with columns: [Owner,Scenario,Transaction_Name,Status,ResponseTime,LocalTime,ErrorMessage]
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def get_test_log_df() -> pd.DataFrame:
+    names = pd.CategoricalDtype(["AccountsScenario", "BetsScenario", "GET_Account", "POST_Bet"])
+    return pd.DataFrame({
+        "Owner": pd.Categorical(["REQUEST", "REQUEST", "USER", "REQUEST", "REQUEST"],
+                                categories=["REQUEST", "USER", "GROUP"]),
+        "Scenario": pd.Categorical(["BetsScenario", "AccountsScenario", None, "BetsScenario", "AccountsScenario"],
+                                   dtype=names),
+        "Transaction_Name": pd.Categorical(["POST_Bet", "GET_Account", None, "POST_Bet", "GET_Account"],
+                                           dtype=names),
+        "Status": pd.Categorical(["OK", "KO", "OK", "OK", "OK"], categories=["OK", "KO"]),
+        "ResponseTime": np.array([120, 3000, 0, 95, 40], dtype=np.int32),
+        "LocalTime": np.array([1000, 1100, 1200, 1300, 1400], dtype=np.int64),
+        "ErrorMessage": pd.Categorical([None, "Timeout", None, None, None], categories=["Timeout"]),
+    })
+
+
+##################################################################################################################
+
+
+def test_shared_scenarios_are_views_of_the_block():
+    log_df = get_test_log_df()
+    with SharedGatlingLog(log_df) as shared_log:
+        assert sorted(shared_log.handle["scenarios"]) == ["AccountsScenario", "BetsScenario"]
+        for scenario_name in ["AccountsScenario", "BetsScenario"]:
+            scenario_df = read_shared_scenario_df(shared_log.handle, scenario_name)
+            pd.testing.assert_frame_equal(scenario_df,
+                                          log_df[log_df["Scenario"] == scenario_name].reset_index(drop=True))
+
+            block = np.frombuffer(gatling_shared_log.attached_shared_memory.buf, dtype=np.uint8)
+            assert np.shares_memory(scenario_df["LocalTime"].to_numpy(), block)
+            assert np.shares_memory(scenario_df["Transaction_Name"].cat.codes.to_numpy(), block)
+            with pytest.raises(ValueError):
+                scenario_df["ResponseTime"].to_numpy()[0] = 0
+            del scenario_df, block
+
+
+def test_a_new_shared_log_replaces_the_attached_one():
+    with SharedGatlingLog(get_test_log_df()) as first_log, SharedGatlingLog(get_test_log_df()) as second_log:
+        read_shared_scenario_df(first_log.handle, "BetsScenario")
+        read_shared_scenario_df(second_log.handle, "BetsScenario")
+
+        assert gatling_shared_log.attached_shared_memory.name == second_log.handle["name"]
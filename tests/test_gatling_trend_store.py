@@ -0,0 +1,85 @@
+# ============================================================================================================
+# Purpose:           Tests of gatling_trend_store.py: the summaries of the stored runs are loaded back as they were,
+#                    last runs first cut, and a run stored again replaces itself
+# Author:            Navdit Sharma (Nav)
+# Notes:             Run from the root of the repository: python -m pytest -q tests
+# Revision:          Last change: 18/10/26 :: Created the tests
+# ==============================================================================================================
+
+import sqlite3
+
+import numpy as np
+
+from gatling_run import GatlingRun
+from gatling_trend_store import TREND_PERCENTILE_COLS, TREND_ROLLUP_MS, load_trend, store_run
+
+
+##################################################################################################################
+# Function Name: write_daily_log
+# Description  : Writes the Gatling 2 log of a daily run of two transactions, slower every day, of 3 minutes
+# @param       : Path of the Log File
+# @param       : Day of the run, which shifts its start and slows its requests down
+# @return      : Path of the Log File
+# Author       : Navdit Sharma
+# Comments     : Created on 18/10/2026
+##################################################################################################################
+def write_daily_log(log_path, day: int) -> str:
+    rng = np.random.default_rng(day)
+    run_start = 1534344682000 + day * 86400000
+    lines = ["RUN\tcom.Sim\tsim\t{}\t \t2.0".format(run_start)]
+    for user_id in range(10):
+        user_start = run_start + user_id * 1000
+        lines.append("USER\tMyScenario\t{0}\tSTART\t{1}\t{1}".format(user_id, user_start))
+        for start in range(user_start, user_start + 180000, 2000):
+            for transaction_name in ["GET_Account", "POST_Bet"]:
+                status = "KO\tTimeout" if rng.random() < 0.02 else "OK"
+                lines.append("REQUEST\tMyScenario\t{}\t\t{}\t{}\t{}\t{}".format(
+                    user_id, transaction_name, start, start + 100 * (day + 1) + int(rng.gamma(2, 20)), status))
+        lines.append("USER\tMyScenario\t{}\tEND\t{}\t{}".format(user_id, user_start, user_start + 180000))
+    log_path.write_text("\n".join(lines) + "\n")
+
+    return str(log_path)
+
+
+##################################################################################################################
+
+
+def test_stored_runs_are_loaded_back_last_runs_first_cut(tmp_path):
+    store_path = str(tmp_path / "trend.db")
+    runs = []
+    for day in range(4):
+        log_path = write_daily_log(tmp_path / "simulation-{}.log".format(day), day)
+        runs.append(GatlingRun.load([log_path]))
+        store_run(store_path, "day{}".format(day), [log_path], runs[-1].log_df)
+
+    trend_df = load_trend(store_path, last_runs=3, transaction_name="GET_Account")
+    assert trend_df["label"].tolist() == ["day1", "day2", "day3"]
+    assert (trend_df["transaction_name"] == "GET_Account").all()
+    # Slower every day
+    assert trend_df["p95"].is_monotonic_increasing
+
+    summary_df = runs[3].summary([50, 90, 95, 99]).set_index("Transaction")
+    stored = trend_df.iloc[-1]
+    assert (stored["count"], stored["errors"]) == (summary_df.loc["GET_Account", "Count"],
+                                                   summary_df.loc["GET_Account", "Errors"])
+    assert np.allclose([stored[col_name] for col_name in TREND_PERCENTILE_COLS],
+                       summary_df.loc["GET_Account", ["P50", "P90", "P95", "P99"]].astype(float))
+
+
+def test_run_stored_again_replaces_itself(tmp_path):
+    store_path = str(tmp_path / "trend.db")
+    log_path = write_daily_log(tmp_path / "simulation.log", 0)
+    log_df = GatlingRun.load([log_path]).log_df
+
+    store_run(store_path, "day0", [log_path], log_df)
+    run_id = store_run(store_path, "day0", [log_path], log_df)
+
+    trend_df = load_trend(store_path)
+    assert trend_df["run_id"].tolist() == [run_id, run_id]
+    assert trend_df["transaction_name"].tolist() == ["GET_Account", "POST_Bet"]
+    with sqlite3.connect(store_path) as connection:
+        rollup_counts = connection.execute("SELECT run_id, transaction_name, COUNT(*) FROM minute_rollups "
+                                           "GROUP BY run_id, transaction_name").fetchall()
+    # Requests from 0 to 3 min 7 s of the run, the rollups of the first store deleted with it
+    assert TREND_ROLLUP_MS == 60000
+    assert rollup_counts == [(run_id, "GET_Account", 4), (run_id, "POST_Bet", 4)]